@@ -0,0 +1,51 @@
+"""Throughput of ``fairness_audit.ablation`` on per-modality scores and on a model callable.
+
+Usage::
+
+    python -m benchmarks.ablation [--samples 1000000] [--batch 8192] [--workers 4]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from fairness_audit.ablation import ablate_model, ablate_scores
+from fairness_audit.fusion import BALANCED_WEIGHTS
+
+
+def make_validation_set(samples, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = np.where(rng.random(samples) < 0.3, "non-native", "native")
+    scores = {m: rng.random(samples) for m in BALANCED_WEIGHTS}
+    scores["Audio"] = np.clip(scores["Audio"] - 0.3 * (groups == "non-native"), 0, 1)
+    return scores, groups
+
+
+def fused_model(batch):
+    return sum(BALANCED_WEIGHTS[m] * np.asarray(values) for m, values in batch.items())
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=8192)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    scores, groups = make_validation_set(args.samples)
+    result, seconds = timed(lambda: ablate_scores(scores, BALANCED_WEIGHTS, groups, max_dropped=2))
+    print(f"scores   {args.samples:>10,} samples x {len(result.overall) + 1} variants  {seconds:7.3f} s")
+    _, seconds = timed(lambda: ablate_model(fused_model, scores, groups, max_dropped=2,
+                                            batch_size=args.batch, max_workers=args.workers))
+    print(f"callable {args.samples:>10,} samples x {len(result.overall) + 1} variants  {seconds:7.3f} s  "
+          f"(batches of {args.batch:,}, {args.workers} threads)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Throughput of ``fairness_audit.augmentation`` on a synthetic JSONL corpus.
+
+Usage::
+
+    python -m benchmarks.augmentation [--documents 200000] [--jobs 4] [--gzip]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from fairness_audit.augmentation import augment_file
+
+SENTENCES = [
+    "The doctor advised his patient before he left.",
+    "She is a young engineer and her manager is a man.",
+    "The quarterly report is attached.",
+    "Ask the chairman whether the waiter was paid.",
+    "Our team shipped the release two days early.",
+    "Él dijo que “ça va” — the boys ran home.",
+]
+
+
+def make_corpus(path, documents, seed=0):
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(SENTENCES), size=(documents, 4))
+    with open(path, "w", encoding="utf-8") as handle:
+        for i, row in enumerate(picks):
+            handle.write(json.dumps({"id": i, "text": " ".join(SENTENCES[j] for j in row)}, ensure_ascii=False) + "\n")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=200_000)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--gzip", action="store_true", help="write a gzipped output file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "corpus.jsonl")
+        make_corpus(source, args.documents)
+        size = os.path.getsize(source) / 1e6
+        destination = os.path.join(directory, "augmented.jsonl" + (".gz" if args.gzip else ""))
+        for jobs in sorted({1, args.jobs}):
+            stats, seconds = timed(lambda: augment_file(source, destination, jobs=jobs))
+            print(f"{jobs:>2} jobs  {stats.documents:>10,} documents  {size:8.1f} MB  {seconds:7.3f} s  {size / seconds:6.1f} MB/s")
+    print(stats.by_attribute.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Bootstrap CIs from confusion counts versus resampling the rows.
+
+The row-level reference draws an index matrix per resample and recomputes the
+per-group confusion counts, which is what a straightforward bootstrap of
+``MetricFrame`` does; it is timed on ``--reference-resamples`` resamples and
+extrapolated.
+
+Usage::
+
+    python -m benchmarks.bootstrap [--rows 1000000] [--resamples 1000] [--jobs 4]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.bootstrap import bootstrap_ci
+from fairness_audit.metrics import confusion_counts, disaggregate, encode_groups
+
+
+def make_data(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, rows, dtype=np.int8)
+    y_pred = np.where(rng.random(rows) < 0.8, y_true, 1 - y_true).astype(np.int8)
+    features = pd.DataFrame({
+        "skin_tone": rng.choice(["Light", "Medium", "Dark"], rows),
+        "gender": rng.choice(["Men", "Women", "Non-Binary"], rows, p=[0.48, 0.48, 0.04]),
+        "age_bracket": rng.integers(0, 6, rows),
+    })
+    return y_true, y_pred, features
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--resamples", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--reference-resamples", type=int, default=20,
+                        help="row-level resamples to time (0 to skip)")
+    args = parser.parse_args()
+
+    y_true, y_pred, features = make_data(args.rows)
+    metrics = disaggregate(y_true, y_pred, features)
+    start = time.perf_counter()
+    bootstrap_ci(metrics, n_resamples=args.resamples, n_jobs=args.jobs)
+    seconds = time.perf_counter() - start
+    print(f"counts      {args.rows:>11,} rows  {len(metrics.groups):>4} groups  "
+          f"{args.resamples:,} resamples  {seconds:7.3f} s")
+
+    if args.reference_resamples:
+        codes, groups = encode_groups(features)
+        rng = np.random.default_rng(0)
+        start = time.perf_counter()
+        for _ in range(args.reference_resamples):
+            rows = rng.integers(0, args.rows, args.rows)
+            confusion_counts(y_true[rows], y_pred[rows], codes[rows], len(groups))
+        per_resample = (time.perf_counter() - start) / args.reference_resamples
+        print(f"rows        {args.rows:>11,} rows  {len(groups):>4} groups  "
+              f"{args.resamples:,} resamples  {per_resample * args.resamples:7.3f} s (extrapolated)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Cold and cached runs of the ``fairness_audit.counterfactual`` harness.
+
+Usage::
+
+    python -m benchmarks.counterfactual [--roles 500] [--latency 0.05] [--batch 32] [--concurrency 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from fairness_audit.counterfactual import (
+    ResponseCache, StubBackend, consistency_by_group, evaluate_counterfactuals,
+)
+
+
+def make_templates(roles):
+    return [f"Describe a successful {{age}} {{gender}} {{origin}} professional in role #{i} in one sentence."
+            for i in range(roles)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--roles", type=int, default=500, help="templates, 12 prompts each")
+    parser.add_argument("--latency", type=float, default=0.05, help="simulated seconds per backend request")
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    templates = make_templates(args.roles)
+    backend = StubBackend(latency=args.latency)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(os.path.join(directory, "responses.db"))
+        for label in ("cold", "cached"):
+            run, seconds = timed(lambda: evaluate_counterfactuals(templates, backend, cache=cache, batch_size=args.batch,
+                                                                  concurrency=args.concurrency))
+            print(f"{label:<7} {run.prompts:>8,} prompts  {run.cached:>8,} cached  {seconds:7.3f} s")
+        cache.close()
+    print(consistency_by_group(run.scored, ["gender", "origin"]).to_string(float_format="{:.3f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Throughput of ``fairness_audit.metrics`` versus fairlearn's ``MetricFrame``.
+
+Usage::
+
+    python -m benchmarks.disaggregation [--rows 10000000] [--reference-rows 1000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import disaggregate
+
+
+def make_data(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    y_true = rng.integers(0, 2, rows, dtype=np.int8)
+    y_pred = np.where(rng.random(rows) < 0.8, y_true, 1 - y_true).astype(np.int8)
+    features = pd.DataFrame({
+        "skin_tone": pd.Categorical(rng.choice(["Light", "Medium", "Dark"], rows)),
+        "gender": pd.Categorical(rng.choice(["Men", "Women", "Non-Binary"], rows, p=[0.48, 0.48, 0.04])),
+        "age_bracket": rng.integers(0, 6, rows),
+    })
+    return y_true, y_pred, features
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--reference-rows", type=int, default=1_000_000,
+                        help="rows for the MetricFrame comparison (0 to skip)")
+    args = parser.parse_args()
+
+    y_true, y_pred, features = make_data(args.rows)
+    result, seconds = timed(lambda: disaggregate(y_true, y_pred, features))
+    print(f"engine      {args.rows:>11,} rows  {len(result.groups):>4} groups  {seconds:7.3f} s")
+
+    if args.reference_rows:
+        from fairlearn.metrics import MetricFrame, false_positive_rate, selection_rate, true_positive_rate
+        from sklearn.metrics import accuracy_score
+
+        n = args.reference_rows
+        y_true, y_pred, features = y_true[:n], y_pred[:n], features.iloc[:n]
+        metrics = {
+            "accuracy": accuracy_score,
+            "selection_rate": selection_rate,
+            "true_positive_rate": true_positive_rate,
+            "false_positive_rate": false_positive_rate,
+        }
+        reference, ref_seconds = timed(lambda: MetricFrame(
+            metrics=metrics, y_true=y_true, y_pred=y_pred, sensitive_features=features))
+        result, seconds = timed(lambda: disaggregate(y_true, y_pred, features))
+        deviation = (reference.by_group - result.by_group).abs().max().max()
+        print(f"MetricFrame {n:>11,} rows  {ref_seconds:7.3f} s")
+        print(f"engine      {n:>11,} rows  {seconds:7.3f} s  (max |diff| {deviation:.1e})")
+
+
+if __name__ == "__main__":
+    main()
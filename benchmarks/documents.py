@@ -0,0 +1,56 @@
+"""Rendering time of ``fairness_audit.documents`` bundles for many models.
+
+Usage::
+
+    python -m benchmarks.documents [--models 500] [--jobs 4]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.documents import ModelEvidence, bundle_file
+from fairness_audit.metrics import DisaggregatedMetrics
+from fairness_audit.risk import assess_risk
+
+ANSWERS = {
+    "domain_impact": "High", "autonomy": "Human over the loop",
+    "decision_impact": "Affects Opportunities", "scale": "> 100k people",
+}
+
+
+def make_evidence(models, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = pd.MultiIndex.from_product([["Men", "Women", "Non-binary"], ["Under 40", "40+"], ["A", "B"]],
+                                        names=["gender", "age", "race"])
+    counts = rng.integers(10, 2_000, size=(models, len(groups), 2, 2))
+    risk = assess_risk(*ANSWERS.values())
+    return [
+        ModelEvidence({"name": f"Model {i:04d}", "version": "1.0"}, DisaggregatedMetrics(counts[i], groups), risk,
+                      ANSWERS, {"true_positive_rate": 0.05})
+        for i in range(models)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=500)
+    parser.add_argument("--jobs", type=int, default=4)
+    args = parser.parse_args()
+
+    evidence = make_evidence(args.models)
+    for jobs in sorted({1, args.jobs}):
+        handle, seconds = timed(lambda: bundle_file(evidence, jobs=jobs))
+        size = handle.seek(0, 2) / 1e6
+        print(f"{jobs:>2} jobs  {args.models:>6,} models  {seconds:7.3f} s  {args.models / seconds:8.1f} models/s  {size:6.2f} MB zip")
+
+
+if __name__ == "__main__":
+    main()
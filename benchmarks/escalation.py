@@ -0,0 +1,74 @@
+"""Routing throughput of ``fairness_audit.escalation`` under bursts of monitoring alerts.
+
+Usage::
+
+    python -m benchmarks.escalation [--alerts 200000] [--burst 5000] [--models 1000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.escalation import AUTHORITIES, EscalationRouter
+from fairness_audit.monitoring import DEFAULT_THRESHOLDS, SEVERITIES
+
+
+def make_alerts(alerts, models, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "model": np.char.add("model-", rng.integers(0, models, alerts).astype(str)),
+        "window_end": pd.Timestamp("2026-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 30 * 86_400, alerts)), unit="s"),
+        "group": rng.choice(["A", "B", "C", "D"], alerts),
+        "test": rng.choice(list(DEFAULT_THRESHOLDS), alerts),
+        "value": rng.gamma(2.0, 0.1, alerts),
+        "severity": np.where(rng.random(alerts) < 0.1, SEVERITIES[-1], SEVERITIES[0]),
+    })
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=5_000)
+    parser.add_argument("--models", type=int, default=1_000)
+    args = parser.parse_args()
+
+    alerts = make_alerts(args.alerts, args.models)
+    router = EscalationRouter()
+    bursts = [alerts.iloc[start:start + args.burst] for start in range(0, len(alerts), args.burst)]
+
+    # What a Streamlit callback pays: the routing itself happens in the background.
+    submit_times = []
+    start = time.perf_counter()
+    for burst in bursts:
+        _, seconds = timed(lambda: router.submit(burst))
+        submit_times.append(seconds)
+    print(f"submit   {len(bursts):>10,} bursts   {np.median(submit_times) * 1000:7.2f} ms median, {max(submit_times) * 1000:.2f} ms max")
+
+    # A reader polling while the router works through the inbox.
+    poll_times = []
+    while router.backlog:
+        _, seconds = timed(router.metrics)
+        poll_times.append(seconds)
+    router.wait()
+    seconds = time.perf_counter() - start
+    print(f"route    {args.alerts:>10,} alerts   {seconds:7.3f} s  {args.alerts / seconds:>10,.0f} alerts/s, {len(router):,} open incidents")
+    if poll_times:
+        print(f"metrics  {len(poll_times):>10,} polls    {np.median(poll_times) * 1000:7.2f} ms median while routing")
+
+    for authority in AUTHORITIES:
+        _, seconds = timed(lambda: router.queue(authority, limit=20))
+        print(f"queue    {authority:<48} {seconds * 1000:7.2f} ms")
+    resolved, seconds = timed(lambda: [incident for authority in AUTHORITIES for incident in router.resolve(authority, 1_000)])
+    print(f"resolve  {len(resolved):>10,} incidents {seconds * 1000:6.1f} ms")
+    print(router.metrics()[["open", "warning", "critical", "resolved"]].to_string())
+
+
+if __name__ == "__main__":
+    main()
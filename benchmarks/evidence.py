@@ -0,0 +1,73 @@
+"""Ingestion and lookup speed of ``fairness_audit.evidence`` over many CI builds.
+
+Usage::
+
+    python -m benchmarks.evidence [--entries 300000] [--models 1000] [--batch 10000]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from fairness_audit.evidence import REQUIREMENTS, Artifact, EvidenceStore
+
+
+def make_artifacts(entries, models, seed=0):
+    # One report per model and build; a model's report only changes on
+    # retraining (about every 20 builds), as with nightly CI runs.
+    rng = np.random.default_rng(seed)
+    model = rng.integers(0, models, entries)
+    version = np.arange(entries) // (20 * models)
+    requirements = list(REQUIREMENTS)
+    return [
+        Artifact(json.dumps({"audit": "disaggregate", "model": f"model-{m}", "version": int(v), "gap": (m * 7 + v) % 50 / 1000}),
+                 f"model-{m} fairness report", (requirements[m % len(requirements)],), "disaggregate", f"model-{m}", str(i))
+        for i, (m, v) in enumerate(zip(model, version))
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=300_000)
+    parser.add_argument("--models", type=int, default=1_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    artifacts = make_artifacts(args.entries, args.models)
+    with tempfile.TemporaryDirectory() as directory:
+        store = EvidenceStore(os.path.join(directory, "evidence.db"))
+
+        def ingest():
+            for start in range(0, len(artifacts), args.batch):
+                store.put_many(artifacts[start:start + args.batch])
+
+        _, seconds = timed(ingest)
+        print(f"put      {args.entries:>10,} entries  {seconds:7.3f} s  {args.entries / seconds:>10,.0f} entries/s")
+        stats = store.stats()
+        print(f"stored   {stats['artifacts']:>10,} artifacts  {stats['recorded_bytes'] / 1e6:.1f} MB recorded, "
+              f"{stats['stored_bytes'] / 1e6:.2f} MB stored")
+        digest = store.find(limit=1)["digest"].iloc[0]
+        for label, fn in (
+            ("model", lambda: store.find(model="model-7", limit=100)),
+            ("req+model", lambda: store.find(requirement=next(iter(REQUIREMENTS)), model="model-3", limit=100)),
+            ("digest", lambda: store.find(digest=digest)),
+            ("get", lambda: store.get(digest)),
+            ("coverage", store.coverage),
+            ("verify", store.verify),
+        ):
+            _, seconds = timed(fn)
+            print(f"{label:<9} {seconds * 1000:10.1f} ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Time to sweep the fusion-weight simplex with ``fairness_audit.fusion.weight_sweep``.
+
+Usage::
+
+    python -m benchmarks.fusion_sweep [--samples 100000] [--resolution 60]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from fairness_audit.fusion import MODALITIES, simplex_weights, weight_sweep
+
+
+def make_scores(samples, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = np.where(rng.random(samples) < 0.3, "non-native", "native")
+    quality = rng.beta(5, 4, samples)
+    scores = {m: np.clip(quality + rng.normal(0.0, 0.12, samples), 0, 1) for m in MODALITIES}
+    scores["Audio"] = np.clip(scores["Audio"] - 0.3 * (groups == "non-native"), 0, 1)
+    return scores, groups
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--resolution", type=int, default=60)
+    args = parser.parse_args()
+
+    scores, groups = make_scores(args.samples)
+    sweep, seconds = timed(lambda: weight_sweep(scores, groups, resolution=args.resolution))
+    print(f"sweep       {args.samples:>9,} samples x {len(sweep):,} weightings  {seconds:7.3f} s")
+
+    def brute_force():
+        fused = np.column_stack([scores[m] for m in MODALITIES]) @ simplex_weights(args.resolution).T >= 0.5
+        return [fused[groups == g].mean(axis=0) for g in np.unique(groups)]
+    _, seconds = timed(brute_force)
+    print(f"brute force {args.samples:>9,} samples x {len(sweep):,} weightings  {seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
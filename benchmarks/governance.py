@@ -0,0 +1,62 @@
+"""Write and overview speed of ``fairness_audit.governance`` for a large project portfolio.
+
+Usage::
+
+    python -m benchmarks.governance [--projects 10000] [--sprints 10] [--clicks 20000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from fairness_audit.governance import CHECKLISTS, GovernanceStore
+
+ITEMS = [item for items in CHECKLISTS.values() for item in items]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--sprints", type=int, default=10)
+    parser.add_argument("--clicks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rows = [(f"project-{p}", s, item, rng.random() < 0.8, 1_790_000_000 + s * 1_209_600)
+            for p in range(args.projects) for s in range(1, args.sprints + 1) for item in ITEMS]
+    with tempfile.TemporaryDirectory() as directory:
+        store = GovernanceStore(os.path.join(directory, "governance.db"), debounce=60)
+        _, seconds = timed(lambda: store.record(rows))
+        print(f"record    {len(rows):>10,} rows     {seconds:7.3f} s")
+
+        # Checkbox clicks staged from callbacks, then written as one debounced batch.
+        projects = rng.integers(0, args.projects, args.clicks)
+        items = rng.integers(0, len(ITEMS), args.clicks)
+
+        def click():
+            for p, i in zip(projects, items):
+                store.stage(f"project-{p}", args.sprints, ITEMS[i], True)
+
+        _, seconds = timed(click)
+        print(f"stage     {args.clicks:>10,} clicks   {seconds:7.3f} s  {seconds / args.clicks * 1e6:6.1f} us/click")
+        written, seconds = timed(store.flush)
+        print(f"flush     {written:>10,} changes  {seconds:7.3f} s")
+
+        portfolio, seconds = timed(store.portfolio)
+        print(f"portfolio {len(portfolio):>10,} projects {seconds:7.3f} s")
+        _, seconds = timed(lambda: store.load("project-7", args.sprints))
+        print(f"load      {1:>10,} project  {seconds * 1000:7.3f} ms")
+        print(portfolio["blocked_at"].value_counts(sort=False).to_string())
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
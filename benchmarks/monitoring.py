@@ -0,0 +1,49 @@
+"""Event throughput of ``fairness_audit.monitoring.DriftMonitor``.
+
+Usage::
+
+    python -m benchmarks.monitoring [--events 5000000] [--batch 50000] [--groups 4]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.monitoring import DriftMonitor
+
+
+def make_log(events, groups, days=14, seed=0):
+    rng = np.random.default_rng(seed)
+    seconds = np.sort(rng.integers(0, days * 86_400, events))
+    return pd.DataFrame({
+        "timestamp": pd.Timestamp("2026-01-01") + pd.to_timedelta(seconds, unit="s"),
+        "group": rng.integers(0, groups, events),
+        "y_true": rng.integers(0, 2, events),
+        "y_pred": rng.integers(0, 2, events),
+        "score": rng.random(events),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5_000_000)
+    parser.add_argument("--batch", type=int, default=50_000)
+    parser.add_argument("--groups", type=int, default=4)
+    args = parser.parse_args()
+
+    log = make_log(args.events, args.groups)
+    monitor = DriftMonitor(bucket="1h", window=24)
+    start = time.perf_counter()
+    for begin in range(0, len(log), args.batch):
+        batch = log.iloc[begin:begin + args.batch]
+        monitor.update(batch["timestamp"], batch["group"].to_numpy(), batch["y_true"].to_numpy(),
+                       batch["y_pred"].to_numpy(), batch["score"].to_numpy())
+    monitor.flush()
+    seconds = time.perf_counter() - start
+    print(f"{args.events:>10,} events in batches of {args.batch:,}  {seconds:7.3f} s  "
+          f"({args.events / seconds:,.0f} events/s, {len(monitor.disparity())} windows, {len(monitor.alerts)} alerts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Throughput of ``fairness_audit.risk.classify_portfolio`` versus row-by-row ``assess_risk``.
+
+Usage::
+
+    python -m benchmarks.portfolio [--systems 100000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.risk import FACTORS, assess_risk, classify_portfolio
+
+
+def make_inventory(systems, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({factor: rng.choice(list(levels), systems) for factor, levels in FACTORS.items()})
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--systems", type=int, default=100_000)
+    args = parser.parse_args()
+
+    inventory = make_inventory(args.systems)
+    classified, seconds = timed(lambda: classify_portfolio(inventory))
+    rows, row_seconds = timed(lambda: [assess_risk(*row) for row in inventory.itertuples(index=False)])
+    assert classified["score"].tolist() == [assessment.score for assessment in rows]
+    print(f"{args.systems:>10,} systems  vectorized {seconds:7.3f} s  row by row {row_seconds:7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
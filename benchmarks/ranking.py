@@ -0,0 +1,51 @@
+"""Throughput of ``fairness_audit.ranking.fair_rerank`` versus a full sort.
+
+Usage::
+
+    python -m benchmarks.ranking [--items 1000000] [--users 64] [--k 50]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.ranking import fair_rerank
+
+
+def make_catalog(items, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = pd.Categorical(np.where(rng.random(items) < 0.7, "majority", "minority"))
+    scores = rng.normal(0.0, 1.0, items) - 0.5 * (groups == "minority")
+    return scores, groups
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=64)
+    parser.add_argument("--k", type=int, default=50)
+    args = parser.parse_args()
+
+    scores, groups = make_catalog(args.items)
+    boost = 0.5 * (groups == "minority")
+    result, seconds = timed(lambda: fair_rerank(scores, groups, "minority", 0.5, k=args.k))
+    _, sort_seconds = timed(lambda: np.argsort(-(scores + boost), kind="stable")[:args.k])
+    print(f"one list    {args.items:>10,} items  engine {seconds:7.3f} s  full sort {sort_seconds:7.3f} s  "
+          f"(exposure gap {result.exposure_gap:.3f})")
+
+    rng = np.random.default_rng(1)
+    user_scores = scores + rng.normal(0.0, 0.3, (args.users, args.items))
+    _, seconds = timed(lambda: fair_rerank(user_scores, groups, "minority", 0.5, k=args.k))
+    print(f"{args.users:>3} users   {args.items:>10,} items  engine {seconds:7.3f} s  "
+          f"({seconds / args.users * 1000:.1f} ms per user)")
+
+
+if __name__ == "__main__":
+    main()
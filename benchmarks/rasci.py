@@ -0,0 +1,61 @@
+"""Load, validation and lookup speed of ``fairness_audit.rasci`` on a synthetic org-scale matrix.
+
+Usage::
+
+    python -m benchmarks.rasci [--tasks 20000] [--roles 500] [--density 0.03]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from fairness_audit.rasci import LETTERS, RasciMatrix
+
+
+def make_matrix(tasks, roles, density, seed=0):
+    rng = np.random.default_rng(seed)
+    codes = np.where(rng.random((tasks, roles)) < density, rng.integers(1, len(LETTERS) + 1, (tasks, roles)), 0)
+    return RasciMatrix([f"task-{i}" for i in range(tasks)], [f"role-{j}" for j in range(roles)], codes)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--roles", type=int, default=500)
+    parser.add_argument("--density", type=float, default=0.03)
+    args = parser.parse_args()
+
+    matrix = make_matrix(args.tasks, args.roles, args.density)
+    print(f"{matrix}  {matrix.codes.nbytes / 1e6:.1f} MB of codes")
+    with tempfile.TemporaryDirectory() as directory:
+        wide, long = os.path.join(directory, "wide.parquet"), os.path.join(directory, "long.parquet")
+        frame = matrix.to_frame()
+        frame.to_parquet(wide)
+        cells = frame.melt(id_vars="task", var_name="role", value_name="assignment")
+        cells[cells["assignment"] != ""].to_parquet(long)
+        for label, fn in (
+            ("read wide", lambda: RasciMatrix.read(wide)),
+            ("read long", lambda: RasciMatrix.read(long, "task", "role")),
+        ):
+            _, seconds = timed(fn)
+            print(f"{label:<10} {seconds:8.3f} s")
+    issues, seconds = timed(matrix.validate)
+    print(f"{'validate':<10} {seconds:8.3f} s  {len(issues):,} violations")
+    _, seconds = timed(lambda: matrix.tasks_for("role-0"))
+    print(f"{'index':<10} {seconds:8.3f} s  (first lookup builds it)")
+    _, seconds = timed(lambda: [matrix.tasks_for(f"role-{j}", "A") for j in range(args.roles)])
+    print(f"{'lookup':<10} {seconds / args.roles * 1e6:8.1f} us per role")
+    _, seconds = timed(lambda: matrix.page(np.arange(50), list(matrix.roles[:20])))
+    print(f"{'page':<10} {seconds * 1000:8.2f} ms  50 tasks x 20 roles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Cold-start benchmark for the deferred fairlearn/scikit-learn imports.
+
+Each scenario runs in a fresh interpreter so nothing is shared through
+``sys.modules``. Two things are measured:
+
+* ``imports``: the module-level imports a page pays before rendering, with the
+  metric stack imported eagerly (the old ``app.py`` header) versus through
+  ``fairness_audit.lazy``.
+* ``part3``: a headless render of the Part 3 page via ``AppTest`` with the
+  vision recipe closed, which is what every visitor of that page pays.
+
+Usage::
+
+    python -m benchmarks.startup_time [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "sklearn_loaded": "sklearn" in sys.modules,
+}}))
+"""
+
+SCENARIOS = {
+    "imports (eager)": """
+import streamlit, pandas, altair
+from sklearn.metrics import accuracy_score
+from fairlearn.metrics import MetricFrame
+""",
+    "imports (lazy)": """
+import streamlit, pandas, altair
+from fairness_audit.lazy import fairlearn_metrics, sklearn_metrics
+""",
+    "part3 render (lazy, recipe closed)": """
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=120)
+at.run()
+at.switch_page("parts/part3_architecture_cookbook.py")
+at.run()
+""",
+    "part3 render (recipe opened)": """
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=120)
+at.run()
+at.switch_page("parts/part3_architecture_cookbook.py")
+at.session_state["p3_vision_recipe"] = True
+at.run()
+""",
+}
+
+
+def run_probe(body):
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(body=body)],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per scenario")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<38} {'median s':>9} {'max RSS MB':>11} {'sklearn':>8}")
+    for name, body in SCENARIOS.items():
+        samples = [run_probe(body) for _ in range(args.runs)]
+        seconds = statistics.median(s["seconds"] for s in samples)
+        rss = statistics.median(s["max_rss_mb"] for s in samples)
+        loaded = "yes" if samples[-1]["sklearn_loaded"] else "no"
+        print(f"{name:<38} {seconds:>9.3f} {rss:>11.1f} {loaded:>8}")
+
+
+if __name__ == "__main__":
+    main()
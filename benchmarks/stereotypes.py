@@ -0,0 +1,55 @@
+"""Throughput of ``fairness_audit.stereotypes`` on synthetic generated texts.
+
+Usage::
+
+    python -m benchmarks.stereotypes [--documents 500000] [--batch 10000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.stereotypes import StereotypeLexicon, score_texts, stereotype_rates
+
+PHRASES = [
+    "An engineer with five years of experience in Python and cloud architecture.",
+    "A nurturing and collaborative colleague who is a great team player.",
+    "Energetic but inexperienced, and slow to adopt new tools.",
+    "Hard-working despite language barriers, with a heavy accent.",
+    "Led three major projects to completion ahead of schedule.",
+    "Manages a budget of two million dollars and mentors junior staff.",
+]
+
+
+def make_texts(documents, seed=0):
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(PHRASES), size=(documents, 3))
+    texts = [" ".join(PHRASES[j] for j in row) for row in picks]
+    groups = pd.Series(rng.choice(["female", "male", "non-binary"], documents), name="gender")
+    return texts, groups
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=500_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+
+    texts, groups = make_texts(args.documents)
+    lexicon = StereotypeLexicon()
+    scored, seconds = timed(lambda: score_texts(texts, lexicon, batch_size=args.batch))
+    print(f"scored {len(texts):>10,} documents  {seconds:7.3f} s  {len(texts) / seconds * 60:>12,.0f} documents/min")
+    rates, seconds = timed(lambda: stereotype_rates(scored, groups))
+    print(f"rates  {len(rates):>10,} groups     {seconds:7.3f} s")
+    print(rates.to_string(float_format="{:.3f}".format))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Computational building blocks behind the Fairness Implementation Playbook."""
@@ -0,0 +1,3 @@
+from fairness_audit.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,132 @@
+"""Modality ablation across a validation set (the Part 3 cross-modal consistency check).
+
+Each sample is scored once with every modality and once per ablation
+variant, i.e. with one (or, with ``max_dropped > 1``, several) modalities
+replaced by a blank. The Prediction Agreement Rate of a variant is the share
+of samples whose prediction does not change; computing it per demographic
+group shows which modality the model leans on for whom.
+
+For late-fusion models given as per-modality scores, every variant of every
+sample comes out of a single matrix product. Arbitrary models are passed as
+a callable and evaluated batch by batch in a thread pool.
+"""
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import encode_groups
+
+DEFAULT_BATCH_SIZE = 1024
+
+
+class AblationResult(NamedTuple):
+    agreement: pd.DataFrame  # group x variant: Prediction Agreement Rate
+    overall: pd.Series       # variant: agreement over all samples
+    gap: pd.Series           # variant: largest minus smallest group agreement
+    score_shift: pd.DataFrame  # group x variant: mean change of the model score
+    group_size: pd.Series
+
+
+def ablation_variants(modalities, max_dropped=1):
+    """Labels and ``(variants, modalities)`` keep-masks; row 0 is the full model."""
+    modalities = list(modalities)
+    if not 1 <= max_dropped < len(modalities):
+        raise ValueError(f"max_dropped must be between 1 and {len(modalities) - 1}.")
+    labels, masks = ["baseline"], [np.ones(len(modalities))]
+    for size in range(1, max_dropped + 1):
+        for dropped in itertools.combinations(range(len(modalities)), size):
+            mask = np.ones(len(modalities))
+            mask[list(dropped)] = 0.0
+            labels.append("without " + " + ".join(modalities[i] for i in dropped))
+            masks.append(mask)
+    return labels, np.array(masks)
+
+
+def _summarise(scores, predictions, labels, sensitive_features):
+    """Agreement of every variant with the baseline, per group and overall."""
+    codes, groups = encode_groups(sensitive_features)
+    n_groups, n_variants = len(groups), predictions.shape[1]
+    agree = predictions[:, 1:] == predictions[:, :1]
+    group_size = np.bincount(codes, minlength=n_groups)
+    # One bincount over (group, variant) pairs for all variants at once.
+    cells = (codes[:, None] * (n_variants - 1) + np.arange(n_variants - 1)).ravel()
+    agreed = np.bincount(cells, weights=agree.ravel(), minlength=n_groups * (n_variants - 1))
+    shift = np.bincount(cells, weights=(scores[:, 1:] - scores[:, :1]).ravel(), minlength=n_groups * (n_variants - 1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        agreement = agreed.reshape(n_groups, -1) / group_size[:, None]
+        score_shift = shift.reshape(n_groups, -1) / group_size[:, None]
+
+    agreement = pd.DataFrame(agreement, index=groups, columns=labels[1:]).rename_axis(columns="variant")
+    return AblationResult(
+        agreement=agreement,
+        overall=pd.Series(agree.mean(axis=0), index=labels[1:], name="agreement"),
+        gap=(agreement.max() - agreement.min()).rename("gap"),
+        score_shift=pd.DataFrame(score_shift, index=groups, columns=labels[1:]).rename_axis(columns="variant"),
+        group_size=pd.Series(group_size, index=groups, name="count"),
+    )
+
+
+def ablate_scores(scores, weights, sensitive_features, threshold=0.5, fill=0.0, max_dropped=1):
+    """Ablation of a weighted late-fusion model from per-modality scores.
+
+    ``scores`` maps each modality to an array of per-sample scores (a
+    ``DataFrame`` works too) and ``weights`` maps modalities to fusion
+    weights. A dropped modality's score is replaced by ``fill``; a sample is
+    positive when its fused score is at least ``threshold``.
+    """
+    modalities = list(weights)
+    missing = [m for m in modalities if m not in scores]
+    if missing:
+        raise ValueError(f"No scores given for modalities {missing}.")
+    matrix = np.column_stack([np.asarray(scores[m], dtype=np.float64) for m in modalities])
+    w = np.array([weights[m] for m in modalities], dtype=np.float64)
+    labels, keep = ablation_variants(modalities, max_dropped)
+
+    # fused[:, v] = sum_k w_k * (keep_vk * s_k + (1 - keep_vk) * fill), for
+    # every variant v in one (samples x modalities) @ (modalities x variants) product.
+    fused = matrix @ (keep * w).T + fill * ((1 - keep) @ w)
+    return _summarise(fused, fused >= threshold, labels, sensitive_features)
+
+
+def _blank_like(values):
+    return np.zeros_like(np.asarray(values))
+
+
+def ablate_model(model, inputs, sensitive_features, threshold=0.5, blank=None, max_dropped=1,
+                 batch_size=DEFAULT_BATCH_SIZE, max_workers=None):
+    """Ablation of an arbitrary model callable.
+
+    ``inputs`` maps each modality to its per-sample inputs (first axis =
+    samples). ``model(batch)`` receives the same mapping for one batch and
+    returns a score (or numeric label) per sample. ``blank`` maps a
+    modality to a function building the stand-in for a batch of its inputs
+    (default: zeros). With ``threshold=None`` the model's outputs are
+    compared as labels. Batches of all variants run in a pool of
+    ``max_workers`` threads, which suits models that release the GIL
+    (numpy, PyTorch, ONNX Runtime) or call a remote service.
+    """
+    modalities = list(inputs)
+    blank = {m: _blank_like for m in modalities} | dict(blank or {})
+    n = len(inputs[modalities[0]])
+    labels, keep = ablation_variants(modalities, max_dropped)
+    outputs = [[None] * -(-n // batch_size) for _ in labels]
+
+    def run(variant, start):
+        batch = {m: inputs[m][start:start + batch_size] for m in modalities}
+        for m, kept in zip(modalities, keep[variant]):
+            if not kept:
+                batch[m] = blank[m](batch[m])
+        outputs[variant][start // batch_size] = np.asarray(model(batch)).reshape(-1)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4)) as pool:
+        futures = [pool.submit(run, v, start) for v in range(len(labels)) for start in range(0, n, batch_size)]
+        for future in futures:
+            future.result()
+
+    scores = np.column_stack([np.concatenate(parts) for parts in outputs])
+    predictions = scores if threshold is None else scores >= threshold
+    return _summarise(scores.astype(np.float64), predictions, labels, sensitive_features)
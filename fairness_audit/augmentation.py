@@ -0,0 +1,240 @@
+"""Counterfactual data augmentation of JSONL corpora (the Part 3 fine-tuning recipe).
+
+A ``SwapLexicon`` pairs demographic terms per attribute ("he" / "she",
+"father" / "mother", ...) and compiles all of them into one regular
+expression whose alternatives are factored into a prefix trie, so each text
+is scanned once whatever the size of the lexicon, and a Python callback only
+runs on actual matches. Terms match in lower, Title or UPPER case and are
+swapped in the same case; listing the three casings in the trie is about
+twice as fast as matching case-insensitively.
+
+``augment_file`` streams a corpus line by line: blocks of lines go to a
+pool of worker processes, at most two blocks per worker are in flight, and
+results are written in input order as they arrive, so memory stays constant
+however large the corpus is.
+"""
+import gzip
+import json
+import os
+import re
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import pandas as pd
+
+DEFAULT_BLOCK_BYTES = 1 << 20
+COUNTERFACTUAL_FIELD = "counterfactual"
+
+# Ambiguous terms map to their first partner: "her" becomes "his", not "him".
+DEFAULT_SWAPS = {
+    "gender": [
+        ("he", "she"), ("his", "her"), ("him", "her"), ("himself", "herself"), ("hers", "his"),
+        ("man", "woman"), ("men", "women"), ("boy", "girl"), ("boys", "girls"),
+        ("father", "mother"), ("fathers", "mothers"), ("dad", "mom"), ("son", "daughter"), ("sons", "daughters"),
+        ("brother", "sister"), ("brothers", "sisters"), ("husband", "wife"), ("husbands", "wives"),
+        ("uncle", "aunt"), ("nephew", "niece"), ("grandfather", "grandmother"), ("boyfriend", "girlfriend"),
+        ("gentleman", "lady"), ("gentlemen", "ladies"), ("king", "queen"), ("mr", "mrs"),
+        ("male", "female"), ("males", "females"), ("masculine", "feminine"),
+        ("actor", "actress"), ("waiter", "waitress"), ("chairman", "chairwoman"), ("spokesman", "spokeswoman"),
+    ],
+    "age": [
+        ("young", "middle-aged"), ("younger", "older"), ("teenager", "pensioner"), ("teenagers", "pensioners"),
+    ],
+}
+
+
+def _trie_pattern(words):
+    """A regex matching exactly ``words``, with shared prefixes factored out."""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def walk(node):
+        branches = [re.escape(char) + walk(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return walk(trie)
+
+
+def _casings(term, counterpart):
+    yield term, counterpart
+    yield term[0].upper() + term[1:], counterpart[0].upper() + counterpart[1:]
+    yield term.upper(), counterpart.upper()
+
+
+class SwapLexicon:
+    """Bidirectional term swaps per attribute, compiled into a single matcher.
+
+    ``swaps`` maps attribute names to ``(term, counterpart)`` pairs (default:
+    ``DEFAULT_SWAPS``). Every pair swaps both ways; a term listed in several
+    pairs maps to its first counterpart.
+    """
+
+    def __init__(self, swaps=None):
+        self.swaps = {attribute: [tuple(pair) for pair in pairs]
+                      for attribute, pairs in (DEFAULT_SWAPS if swaps is None else swaps).items()}
+        self.replacement, self.attribute = {}, {}
+        for attribute, pairs in self.swaps.items():
+            for a, b in pairs:
+                for term, counterpart in ((a.lower(), b.lower()), (b.lower(), a.lower())):
+                    if term in self.attribute and self.attribute[term] != attribute:
+                        raise ValueError(f"Term {term!r} is listed under both {self.attribute[term]!r} and {attribute!r}.")
+                    self.replacement.setdefault(term, counterpart)
+                    self.attribute[term] = attribute
+        # Every casing of every term, mapped to its swap and to its lowercase form.
+        self._table, self._lower = {}, {}
+        for term, counterpart in self.replacement.items():
+            for cased, cased_counterpart in _casings(term, counterpart):
+                self._table[cased] = cased_counterpart
+                self._lower[cased] = term
+        # The lookahead lets the regex engine skip positions that cannot start a word.
+        self.pattern = re.compile(r"\b(?=[^\W\d_])" + _trie_pattern(self._table) + r"\b")
+
+    @classmethod
+    def from_json(cls, path):
+        """Lexicon from a ``{"attribute": [["term", "counterpart"], ...]}`` JSON file."""
+        with open(path, encoding="utf-8") as handle:
+            return cls(json.load(handle))
+
+    def __reduce__(self):
+        return type(self), (self.swaps,)
+
+    def _replacer(self, counts, seen):
+        table, lower = self._table, self._lower
+
+        def replace(match):
+            word = match.group()
+            term = lower[word]
+            counts[term] = counts.get(term, 0) + 1
+            seen.add(term)
+            return table[word]
+
+        return replace
+
+    def swap(self, text, counts=None):
+        """``text`` with every lexicon term swapped; matched terms are tallied in the ``counts`` dict."""
+        if counts is None:
+            table = self._table
+            return self.pattern.sub(lambda match: table[match.group()], text)
+        return self.pattern.sub(self._replacer(counts, set()), text)
+
+
+class AugmentationStats(NamedTuple):
+    documents: int
+    augmented: int           # documents with at least one swap
+    by_attribute: pd.DataFrame  # attribute: swaps and documents touched
+    terms: pd.DataFrame      # one row per swapped term: attribute, replacement, count
+
+
+_worker_lexicon = None
+
+
+def _init_worker(lexicon):
+    global _worker_lexicon
+    _worker_lexicon = lexicon
+
+
+def _augment_block(block, fields, keep_original, lexicon=None):
+    """Augmented JSONL bytes of one block of lines, its term counts and per-document attribute hits."""
+    lexicon = lexicon or _worker_lexicon
+    first_line, lines = block
+    output, terms, touched = [], {}, Counter()
+    documents = augmented = 0
+    # One callback for the whole block: it tallies terms block-wide and
+    # collects each document's terms in ``seen``, which is reset per document.
+    seen = set()
+    replace = lexicon._replacer(terms, seen)
+    for offset, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"Line {first_line + offset + 1} is not valid JSON: {exc}") from None
+        documents += 1
+        seen.clear()
+        swapped = dict(record)
+        for field in fields:
+            if isinstance(record.get(field), str):
+                swapped[field] = lexicon.pattern.sub(replace, record[field])
+        if keep_original:
+            output.append(line if line.endswith(b"\n") else line + b"\n")
+        if seen:
+            augmented += 1
+            swapped[COUNTERFACTUAL_FIELD] = True
+            output.append(json.dumps(swapped, ensure_ascii=False).encode() + b"\n")
+            for attribute in {lexicon.attribute[term] for term in seen}:
+                touched[attribute] += 1
+    return b"".join(output), documents, augmented, Counter(terms), touched
+
+
+def _open(path, mode):
+    return gzip.open(path, mode) if str(path).endswith(".gz") else open(path, mode)
+
+
+def _blocks(handle, block_bytes):
+    line = 0
+    while True:
+        lines = handle.readlines(block_bytes)
+        if not lines:
+            return
+        yield line, lines
+        line += len(lines)
+
+
+def augment_file(source, destination, fields=("text",), lexicon=None, keep_original=True, jobs=None,
+                 block_bytes=DEFAULT_BLOCK_BYTES):
+    """Stream a JSONL corpus into ``destination`` with counterfactual copies of its records.
+
+    For every record whose ``fields`` contain a lexicon term, a copy with the
+    terms swapped and ``"counterfactual": true`` is written right after the
+    original (or alone, with ``keep_original=False``). Either file may be
+    gzipped (``.gz``). Blocks of about ``block_bytes`` are augmented in
+    ``jobs`` worker processes (default: all cores; ``1`` runs in-process).
+    """
+    lexicon = lexicon or SwapLexicon()
+    fields = [fields] if isinstance(fields, str) else list(fields)
+    jobs = jobs or os.cpu_count() or 1
+    documents = augmented = 0
+    terms, touched = Counter(), Counter()
+
+    def collect(result):
+        nonlocal documents, augmented
+        data, n, changed, block_terms, block_touched = result
+        target.write(data)
+        documents += n
+        augmented += changed
+        terms.update(block_terms)
+        touched.update(block_touched)
+
+    with _open(source, "rb") as handle, _open(destination, "wb") as target:
+        if jobs == 1:
+            for block in _blocks(handle, block_bytes):
+                collect(_augment_block(block, fields, keep_original, lexicon))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(lexicon,)) as pool:
+                pending = deque()
+                for block in _blocks(handle, block_bytes):
+                    pending.append(pool.submit(_augment_block, block, fields, keep_original))
+                    if len(pending) >= 2 * jobs:
+                        collect(pending.popleft().result())
+                while pending:
+                    collect(pending.popleft().result())
+
+    table = pd.DataFrame(
+        [(lexicon.attribute[term], term, lexicon.replacement[term], count) for term, count in terms.most_common()],
+        columns=["attribute", "term", "replacement", "count"],
+    )
+    by_attribute = pd.DataFrame({
+        "swaps": table.groupby("attribute")["count"].sum(),
+        "documents": pd.Series(touched, dtype="int64"),
+    }).reindex(list(lexicon.swaps)).fillna(0).astype("int64").rename_axis("attribute")
+    return AugmentationStats(documents, augmented, by_attribute, table)
@@ -0,0 +1,98 @@
+"""Bootstrap confidence intervals for per-group metrics.
+
+Every metric in ``METRICS`` is a function of a group's confusion counts, so
+the bootstrap never has to touch the rows. In the Poisson bootstrap every row
+gets an independent ``Poisson(1)`` weight; the weighted size of a
+``(group, y_true, y_pred)`` cell holding ``n`` rows is then a sum of ``n``
+``Poisson(1)`` draws, i.e. a single ``Poisson(n)`` draw. One vectorized
+``rng.poisson(counts)`` per batch of resamples is therefore exactly the
+row-level Poisson bootstrap, at a cost of ``O(resamples x groups)`` whether
+the counts came from a thousand rows or a billion.
+
+Resamples are drawn in fixed-size batches, each from its own child of one
+``SeedSequence``, and the batches are fanned out over a process pool once the
+work is large enough to pay for the worker start-up. Which random numbers a
+resample sees depends on the batching only, so results are identical for any
+``n_jobs``.
+"""
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import METRICS, _rates
+
+BATCH_SIZE = 250
+
+# Below this many Poisson draws (resamples x groups x 4) a single process
+# finishes before a pool would have started.
+PARALLEL_MIN_DRAWS = 4_000_000
+
+
+class BootstrapCI(NamedTuple):
+    by_group: pd.DataFrame
+    difference: pd.DataFrame
+
+
+def _resample_rates(counts, size, seed):
+    """Metric table of ``size`` Poisson resamples of ``(n_groups, 2, 2)`` counts."""
+    rng = np.random.default_rng(seed)
+    resampled = rng.poisson(counts, size=(size, *counts.shape))
+    table = _rates(resampled)
+    # A resample that happens to contain no positives (or negatives) says
+    # nothing about TPR (FPR); leave it out instead of counting it as 0.
+    table[..., 2][resampled[..., 1, :].sum(axis=-1) == 0] = np.nan
+    table[..., 3][resampled[..., 0, :].sum(axis=-1) == 0] = np.nan
+    return table
+
+
+def bootstrap_rates(counts, n_resamples=1000, seed=0, n_jobs=None):
+    """``(n_resamples, n_groups, len(METRICS))`` metric values under the Poisson bootstrap.
+
+    ``n_jobs`` caps the worker processes (default: all cores); small jobs
+    always run in-process.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    sizes = [min(BATCH_SIZE, n_resamples - start) for start in range(0, n_resamples, BATCH_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(sizes))
+    if n_jobs > 1 and n_resamples * counts.size >= PARALLEL_MIN_DRAWS:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            batches = list(pool.map(_resample_rates, [counts] * len(sizes), sizes, seeds))
+    else:
+        batches = [_resample_rates(counts, size, batch_seed) for size, batch_seed in zip(sizes, seeds)]
+    return np.concatenate(batches)
+
+
+def bootstrap_ci(metrics, n_resamples=1000, confidence=0.95, seed=0, n_jobs=None):
+    """Percentile confidence intervals for a ``DisaggregatedMetrics``.
+
+    Returns ``BootstrapCI(by_group, difference)``. ``by_group`` is indexed like
+    ``metrics.by_group`` with ``(metric, estimate | lower | upper)`` columns;
+    ``difference`` holds the same three columns for the between-groups
+    ``difference()`` of each metric. Sampling noise only ever widens a
+    max-minus-min gap, so with many small groups that interval can sit above
+    the point estimate; read it as a bound on how large the gap may be.
+    """
+    samples = bootstrap_rates(metrics.counts, n_resamples, seed=seed, n_jobs=n_jobs)
+    tail = (1 - confidence) / 2 * 100
+    with warnings.catch_warnings():
+        # Unobserved groups are NaN in every resample.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        lower, upper = np.nanpercentile(samples, [tail, 100 - tail], axis=0)
+        gaps = np.nanmax(samples, axis=1) - np.nanmin(samples, axis=1)
+        gap_lower, gap_upper = np.nanpercentile(gaps, [tail, 100 - tail], axis=0)
+
+    estimate = metrics.by_group
+    by_group = pd.concat({
+        metric: pd.DataFrame({"estimate": estimate[metric], "lower": lower[:, j], "upper": upper[:, j]})
+        for j, metric in enumerate(METRICS)
+    }, axis=1)
+    difference = pd.DataFrame({
+        "estimate": metrics.difference(), "lower": gap_lower, "upper": gap_upper,
+    }, index=list(METRICS))
+    return BootstrapCI(by_group, difference)
@@ -0,0 +1,233 @@
+"""``fairness-audit``: run the playbook's audits from the command line.
+
+Usage::
+
+    python -m fairness_audit risk --domain-impact High --autonomy "Human over the loop" \\
+        --decision-impact "Affects Opportunities" --scale "> 100k people" --fail-on "High Risk"
+    python -m fairness_audit portfolio inventory.csv --column scale=users_per_year --format markdown
+    python -m fairness_audit disaggregate preds.parquet --y-true label --y-pred pred \\
+        --sensitive gender race --max-difference accuracy=0.05 --format markdown
+    python -m fairness_audit disaggregate preds.parquet --y-true label --y-pred pred \\
+        --sensitive gender --store metrics.db --model resume-screener
+    python -m fairness_audit rerank catalog.csv --score relevance --group provider \\
+        --protected minority --boost 0.2 -k 50 --max-exposure-gap 0.05
+    python -m fairness_audit monitor prediction_log.parquet --timestamp ts --group gender \\
+        --y-true label --y-pred pred --bucket 1h --window 24 --fail-on Critical
+    python -m fairness_audit augment corpus.jsonl.gz augmented.jsonl.gz --field prompt completion
+    python -m fairness_audit rasci responsibilities.csv --task-column task
+    python -m fairness_audit fusion --text 0.8 --vision 0.7 --audio 0.3 --dominant Audio
+    python -m fairness_audit batch audits.json --jobs 8 --output report.md --format markdown
+    python -m fairness_audit disaggregate preds.parquet --y-true label --y-pred pred --sensitive gender \\
+        --evidence evidence.db --requirement "EU AI Act Art. 10" --build "$CI_PIPELINE_ID"
+
+The exit status is 1 when any audit failed its gate or could not run, so the
+command can guard a CI stage directly. With ``--evidence`` every report is
+also recorded, as JSON, in a content-addressed evidence store.
+"""
+import argparse
+import json
+import os
+import sys
+
+from fairness_audit.evidence import EVIDENCE_ENV, REQUIREMENTS, Artifact, EvidenceStore
+from fairness_audit.fusion import MODALITIES
+from fairness_audit.ingest import DEFAULT_CHUNKSIZE
+from fairness_audit.metrics import METRICS
+from fairness_audit.monitoring import SEVERITIES
+from fairness_audit.report import (
+    render_json, render_markdown, run_audit, run_batch,
+)
+from fairness_audit.risk import AUTONOMY, DECISION_IMPACT, DOMAIN_IMPACT, FACTORS, SCALE, TIERS
+from fairness_audit.store import STORE_ENV
+
+
+def _parse_label(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _parse_pairs(pairs, cast=str):
+    parsed = {}
+    for pair in pairs or []:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {pair!r}.")
+        parsed[key] = cast(value)
+    return parsed
+
+
+def _load_manifest(path):
+    """Audit specs from a JSON list (or ``{"audits": [...]}``); file paths resolve against the manifest."""
+    with open(path, encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    specs = manifest["audits"] if isinstance(manifest, dict) else manifest
+    root = os.path.dirname(os.path.abspath(path))
+    for spec in specs:
+        for key in ("sources", "source", "destination", "lexicon"):
+            if spec.get(key):
+                paths = [spec[key]] if isinstance(spec[key], str) else spec[key]
+                resolved = [os.path.join(root, p) for p in paths]
+                spec[key] = resolved[0] if isinstance(spec[key], str) else resolved
+    return specs
+
+
+def build_parser():
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=["json", "markdown"], default="json")
+    output.add_argument("--output", "-o", help="write the report here instead of stdout")
+    output.add_argument("--evidence", default=os.environ.get(EVIDENCE_ENV),
+                        help=f"also record each report in this SQLite evidence store (default: ${EVIDENCE_ENV})")
+    output.add_argument("--requirement", action="append", default=[],
+                        help=f"regulatory requirement the reports evidence, e.g. {', '.join(map(repr, REQUIREMENTS))} (repeatable)")
+    output.add_argument("--build", help="CI build or pipeline id to record with the reports")
+
+    parser = argparse.ArgumentParser(prog="fairness-audit", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    risk = commands.add_parser("risk", parents=[output], help="inherent-risk score and tier of one system")
+    risk.add_argument("--domain-impact", required=True, choices=list(DOMAIN_IMPACT))
+    risk.add_argument("--autonomy", required=True, choices=list(AUTONOMY))
+    risk.add_argument("--decision-impact", required=True, choices=list(DECISION_IMPACT))
+    risk.add_argument("--scale", required=True, choices=list(SCALE))
+    risk.add_argument("--fail-on", choices=TIERS, help="fail when the tier is this one or higher")
+
+    portfolio = commands.add_parser("portfolio", parents=[output], help="score and tier of every system in an inventory")
+    portfolio.add_argument("source", help="CSV/Parquet inventory, one row per AI system")
+    portfolio.add_argument("--column", action="append", metavar="FACTOR=COLUMN",
+                           help=f"inventory column holding a factor, if not named after it; factors: {', '.join(FACTORS)} (repeatable)")
+    portfolio.add_argument("--fail-on", choices=TIERS, help="fail when any system is in this tier or higher")
+
+    disaggregate = commands.add_parser("disaggregate", parents=[output], help="per-group metrics of prediction files")
+    disaggregate.add_argument("sources", nargs="+", help="CSV/Parquet files, row-aligned if several")
+    disaggregate.add_argument("--y-true", required=True)
+    disaggregate.add_argument("--y-pred", required=True)
+    disaggregate.add_argument("--sensitive", required=True, nargs="+", help="sensitive feature columns")
+    disaggregate.add_argument("--pos-label", default="1", type=_parse_label)
+    disaggregate.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    disaggregate.add_argument("--max-difference", action="append", metavar="METRIC=VALUE",
+                              help="fail when a metric's between-groups difference exceeds VALUE (repeatable)")
+    disaggregate.add_argument("--store", default=os.environ.get(STORE_ENV),
+                              help=f"also append the per-group metrics to this SQLite metric store (default: ${STORE_ENV})")
+    disaggregate.add_argument("--model", help="model name to store the metrics under (default: the file names)")
+
+    rerank = commands.add_parser("rerank", parents=[output], help="provider exposure after fairness re-ranking")
+    rerank.add_argument("source", help="CSV/Parquet catalog, one row per item")
+    rerank.add_argument("--score", required=True, help="relevance score column")
+    rerank.add_argument("--group", required=True, help="provider group column")
+    rerank.add_argument("--protected", required=True, nargs="+", type=_parse_label, help="group label(s) to boost")
+    rerank.add_argument("--boost", type=float, default=0.0)
+    rerank.add_argument("-k", type=int, default=10)
+    rerank.add_argument("--max-exposure-gap", type=float)
+
+    monitor = commands.add_parser("monitor", parents=[output], help="fairness drift alerts over a timestamped prediction log")
+    monitor.add_argument("source", help="CSV/Parquet log, ordered by time")
+    monitor.add_argument("--timestamp", required=True)
+    monitor.add_argument("--group", required=True, help="sensitive feature column")
+    monitor.add_argument("--y-true", required=True)
+    monitor.add_argument("--y-pred", required=True)
+    monitor.add_argument("--score", help="model score column in [0, 1], for the PSI test")
+    monitor.add_argument("--pos-label", default="1", type=_parse_label)
+    monitor.add_argument("--bucket", default="1h", help="bucket width, e.g. 15min, 1h, 1D")
+    monitor.add_argument("--window", type=int, default=24, help="buckets per sliding window")
+    monitor.add_argument("--metric", choices=METRICS, default="selection_rate")
+    monitor.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    monitor.add_argument("--fail-on", choices=SEVERITIES, help="fail on any alert of this severity or above")
+
+    augment = commands.add_parser("augment", parents=[output], help="counterfactual copies of a JSONL corpus for fine-tuning")
+    augment.add_argument("source", help="JSONL corpus, optionally gzipped")
+    augment.add_argument("destination", help="JSONL file to write (.gz to compress)")
+    augment.add_argument("--field", nargs="+", default=["text"], help="text fields to swap terms in")
+    augment.add_argument("--lexicon", help='JSON swap lexicon: {"attribute": [["term", "counterpart"], ...]}')
+    augment.add_argument("--counterfactual-only", action="store_true", help="write only the counterfactual copies")
+    augment.add_argument("--jobs", type=int, help="worker processes (default: all cores)")
+
+    rasci = commands.add_parser("rasci", parents=[output], help="RASCI rule violations of a responsibility matrix")
+    rasci.add_argument("source", help="CSV/Parquet matrix: one row per task and one column per role, or long with --role-column")
+    rasci.add_argument("--task-column", help="task name column (default: the first, or 'task' when long)")
+    rasci.add_argument("--role-column", help="read a long matrix: one row per task, role and assignment")
+    rasci.add_argument("--assignment-column", default="assignment", help="assignment column of a long matrix")
+
+    fusion = commands.add_parser("fusion", parents=[output], help="fused multi-modal score under several weightings")
+    for modality in MODALITIES:
+        fusion.add_argument(f"--{modality.lower()}", type=float, required=True, help=f"{modality} score")
+    fusion.add_argument("--dominant", choices=MODALITIES, help="weight this modality at 0.8")
+
+    batch = commands.add_parser("batch", parents=[output], help="run the audits listed in a JSON manifest")
+    batch.add_argument("manifest", help='JSON list of {"audit": "risk" | "portfolio" | "disaggregate" | "rerank" | "monitor" | "augment" | "rasci" | "fusion", ...arguments}')
+    batch.add_argument("--jobs", type=int, help="worker processes (default: all cores)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "batch":
+        reports = run_batch(_load_manifest(args.manifest), jobs=args.jobs)
+    else:
+        if args.command == "risk":
+            spec = {"domain_impact": args.domain_impact, "autonomy": args.autonomy,
+                    "decision_impact": args.decision_impact, "scale": args.scale, "fail_on": args.fail_on}
+        elif args.command == "portfolio":
+            try:
+                columns = _parse_pairs(args.column)
+            except argparse.ArgumentTypeError as exc:
+                parser.error(str(exc))
+            unknown = [factor for factor in columns if factor not in FACTORS]
+            if unknown:
+                parser.error(f"Unknown factors {unknown}; expected some of {list(FACTORS)}.")
+            spec = {"source": args.source, "columns": columns, "fail_on": args.fail_on}
+        elif args.command == "disaggregate":
+            try:
+                limits = _parse_pairs(args.max_difference, cast=float)
+            except argparse.ArgumentTypeError as exc:
+                parser.error(str(exc))
+            spec = {"sources": args.sources, "y_true": args.y_true, "y_pred": args.y_pred,
+                    "sensitive_columns": args.sensitive, "pos_label": args.pos_label,
+                    "chunksize": args.chunksize, "max_difference": limits or None,
+                    "store": args.store, "model": args.model}
+        elif args.command == "rerank":
+            spec = {"source": args.source, "score_column": args.score, "group_column": args.group,
+                    "protected": args.protected, "fairness_boost": args.boost, "k": args.k,
+                    "max_exposure_gap": args.max_exposure_gap}
+        elif args.command == "monitor":
+            spec = {"source": args.source, "timestamp_column": args.timestamp, "group_column": args.group,
+                    "y_true": args.y_true, "y_pred": args.y_pred, "score_column": args.score,
+                    "pos_label": args.pos_label, "bucket": args.bucket, "window": args.window,
+                    "metric": args.metric, "chunksize": args.chunksize, "fail_on": args.fail_on}
+        elif args.command == "augment":
+            spec = {"source": args.source, "destination": args.destination, "fields": args.field,
+                    "lexicon": args.lexicon, "keep_original": not args.counterfactual_only, "jobs": args.jobs}
+        elif args.command == "rasci":
+            spec = {"source": args.source, "task_column": args.task_column, "role_column": args.role_column,
+                    "assignment_column": args.assignment_column}
+        else:
+            spec = {"scores": {m: getattr(args, m.lower()) for m in MODALITIES}, "dominant": args.dominant}
+        reports = [run_audit({"audit": args.command, **spec})]
+
+    rendered = render_markdown(reports) if args.format == "markdown" else render_json(reports)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered)
+    else:
+        sys.stdout.write(rendered if rendered.endswith("\n") else rendered + "\n")
+
+    if args.evidence:
+        store = EvidenceStore(args.evidence)
+        try:
+            store.put_many(
+                Artifact(render_json([report]), report.name, args.requirement, report.audit,
+                         getattr(args, "model", None), args.build)
+                for report in reports
+            )
+        finally:
+            store.close()
+
+    for report in reports:
+        if "error" in report.summary:
+            print(f"fairness-audit: {report.name}: {report.summary['error']}", file=sys.stderr)
+    return 1 if any(report.passed is False for report in reports) else 0
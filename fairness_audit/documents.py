@@ -0,0 +1,431 @@
+"""Model Cards and Compliance Addenda filled in from audit results.
+
+The Part 2 Model Card and the Part 4 Compliance Addendum are built from a
+model's ``ModelEvidence``: its documentation fields, the per-group
+confusion counts of its fairness audit (``DisaggregatedMetrics``), its
+risk classification and the CI gate it was held to. Findings such as "TPR
+difference of 2.8% across gender" or the worst intersectional group are
+computed, not typed in.
+
+Each document is a plain structure of sections, rendered by one of two Jinja
+templates (Markdown, HTML) that are compiled once at import. ``write_bundle``
+renders many models' documents in worker processes and streams them into a
+ZIP file entry by entry.
+"""
+import datetime
+import os
+import re
+import tempfile
+import warnings
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import jinja2
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import METRICS, DisaggregatedMetrics, _rates
+from fairness_audit.risk import MAX_SCORE, TIERS, RiskAssessment
+
+DOCUMENTS = ("model_card", "compliance_addendum")
+FORMATS = ("md", "html")
+FILE_NAMES = {"model_card": "Model_Card", "compliance_addendum": "Compliance_Addendum"}
+METRIC_LABELS = {
+    "accuracy": "Accuracy",
+    "selection_rate": "Selection rate",
+    "true_positive_rate": "TPR",
+    "false_positive_rate": "FPR",
+}
+FAIRNESS_DEFINITIONS = {
+    "accuracy": "Accuracy Parity",
+    "selection_rate": "Demographic Parity (Selection Rate Parity)",
+    "true_positive_rate": "Equal Opportunity (True Positive Rate Parity)",
+    "false_positive_rate": "False Positive Rate Parity",
+}
+MIN_GROUP_SIZE = 100
+NOT_DOCUMENTED = "Not documented."
+
+_MARKDOWN = """\
+# {{ title }}
+
+{% for label, value in meta %}
+**{{ label }}:** {{ value }}{{ "  " if not loop.last }}
+{% endfor %}
+{% for section in sections %}
+
+## {{ section.heading }}
+
+{% for label, value in section["items"] %}
+- **{{ label }}:** {{ value }}
+{% endfor %}
+{% if section.table %}
+{{ "\\n" if section["items"] }}| {{ section.table.columns | join(" | ") }} |
+|{% for _ in section.table.columns %} --- |{% endfor %}
+
+{% for row in section.table.rows %}
+| {{ row | join(" | ") }} |
+{% endfor %}
+{% endif %}
+{% endfor %}
+"""
+
+_HTML = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{{ title }}</title>
+<style>
+body { font-family: sans-serif; max-width: 60rem; margin: 2rem auto; line-height: 1.5; }
+table { border-collapse: collapse; } th, td { border: 1px solid #ccc; padding: 0.25rem 0.6rem; text-align: left; }
+</style>
+</head>
+<body>
+<h1>{{ title }}</h1>
+<p>{% for label, value in meta %}<strong>{{ label }}:</strong> {{ value }}{% if not loop.last %}<br>{% endif %}{% endfor %}</p>
+{% for section in sections %}
+<h2>{{ section.heading }}</h2>
+<ul>
+{% for label, value in section["items"] %}
+<li><strong>{{ label }}:</strong> {{ value }}</li>
+{% endfor %}
+</ul>
+{% if section.table %}
+<table>
+<tr>{% for column in section.table.columns %}<th>{{ column }}</th>{% endfor %}</tr>
+{% for row in section.table.rows %}
+<tr>{% for cell in row %}<td>{{ cell }}</td>{% endfor %}</tr>
+{% endfor %}
+</table>
+{% endif %}
+{% endfor %}
+</body>
+</html>
+"""
+
+_TEMPLATES = {
+    "md": jinja2.Environment(trim_blocks=True, lstrip_blocks=True, autoescape=False).from_string(_MARKDOWN),
+    "html": jinja2.Environment(trim_blocks=True, lstrip_blocks=True, autoescape=True).from_string(_HTML),
+}
+
+
+class ModelEvidence(NamedTuple):
+    """Everything the documents of one model are filled from.
+
+    ``details`` holds the free-text documentation fields: ``name``,
+    ``version``, ``developer``, ``date``, ``primary_use``, ``out_of_scope``,
+    ``training_data``, ``evaluation_data``, ``mitigation``, ``risks``,
+    ``regulations`` (a list), ``legal_basis`` and ``oversight``; missing ones
+    are derived from the audit where possible, else marked as not
+    documented. ``max_difference`` is the CI gate (metric -> largest
+    acceptable between-groups difference) and ``reviews`` a list of
+    ``(date, review, outcome)`` entries for the audit log.
+    """
+    details: dict
+    metrics: DisaggregatedMetrics
+    risk: Optional[RiskAssessment] = None
+    answers: Optional[dict] = None  # factor -> level of the risk assessment
+    max_difference: Optional[dict] = None
+    reviews: tuple = ()
+    primary_metric: str = "true_positive_rate"
+
+
+def _pct(value):
+    return "n/a" if np.isnan(value) else f"{value:.1%}"
+
+
+def _points(value):
+    return "n/a" if np.isnan(value) else f"{value * 100:.1f} pts"
+
+
+def _today():
+    return datetime.date.today().isoformat()
+
+
+def _group_label(group):
+    return ", ".join(map(str, group)) if isinstance(group, tuple) else str(group)
+
+
+def _spread(rates):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN metric columns
+        return np.nanmax(rates, axis=0) - np.nanmin(rates, axis=0)
+
+
+class _Facts(NamedTuple):
+    columns: list       # sensitive feature names
+    labels: list        # one label per group
+    sizes: np.ndarray   # predictions per group
+    rates: np.ndarray   # (groups, METRICS)
+    overall: np.ndarray
+    difference: np.ndarray  # between-groups difference per metric
+    marginal: dict      # feature -> between-groups difference per metric over that feature alone
+
+
+def _facts(metrics):
+    """Everything the documents quote, from the confusion counts in one pass of numpy."""
+    counts, groups = metrics.counts, metrics.groups
+    rates = _rates(counts)
+    columns = [name or "group" for name in groups.names]
+    marginal = {}
+    if isinstance(groups, pd.MultiIndex):
+        for i, column in enumerate(columns):
+            summed = np.zeros((len(groups.levels[i]), 2, 2), dtype=np.int64)
+            np.add.at(summed, groups.codes[i], counts)
+            marginal[column] = _spread(_rates(summed[summed.sum(axis=(1, 2)) > 0]))
+    return _Facts(columns, [_group_label(g) for g in groups], counts.sum(axis=(1, 2)), rates,
+                  _rates(counts.sum(axis=0)), _spread(rates), marginal)
+
+
+def gate_status(evidence, facts=None):
+    """``(passed, breaches)`` of the evidence's CI gate; ``passed`` is ``None`` without a gate."""
+    if not evidence.max_difference:
+        return None, {}
+    facts = facts or _facts(evidence.metrics)
+    breaches = {}
+    for metric, limit in evidence.max_difference.items():
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {list(METRICS)}.")
+        difference = float(facts.difference[METRICS.index(metric)])
+        if difference > limit:
+            breaches[metric] = difference
+    return not breaches, breaches
+
+
+def _gate_text(evidence, facts):
+    passed, breaches = gate_status(evidence, facts)
+    if passed is None:
+        return "No CI gate configured."
+    limits = ", ".join(f"{METRIC_LABELS[m]} difference ≤ {_points(v)}" for m, v in evidence.max_difference.items())
+    if passed:
+        return f"Passed ({limits})."
+    failed = "; ".join(f"{METRIC_LABELS[m]} difference {_points(v)} exceeds {_points(evidence.max_difference[m])}"
+                       for m, v in breaches.items())
+    return f"Failed: {failed}."
+
+
+def _findings(evidence, facts):
+    """Per-attribute differences and the lowest group of the primary metric."""
+    i = METRICS.index(evidence.primary_metric)
+    label = METRIC_LABELS[evidence.primary_metric]
+    if facts.marginal:
+        per_attribute = [f"{_points(facts.marginal[c][i])} across {c}" for c in facts.columns]
+        per_attribute.append(f"{_points(facts.difference[i])} across their intersections")
+    else:
+        per_attribute = [f"{_points(facts.difference[i])} across {facts.columns[0]}"]
+    findings = f"{label} difference between groups of {', '.join(per_attribute[:-1])}{' and ' if len(per_attribute) > 1 else ''}{per_attribute[-1]}."
+
+    values = np.where(facts.sizes >= MIN_GROUP_SIZE, facts.rates[:, i], np.nan)
+    if np.isnan(values).all():
+        return findings, "No group has enough examples for a reliable comparison."
+    worst = int(np.nanargmin(values))
+    scope = "intersectional group" if facts.marginal else "group"
+    gaps = (f"Lowest {label} in the {scope} '{facts.labels[worst]}': {_pct(values[worst])}, "
+            f"{_points(facts.overall[i] - values[worst])} below the overall {_pct(facts.overall[i])}.")
+    return findings, gaps
+
+
+def _small_groups(facts):
+    small = [(label, size) for label, size in zip(facts.labels, facts.sizes) if 0 < size < MIN_GROUP_SIZE]
+    if not small:
+        return f"Every group has at least {MIN_GROUP_SIZE} evaluation examples."
+    listed = ", ".join(f"'{label}' (n={size:,})" for label, size in small)
+    return f"Limitation: data for {listed} was insufficient for robust analysis (fewer than {MIN_GROUP_SIZE} examples)."
+
+
+def _meta(details):
+    return [("Model version", details.get("version", NOT_DOCUMENTED)), ("Date", details.get("date") or _today())]
+
+
+def _risk_text(risk):
+    return f"{risk.tier} (score {risk.score}/{MAX_SCORE})." if risk else NOT_DOCUMENTED
+
+
+def model_card(evidence):
+    """The Part 2 Enhanced Model Card of one model, as a renderable structure."""
+    details, facts = evidence.details, _facts(evidence.metrics)
+    findings, gaps = _findings(evidence, facts)
+    observed = np.flatnonzero(facts.sizes > 0)
+    table = {
+        "columns": ["Group", "n"] + [METRIC_LABELS[m] for m in METRICS],
+        "rows": [[facts.labels[g], f"{facts.sizes[g]:,}"] + [_pct(v) for v in facts.rates[g]] for g in observed],
+    }
+    intersectional = bool(facts.marginal)
+    sections = [
+        {"heading": "Model Details", "items": [
+            ("Model developer", details.get("developer", NOT_DOCUMENTED)),
+            ("Model date", details.get("date") or _today()),
+            ("Model version", details.get("version", NOT_DOCUMENTED)),
+        ]},
+        {"heading": "Intended Use", "items": [
+            ("Primary use", details.get("primary_use", NOT_DOCUMENTED)),
+            ("Out-of-scope uses", details.get("out_of_scope", NOT_DOCUMENTED)),
+        ]},
+        {"heading": "Training Data", "items": [
+            ("Source", details.get("training_data", NOT_DOCUMENTED)),
+            ("Key Demographics", f"Analysis performed on {' and '.join(facts.columns)} subgroups. {_small_groups(facts)}"),
+        ]},
+        {"heading": "Evaluation Data", "items": [
+            ("Dataset", details.get("evaluation_data", NOT_DOCUMENTED)),
+            ("Size", f"{int(facts.sizes.sum()):,} predictions across {len(observed)} groups."),
+            ("Demographics", ", ".join(facts.columns) + "."),
+        ]},
+        {"heading": "Fairness & Intersectional Analysis", "items": [
+            ("Fairness Metrics", FAIRNESS_DEFINITIONS[evidence.primary_metric] + "."),
+            ("Groups Analyzed", ", ".join(facts.columns) + (", and their intersections." if intersectional else ".")),
+            ("Findings", findings),
+            ("Intersectional Gaps" if intersectional else "Largest Gap", gaps),
+            ("Fairness Gate", _gate_text(evidence, facts)),
+            ("Mitigation", details.get("mitigation", NOT_DOCUMENTED)),
+        ], "table": table},
+        {"heading": "Ethical Considerations", "items": [
+            ("Risk Classification", _risk_text(evidence.risk)),
+            ("Risks", details.get("risks", NOT_DOCUMENTED)),
+            ("Mitigations", details.get("oversight", NOT_DOCUMENTED)),
+        ]},
+    ]
+    return {"title": f"Model Card: {details.get('name', 'Unnamed model')}", "meta": _meta(details), "sections": sections}
+
+
+def _regulations(evidence):
+    if evidence.details.get("regulations"):
+        return "; ".join(evidence.details["regulations"]) + "."
+    if evidence.risk is None:
+        return NOT_DOCUMENTED
+    regulations = {
+        TIERS[2]: ["EU AI Act: high-risk obligations (Art. 9-15: risk management, data governance, documentation, human oversight)"],
+        TIERS[1]: ["EU AI Act: transparency obligations (Art. 50)"],
+        TIERS[0]: ["EU AI Act: no mandatory obligations; voluntary codes of conduct (Art. 95)"],
+    }[evidence.risk.tier]
+    answers = evidence.answers or {}
+    if answers.get("autonomy") == "Fully Autonomous" and answers.get("decision_impact") != "Informational":
+        regulations.append("GDPR Art. 22: solely automated decisions with legal or similarly significant effects")
+    return "; ".join(regulations) + "."
+
+
+_OVERSIGHT = {
+    "Human in the loop": "A human reviews and approves every decision before it takes effect.",
+    "Human over the loop": "Decisions take effect automatically; a human monitors them and can intervene or override.",
+    "Fully Autonomous": "Decisions take effect without routine human review; oversight relies on monitoring and appeals.",
+}
+
+
+def compliance_addendum(evidence):
+    """The Part 4 Compliance Addendum of one model, as a renderable structure."""
+    details, risk, facts = evidence.details, evidence.risk, _facts(evidence.metrics)
+    answers = evidence.answers or {}
+    observed = np.flatnonzero(facts.sizes > 0)
+    total = int(facts.sizes.sum())
+    representation = {
+        "columns": ["Group", "n", "Share"],
+        "rows": [[facts.labels[g], f"{facts.sizes[g]:,}", _pct(facts.sizes[g] / total)] for g in observed],
+    }
+    risk_items = [("Result", _risk_text(risk))]
+    if risk:
+        risk_items.append(("Justification", "; ".join(
+            f"{factor.replace('_', ' ').capitalize()}: {answers.get(factor, '?')} ({points} pts)"
+            for factor, points in risk.points.items()) + "."))
+
+    passed, _ = gate_status(evidence, facts)
+    outcome = {True: "Passed", False: "Failed", None: "Completed (no gate)"}[passed]
+    log = [list(map(str, review)) for review in evidence.reviews]
+    log.append([details.get("date") or _today(), "Fairness audit (disaggregated metrics)", outcome])
+    sections = [
+        {"heading": "1. Applicable Regulations & Legal Basis", "items": [
+            ("Regulations", _regulations(evidence)),
+            ("Legal basis for processing", details.get("legal_basis", NOT_DOCUMENTED)),
+        ]},
+        {"heading": "2. Risk Classification", "items": risk_items},
+        {"heading": "3. Data Governance Log", "items": [
+            ("Datasheet", details.get("training_data", NOT_DOCUMENTED)),
+            ("Evaluation data", f"{total:,} predictions; groups by {', '.join(facts.columns)}."),
+            ("Representation", _small_groups(facts)),
+        ], "table": representation},
+        {"heading": "4. Human Oversight Mechanism", "items": [
+            ("Mechanism", details.get("oversight") or _OVERSIGHT.get(answers.get("autonomy"), NOT_DOCUMENTED)),
+            ("Alert conditions", _gate_text(evidence, facts)),
+        ]},
+        {"heading": "5. Log of Audits and Reviews", "items": [], "table": {"columns": ["Date", "Review", "Outcome"], "rows": log}},
+    ]
+    return {"title": f"Compliance Addendum for {details.get('name', 'Unnamed model')}", "meta": _meta(details), "sections": sections}
+
+
+_BUILDERS = {"model_card": model_card, "compliance_addendum": compliance_addendum}
+
+
+def render(document, fmt="md"):
+    """Render a ``model_card``/``compliance_addendum`` structure as Markdown or HTML."""
+    if fmt not in _TEMPLATES:
+        raise ValueError(f"Unknown format {fmt!r}; expected one of {list(FORMATS)}.")
+    return _TEMPLATES[fmt].render(**document)
+
+
+def _slug(name):
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "model"
+
+
+def _folders(evidence):
+    """One folder per model, named after it; a name that slugs to a taken folder gets its position as a suffix."""
+    folders, taken = [], set()
+    for position, model in enumerate(evidence, 1):
+        folder = _slug(model.details.get("name", "model"))
+        if folder in taken:
+            folder = f"{folder}_{position}"
+            while folder in taken:
+                folder += "_"
+        taken.add(folder)
+        folders.append(folder)
+    return folders
+
+
+def render_model(evidence, documents=DOCUMENTS, formats=FORMATS, folder=None):
+    """``(path, text)`` of every document of one model, under ``folder`` (default: named after the model)."""
+    folder = folder or _slug(evidence.details.get("name", "model"))
+    files = []
+    for kind in documents:
+        document = _BUILDERS[kind](evidence)
+        files += [(f"{folder}/{FILE_NAMES[kind]}.{fmt}", render(document, fmt)) for fmt in formats]
+    return files
+
+
+def _render_many(batch, documents, formats):
+    return [render_model(evidence, documents, formats, folder) for evidence, folder in batch]
+
+
+def render_models(evidence, documents=DOCUMENTS, formats=FORMATS, jobs=None, batch_size=16):
+    """Yield ``(path, text)`` for many models, in order, rendered in ``jobs`` worker processes.
+
+    Every model gets its own folder, even when two names slug alike.
+    """
+    evidence = list(evidence)
+    jobs = min(jobs or os.cpu_count() or 1, -(-len(evidence) // batch_size) or 1)
+    models = list(zip(evidence, _folders(evidence)))
+    batches = [models[start:start + batch_size] for start in range(0, len(models), batch_size)]
+    if jobs <= 1:
+        for batch in batches:
+            for files in _render_many(batch, documents, formats):
+                yield from files
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for rendered in pool.map(_render_many, batches, [documents] * len(batches), [formats] * len(batches)):
+            for files in rendered:
+                yield from files
+
+
+def write_bundle(evidence, target, documents=DOCUMENTS, formats=FORMATS, jobs=None):
+    """Write every model's documents into a ZIP archive at ``target`` (a path or binary file); returns the entry count."""
+    entries = 0
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path, text in render_models(evidence, documents, formats, jobs):
+            archive.writestr(path, text)
+            entries += 1
+    return entries
+
+
+def bundle_file(evidence, documents=DOCUMENTS, formats=FORMATS, jobs=None, spool_bytes=8 << 20):
+    """The ZIP bundle in a temporary file, rewound for reading (in memory only up to ``spool_bytes``)."""
+    handle = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+    write_bundle(evidence, handle, documents, formats, jobs)
+    handle.seek(0)
+    return handle
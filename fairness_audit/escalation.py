@@ -0,0 +1,253 @@
+"""Routing of fairness incidents to the decision tiers of Part 2.
+
+Every monitoring alert is classified into a tier (``classify``) and queued
+for that tier's authority: Critical alerts go to the AI Review Board (Tier
+3), disparity warnings to department leadership (Tier 2), other warnings to
+the team (Tier 1). Alerts for the same model, group and test coalesce into
+one open incident; an incident that keeps firing (``escalate_after`` alerts)
+moves up a tier.
+
+Each authority has a heap keyed on ``(severity, received time)``, so
+``resolve`` always hands out the most severe, oldest incident first.
+Coalescing and escalation push a fresh heap entry and leave the old one to
+be skipped on pop (the lazy deletion of the ``heapq`` documentation); the
+heap is rebuilt once most of it is stale.
+
+``submit`` only appends a batch of alerts to an inbox and returns; a
+background thread, started on demand like the governance flusher, routes
+the inbox in slices so readers never wait long for the lock. A burst of
+thousands of alerts therefore costs the caller (a Streamlit callback) a
+column check and a queue append.
+"""
+import collections
+import heapq
+import itertools
+import threading
+import time
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.monitoring import SEVERITIES, Alert
+
+DECISION_TIERS = {
+    1: ("Operational", "Team Leads & Technical Specialists"),
+    2: ("Tactical", "Department Leadership & Fairness Program Leads"),
+    3: ("Strategic", "Executive Leadership & AI Review Board"),
+}
+AUTHORITIES = tuple(authority for _, authority in DECISION_TIERS.values())
+DEFAULT_ESCALATE_AFTER = 24  # a day of hourly windows
+ROUTING_SLICE = 500
+RESOLUTION_HISTORY = 10_000
+
+_RANK = {severity: rank for rank, severity in enumerate(SEVERITIES)}
+
+
+def classify(severity, test):
+    """Decision tier of one alert."""
+    if severity not in _RANK:
+        raise ValueError(f"Unknown severity {severity!r}; expected one of {list(SEVERITIES)}.")
+    if severity == SEVERITIES[-1]:
+        return 3
+    # A gap between groups calls for a threshold or mitigation decision, not a technical fix.
+    return 2 if test == "disparity" else 1
+
+
+class Incident(NamedTuple):
+    id: int
+    model: object
+    group: object
+    test: str
+    severity: str
+    tier: int
+    value: float       # the latest alert's test statistic
+    alerts: int        # alerts coalesced into the incident
+    raised: object     # window end of the first alert
+    received: float    # epoch seconds when the first alert was routed
+
+    @property
+    def authority(self):
+        return DECISION_TIERS[self.tier][1]
+
+
+class EscalationRouter:
+    """Open fairness incidents queued per decision-tier authority.
+
+    Thread-safe, so one router can be held as a Streamlit resource and fed
+    from any session: a triage queue shared by everyone who opens the app. ``clock`` returns epoch seconds (default
+    ``time.time``).
+    """
+
+    def __init__(self, escalate_after=DEFAULT_ESCALATE_AFTER, clock=time.time):
+        self.escalate_after = escalate_after
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._heaps = {authority: [] for authority in AUTHORITIES}
+        self._open = {}   # (model, group, test) -> (Incident, heap sequence number of its live entry)
+        self._sequence = itertools.count()
+        self._ids = itertools.count(1)
+        # Resolution times of the latest ``RESOLUTION_HISTORY`` incidents per authority.
+        self._resolved = {authority: collections.deque(maxlen=RESOLUTION_HISTORY) for authority in AUTHORITIES}
+        self._resolved_total = collections.Counter()
+        self._inbox = collections.deque()
+        self._backlog = 0
+        self._worker = None
+        self._idle = threading.Event()
+        self._idle.set()
+        self.routed = 0
+
+    def submit(self, alerts, model=None):
+        """Queue alerts for routing and return at once; returns how many were queued.
+
+        ``alerts`` is an alert table (``DriftMonitor.alert_table()``, with
+        an optional ``model`` column) or an iterable of ``Alert``; ``model``
+        applies to alerts that do not name one.
+        """
+        table = alerts if isinstance(alerts, pd.DataFrame) else pd.DataFrame(list(alerts), columns=Alert._fields)
+        missing = set(Alert._fields) - set(table.columns)
+        if missing:
+            raise ValueError(f"Alerts need the columns {list(Alert._fields)}; missing {sorted(missing)}.")
+        unknown = set(table["severity"].unique()) - set(SEVERITIES)
+        if unknown:
+            raise ValueError(f"Unknown severities {sorted(unknown)}; expected one of {list(SEVERITIES)}.")
+        if not pd.api.types.is_numeric_dtype(table["value"]):
+            try:
+                table = table.assign(value=pd.to_numeric(table["value"]))
+            except (TypeError, ValueError):
+                raise ValueError("Alert values must be numeric.") from None
+        if table.empty:
+            return 0
+        with self._lock:
+            self._inbox.append((table, model))
+            self._backlog += len(table)
+            self._idle.clear()
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._route_inbox, daemon=True)
+                self._worker.start()
+        return len(table)
+
+    def _route_inbox(self):
+        try:
+            while True:
+                with self._lock:
+                    if not self._inbox:
+                        return
+                    table, model = self._inbox.popleft()
+                received = self.clock()
+                models = table["model"].to_numpy(dtype=object) if "model" in table else np.full(len(table), model, dtype=object)
+                batch = list(zip(models, table["group"].to_numpy(dtype=object), table["test"].to_numpy(dtype=object),
+                                 table["severity"].to_numpy(dtype=object), table["value"].to_numpy(dtype=float),
+                                 table["window_end"].to_numpy(dtype=object)))
+                for start in range(0, len(batch), ROUTING_SLICE):
+                    with self._lock:
+                        for alert in batch[start:start + ROUTING_SLICE]:
+                            self._route(*alert, received)
+                        self._backlog -= len(batch[start:start + ROUTING_SLICE])
+        finally:
+            # Also reached when routing fails: the rest of the failed batch is
+            # dropped, and a new worker takes over any batches queued behind it.
+            with self._lock:
+                self._backlog = sum(len(table) for table, _ in self._inbox)
+                if self._inbox:
+                    self._worker = threading.Thread(target=self._route_inbox, daemon=True)
+                    self._worker.start()
+                else:
+                    self._worker = None
+                    self._idle.set()
+
+    def _route(self, model, group, test, severity, value, raised, received):
+        key = (model, group, test)
+        self.routed += 1
+        current = self._open.get(key)
+        if current is None:
+            incident = Incident(next(self._ids), model, group, test, severity, classify(severity, test),
+                                value, 1, raised, received)
+        else:
+            incident = current[0]
+            if _RANK[severity] > _RANK[incident.severity]:
+                incident = incident._replace(severity=severity)
+            tier = max(incident.tier, classify(severity, test))
+            if (incident.alerts + 1) % self.escalate_after == 0:
+                tier = min(tier + 1, max(DECISION_TIERS))
+            incident = incident._replace(tier=tier, value=value, alerts=incident.alerts + 1)
+            if (incident.severity, incident.tier) == (current[0].severity, current[0].tier):
+                # Same queue position: keep the live heap entry.
+                self._open[key] = (incident, current[1])
+                return
+        self._push(key, incident)
+
+    def _push(self, key, incident):
+        sequence = next(self._sequence)
+        self._open[key] = (incident, sequence)
+        heap = self._heaps[incident.authority]
+        heapq.heappush(heap, (-_RANK[incident.severity], incident.received, sequence, key))
+        if len(heap) > 64 and len(heap) > 2 * len(self._open):
+            self._compact()
+
+    def _live(self, entry):
+        current = self._open.get(entry[3])
+        return current is not None and current[1] == entry[2]
+
+    def _compact(self):
+        for authority, heap in self._heaps.items():
+            heap[:] = [entry for entry in heap if self._live(entry)]
+            heapq.heapify(heap)
+
+    def wait(self, timeout=None):
+        """Block until every submitted alert is routed; returns ``False`` on timeout."""
+        return self._idle.wait(timeout)
+
+    @property
+    def backlog(self):
+        """Alerts submitted but not routed yet."""
+        return self._backlog
+
+    def resolve(self, authority, count=1):
+        """Close the ``count`` most severe, oldest incidents of ``authority``; returns them."""
+        if authority not in self._heaps:
+            raise ValueError(f"Unknown authority {authority!r}; expected one of {list(AUTHORITIES)}.")
+        resolved = []
+        with self._lock:
+            heap, now = self._heaps[authority], self.clock()
+            while heap and len(resolved) < count:
+                entry = heapq.heappop(heap)
+                if self._live(entry):
+                    incident, _ = self._open.pop(entry[3])
+                    self._resolved[authority].append(now - incident.received)
+                    self._resolved_total[authority] += 1
+                    resolved.append(incident)
+        return resolved
+
+    def __len__(self):
+        return len(self._open)
+
+    def queue(self, authority, limit=None):
+        """Open incidents of ``authority`` in the order ``resolve`` would take them."""
+        with self._lock:
+            live = [entry for entry in self._heaps[authority] if self._live(entry)]
+            entries = sorted(live) if limit is None else heapq.nsmallest(limit, live)
+            incidents = [self._open[entry[3]][0] for entry in entries]
+        table = pd.DataFrame(incidents, columns=Incident._fields)
+        table["received"] = pd.to_datetime(table["received"], unit="s")
+        return table.set_index("id")
+
+    def metrics(self, quantiles=(0.5, 0.9)):
+        """Per authority: open incidents by severity, age of the oldest, and time-to-resolution quantiles (seconds)."""
+        now = self.clock()
+        rows = []
+        with self._lock:
+            open_by = collections.defaultdict(list)
+            for incident, _ in self._open.values():
+                open_by[incident.authority].append(incident)
+            resolved = {authority: np.array(times) for authority, times in self._resolved.items()}
+            totals = dict(self._resolved_total)
+        for tier, (level, authority) in DECISION_TIERS.items():
+            incidents, times = open_by[authority], resolved[authority]
+            row = {"tier": tier, "level": level, "authority": authority, "open": len(incidents)}
+            row.update({severity.lower(): sum(i.severity == severity for i in incidents) for severity in SEVERITIES})
+            row["oldest_age"] = now - min(i.received for i in incidents) if incidents else np.nan
+            row["resolved"] = totals.get(authority, 0)
+            row.update({f"ttr_p{round(q * 100)}": np.quantile(times, q) if len(times) else np.nan for q in quantiles})
+            rows.append(row)
+        return pd.DataFrame(rows).set_index("authority")
@@ -0,0 +1,283 @@
+"""Content-addressed, append-only evidence store for compliance audit trails.
+
+Every artifact (a fairness test report, a model card, a datasheet) is
+identified by the SHA-256 of its bytes and stored zlib-compressed once in
+``blobs``, however many times it is recorded: a CI build that produces the
+same report as the previous one only adds a log entry of a few dozen bytes.
+
+``log`` is the audit trail proper, one row per recorded artifact with its
+name, model and build, indexed for lookups by digest, model and name.
+``links`` maps log entries to the regulatory requirements they evidence
+(``REQUIREMENTS`` lists the ones of the Part 4 "Translating Law to Code"
+tab), keyed on ``(requirement, seq)`` so coverage queries read one index
+range. Triggers reject every ``UPDATE`` and ``DELETE``, and each entry
+carries a hash chained over all previous ones, so ``verify`` detects entries
+rewritten outside the store.
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+from fairness_audit.store import _epoch_seconds
+
+EVIDENCE_ENV = "FAIRNESS_AUDIT_EVIDENCE_STORE"
+REQUIREMENTS = {
+    "EU AI Act Art. 10": "Data Quality & Governance",
+    "EU AI Act Art. 14": "Human Oversight",
+    "GDPR Art. 22": "Transparency & Explainability",
+}
+COMPRESSION_LEVEL = 6
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    id INTEGER PRIMARY KEY,
+    digest BLOB NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS log (
+    seq INTEGER PRIMARY KEY,
+    ts INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT,
+    model TEXT,
+    build TEXT,
+    chain BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS log_digest ON log (digest);
+CREATE INDEX IF NOT EXISTS log_model_ts ON log (model, ts);
+CREATE INDEX IF NOT EXISTS log_name_seq ON log (name, seq);
+CREATE TABLE IF NOT EXISTS links (
+    requirement TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (requirement, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS links_seq ON links (seq);
+"""
+
+# The trail is append-only: rows can be added, never changed or removed.
+_TRIGGERS = "".join(
+    f"CREATE TRIGGER IF NOT EXISTS {table}_no_{action.lower()} BEFORE {action} ON {table}"
+    f" BEGIN SELECT RAISE(ABORT, 'the evidence store is append-only'); END;\n"
+    for table in ("blobs", "log", "links") for action in ("UPDATE", "DELETE")
+)
+
+_GENESIS = bytes(32)
+
+
+class Artifact(NamedTuple):
+    """One piece of evidence to record; ``data`` is ``bytes`` or text (stored as UTF-8)."""
+    data: object
+    name: str
+    requirements: tuple = ()
+    kind: Optional[str] = None   # e.g. the audit that produced a report
+    model: Optional[str] = None
+    build: Optional[str] = None
+    timestamp: object = None     # default: now
+
+
+class Entry(NamedTuple):
+    seq: int
+    digest: str  # hex SHA-256 of the artifact's bytes
+    new: bool    # False when the bytes were already stored
+
+
+def _chain(previous, ts, digest, name, kind, model, build, requirements):
+    fields = "\x1f".join([str(ts), name, kind or "", model or "", build or "", *sorted(requirements)])
+    return hashlib.sha256(previous + digest + fields.encode()).digest()
+
+
+def _digest_bytes(digest):
+    if isinstance(digest, bytes):
+        return digest
+    try:
+        raw = bytes.fromhex(digest)
+    except ValueError:
+        raw = b""
+    if len(raw) != 32:
+        raise ValueError(f"{digest!r} is not a SHA-256 hex digest.")
+    return raw
+
+
+class EvidenceStore:
+    """Artifacts and their audit trail in a SQLite file (or ``":memory:"``).
+
+    Like ``MetricStore``, one connection is shared by all threads behind a
+    lock, so a store can be held as a Streamlit resource. Writes take an
+    immediate transaction, so CI jobs in several processes can append to the
+    same file.
+    """
+
+    def __init__(self, path=":memory:", compression_level=COMPRESSION_LEVEL):
+        self.path = str(path)
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA + _TRIGGERS)
+
+    def close(self):
+        self._connection.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._connection, params=params)
+
+    def _existing(self, digests):
+        found = set()
+        for start in range(0, len(digests), 500):
+            chunk = digests[start:start + 500]
+            found.update(row[0] for row in self._connection.execute(
+                f"SELECT digest FROM blobs WHERE digest IN ({', '.join('?' * len(chunk))})", chunk))
+        return found
+
+    def put(self, data, name, requirements=(), kind=None, model=None, build=None, timestamp=None):
+        """Record one artifact; see ``put_many``."""
+        return self.put_many([Artifact(data, name, tuple(requirements), kind, model, build, timestamp)])[0]
+
+    def put_many(self, artifacts):
+        """Append artifacts to the trail in one transaction; returns an ``Entry`` per artifact.
+
+        Bytes already in the store (from earlier calls or earlier in the
+        batch) are not stored again. Hashing and compression run before the
+        write lock is taken.
+        """
+        artifacts = [Artifact(*artifact) for artifact in artifacts]
+        if not artifacts:
+            return []
+        now = int(time.time())
+        payloads = [a.data.encode() if isinstance(a.data, str) else bytes(a.data) for a in artifacts]
+        digests = [hashlib.sha256(payload).digest() for payload in payloads]
+        given = [i for i, a in enumerate(artifacts) if a.timestamp is not None]
+        timestamps = [now] * len(artifacts)
+        for i, ts in zip(given, _epoch_seconds([artifacts[i].timestamp for i in given]) if given else ()):
+            timestamps[i] = int(ts)
+        for artifact in artifacts:
+            if not artifact.name:
+                raise ValueError("Every artifact needs a name.")
+        unique = dict(zip(digests, payloads))
+        with self._lock:
+            known = self._existing(list(unique))
+        compressed = {digest: zlib.compress(payload, self.compression_level)
+                      for digest, payload in unique.items() if digest not in known}
+
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Another process may have stored some of these blobs in the meantime.
+                new = set(compressed) - self._existing(list(compressed))
+                connection.executemany("INSERT INTO blobs (digest, size, data) VALUES (?, ?, ?)",
+                                       ((d, len(unique[d]), compressed[d]) for d in new))
+                last = connection.execute("SELECT seq, chain FROM log ORDER BY seq DESC LIMIT 1").fetchone()
+                seq, chain = last if last else (0, _GENESIS)
+                rows, links, entries = [], [], []
+                for artifact, digest, ts in zip(artifacts, digests, timestamps):
+                    seq += 1
+                    requirements = artifact.requirements
+                    requirements = sorted({requirements} if isinstance(requirements, str) else set(requirements))
+                    chain = _chain(chain, ts, digest, artifact.name, artifact.kind, artifact.model, artifact.build, requirements)
+                    rows.append((seq, ts, digest, artifact.name, artifact.kind, artifact.model, artifact.build, chain))
+                    links.extend((requirement, seq) for requirement in requirements)
+                    entries.append(Entry(seq, digest.hex(), digest in new))
+                    new.discard(digest)
+                connection.executemany("INSERT INTO log VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+                connection.executemany("INSERT INTO links VALUES (?, ?)", links)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return entries
+
+    def get(self, digest):
+        """The bytes of an artifact, checked against its digest."""
+        raw = _digest_bytes(digest)
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM blobs WHERE digest = ?", (raw,)).fetchone()
+        if row is None:
+            raise KeyError(f"No artifact with digest {raw.hex()}.")
+        try:
+            data = zlib.decompress(row[0])
+        except zlib.error:
+            data = None
+        if data is None or hashlib.sha256(data).digest() != raw:
+            raise ValueError(f"Artifact {raw.hex()} is corrupted.")
+        return data
+
+    def __contains__(self, digest):
+        with self._lock:
+            return self._connection.execute("SELECT 1 FROM blobs WHERE digest = ?", (_digest_bytes(digest),)).fetchone() is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM log").fetchone()[0]
+
+    def find(self, requirement=None, model=None, name=None, digest=None, limit=None):
+        """Log entries matching every given filter, newest first."""
+        clauses, params = [], []
+        if requirement is not None:
+            clauses.append("EXISTS (SELECT 1 FROM links WHERE links.requirement = ? AND links.seq = log.seq)")
+            params.append(requirement)
+        for column, value in (("model", model), ("name", name)):
+            if value is not None:
+                clauses.append(f"log.{column} = ?")
+                params.append(value)
+        if digest is not None:
+            clauses.append("log.digest = ?")
+            params.append(_digest_bytes(digest))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        table = self._query(
+            "SELECT seq, ts AS timestamp, name, kind, model, build, hex(log.digest) AS digest, blobs.size,"
+            " (SELECT group_concat(requirement, '; ') FROM links WHERE links.seq = log.seq) AS requirements"
+            f" FROM log JOIN blobs ON blobs.digest = log.digest{where} ORDER BY seq DESC"
+            + (" LIMIT ?" if limit is not None else ""),
+            params + ([int(limit)] if limit is not None else []),
+        )
+        table["timestamp"] = pd.to_datetime(table["timestamp"], unit="s")
+        table["digest"] = table["digest"].str.lower()
+        return table
+
+    def coverage(self, requirements=None):
+        """Per requirement: entries, distinct artifacts and models, and the latest entry time."""
+        requirements = list(REQUIREMENTS if requirements is None else requirements)
+        table = self._query(
+            "SELECT requirement, COUNT(*) AS entries, COUNT(DISTINCT log.digest) AS artifacts,"
+            " COUNT(DISTINCT log.model) AS models, MAX(log.ts) AS latest"
+            " FROM links JOIN log ON log.seq = links.seq GROUP BY requirement"
+        ).set_index("requirement")
+        table = table.reindex(list(dict.fromkeys(requirements + list(table.index))))
+        counts = ["entries", "artifacts", "models"]
+        table[counts] = table[counts].fillna(0).astype("int64")
+        table["latest"] = pd.to_datetime(table["latest"], unit="s")
+        return table
+
+    def stats(self):
+        """Entries, distinct artifacts, bytes recorded and bytes actually stored."""
+        with self._lock:
+            entries, logical = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(blobs.size), 0) FROM log JOIN blobs ON blobs.digest = log.digest").fetchone()
+            artifacts, raw, stored = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(length(data)), 0) FROM blobs").fetchone()
+        return {"entries": entries, "artifacts": artifacts, "recorded_bytes": logical,
+                "unique_bytes": raw, "stored_bytes": stored}
+
+    def verify(self):
+        """``seq`` of the first entry whose hash chain does not match, or ``None`` if the trail is intact."""
+        with self._lock:
+            links = {}
+            for requirement, seq in self._connection.execute("SELECT requirement, seq FROM links"):
+                links.setdefault(seq, []).append(requirement)
+            rows = self._connection.execute("SELECT seq, ts, digest, name, kind, model, build, chain FROM log ORDER BY seq").fetchall()
+        chain = _GENESIS
+        for seq, ts, digest, name, kind, model, build, stored in rows:
+            chain = _chain(chain, ts, digest, name, kind, model, build, links.get(seq, ()))
+            if chain != stored:
+                return seq
+        return None
@@ -0,0 +1,90 @@
+"""Late fusion of per-modality scores (the Part 3 modality-dominance simulation).
+
+A multi-modal model's final score is a weighted sum of its text, vision and
+audio scores. Weights that concentrate on one modality let that modality
+dominate the outcome, which is a fairness risk whenever it is less accurate
+for some groups. ``weight_sweep`` evaluates every weighting on a grid of the
+weight simplex at once, to map where group outcomes diverge.
+"""
+import numpy as np
+import pandas as pd
+
+MODALITIES = ("Text", "Vision", "Audio")
+BALANCED_WEIGHTS = {"Text": 0.33, "Vision": 0.33, "Audio": 0.34}
+
+
+def dominant_weights(modality, share=0.8):
+    """Weights that give ``modality`` ``share`` and split the rest evenly."""
+    if modality not in MODALITIES:
+        raise ValueError(f"Unknown modality {modality!r}; expected one of {list(MODALITIES)}.")
+    rest = round((1.0 - share) / (len(MODALITIES) - 1), 10)
+    return {m: share if m == modality else rest for m in MODALITIES}
+
+
+def fuse(scores, weights):
+    """Weighted sum of ``scores`` (modality -> score or array of scores)."""
+    missing = [m for m in scores if m not in weights]
+    if missing:
+        raise ValueError(f"No weight given for modalities {missing}.")
+    return sum(weights[m] * np.asarray(score, dtype=np.float64) for m, score in scores.items())
+
+
+def simplex_weights(resolution=60):
+    """Every weighting of ``MODALITIES`` in steps of ``1 / resolution``, as an ``(n, 3)`` array.
+
+    ``resolution=60`` gives 1,891 weightings.
+    """
+    a, b = np.meshgrid(np.arange(resolution + 1), np.arange(resolution + 1), indexing="ij")
+    inside = a + b <= resolution
+    a, b = a[inside], b[inside]
+    return np.column_stack([a, b, resolution - a - b]) / resolution
+
+
+def weight_sweep(scores, groups, resolution=60, threshold=0.5, chunk_size=16_384):
+    """Per-group selection rate under every weighting of the simplex.
+
+    ``scores`` maps each modality to per-sample scores and ``groups`` gives
+    each sample's group. A sample is selected when its fused score is at
+    least ``threshold``. Returns one row per weighting, in
+    ``simplex_weights`` order: the three weights, the selection rate of
+    every group, their ``gap`` (max - min) and the ``lowest`` group.
+    """
+    text, vision, audio = (np.asarray(scores[m], dtype=np.float64) for m in MODALITIES)
+    codes, labels = pd.factorize(np.asarray(groups), sort=True)
+    if (codes < 0).any():
+        raise ValueError("groups contains missing values.")
+    n_groups, r = len(labels), resolution
+
+    # With the text weight fixed at a = i / r, a sample's fused score is
+    # linear in the vision weight b = j / r: u + b * v. It is selected on
+    # one contiguous run [lo, hi) of j, so each row of the lattice is a
+    # difference array (+1 at lo, -1 at hi) per group, summed by cumsum:
+    # O(samples x r) work instead of O(samples x r^2) fused scores.
+    a = np.arange(r + 1) / r
+    points = r + 1 - np.arange(r + 1)  # lattice points in row i: j = 0 .. r - i
+    width = r + 2
+    diff = np.zeros((r + 1) * n_groups * width, dtype=np.int64)
+    for start in range(0, len(codes), chunk_size):
+        rows = slice(start, start + chunk_size)
+        u = audio[rows, None] + a * (text[rows, None] - audio[rows, None])
+        v = (vision[rows] - audio[rows])[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = r * (threshold - u) / v
+        lo = np.where(v > 0, np.clip(np.ceil(crossing), 0, points), 0)
+        hi = np.where(v < 0, np.clip(np.floor(crossing) + 1, 0, points), points)
+        flat = np.where(v == 0, u >= threshold, True)
+        lo = np.where(flat, lo, points).astype(np.int64)
+        base = (np.arange(r + 1) * n_groups + codes[rows, None]) * width
+        diff += np.bincount((base + lo).ravel(), minlength=len(diff))
+        diff -= np.bincount((base + hi.astype(np.int64)).ravel(), minlength=len(diff))
+    selected = np.cumsum(diff.reshape(r + 1, n_groups, width), axis=2)
+
+    i, j = np.meshgrid(np.arange(r + 1), np.arange(r + 1), indexing="ij")
+    inside = i + j <= r
+    rates = selected[i[inside], :, j[inside]] / np.bincount(codes, minlength=n_groups)
+
+    table = pd.DataFrame(simplex_weights(resolution), columns=list(MODALITIES))
+    table[[str(label) for label in labels]] = rates
+    table["gap"] = rates.max(axis=1) - rates.min(axis=1)
+    table["lowest"] = np.asarray(labels, dtype=object)[rates.argmin(axis=1)]
+    return table
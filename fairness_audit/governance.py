@@ -0,0 +1,248 @@
+"""Governance-gate and Definition-of-Done status per project and sprint.
+
+Each checklist item of each project and sprint is one row of ``checks``,
+keyed on ``(project, sprint, item)``. ``projects`` holds one row per project
+with its latest sprint and the items done in it as a bit mask per checklist,
+upserted with every write, so a Review Board overview of thousands of
+projects is a single scan of ``projects`` rather than one query per project.
+
+Writes from widget callbacks are staged and debounced: ``stage`` only
+records the latest value per item, and a timer flushes everything staged
+in one transaction once the clicking stops for ``debounce`` seconds (or the
+batch reaches ``max_batch`` items). Flushes hold a write lock from taking
+the staged changes to committing them, so a later flush never lands before
+an earlier one. Reads merge the staged values, so a session sees its own
+clicks immediately. Connections come from a small
+pool; with WAL, readers never wait for the writer.
+"""
+import atexit
+import itertools
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+GOVERNANCE_ENV = "FAIRNESS_AUDIT_GOVERNANCE_STORE"
+CHECKLISTS = {
+    "gates": ("data_review", "design_approval", "pre_deployment", "monitoring_trigger"),
+    "dod": ("bias_tests", "fairness_thresholds", "intersectional_testing", "impact_review"),
+}
+ITEM_LABELS = {
+    "data_review": "Data Review Gate",
+    "design_approval": "Design Approval Gate",
+    "pre_deployment": "Pre-Deployment Gate",
+    "monitoring_trigger": "Monitoring Trigger Gate",
+    "bias_tests": "Bias tests executed",
+    "fairness_thresholds": "Fairness thresholds met",
+    "intersectional_testing": "Intersectional testing",
+    "impact_review": "Downstream impact review",
+}
+CLEARED = "Cleared"
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_POOL_SIZE = 4
+
+_CHECKLIST = {item: (checklist, 1 << bit) for checklist, items in CHECKLISTS.items() for bit, item in enumerate(items)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checks (
+    project TEXT NOT NULL,
+    sprint INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    done INTEGER NOT NULL,
+    updated INTEGER NOT NULL,
+    PRIMARY KEY (project, sprint, item)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS projects (
+    project TEXT PRIMARY KEY,
+    sprint INTEGER NOT NULL,
+    gates INTEGER NOT NULL,
+    dod INTEGER NOT NULL,
+    updated INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+# Only a sprint at least as recent as the stored one replaces a project's snapshot.
+_UPSERT_PROJECT = """
+INSERT INTO projects VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (project) DO UPDATE SET
+    sprint = excluded.sprint, gates = excluded.gates, dod = excluded.dod, updated = excluded.updated
+WHERE excluded.sprint >= projects.sprint
+"""
+
+_memory_ids = itertools.count()
+
+
+def _item(item):
+    if item not in _CHECKLIST:
+        raise ValueError(f"Unknown checklist item {item!r}; expected one of {list(_CHECKLIST)}.")
+    return _CHECKLIST[item]
+
+
+def blocked_at(gates):
+    """First gate not yet passed for each gate bit mask (``CLEARED`` when all are)."""
+    gates = np.asarray(gates, dtype=np.int64)
+    labels = np.array([ITEM_LABELS[item] for item in CHECKLISTS["gates"]] + [CLEARED], dtype=object)
+    first_open = np.full(gates.shape, len(CHECKLISTS["gates"]))
+    for bit in reversed(range(len(CHECKLISTS["gates"]))):
+        first_open = np.where(gates & (1 << bit), first_open, bit)
+    return labels[first_open]
+
+
+class GovernanceStore:
+    """Checklist status per project and sprint in a SQLite file (or ``":memory:"``).
+
+    Connections are pooled (``pool_size``) and shared by all threads, so a
+    store can be held as a Streamlit resource.
+    """
+
+    def __init__(self, path=":memory:", pool_size=DEFAULT_POOL_SIZE, debounce=DEFAULT_DEBOUNCE, max_batch=500):
+        self.path = str(path)
+        self.debounce = debounce
+        self.max_batch = max_batch
+        # A named shared-cache database, so every pooled connection sees the same in-memory data.
+        target, uri = (f"file:governance-{next(_memory_ids)}?mode=memory&cache=shared", True) if self.path == ":memory:" else (self.path, False)
+        self._pool = queue.Queue()
+        for _ in range(pool_size):
+            connection = sqlite3.connect(target, uri=uri, check_same_thread=False, isolation_level=None, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._pool.put(connection)
+        with self._connection() as connection:
+            connection.executescript(_SCHEMA)
+        self._pending, self._writing = {}, []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._deadline, self._flusher = 0.0, None
+        atexit.register(self.flush)
+
+    @contextmanager
+    def _connection(self):
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def close(self):
+        self.flush()
+        atexit.unregister(self.flush)
+        while not self._pool.empty():
+            self._pool.get().close()
+
+    def _query(self, sql, params=()):
+        with self._connection() as connection:
+            return pd.read_sql_query(sql, connection, params=params)
+
+    def stage(self, project, sprint, item, done):
+        """Queue one checkbox change; it is written with the others once changes pause."""
+        _item(item)
+        with self._pending_lock:
+            self._pending[(str(project), int(sprint), item)] = (bool(done), int(time.time()))
+            self._deadline = time.monotonic() + self.debounce
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_when_idle, daemon=True)
+                self._flusher.start()
+            full = len(self._pending) >= self.max_batch
+        if full:
+            self.flush()
+
+    def _flush_when_idle(self):
+        # One background thread per burst of changes: it sleeps until no
+        # change has been staged for ``debounce`` seconds, then flushes.
+        while True:
+            with self._pending_lock:
+                if not self._pending:
+                    self._flusher = None
+                    return
+                delay = self._deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                self.flush()
+
+    def flush(self):
+        """Write every staged change in one transaction; returns how many were written."""
+        # Taken before the staged changes: an older batch still being written
+        # would otherwise commit after this one and revert its changes.
+        with self._flush_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, {}
+                self._writing.append(pending)
+            try:
+                if pending:
+                    self.record((project, sprint, item, done, updated) for (project, sprint, item), (done, updated) in pending.items())
+            finally:
+                with self._pending_lock:
+                    self._writing.remove(pending)
+        return len(pending)
+
+    def record(self, rows):
+        """Write ``(project, sprint, item, done, updated)`` rows now, in one transaction, and refresh the snapshots."""
+        rows = [(str(p), int(s), i, int(bool(d)), int(u)) for p, s, i, d, u in rows]
+        for row in rows:
+            _item(row[2])
+        scopes = sorted({(p, s) for p, s, _, _, _ in rows})
+        with self._connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany("INSERT OR REPLACE INTO checks VALUES (?, ?, ?, ?, ?)", rows)
+                snapshots = []
+                for project, sprint in scopes:
+                    masks = {"gates": 0, "dod": 0}
+                    updated = 0
+                    for item, done, stamp in connection.execute(
+                            "SELECT item, done, updated FROM checks WHERE project = ? AND sprint = ?", (project, sprint)):
+                        checklist, bit = _CHECKLIST.get(item, (None, 0))
+                        if checklist and done:
+                            masks[checklist] |= bit
+                        updated = max(updated, stamp)
+                    snapshots.append((project, sprint, masks["gates"], masks["dod"], updated))
+                connection.executemany(_UPSERT_PROJECT, snapshots)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def load(self, project, sprint):
+        """``{item: done}`` of every checklist item of one project and sprint, staged changes included."""
+        project, sprint = str(project), int(sprint)
+        with self._connection() as connection:
+            status = dict.fromkeys(_CHECKLIST, False)
+            status.update((item, bool(done)) for item, done in connection.execute(
+                "SELECT item, done FROM checks WHERE project = ? AND sprint = ?", (project, sprint)))
+        with self._pending_lock:
+            # Changes being written right now may not be visible to this connection yet.
+            for staged in [*self._writing, self._pending]:
+                status.update((item, done) for (p, s, item), (done, _) in staged.items() if (p, s) == (project, sprint))
+        return status
+
+    def __len__(self):
+        with self._connection() as connection:
+            return connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+    def projects(self):
+        with self._connection() as connection:
+            return [row[0] for row in connection.execute("SELECT project FROM projects ORDER BY project")]
+
+    def latest_sprint(self, project):
+        """The most recent sprint with any recorded status, or ``None``."""
+        with self._connection() as connection:
+            row = connection.execute("SELECT MAX(sprint) FROM checks WHERE project = ?", (str(project),)).fetchone()
+        return row[0]
+
+    def portfolio(self):
+        """One row per project: latest sprint, gates passed, DoD items done, where it is blocked and when it last changed."""
+        self.flush()
+        table = self._query("SELECT project, sprint, gates, dod, updated FROM projects ORDER BY project")
+        masks = {checklist: table.pop(checklist).to_numpy(dtype=np.int64) for checklist in CHECKLISTS}
+        for checklist, items in CHECKLISTS.items():
+            table[f"{checklist}_done"] = sum((masks[checklist] >> bit) & 1 for bit in range(len(items)))
+        table["blocked_at"] = pd.Categorical(blocked_at(masks["gates"]),
+                                             categories=[ITEM_LABELS[i] for i in CHECKLISTS["gates"]] + [CLEARED], ordered=True)
+        table["updated"] = pd.to_datetime(table["updated"], unit="s")
+        return table.set_index("project")
@@ -0,0 +1,204 @@
+"""Chunked ingestion of prediction files into per-group confusion counts.
+
+Evaluation sets of several GB never need to be in memory at once: every
+chunk (a pandas ``chunksize`` slice of a CSV or a pyarrow record batch of a
+Parquet file) is reduced to per-group confusion counts and folded into a
+``ConfusionAccumulator``. Memory is bounded by the chunk size plus one
+``2 x 2`` count matrix per observed group.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import DisaggregatedMetrics, _as_binary
+
+DEFAULT_CHUNKSIZE = 500_000
+
+
+class ConfusionAccumulator:
+    """Incrementally accumulates ``[group, y_true, y_pred]`` counts."""
+
+    def __init__(self, sensitive_columns, pos_label=1):
+        if not sensitive_columns:
+            raise ValueError("At least one sensitive column is required.")
+        self.sensitive_columns = list(sensitive_columns)
+        self.pos_label = pos_label
+        self.rows = 0
+        # Per column: label -> code, in order of first appearance.
+        self._level_codes = [{} for _ in self.sensitive_columns]
+        self._levels = [[] for _ in self.sensitive_columns]
+        # Tuple of column codes -> row in ``_counts``.
+        self._group_ids = {}
+        self._counts = np.zeros((0, 2, 2), dtype=np.int64)
+
+    def _encode_column(self, i, values):
+        codes, uniques = pd.factorize(values)
+        if (codes < 0).any():
+            raise ValueError(f"Sensitive column {self.sensitive_columns[i]!r} contains missing values.")
+        level_codes, levels = self._level_codes[i], self._levels[i]
+        mapping = np.empty(len(uniques), dtype=np.int64)
+        for j, label in enumerate(uniques):
+            code = level_codes.get(label)
+            if code is None:
+                code = level_codes[label] = len(levels)
+                levels.append(label)
+            mapping[j] = code
+        return mapping[codes]
+
+    def update(self, y_true, y_pred, sensitive_features):
+        """Fold one chunk into the running counts."""
+        sensitive_features = pd.DataFrame(sensitive_features)
+        column_codes = [
+            self._encode_column(i, sensitive_features[column].to_numpy())
+            for i, column in enumerate(self.sensitive_columns)
+        ]
+        # Chunk-local dense key over the levels seen so far, then one bincount.
+        shape = tuple(len(levels) for levels in self._levels)
+        local = np.ravel_multi_index(column_codes, shape)
+        observed, inverse = np.unique(local, return_inverse=True)
+        flat = inverse.reshape(-1) * 4 + _as_binary(y_true, self.pos_label) * 2 + _as_binary(y_pred, self.pos_label)
+        chunk_counts = np.bincount(flat, minlength=len(observed) * 4).reshape(-1, 2, 2)
+
+        group_rows = np.empty(len(observed), dtype=np.int64)
+        new_groups = 0
+        for j, key in enumerate(zip(*np.unravel_index(observed, shape))):
+            key = tuple(int(code) for code in key)
+            row = self._group_ids.get(key)
+            if row is None:
+                row = self._group_ids[key] = len(self._group_ids)
+                new_groups += 1
+            group_rows[j] = row
+        if new_groups:
+            self._counts = np.concatenate([self._counts, np.zeros((new_groups, 2, 2), dtype=np.int64)])
+        np.add.at(self._counts, group_rows, chunk_counts)
+        self.rows += len(local)
+
+    def group_table(self):
+        """One row per observed group: the label columns plus tn/fp/fn/tp counts."""
+        keys = np.array(list(self._group_ids), dtype=np.int64).reshape(-1, len(self.sensitive_columns))
+        table = pd.DataFrame({
+            column: np.asarray(self._levels[i], dtype=object)[keys[:, i]] if len(keys) else []
+            for i, column in enumerate(self.sensitive_columns)
+        })
+        flat = self._counts.reshape(-1, 4)
+        for j, name in enumerate(("tn", "fp", "fn", "tp")):
+            table[name] = flat[:, j]
+        return table
+
+    def to_metrics(self, columns=None):
+        """``DisaggregatedMetrics`` over ``columns`` (default: all sensitive columns).
+
+        Counts of groups that only differ in the omitted columns are summed, so
+        single-attribute and intersectional views come from the same pass.
+        """
+        return DisaggregatedMetrics.from_group_table(self.group_table(), columns or self.sensitive_columns)
+
+
+def detect_format(name):
+    ext = os.path.splitext(str(name).lower())[1]
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    if ext in (".csv", ".txt", ".gz", ".zip", ".bz2", ".xz"):
+        return "csv"
+    raise ValueError(f"Cannot infer the file format of {name!r}; expected CSV or Parquet.")
+
+
+def read_columns(source, fmt=None):
+    """Column names of a CSV or Parquet source without reading its rows."""
+    fmt = fmt or detect_format(getattr(source, "name", source))
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        columns = pq.ParquetFile(source).schema_arrow.names
+    else:
+        columns = list(pd.read_csv(source, nrows=0).columns)
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return columns
+
+
+def iter_chunks(source, columns=None, fmt=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield ``DataFrame`` chunks of at most ``chunksize`` rows from one file."""
+    fmt = fmt or detect_format(getattr(source, "name", source))
+    if hasattr(source, "seek"):
+        source.seek(0)
+    if fmt == "parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Reading Parquet files requires `pyarrow` (pip install pyarrow).") from exc
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize)
+
+
+def iter_aligned_chunks(streams):
+    """Zip several chunk streams row-by-row into combined ``DataFrame`` chunks.
+
+    Used when ``y_true``, ``y_pred`` and the sensitive features arrive as
+    separate files of equal length whose chunk boundaries need not line up
+    (e.g. Parquet row groups of different sizes).
+    """
+    streams = [iter(stream) for stream in streams]
+    buffers = [None] * len(streams)
+    while True:
+        for i, stream in enumerate(streams):
+            if buffers[i] is None or buffers[i].empty:
+                buffers[i] = next(stream, None)
+        exhausted = [buffer is None for buffer in buffers]
+        if all(exhausted):
+            return
+        if any(exhausted):
+            raise ValueError("Input files have different numbers of rows.")
+        n = min(len(buffer) for buffer in buffers)
+        yield pd.concat([buffer.iloc[:n].reset_index(drop=True) for buffer in buffers], axis=1)
+        buffers = [buffer.iloc[n:] for buffer in buffers]
+
+
+def read_catalog(source, score_column, group_column, chunksize=DEFAULT_CHUNKSIZE):
+    """Relevance scores and provider groups of a catalog file, one row per item.
+
+    Returns ``(scores, groups)`` as a float array and a ``pd.Categorical``.
+    """
+    catalog = pd.concat(iter_chunks(source, columns=[score_column, group_column], chunksize=chunksize), ignore_index=True)
+    scores = pd.to_numeric(catalog[score_column]).to_numpy(dtype=np.float64)
+    return scores, pd.Categorical(catalog[group_column])
+
+
+def accumulate(chunks, y_true, y_pred, sensitive_columns, pos_label=1, progress=None):
+    """Fold a stream of ``DataFrame`` chunks into a ``ConfusionAccumulator``.
+
+    ``progress``, if given, is called with the running row count after each chunk.
+    """
+    accumulator = ConfusionAccumulator(sensitive_columns, pos_label=pos_label)
+    for chunk in chunks:
+        accumulator.update(chunk[y_true].to_numpy(), chunk[y_pred].to_numpy(), chunk[accumulator.sensitive_columns])
+        if progress is not None:
+            progress(accumulator.rows)
+    return accumulator
+
+
+def ingest_files(sources, y_true, y_pred, sensitive_columns, pos_label=1,
+                 chunksize=DEFAULT_CHUNKSIZE, progress=None):
+    """Stream one or more CSV/Parquet files into a ``ConfusionAccumulator``.
+
+    With several files, each must hold a disjoint subset of the needed
+    columns for the same rows in the same order.
+    """
+    wanted = [y_true, y_pred, *sensitive_columns]
+    if len(sources) == 1:
+        chunks = iter_chunks(sources[0], columns=wanted, chunksize=chunksize)
+    else:
+        streams, claimed = [], set()
+        for source in sources:
+            available = set(read_columns(source))
+            columns = [column for column in wanted if column in available and column not in claimed]
+            if columns:
+                claimed.update(columns)
+                streams.append(iter_chunks(source, columns=columns, chunksize=chunksize))
+        missing = [column for column in wanted if column not in claimed]
+        if missing:
+            raise ValueError(f"Columns not found in any input file: {missing}")
+        chunks = iter_aligned_chunks(streams)
+    return accumulate(chunks, y_true, y_pred, sensitive_columns, pos_label=pos_label, progress=progress)
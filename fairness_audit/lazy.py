@@ -0,0 +1,48 @@
+"""Deferred imports for the heavy metric dependencies.
+
+``fairlearn`` and ``scikit-learn`` pull in scipy and most of sklearn, which
+dominates cold start and per-session memory. Pages import the proxies below
+instead of the real modules; the underlying import only happens the first time
+an attribute is accessed, i.e. when a recipe that needs a metric engine is
+actually opened.
+"""
+import importlib
+import sys
+import threading
+import types
+
+_import_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            with _import_lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def is_loaded(name):
+    """Return True if ``name`` has already been imported in this process."""
+    return name in sys.modules
+
+
+fairlearn_metrics = LazyModule("fairlearn.metrics")
+sklearn_metrics = LazyModule("sklearn.metrics")
@@ -0,0 +1,171 @@
+"""Vectorized disaggregated metrics for binary classifiers.
+
+A drop-in for the subset of ``fairlearn.metrics.MetricFrame`` the playbook
+uses, built for evaluation sets with tens of millions of predictions. Every
+row is reduced to a single integer ``group * 4 + y_true * 2 + y_pred`` and one
+``np.bincount`` call yields the confusion matrix of every group at once; all
+metrics (and their ``difference()``/``ratio()``) are then derived from those
+counts without touching the rows again.
+
+Results match ``MetricFrame.by_group`` for ``accuracy_score``,
+``selection_rate``, ``true_positive_rate`` and ``false_positive_rate``:
+groups are sorted, multiple sensitive features produce a ``MultiIndex`` over
+every combination (unobserved combinations are ``NaN``), and a rate with an
+empty denominator is reported as ``0.0``.
+"""
+import numpy as np
+import pandas as pd
+
+METRICS = ("accuracy", "selection_rate", "true_positive_rate", "false_positive_rate")
+
+# Above this many feature combinations only the observed ones are kept, since
+# materialising the full cartesian product would dwarf the data itself.
+MAX_DENSE_GROUPS = 1 << 22
+
+
+def _as_binary(values, pos_label):
+    values = np.asarray(values)
+    if values.dtype == bool:
+        return values.astype(np.int64)
+    return (values == pos_label).astype(np.int64)
+
+
+def _feature_columns(sensitive_features):
+    """Normalise the accepted sensitive-feature inputs to ``[(name, values)]``."""
+    if isinstance(sensitive_features, pd.DataFrame):
+        return [(str(c), sensitive_features[c]) for c in sensitive_features.columns]
+    if isinstance(sensitive_features, dict):
+        return [(str(k), v) for k, v in sensitive_features.items()]
+    if isinstance(sensitive_features, pd.Series):
+        name = sensitive_features.name
+        return [(str(name) if name is not None else "sensitive_feature_0", sensitive_features)]
+    values = np.asarray(sensitive_features)
+    if values.ndim == 2:
+        return [(f"sensitive_feature_{i}", values[:, i]) for i in range(values.shape[1])]
+    return [("sensitive_feature_0", values)]
+
+
+def encode_groups(sensitive_features):
+    """Map each row to an integer group code.
+
+    Returns ``(codes, index)`` where ``index`` is the ``pd.Index`` (or
+    ``MultiIndex`` for several features) of group labels and ``codes[i]`` is
+    the position of row ``i``'s group in it.
+    """
+    columns = _feature_columns(sensitive_features)
+    names, levels, column_codes = [], [], []
+    for name, values in columns:
+        if not isinstance(values, (pd.Series, pd.Categorical)):
+            values = np.asarray(values)
+        codes, uniques = pd.factorize(values, sort=True)
+        if (codes < 0).any():
+            raise ValueError(f"Sensitive feature {name!r} contains missing values.")
+        names.append(name)
+        levels.append(pd.Index(uniques))
+        column_codes.append(codes.astype(np.int64))
+
+    if len(columns) == 1:
+        return column_codes[0], levels[0].rename(names[0])
+
+    shape = tuple(len(level) for level in levels)
+    combined = np.ravel_multi_index(column_codes, shape)
+    if np.prod(shape, dtype=np.float64) <= MAX_DENSE_GROUPS:
+        return combined, pd.MultiIndex.from_product(levels, names=names)
+
+    observed, codes = np.unique(combined, return_inverse=True)
+    unravelled = np.unravel_index(observed, shape)
+    index = pd.MultiIndex(levels=levels, codes=list(unravelled), names=names)
+    return codes.reshape(-1), index
+
+
+def confusion_counts(y_true, y_pred, codes, n_groups, pos_label=1):
+    """Per-group ``[[tn, fp], [fn, tp]]`` counts in one ``bincount`` pass.
+
+    Returns an ``(n_groups, 2, 2)`` int64 array indexed ``[group, y_true, y_pred]``.
+    """
+    y_true = _as_binary(y_true, pos_label)
+    y_pred = _as_binary(y_pred, pos_label)
+    codes = np.asarray(codes, dtype=np.int64)
+    if not (len(y_true) == len(y_pred) == len(codes)):
+        raise ValueError("y_true, y_pred and sensitive_features must have the same length.")
+    flat = codes * 4 + y_true * 2 + y_pred
+    return np.bincount(flat, minlength=n_groups * 4).reshape(n_groups, 2, 2)
+
+
+def _rates(counts):
+    """Metric table from ``(..., 2, 2)`` confusion counts, shape ``(..., len(METRICS))``."""
+    counts = counts.astype(np.float64)
+    tn, fp = counts[..., 0, 0], counts[..., 0, 1]
+    fn, tp = counts[..., 1, 0], counts[..., 1, 1]
+    total = tn + fp + fn + tp
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = np.stack([
+            (tp + tn) / total,
+            (tp + fp) / total,
+            np.where(tp + fn > 0, tp / (tp + fn), 0.0),
+            np.where(fp + tn > 0, fp / (fp + tn), 0.0),
+        ], axis=-1)
+    # A group with no rows at all has no defined metrics (MetricFrame gives NaN).
+    table[total == 0] = np.nan
+    return table
+
+
+class DisaggregatedMetrics:
+    """Per-group binary classification metrics with a MetricFrame-like API."""
+
+    def __init__(self, counts, groups):
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.groups = groups
+        if self.counts.shape != (len(groups), 2, 2):
+            raise ValueError("counts must have shape (n_groups, 2, 2).")
+
+    @classmethod
+    def from_predictions(cls, y_true, y_pred, sensitive_features, pos_label=1):
+        codes, groups = encode_groups(sensitive_features)
+        return cls(confusion_counts(y_true, y_pred, codes, len(groups), pos_label), groups)
+
+    @classmethod
+    def from_group_table(cls, table, columns):
+        """Sum per-group ``tn/fp/fn/tp`` rows (e.g. ``ConfusionAccumulator.group_table()``) over ``columns``."""
+        columns = list(columns)
+        table = table.groupby(columns, sort=True)[["tn", "fp", "fn", "tp"]].sum()
+        groups = table.index if len(columns) > 1 else pd.Index(table.index, name=columns[0])
+        return cls(table.to_numpy().reshape(-1, 2, 2), groups)
+
+    @property
+    def overall(self):
+        return pd.Series(_rates(self.counts.sum(axis=0)), index=list(METRICS))
+
+    @property
+    def by_group(self):
+        return pd.DataFrame(_rates(self.counts), index=self.groups, columns=list(METRICS))
+
+    @property
+    def group_size(self):
+        return pd.Series(self.counts.sum(axis=(1, 2)), index=self.groups, name="count")
+
+    def group_min(self):
+        return self.by_group.min()
+
+    def group_max(self):
+        return self.by_group.max()
+
+    def difference(self, method="between_groups"):
+        if method == "between_groups":
+            return self.group_max() - self.group_min()
+        if method == "to_overall":
+            return (self.by_group - self.overall).abs().max()
+        raise ValueError(f"Unknown method {method!r}; use 'between_groups' or 'to_overall'.")
+
+    def ratio(self, method="between_groups"):
+        if method == "between_groups":
+            return self.group_min() / self.group_max()
+        if method == "to_overall":
+            ratios = self.by_group / self.overall
+            return ratios.where(ratios <= 1, 1 / ratios).min()
+        raise ValueError(f"Unknown method {method!r}; use 'between_groups' or 'to_overall'.")
+
+
+def disaggregate(y_true, y_pred, sensitive_features, pos_label=1):
+    """Compute every metric in ``METRICS`` for every group in one pass."""
+    return DisaggregatedMetrics.from_predictions(y_true, y_pred, sensitive_features, pos_label)
@@ -0,0 +1,352 @@
+"""Streaming fairness-drift monitoring (the Part 2 monitoring framework).
+
+Timestamped prediction logs are consumed in batches of any size. Events are
+binned into fixed-width time buckets, each reduced to per-group confusion
+counts (one ``np.bincount`` per batch, as in ``metrics``) and a histogram of
+model scores. A bucket is closed when a later one starts; closing it updates
+the sliding window of the last ``window`` buckets by adding the new bucket
+and subtracting the one that fell out, so the cost per event is constant
+whatever the window length. ``window=1`` gives tumbling windows.
+
+The first ``reference_buckets`` buckets form the reference period. After
+it, every closed bucket runs three tests and raises tiered alerts:
+
+* ``cusum``: a two-sided CUSUM per group on the monitored metric of each
+  bucket, standardised by its binomial standard error against the
+  reference rate. Deviations within ``tolerance`` of the reference are
+  slack, so busy streams, whose standard errors are tiny, do not alarm on
+  practically irrelevant shifts. So are deviations within two standard
+  errors of the reference rate's own estimate: a short reference period
+  misses the true rate by a constant that the CUSUM would otherwise add up
+  bucket after bucket until it alarms on a stationary stream.
+* ``psi``: the population stability index of each group's score (or
+  predicted label) distribution over the window against the reference.
+* ``disparity``: the between-groups difference of the monitored metric over
+  the window.
+
+A test crossing its ``Warning`` or ``Critical`` threshold raises an
+``Alert`` once, when its severity rises; it can fire again after returning
+to normal.
+"""
+from collections import deque
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.ingest import DEFAULT_CHUNKSIZE, iter_chunks
+from fairness_audit.metrics import METRICS, _as_binary, _rates
+
+SEVERITIES = ("Warning", "Critical")
+TESTS = ("cusum", "psi", "disparity")
+# (Warning, Critical) thresholds per test. PSI follows the usual 0.1 / 0.25
+# rule of thumb; CUSUM values are in standard errors, high enough that a
+# stationary stream of hourly buckets goes months without a false warning.
+DEFAULT_THRESHOLDS = {
+    "cusum": (6.0, 10.0),
+    "psi": (0.1, 0.25),
+    "disparity": (0.1, 0.2),
+}
+CUSUM_SLACK = 0.5
+REFERENCE_MARGIN = 2.0  # standard errors of the reference rate
+PSI_EPSILON = 1e-4
+
+
+class Alert(NamedTuple):
+    window_end: pd.Timestamp
+    group: object
+    test: str
+    value: float
+    severity: str
+
+
+def _as_nanoseconds(timestamps):
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    if index.tz is not None:
+        index = index.tz_convert(None)
+    return index.as_unit("ns").asi8
+
+
+def _metric_rate(counts, metric):
+    """Monitored metric of ``(..., 2, 2)`` counts and the size of its denominator."""
+    rates = _rates(counts)[..., METRICS.index(metric)]
+    if metric == "true_positive_rate":
+        n = counts[..., 1, :].sum(axis=-1)
+    elif metric == "false_positive_rate":
+        n = counts[..., 0, :].sum(axis=-1)
+    else:
+        n = counts.sum(axis=(-2, -1))
+    return rates, n
+
+
+def _psi(actual, expected):
+    """Population stability index of each row of two ``(groups, bins)`` count arrays."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = np.maximum(actual / actual.sum(axis=1, keepdims=True), PSI_EPSILON)
+        e = np.maximum(expected / expected.sum(axis=1, keepdims=True), PSI_EPSILON)
+    return ((a - e) * np.log(a / e)).sum(axis=1)
+
+
+class DriftMonitor:
+    """Windowed per-group metrics, drift tests and alerts over a prediction stream.
+
+    ``bucket`` is the bucket width (anything ``pd.Timedelta`` accepts) and
+    ``window`` the number of buckets per sliding window. ``metric`` is one
+    of ``METRICS``, and ``tolerance`` the change in it that the CUSUM
+    ignores. Groups with fewer than ``min_count`` events in a window are
+    left out of its PSI and disparity: below a few hundred events, sampling
+    noise alone moves a rate by more than the 0.1 disparity warning.
+    ``thresholds`` overrides entries of ``DEFAULT_THRESHOLDS``.
+    """
+
+    def __init__(self, bucket="1h", window=24, metric="selection_rate", reference_buckets=None,
+                 pos_label=1, score_bins=10, min_count=500, tolerance=0.02, thresholds=None):
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {list(METRICS)}.")
+        if window < 1:
+            raise ValueError("window must be at least one bucket.")
+        self.bucket = pd.Timedelta(bucket)
+        self.window = int(window)
+        self.metric = metric
+        self.reference_buckets = int(reference_buckets or window)
+        self.pos_label = pos_label
+        self.score_bins = score_bins
+        self.min_count = min_count
+        self.tolerance = tolerance
+        self.thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+
+        self.events = 0
+        self.late_events = 0
+        self.alerts = []
+        self._width = self.bucket.value
+        self._bins = None
+        self._group_codes = {}
+        self.groups = []
+        self._open = None  # id of the bucket still receiving events
+        self._open_counts = self._open_hist = None
+        self._ring = deque()
+        self._window_counts = self._window_hist = None
+        self._reference_counts = self._reference_hist = None
+        self._reference_seen = 0
+        self._reference_rate = self._reference_n = None
+        self._cusum = None  # (groups, 2): upper and lower statistics
+        self._severity = {}
+        self._history = []
+        self._disparity = []
+
+    # --- ingestion ---------------------------------------------------------
+
+    def _encode_groups(self, values):
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        if (codes < 0).any():
+            raise ValueError("Group column contains missing values.")
+        mapping = np.empty(len(uniques), dtype=np.int64)
+        for i, label in enumerate(uniques):
+            code = self._group_codes.get(label)
+            if code is None:
+                code = self._group_codes[label] = len(self.groups)
+                self.groups.append(label)
+            mapping[i] = code
+        self._grow(len(self.groups))
+        return mapping[codes]
+
+    def _grow(self, n_groups):
+        """Pad every per-group array to ``n_groups`` rows (new groups start at zero)."""
+        if self._open_counts is not None and len(self._open_counts) == n_groups:
+            return
+
+        def pad(array, fill=0):
+            if array is None:
+                return None
+            extra = np.full((n_groups - len(array), *array.shape[1:]), fill, dtype=array.dtype)
+            return np.concatenate([array, extra])
+
+        bins = self._bins or 0
+        if self._open_counts is None:
+            self._open_counts = np.zeros((n_groups, 2, 2), dtype=np.int64)
+            self._open_hist = np.zeros((n_groups, bins), dtype=np.int64)
+            self._window_counts = np.zeros((n_groups, 2, 2), dtype=np.int64)
+            self._window_hist = np.zeros((n_groups, bins), dtype=np.int64)
+            self._reference_counts = np.zeros((n_groups, 2, 2), dtype=np.int64)
+            self._reference_hist = np.zeros((n_groups, bins), dtype=np.int64)
+            self._cusum = np.zeros((n_groups, 2))
+            return
+        self._open_counts, self._open_hist = pad(self._open_counts), pad(self._open_hist)
+        self._window_counts, self._window_hist = pad(self._window_counts), pad(self._window_hist)
+        self._reference_counts, self._reference_hist = pad(self._reference_counts), pad(self._reference_hist)
+        self._reference_rate = pad(self._reference_rate, np.nan)
+        self._reference_n = pad(self._reference_n)
+        self._cusum = pad(self._cusum)
+        self._ring = deque((pad(counts), pad(hist)) for counts, hist in self._ring)
+
+    def _score_bin(self, y_pred, scores):
+        if scores is None:
+            return y_pred
+        scores = np.asarray(scores, dtype=np.float64)
+        return np.clip((scores * self.score_bins).astype(np.int64), 0, self.score_bins - 1)
+
+    def update(self, timestamps, groups, y_true, y_pred, scores=None):
+        """Add a batch of events; returns the alerts raised by buckets it closed.
+
+        ``scores`` (in ``[0, 1]``) are binned for the PSI test; without them
+        the PSI compares predicted-label distributions. Events older than
+        the open bucket arrive too late to be counted and are only tallied
+        in ``late_events``.
+        """
+        bins = 2 if scores is None else self.score_bins
+        if self._bins is None:
+            self._bins = bins
+        elif bins != self._bins:
+            raise ValueError("Pass scores with every batch or with none.")
+        ns = _as_nanoseconds(timestamps)
+        if not len(ns):
+            return []
+        codes = self._encode_groups(groups)
+        y_true = _as_binary(y_true, self.pos_label)
+        y_pred = _as_binary(y_pred, self.pos_label)
+        score_bin = self._score_bin(y_pred, scores)
+
+        bucket = ns // self._width
+        if self._open is None:
+            self._open = int(bucket.min())
+        on_time = bucket >= self._open
+        if not on_time.all():
+            self.late_events += int((~on_time).sum())
+            bucket, codes, y_true, y_pred, score_bin = (a[on_time] for a in (bucket, codes, y_true, y_pred, score_bin))
+        self.events += len(bucket)
+
+        # One bincount per batch over (observed bucket, group, cell).
+        observed, position = np.unique(bucket, return_inverse=True)
+        n_groups = len(self.groups)
+        counts = np.bincount((position * n_groups + codes) * 4 + y_true * 2 + y_pred,
+                             minlength=len(observed) * n_groups * 4).reshape(len(observed), n_groups, 2, 2)
+        hist = np.bincount((position * n_groups + codes) * self._bins + score_bin,
+                           minlength=len(observed) * n_groups * self._bins).reshape(len(observed), n_groups, self._bins)
+
+        raised = []
+        for bucket_id, bucket_counts, bucket_hist in zip(observed.tolist(), counts, hist):
+            # Close the open bucket and the empty ones in between; past a
+            # full window of empty buckets nothing remains to slide out.
+            gap = bucket_id - self._open
+            for step in range(min(gap, self.window + 1)):
+                raised += self._close(self._open + step)
+                self._open_counts[:] = 0
+                self._open_hist[:] = 0
+            self._open = bucket_id
+            self._open_counts += bucket_counts
+            self._open_hist += bucket_hist
+        return raised
+
+    def flush(self):
+        """Close the open bucket, e.g. at the end of a log; returns its alerts."""
+        if self._open is None:
+            return []
+        raised = self._close(self._open)
+        self._open_counts[:] = 0
+        self._open_hist[:] = 0
+        self._open += 1
+        return raised
+
+    # --- windows and tests --------------------------------------------------
+
+    def _close(self, bucket_id):
+        counts, hist = self._open_counts.copy(), self._open_hist.copy()
+        self._ring.append((counts, hist))
+        self._window_counts += counts
+        self._window_hist += hist
+        if len(self._ring) > self.window:
+            old_counts, old_hist = self._ring.popleft()
+            self._window_counts -= old_counts
+            self._window_hist -= old_hist
+        window_end = pd.Timestamp((bucket_id + 1) * self._width)
+
+        rate, n = _metric_rate(self._window_counts, self.metric)
+        supported = n >= self.min_count
+        disparity = np.ptp(rate[supported]) if supported.sum() >= 2 else np.nan
+
+        if self._reference_seen < self.reference_buckets:
+            self._reference_seen += 1
+            self._reference_counts += counts
+            self._reference_hist += hist
+            if self._reference_seen == self.reference_buckets:
+                self._reference_rate, self._reference_n = _metric_rate(self._reference_counts, self.metric)
+            self._record(window_end, rate, n, np.full(len(rate), np.nan), np.full(len(rate), np.nan), disparity)
+            return []
+
+        # CUSUM on this bucket alone: buckets do not overlap, windows do.
+        bucket_rate, bucket_n = _metric_rate(counts, self.metric)
+        p0 = self._reference_rate
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.maximum(p0 * (1 - p0), 1e-4)
+            se = np.sqrt(variance / bucket_n)
+            z = (bucket_rate - p0) / se
+            slack = np.maximum(CUSUM_SLACK, self.tolerance / se) + REFERENCE_MARGIN * np.sqrt(variance / self._reference_n) / se
+        z = np.where((bucket_n > 0) & np.isfinite(z), z, 0.0)
+        slack = np.where(np.isfinite(slack), slack, CUSUM_SLACK)
+        self._cusum[:, 0] = np.maximum(0.0, self._cusum[:, 0] + z - slack)
+        self._cusum[:, 1] = np.maximum(0.0, self._cusum[:, 1] - z - slack)
+        cusum = self._cusum.max(axis=1)
+
+        psi = np.where(supported & (self._reference_hist.sum(axis=1) > 0),
+                       _psi(self._window_hist, self._reference_hist), np.nan)
+        self._record(window_end, rate, n, cusum, psi, disparity)
+
+        raised = []
+        for i, group in enumerate(self.groups):
+            raised += self._check(window_end, group, "cusum", cusum[i])
+            raised += self._check(window_end, group, "psi", psi[i])
+        raised += self._check(window_end, None, "disparity", disparity)
+        self.alerts += raised
+        return raised
+
+    def _check(self, window_end, group, test, value):
+        warning, critical = self.thresholds[test]
+        level = 0 if not value >= warning else 1 if value < critical else 2
+        previous = self._severity.get((group, test), 0)
+        self._severity[(group, test)] = level
+        if level > previous:
+            return [Alert(window_end, group, test, float(value), SEVERITIES[level - 1])]
+        return []
+
+    def _record(self, window_end, rate, n, cusum, psi, disparity):
+        self._history.append((window_end, rate, n, cusum, psi))
+        self._disparity.append((window_end, disparity))
+
+    # --- results ------------------------------------------------------------
+
+    @property
+    def reference_ready(self):
+        return self._reference_rate is not None
+
+    def history(self):
+        """One row per closed window and group: event count, metric, CUSUM and PSI."""
+        if not self._history:
+            return pd.DataFrame(columns=["window_end", "group", "count", self.metric, "cusum", "psi"])
+        frames = [pd.DataFrame({
+            "window_end": window_end,
+            "group": self.groups[:len(rate)],
+            "count": n,
+            self.metric: rate,
+            "cusum": cusum,
+            "psi": psi,
+        }) for window_end, rate, n, cusum, psi in self._history]
+        return pd.concat(frames, ignore_index=True)
+
+    def disparity(self):
+        """Between-groups difference of the monitored metric per closed window."""
+        return pd.DataFrame(self._disparity, columns=["window_end", "disparity"]).set_index("window_end")["disparity"]
+
+    def alert_table(self):
+        return pd.DataFrame(self.alerts, columns=Alert._fields)
+
+
+def monitor_file(source, timestamp_column, group_column, y_true, y_pred, score_column=None,
+                 chunksize=DEFAULT_CHUNKSIZE, **monitor_options):
+    """Replay a time-ordered CSV/Parquet prediction log through a ``DriftMonitor``."""
+    columns = [timestamp_column, group_column, y_true, y_pred] + ([score_column] if score_column else [])
+    monitor = DriftMonitor(**monitor_options)
+    for chunk in iter_chunks(source, columns=columns, chunksize=chunksize):
+        monitor.update(chunk[timestamp_column], chunk[group_column], chunk[y_true].to_numpy(), chunk[y_pred].to_numpy(),
+                       None if score_column is None else chunk[score_column].to_numpy())
+    monitor.flush()
+    return monitor
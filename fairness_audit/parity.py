@@ -0,0 +1,75 @@
+"""Demographic parity checks and decision-threshold sweeps.
+
+``threshold_sweep`` produces the whole disparity-vs-threshold curve without a
+pass per threshold: each score is binned once against the sorted thresholds,
+a single ``bincount`` builds a ``(group, bin)`` histogram, and a reversed
+cumulative sum turns it into "selected at threshold ``t``" counts for every
+group and threshold at once. That is ``O(n log T)`` for ``n`` scores and ``T``
+thresholds instead of ``O(n T)``.
+
+A parity check passes only when the disparity is strictly below its
+threshold: with the default 0.1, a gap of exactly ten points fails, matching
+the "less than 10%" wording of the acceptance criteria.
+"""
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import _as_binary, encode_groups
+
+
+class ParityCheck(NamedTuple):
+    disparity: float
+    selection_rates: pd.Series
+    passed: bool
+
+
+def selection_rates(predictions, sensitive_features, pos_label=1):
+    """Share of positive predictions per group."""
+    codes, groups = encode_groups(sensitive_features)
+    positives = np.bincount(codes, weights=_as_binary(predictions, pos_label), minlength=len(groups))
+    sizes = np.bincount(codes, minlength=len(groups))
+    with np.errstate(invalid="ignore"):
+        rates = positives / sizes
+    return pd.Series(rates, index=groups, name="selection_rate").dropna()
+
+
+def check_demographic_parity(predictions, sensitive_attributes, threshold=0.1, pos_label=1):
+    """Largest gap in selection rate between any two groups, and whether it is below ``threshold``.
+
+    The comparison is strict: a disparity equal to ``threshold`` fails.
+    """
+    rates = selection_rates(predictions, sensitive_attributes, pos_label)
+    disparity = float(rates.max() - rates.min()) if len(rates) else 0.0
+    return ParityCheck(disparity, rates, disparity < threshold)
+
+
+def threshold_sweep(scores, sensitive_features, thresholds=501):
+    """Per-group selection rate and demographic-parity disparity at every threshold.
+
+    ``thresholds`` is either an array of cut-offs or a number of evenly spaced
+    cut-offs over ``[min(scores), max(scores)]``. A row is selected when
+    ``score >= threshold``. Returns ``(rates, disparity)``: a threshold x group
+    ``DataFrame`` of selection rates and a ``Series`` of max-minus-min rates.
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    codes, groups = encode_groups(sensitive_features)
+    if np.isscalar(thresholds):
+        thresholds = np.linspace(scores.min(), scores.max(), int(thresholds))
+    thresholds = np.unique(np.asarray(thresholds, dtype=np.float64))
+    n_groups, n_thresholds = len(groups), len(thresholds)
+
+    # bins[i] = number of thresholds <= scores[i]; row i is selected at
+    # threshold k exactly when bins[i] > k.
+    bins = np.searchsorted(thresholds, scores, side="right")
+    histogram = np.bincount(codes * (n_thresholds + 1) + bins,
+                            minlength=n_groups * (n_thresholds + 1)).reshape(n_groups, n_thresholds + 1)
+    selected = np.cumsum(histogram[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    sizes = histogram.sum(axis=1)
+    observed = sizes > 0
+
+    rates = pd.DataFrame((selected[observed] / sizes[observed, None]).T,
+                         index=pd.Index(thresholds, name="threshold"), columns=groups[observed])
+    disparity = (rates.max(axis=1) - rates.min(axis=1)).rename("disparity")
+    return rates, disparity
@@ -0,0 +1,214 @@
+"""RASCI responsibility matrices at organisation scale (the Part 2 Responsibility tab).
+
+A ``RasciMatrix`` holds one ``int8`` code per task and role (0 = no
+assignment, then R, A, S, C, I), plus a sparse dict of cell notes such as
+"for high-risk" in ``A (for high-risk)``. Thousands of tasks by hundreds of
+roles take a few megabytes, and every check is a column-wise pass of numpy.
+
+Matrices load from CSV or Parquet files in chunks, either wide (one row per
+task, one column per role) or long (one row per task, role and assignment).
+Each distinct cell text is parsed once. ``validate`` applies the RASCI rules
+to all tasks at once. ``tasks_for`` answers "every task where role X is
+Accountable" from an index of the non-empty cells grouped by role and
+letter, built on first use.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.ingest import iter_chunks
+
+LETTERS = ("R", "A", "S", "C", "I")
+LETTER_NAMES = {"R": "Responsible", "A": "Accountable", "S": "Supportive", "C": "Consulted", "I": "Informed"}
+CODES = {letter: code for code, letter in enumerate(LETTERS, 1)}
+RULES = {
+    "orphan": "No role is assigned to the task.",
+    "no_accountable": "Nobody is Accountable.",
+    "multiple_accountable": "More than one role is Accountable; there should be exactly one 'A' per task.",
+    "no_responsible": "Nobody is Responsible for doing the work.",
+}
+
+_CELL = re.compile(r"\s*([RASCI])\s*(?:\((.*)\))?\s*", re.IGNORECASE)
+_EMPTY = {"", "-", "–"}
+_DISPLAY = np.array([""] + list(LETTERS), dtype=object)
+
+
+def _parse_cells(values):
+    """Codes and notes of an array of cell texts, parsing each distinct text once."""
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    parsed_codes = np.zeros(len(uniques) + 1, dtype=np.int8)  # the extra 0 is for missing cells (code -1)
+    parsed_notes = [None] * len(uniques)
+    invalid = []
+    for i, text in enumerate(uniques):
+        text = str(text).strip()
+        if text in _EMPTY:
+            continue
+        match = _CELL.fullmatch(text)
+        if match is None:
+            invalid.append(text)
+            continue
+        parsed_codes[i] = CODES[match.group(1).upper()]
+        parsed_notes[i] = match.group(2).strip() if match.group(2) else None
+    if invalid:
+        shown = ", ".join(map(repr, invalid[:5]))
+        raise ValueError(f"Cells must hold one of {'/'.join(LETTERS)}, optionally with a note in parentheses; found {shown}.")
+    noted = np.array([note is not None for note in parsed_notes] + [False])
+    positions = np.flatnonzero(noted[codes])
+    return parsed_codes[codes], {int(p): parsed_notes[codes[p]] for p in positions}
+
+
+class RasciMatrix:
+    """Assignments of ``roles`` to ``tasks``: a ``(tasks, roles)`` array of codes.
+
+    ``notes`` maps ``(task_position, role_position)`` to the text qualifying
+    a cell, e.g. ``"for high-risk"``.
+    """
+
+    def __init__(self, tasks, roles, codes, notes=None):
+        self.tasks = pd.Index(tasks, name="task", dtype=object)
+        self.roles = pd.Index(roles, name="role", dtype=object)
+        for label, index in (("task", self.tasks), ("role", self.roles)):
+            if index.has_duplicates:
+                raise ValueError(f"Duplicate {label} names: {list(index[index.duplicated()].unique()[:5])}.")
+        self.codes = np.asarray(codes, dtype=np.int8)
+        if self.codes.shape != (len(self.tasks), len(self.roles)):
+            raise ValueError("codes must have shape (n_tasks, n_roles).")
+        self.notes = dict(notes or {})
+        self._index = None
+
+    @classmethod
+    def from_frame(cls, frame, task_column=None):
+        """From a wide table: one row per task, one column per role (``task_column`` defaults to the first)."""
+        task_column = task_column or frame.columns[0]
+        roles = [column for column in frame.columns if column != task_column]
+        cells = frame[roles].to_numpy(dtype=object)
+        codes, notes = _parse_cells(cells.ravel())
+        return cls(frame[task_column].astype(str).to_numpy(), roles, codes.reshape(cells.shape),
+                   {divmod(p, len(roles)): note for p, note in notes.items()})
+
+    @classmethod
+    def from_long(cls, frame, task_column="task", role_column="role", assignment_column="assignment"):
+        """From a long table: one row per task, role and assignment; unlisted cells are empty."""
+        tasks, task_names = pd.factorize(frame[task_column].astype(str))
+        roles, role_names = pd.factorize(frame[role_column].astype(str))
+        cell = tasks.astype(np.int64) * len(role_names) + roles
+        duplicated = pd.Series(cell).duplicated().to_numpy()
+        if duplicated.any():
+            first = np.flatnonzero(duplicated)[0]
+            raise ValueError(f"Task {task_names[tasks[first]]!r} lists role {role_names[roles[first]]!r} more than once.")
+        parsed, notes = _parse_cells(frame[assignment_column].to_numpy(dtype=object))
+        codes = np.zeros((len(task_names), len(role_names)), dtype=np.int8)
+        codes[tasks, roles] = parsed
+        return cls(task_names, role_names, codes, {(int(tasks[p]), int(roles[p])): note for p, note in notes.items()})
+
+    @classmethod
+    def read(cls, source, task_column=None, role_column=None, assignment_column="assignment", fmt=None):
+        """From a CSV/Parquet file, read in chunks: long format when ``role_column`` is given, else wide."""
+        if role_column is not None:
+            columns = [task_column or "task", role_column, assignment_column]
+            chunks = [chunk.astype({columns[0]: "category", role_column: "category"})
+                      for chunk in iter_chunks(source, columns=columns, fmt=fmt)]
+            frame = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame(columns=columns)
+            return cls.from_long(frame, columns[0], role_column, assignment_column)
+        parts = []
+        for chunk in iter_chunks(source, fmt=fmt):
+            part = cls.from_frame(chunk, task_column)
+            parts.append(part)
+        if not parts:
+            raise ValueError("The RASCI file has no rows.")
+        offsets = np.cumsum([0] + [len(part.tasks) for part in parts])
+        notes = {(offset + t, r): note for offset, part in zip(offsets, parts) for (t, r), note in part.notes.items()}
+        return cls(np.concatenate([part.tasks.to_numpy() for part in parts]), parts[0].roles,
+                   np.concatenate([part.codes for part in parts]), notes)
+
+    def __repr__(self):
+        return f"RasciMatrix({len(self.tasks):,} tasks x {len(self.roles):,} roles, {np.count_nonzero(self.codes):,} assignments)"
+
+    def letter_counts(self, axis=1):
+        """Assignments per letter: per task (``axis=1``, shape ``(tasks, 5)``) or per role (``axis=0``)."""
+        return np.stack([np.count_nonzero(self.codes == code, axis=axis) for code in CODES.values()], axis=-1)
+
+    def role_summary(self):
+        """Tasks per role and letter."""
+        return pd.DataFrame(self.letter_counts(axis=0), index=self.roles, columns=list(LETTERS))
+
+    def validate(self):
+        """One row per broken rule and task (see ``RULES``); empty when the matrix is sound."""
+        counts = self.letter_counts()
+        accountable, responsible = counts[:, 1], counts[:, 0]
+        assigned = counts.sum(axis=1) > 0
+        checks = {
+            "orphan": ~assigned,
+            "no_accountable": assigned & (accountable == 0),
+            "multiple_accountable": accountable > 1,
+            "no_responsible": assigned & (responsible == 0),
+        }
+        frames = []
+        for rule, mask in checks.items():
+            rows = np.flatnonzero(mask)
+            detail = [RULES[rule]] * len(rows)
+            if rule == "multiple_accountable" and len(rows):
+                task, role = np.nonzero(self.codes[rows] == CODES["A"])
+                split = np.searchsorted(task, np.arange(1, len(rows)))
+                detail = [f"Accountable: {', '.join(self._label(rows[i], r) for r in group)}."
+                          for i, group in enumerate(np.split(role, split))]
+            frames.append(pd.DataFrame({"task": self.tasks[rows], "rule": rule, "detail": detail}))
+        issues = pd.concat(frames, ignore_index=True)
+        issues["rule"] = pd.Categorical(issues["rule"], categories=list(RULES))
+        return issues
+
+    def _label(self, task, role):
+        note = self.notes.get((int(task), int(role)))
+        return f"{self.roles[role]} ({note})" if note else str(self.roles[role])
+
+    def _lookup(self):
+        # Non-empty cells sorted by (role, letter), task order kept within each run;
+        # ``offsets[role * 6 + code]`` is where a run starts.
+        if self._index is None:
+            task, role = np.nonzero(self.codes)
+            key = role.astype(np.int64) * (len(LETTERS) + 1) + self.codes[task, role]
+            order = np.argsort(key, kind="stable")
+            offsets = np.searchsorted(key[order], np.arange(len(self.roles) * (len(LETTERS) + 1) + 1))
+            self._index = (task[order], offsets)
+        return self._index
+
+    def tasks_for(self, role, letter="A"):
+        """Tasks where ``role`` holds ``letter``, in matrix order."""
+        if letter not in CODES:
+            raise ValueError(f"Unknown letter {letter!r}; expected one of {list(LETTERS)}.")
+        position = self.roles.get_loc(role)
+        tasks, offsets = self._lookup()
+        key = position * (len(LETTERS) + 1) + CODES[letter]
+        return self.tasks[tasks[offsets[key]:offsets[key + 1]]]
+
+    def roles_for(self, task):
+        """``{role: letter}`` of one task's assignments."""
+        row = self.codes[self.tasks.get_loc(task)]
+        return {self.roles[r]: LETTERS[code - 1] for r, code in zip(np.flatnonzero(row), row[row > 0])}
+
+    def search(self, text):
+        """Positions of the tasks whose name contains ``text`` (case-insensitive)."""
+        if not text:
+            return np.arange(len(self.tasks))
+        return np.flatnonzero(self.tasks.str.contains(text, case=False, regex=False))
+
+    def page(self, rows, roles=None):
+        """Display table of the task positions ``rows`` and the given ``roles`` (default: all), notes included."""
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.arange(len(self.roles)) if roles is None else self.roles.get_indexer(roles)
+        if (columns < 0).any():
+            raise KeyError(f"Unknown roles: {[r for r, c in zip(roles, columns) if c < 0]}.")
+        cells = _DISPLAY[self.codes[np.ix_(rows, columns)]]
+        if self.notes:
+            row_at = {r: i for i, r in enumerate(rows)}
+            column_at = {c: j for j, c in enumerate(columns)}
+            for (task, role), note in self.notes.items():
+                if task in row_at and role in column_at:
+                    i, j = row_at[task], column_at[role]
+                    cells[i, j] = f"{cells[i, j]} ({note})"
+        return pd.DataFrame(cells, index=self.tasks[rows], columns=self.roles[columns])
+
+    def to_frame(self):
+        """The whole matrix as a wide table, notes included."""
+        return self.page(np.arange(len(self.tasks))).reset_index()
@@ -0,0 +1,283 @@
+"""Headless audits and their JSON/Markdown reports.
+
+Each ``*_report`` function runs one of the playbook's audits without
+Streamlit and returns a ``Report``: scalar ``summary`` fields, named tables,
+and a ``passed`` verdict when a CI gate (a maximum disparity, a risk tier to
+fail on) was given. ``run_batch`` runs many audits in worker processes, e.g.
+one per model in a CI pipeline.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.augmentation import SwapLexicon, augment_file
+from fairness_audit.escalation import AUTHORITIES, DECISION_TIERS, EscalationRouter
+from fairness_audit.fusion import BALANCED_WEIGHTS, dominant_weights, fuse
+from fairness_audit.ingest import DEFAULT_CHUNKSIZE, ingest_files, iter_chunks, read_catalog
+from fairness_audit.monitoring import SEVERITIES, monitor_file
+from fairness_audit.ranking import fair_rerank
+from fairness_audit.rasci import RULES, RasciMatrix
+from fairness_audit.risk import FACTORS, TIERS, assess_risk, classify_portfolio, tier_distribution
+from fairness_audit.store import MetricStore
+
+
+class Report(NamedTuple):
+    audit: str
+    name: str
+    summary: dict
+    tables: dict
+    passed: Optional[bool] = None
+
+
+def risk_report(domain_impact, autonomy, decision_impact, scale, fail_on=None, name="risk"):
+    """Inherent-risk score and tier; fails when the tier is ``fail_on`` or above."""
+    assessment = assess_risk(domain_impact, autonomy, decision_impact, scale)
+    answers = dict(zip(FACTORS, (domain_impact, autonomy, decision_impact, scale)))
+    factors = pd.DataFrame({
+        "level": answers,
+        "points": assessment.points,
+    }).rename_axis("factor")
+    passed = None if fail_on is None else TIERS.index(assessment.tier) < TIERS.index(fail_on)
+    summary = {"score": assessment.score, "tier": assessment.tier}
+    return Report("risk", name, summary, {"factors": factors}, passed)
+
+
+def portfolio_report(source, columns=None, fail_on=None, name=None):
+    """Score and tier of every system in an inventory file; fails when any is ``fail_on`` or above."""
+    inventory = pd.concat(iter_chunks(source), ignore_index=True)
+    classified = classify_portfolio(inventory, columns)
+    distribution = tier_distribution(classified)
+    summary = {"systems": len(classified)}
+    summary.update({tier: int(count) for tier, count in distribution["systems"].items()})
+    passed = None
+    if fail_on is not None:
+        flagged = int(distribution["systems"].iloc[TIERS.index(fail_on):].sum())
+        summary["flagged"] = flagged
+        passed = flagged == 0
+    systems = classified.sort_values("score", ascending=False, kind="stable")
+    return Report("portfolio", name or str(source), summary, {"distribution": distribution, "systems": systems.rename_axis("row")}, passed)
+
+
+def disaggregation_report(sources, y_true, y_pred, sensitive_columns, pos_label=1,
+                          chunksize=DEFAULT_CHUNKSIZE, max_difference=None, name=None,
+                          store=None, model=None):
+    """Per-group metrics of a prediction file set, streamed in chunks.
+
+    ``max_difference`` maps metric names to the largest acceptable
+    between-groups ``difference()``. With ``store`` (a ``MetricStore`` file),
+    the per-group metrics are also appended to its history under ``model``.
+    """
+    sources = [sources] if isinstance(sources, (str, os.PathLike)) else list(sources)
+    audit = ingest_files(sources, y_true, y_pred, sensitive_columns, pos_label=pos_label, chunksize=chunksize)
+    metrics = audit.to_metrics()
+    disparity = pd.DataFrame({"difference": metrics.difference(), "ratio": metrics.ratio()}).rename_axis("metric")
+
+    passed = None
+    summary = {"rows": audit.rows, "groups": int((metrics.group_size > 0).sum())}
+    summary.update({f"overall_{metric}": value for metric, value in metrics.overall.items()})
+    if max_difference:
+        unknown = [metric for metric in max_difference if metric not in disparity.index]
+        if unknown:
+            raise ValueError(f"Unknown metrics {unknown}; expected some of {list(disparity.index)}.")
+        breaches = {metric: float(disparity.loc[metric, "difference"]) for metric, limit in max_difference.items()
+                    if disparity.loc[metric, "difference"] > limit}
+        summary["breaches"] = breaches
+        passed = not breaches
+    if store:
+        metric_store = MetricStore(store)
+        try:
+            summary["stored_observations"] = metric_store.record_metrics(model or name or ", ".join(map(str, sources)), metrics)
+        finally:
+            metric_store.close()
+
+    tables = {
+        "by_group": metrics.by_group.join(metrics.group_size),
+        "disparity": disparity,
+    }
+    return Report("disaggregate", name or ", ".join(map(str, sources)), summary, tables, passed)
+
+
+def rerank_report(source, score_column, group_column, protected, fairness_boost, k=10,
+                  max_exposure_gap=None, name=None):
+    """Exposure of each provider group in a re-ranked catalog."""
+    scores, groups = read_catalog(source, score_column, group_column)
+    result = fair_rerank(scores, groups, protected, fairness_boost, k=k)
+    summary = {
+        "items": len(scores),
+        "k": min(k, len(scores)),
+        "fairness_boost": fairness_boost,
+        "exposure_gap": result.exposure_gap,
+        "relevance_retained": result.relevance_retained,
+    }
+    passed = None if max_exposure_gap is None else result.exposure_gap <= max_exposure_gap
+    return Report("rerank", name or str(source), summary, {"exposure": result.exposure}, passed)
+
+
+def drift_report(source, timestamp_column, group_column, y_true, y_pred, score_column=None, bucket="1h",
+                 window=24, metric="selection_rate", fail_on=None, chunksize=DEFAULT_CHUNKSIZE, name=None, **options):
+    """Replay a prediction log through a ``DriftMonitor``; fails on any alert of ``fail_on`` severity or above.
+
+    The alerts are also routed to their decision tiers: ``incidents`` lists
+    the resulting open incidents per authority, most urgent first.
+    """
+    monitor = monitor_file(source, timestamp_column, group_column, y_true, y_pred, score_column=score_column,
+                           chunksize=chunksize, bucket=bucket, window=window, metric=metric, **options)
+    alerts = monitor.alert_table()
+    router = EscalationRouter()
+    router.submit(alerts, model=name or str(source))
+    router.wait()
+    incidents = pd.concat({authority: router.queue(authority).drop(columns=["model", "received"]) for authority in AUTHORITIES},
+                          names=["authority", "incident"])
+    history = monitor.history()
+    summary = {
+        "events": monitor.events,
+        "late_events": monitor.late_events,
+        "windows": len(monitor.disparity()),
+        "final_disparity": float(monitor.disparity().iloc[-1]) if len(history) else np.nan,
+    }
+    summary.update({f"{severity.lower()}_alerts": int((alerts["severity"] == severity).sum()) for severity in SEVERITIES})
+    summary.update({f"tier_{tier}_incidents": int((incidents["tier"] == tier).sum()) for tier in DECISION_TIERS})
+    passed = None
+    if fail_on is not None:
+        passed = not alerts["severity"].isin(SEVERITIES[SEVERITIES.index(fail_on):]).any()
+    latest = history[history["window_end"] == history["window_end"].max()].set_index("group").drop(columns="window_end")
+    return Report("monitor", name or str(source), summary, {"alerts": alerts.rename_axis("alert"), "incidents": incidents, "latest_window": latest}, passed)
+
+
+def augmentation_report(source, destination, fields=("text",), lexicon=None, keep_original=True, jobs=None, name=None):
+    """Counterfactual copies of a JSONL corpus's records, with swap counts per attribute.
+
+    ``lexicon`` is a swap lexicon JSON file (default: the built-in one).
+    """
+    lexicon = SwapLexicon.from_json(lexicon) if lexicon else SwapLexicon()
+    stats = augment_file(source, destination, fields=fields, lexicon=lexicon, keep_original=keep_original, jobs=jobs)
+    summary = {
+        "documents": stats.documents,
+        "augmented": stats.augmented,
+        "swaps": int(stats.by_attribute["swaps"].sum()),
+        "destination": str(destination),
+    }
+    return Report("augment", name or str(source), summary, {"by_attribute": stats.by_attribute, "terms": stats.terms.set_index("term")})
+
+
+def rasci_report(source, task_column=None, role_column=None, assignment_column="assignment", name=None):
+    """RASCI rule violations of a responsibility matrix file; fails when any task breaks a rule.
+
+    The file is wide (one column per role) unless ``role_column`` is given,
+    in which case it is long (one row per task, role and assignment).
+    """
+    matrix = RasciMatrix.read(source, task_column, role_column, assignment_column)
+    issues = matrix.validate()
+    summary = {"tasks": len(matrix.tasks), "roles": len(matrix.roles), "assignments": int((matrix.codes > 0).sum())}
+    summary.update({rule: int(count) for rule, count in issues["rule"].value_counts(sort=False).reindex(list(RULES)).items()})
+    tables = {"roles": matrix.role_summary(), "issues": issues.set_index("task")}
+    return Report("rasci", name or str(source), summary, tables, issues.empty)
+
+
+def fusion_report(scores, weights=None, dominant=None, name="fusion"):
+    """Fused score under the given weights, balanced weights and each dominant modality."""
+    scenarios = {"balanced": BALANCED_WEIGHTS}
+    scenarios.update({f"{modality} dominant": dominant_weights(modality) for modality in BALANCED_WEIGHTS})
+    if dominant is not None:
+        weights = dominant_weights(dominant)
+    if weights is not None:
+        scenarios = {"configured": weights, **scenarios}
+
+    table = pd.DataFrame.from_dict(scenarios, orient="index").rename_axis("weights")
+    table["fused_score"] = [float(fuse(scores, w)) for w in scenarios.values()]
+    summary = {
+        "fused_score": float(table["fused_score"].iloc[0]),
+        "spread_across_weightings": float(table["fused_score"].max() - table["fused_score"].min()),
+    }
+    return Report("fusion", name, summary, {"scenarios": table, "scores": pd.Series(scores, name="score").rename_axis("modality").to_frame()})
+
+
+AUDITS = {
+    "risk": risk_report,
+    "portfolio": portfolio_report,
+    "disaggregate": disaggregation_report,
+    "rerank": rerank_report,
+    "monitor": drift_report,
+    "augment": augmentation_report,
+    "rasci": rasci_report,
+    "fusion": fusion_report,
+}
+
+
+def run_audit(spec):
+    """Run one audit from a ``{"audit": <name>, **arguments}`` mapping.
+
+    Errors are reported as a failed ``Report`` rather than raised, so one bad
+    entry does not abort a batch.
+    """
+    spec = dict(spec)
+    audit = spec.pop("audit", None)
+    name = spec.get("name") or audit or "audit"
+    try:
+        if audit not in AUDITS:
+            raise ValueError(f"Unknown audit {audit!r}; expected one of {list(AUDITS)}.")
+        return AUDITS[audit](**spec)
+    except (ValueError, KeyError, TypeError, OSError, ImportError) as exc:
+        return Report(audit or "unknown", name, {"error": f"{type(exc).__name__}: {exc}"}, {}, False)
+
+
+def run_batch(specs, jobs=None):
+    """Run many audits, in up to ``jobs`` worker processes (default: all cores)."""
+    specs = list(specs)
+    jobs = min(jobs or os.cpu_count() or 1, len(specs))
+    if jobs <= 1:
+        return [run_audit(spec) for spec in specs]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run_audit, specs))
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _table_records(table):
+    return json.loads(table.reset_index().to_json(orient="records", date_format="iso"))
+
+
+def render_json(reports):
+    payload = [{
+        "audit": report.audit,
+        "name": report.name,
+        "passed": report.passed,
+        "summary": report.summary,
+        "tables": {title: _table_records(table) for title, table in report.tables.items()},
+    } for report in reports]
+    return json.dumps(payload, indent=2, default=_json_default)
+
+
+def _format_cell(value):
+    if isinstance(value, (float, np.floating)):
+        return "" if np.isnan(value) else f"{value:.4f}"
+    return str(value)
+
+
+def _markdown_table(table):
+    table = table.reset_index()
+    lines = [
+        "| " + " | ".join(map(str, table.columns)) + " |",
+        "| " + " | ".join("---" for _ in table.columns) + " |",
+    ]
+    lines += ["| " + " | ".join(_format_cell(value) for value in row) + " |" for row in table.itertuples(index=False)]
+    return "\n".join(lines)
+
+
+def render_markdown(reports):
+    sections = ["# Fairness Audit Report"]
+    for report in reports:
+        verdict = {True: " — ✅ passed", False: " — ❌ failed", None: ""}[report.passed]
+        sections.append(f"## {report.audit}: {report.name}{verdict}")
+        sections.append("\n".join(f"- **{key}:** {_format_cell(value)}" for key, value in report.summary.items()))
+        for title, table in report.tables.items():
+            sections.append(f"### {title}\n\n{_markdown_table(table)}")
+    return "\n\n".join(sections) + "\n"
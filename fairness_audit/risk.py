@@ -0,0 +1,216 @@
+"""Multi-factor inherent-risk classification (the Part 4 calculator).
+
+A system is rated on four factors, each worth 1, 3 or 5 points. The total
+(4-20) maps to a tier: below 8 is minimal/low risk, 8-12 limited risk and
+anything above 12 high risk. ``classify_portfolio`` scores a whole AI-system
+inventory at once.
+
+There are only 3^4 = 81 factor combinations, so ``risk_table`` tabulates all
+of them, together with the nearest single-factor change that moves each one
+across a tier boundary. The table for the default (equal) weights is built at
+import time as ``RISK_TABLE``; tables for governance-board weights are built
+once per weight set and cached.
+"""
+import functools
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+DOMAIN_IMPACT = {"Low": 1, "Medium": 3, "High": 5}
+AUTONOMY = {"Human in the loop": 1, "Human over the loop": 3, "Fully Autonomous": 5}
+DECISION_IMPACT = {"Informational": 1, "Affects Opportunities": 3, "Life-Altering": 5}
+SCALE = {"< 1k people": 1, "1k - 100k people": 3, "> 100k people": 5}
+
+FACTORS = {
+    "domain_impact": DOMAIN_IMPACT,
+    "autonomy": AUTONOMY,
+    "decision_impact": DECISION_IMPACT,
+    "scale": SCALE,
+}
+MAX_SCORE = sum(max(levels.values()) for levels in FACTORS.values())
+
+TIERS = ("Minimal / Low Risk", "Limited Risk", "High Risk")
+LIMITED_RISK_MIN = 8   # from 8 inclusive
+HIGH_RISK_ABOVE = 12   # strictly above 12
+
+
+class RiskAssessment(NamedTuple):
+    score: float
+    tier: str
+    points: dict
+
+
+def risk_tier(score):
+    """Tier label for a total score."""
+    return TIERS[risk_tiers([score]).codes[0]]
+
+
+def risk_tiers(scores):
+    """Tier labels for an array of total scores, as an ordered ``pd.Categorical``."""
+    # Rounding keeps weighted sums such as 7.999999999 on the right side of a boundary.
+    scores = np.round(np.asarray(scores, dtype=np.float64), 9)
+    # Weighted scores are fractional, so both boundaries are compared as stated: 8 <= limited <= 12 < high.
+    codes = (scores >= LIMITED_RISK_MIN).astype(np.int8) + (scores > HIGH_RISK_ABOVE)
+    return pd.Categorical.from_codes(codes, categories=TIERS, ordered=True)
+
+
+def assess_risk(domain_impact, autonomy, decision_impact, scale):
+    """Score and classify one system from its four factor levels."""
+    answers = {"domain_impact": domain_impact, "autonomy": autonomy, "decision_impact": decision_impact, "scale": scale}
+    points = {}
+    for factor, level in answers.items():
+        levels = FACTORS[factor]
+        if level not in levels:
+            raise ValueError(f"Unknown {factor} level {level!r}; expected one of {list(levels)}.")
+        points[factor] = levels[level]
+    score = sum(points.values())
+    return RiskAssessment(score, risk_tier(score), points)
+
+
+def _level_points(levels):
+    # Lookup keyed by normalised label and by the point values themselves,
+    # so inventories may record either "Fully Autonomous" or 5.
+    lookup = {str(label).strip().lower(): points for label, points in levels.items()}
+    lookup.update({str(points): points for points in levels.values()})
+    return lookup
+
+
+def _normalise_level(value):
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool) and float(value).is_integer():
+        return str(int(value))
+    return str(value).strip().lower()
+
+
+def factor_points(values, factor):
+    """Points of every entry of ``values`` for one factor.
+
+    Labels match case- and whitespace-insensitively; the point values (1, 3,
+    5) are accepted as well. Each distinct value is looked up once, so the
+    cost is one ``pd.factorize`` over the column. Unknown or missing entries
+    raise ``ValueError`` naming the offending rows.
+    """
+    levels = FACTORS[factor]
+    lookup = _level_points(levels)
+    values = np.asarray(values, dtype=object)
+    codes, uniques = pd.factorize(values)
+    unique_points = np.array([lookup.get(_normalise_level(u), 0) for u in uniques] + [0], dtype=np.int64)
+    points = unique_points[codes]  # code -1 (missing) picks the trailing 0
+    invalid = np.flatnonzero(points == 0)
+    if len(invalid):
+        shown = ", ".join(f"row {i}: {values[i]!r}" for i in invalid[:5])
+        more = f" and {len(invalid) - 5} more" if len(invalid) > 5 else ""
+        raise ValueError(f"Unknown {factor} level in {shown}{more}; expected one of {list(levels)}.")
+    return points
+
+
+def classify_portfolio(inventory, columns=None):
+    """Score and classify every system of an inventory in one vectorized pass.
+
+    ``inventory`` is a ``DataFrame`` with one row per AI system; ``columns``
+    maps each factor name to its column (default: the factor names
+    themselves). Returns a copy of ``inventory`` with ``<factor>_points``,
+    ``score`` and ``tier`` columns appended.
+    """
+    columns = {factor: factor for factor in FACTORS} | dict(columns or {})
+    missing = sorted({column for column in columns.values() if column not in inventory.columns})
+    if missing:
+        raise ValueError(f"Inventory has no columns {missing}; found {list(inventory.columns)}.")
+    result = inventory.copy()
+    score = np.zeros(len(inventory), dtype=np.int64)
+    for factor in FACTORS:
+        points = factor_points(inventory[columns[factor]], factor)
+        result[f"{factor}_points"] = points
+        score += points
+    result["score"] = score
+    result["tier"] = risk_tiers(score)
+    return result
+
+
+def tier_distribution(classified):
+    """Number and share of systems in each tier of a ``classify_portfolio`` result."""
+    counts = classified["tier"].value_counts(sort=False).reindex(TIERS, fill_value=0)
+    return pd.DataFrame({
+        "systems": counts,
+        "share": counts / max(len(classified), 1),
+    }).rename_axis("tier")
+
+
+def normalise_weights(weights=None):
+    """Factor weights rescaled to average 1, as a tuple in ``FACTORS`` order.
+
+    Weights are relative: rescaling keeps the 4-20 score range, and with it
+    the tier thresholds, meaningful. Missing factors default to 1.
+    """
+    weights = {factor: 1.0 for factor in FACTORS} | dict(weights or {})
+    unknown = [factor for factor in weights if factor not in FACTORS]
+    if unknown:
+        raise ValueError(f"Unknown factors {unknown}; expected some of {list(FACTORS)}.")
+    values = np.array([float(weights[factor]) for factor in FACTORS])
+    if (values < 0).any() or values.sum() == 0:
+        raise ValueError("Factor weights must be non-negative and not all zero.")
+    return tuple(np.round(values * len(FACTORS) / values.sum(), 9).tolist())
+
+
+def risk_table(weights=None):
+    """Score, tier and nearest tier flips of every factor combination.
+
+    Indexed by one level per factor. For each combination, ``down_*`` and
+    ``up_*`` describe the single-factor change with the smallest score change
+    that lands in a lower (resp. higher) tier, or hold ``None`` when no
+    single change does. The returned frame is cached and shared; do not
+    modify it.
+    """
+    return _risk_table(normalise_weights(weights))
+
+
+@functools.lru_cache(maxsize=32)
+def _risk_table(weights):
+    weights = np.asarray(weights)
+    names = list(FACTORS)
+    levels = [list(FACTORS[factor]) for factor in names]
+    level_points = np.array([list(FACTORS[factor].values()) for factor in names], dtype=np.float64)
+    n_factors, n_levels = level_points.shape
+
+    # codes[c, f]: level of factor f in combination c.
+    codes = np.indices((n_levels,) * n_factors).reshape(n_factors, -1).T
+    weighted = weights * level_points[np.arange(n_factors), codes]
+    score = weighted.sum(axis=1)
+    tier = risk_tiers(score).codes
+
+    # alternative[c, f, l]: score of combination c with factor f set to level l.
+    alternative = score[:, None, None] - weighted[:, :, None] + (weights[:, None] * level_points)[None]
+    alternative_tier = risk_tiers(alternative.ravel()).codes.reshape(alternative.shape)
+    change = np.abs(alternative - score[:, None, None])
+
+    table = pd.DataFrame(
+        {"score": score, "tier": risk_tiers(score)},
+        index=pd.MultiIndex.from_product(levels, names=names),
+    )
+    rows = np.arange(len(score))
+    for direction, crosses in (("down", alternative_tier < tier[:, None, None]),
+                               ("up", alternative_tier > tier[:, None, None])):
+        cost = np.where(crosses, change, np.inf).reshape(len(score), -1)
+        best = cost.argmin(axis=1)
+        found = np.isfinite(cost[rows, best])
+        factor, level = np.divmod(best, n_levels)
+        table[f"{direction}_factor"] = np.where(found, np.array(names, dtype=object)[factor], None)
+        table[f"{direction}_level"] = np.where(found, np.array(levels, dtype=object)[factor, level], None)
+        table[f"{direction}_score"] = np.where(found, alternative[rows, factor, level], np.nan)
+        table[f"{direction}_tier"] = np.where(found, np.array(TIERS, dtype=object)[alternative_tier[rows, factor, level]], None)
+    return table
+
+
+def what_if_grid(table, x_factor, y_factor, answers):
+    """Scores of all ``x_factor`` x ``y_factor`` levels, other factors fixed at ``answers``.
+
+    ``table`` is a ``risk_table``; returns one row per cell in long format.
+    """
+    if x_factor == y_factor:
+        raise ValueError("Pick two different factors.")
+    others = [factor for factor in FACTORS if factor not in (x_factor, y_factor)]
+    grid = table.xs(tuple(answers[factor] for factor in others), level=others)
+    return grid[["score", "tier"]].reset_index()
+
+
+RISK_TABLE = risk_table()
@@ -0,0 +1,220 @@
+"""Embedded SQLite store of historical per-model, per-group fairness metrics.
+
+Raw observations (one metric value of one group of one model at one time,
+with the number of predictions behind it) go to ``metrics``, indexed on
+``(model, group_name, ts)``. Every insert also upserts daily and weekly
+rollups (count-weighted sums, minimum, maximum), so dashboards and
+period-over-period deltas read a few pre-aggregated rows per group instead of
+scanning raw history.
+"""
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import METRICS
+
+STORE_ENV = "FAIRNESS_AUDIT_METRIC_STORE"
+PERIODS = ("day", "week")
+RECORD_COLUMNS = ["model", "group", "metric", "timestamp", "value", "count"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    model TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    value REAL NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metrics_model_group_ts ON metrics (model, group_name, ts);
+CREATE TABLE IF NOT EXISTS rollups (
+    period TEXT NOT NULL,
+    model TEXT NOT NULL,
+    group_name TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    period_start INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    weight INTEGER NOT NULL,
+    weighted_sum REAL NOT NULL,
+    value_min REAL NOT NULL,
+    value_max REAL NOT NULL,
+    PRIMARY KEY (period, model, metric, period_start, group_name)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_ROLLUP = """
+INSERT INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (period, model, metric, period_start, group_name) DO UPDATE SET
+    samples = samples + excluded.samples,
+    weight = weight + excluded.weight,
+    weighted_sum = weighted_sum + excluded.weighted_sum,
+    value_min = MIN(value_min, excluded.value_min),
+    value_max = MAX(value_max, excluded.value_max)
+"""
+
+
+def _epoch_seconds(timestamps):
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    if index.tz is not None:
+        index = index.tz_convert(None)
+    return index.as_unit("s").asi8
+
+
+def _period_starts(seconds, period):
+    days = seconds // 86_400
+    if period == "week":
+        days -= (days + 3) % 7  # 1970-01-01 was a Thursday; weeks start on Monday
+    return days * 86_400
+
+
+def _bounds(start, end):
+    lower = -2**62 if start is None else int(_epoch_seconds([start])[0])
+    upper = 2**62 if end is None else int(_epoch_seconds([end])[0])
+    return lower, upper
+
+
+class MetricStore:
+    """Per-model, per-group metric history in a SQLite file (or ``":memory:"``).
+
+    One connection is shared by all threads of a process behind a lock, so a
+    store can be cached as a Streamlit resource.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = str(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return pd.read_sql_query(sql, self._connection, params=params)
+
+    def record(self, frame):
+        """Append observations; ``frame`` has the columns of ``RECORD_COLUMNS``.
+
+        ``count`` is the number of predictions behind each value and weights
+        it in the rollups. Rows without a value are skipped.
+        """
+        missing = [column for column in RECORD_COLUMNS if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Observations need the columns {RECORD_COLUMNS}; missing {missing}.")
+        frame = frame[RECORD_COLUMNS].dropna(subset=["value"])
+        rows = pd.DataFrame({
+            "model": frame["model"].astype(str).to_numpy(),
+            "group_name": frame["group"].astype(str).to_numpy(),
+            "metric": frame["metric"].astype(str).to_numpy(),
+            "ts": _epoch_seconds(frame["timestamp"]),
+            "value": frame["value"].to_numpy(dtype=np.float64),
+            "count": frame["count"].fillna(0).to_numpy(dtype=np.int64),
+        })
+        rollups = []
+        weighted = rows.assign(weighted_sum=rows["value"] * rows["count"])
+        for period in PERIODS:
+            grouped = weighted.assign(period_start=_period_starts(rows["ts"].to_numpy(), period)).groupby(
+                ["model", "group_name", "metric", "period_start"], sort=False)
+            batch = grouped.agg(
+                samples=("value", "size"),
+                weight=("count", "sum"),
+                weighted_sum=("weighted_sum", "sum"),
+                value_min=("value", "min"),
+                value_max=("value", "max"),
+            ).reset_index()
+            batch.insert(0, "period", period)
+            rollups.append(batch[["period", "model", "group_name", "metric", "period_start",
+                                  "samples", "weight", "weighted_sum", "value_min", "value_max"]])
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?)",
+                                         rows.itertuples(index=False, name=None))
+            for batch in rollups:
+                self._connection.executemany(_UPSERT_ROLLUP, (
+                    (p, m, g, me, int(s), int(n), int(w), float(ws), float(lo), float(hi))
+                    for p, m, g, me, s, n, w, ws, lo, hi in batch.itertuples(index=False, name=None)))
+        return len(rows)
+
+    def record_metrics(self, model, metrics, timestamp=None):
+        """Append every metric of every group of a ``DisaggregatedMetrics``."""
+        by_group = metrics.by_group
+        groups = [", ".join(map(str, g)) if isinstance(g, tuple) else str(g) for g in by_group.index]
+        frame = pd.DataFrame({
+            "group": np.repeat(groups, len(METRICS)),
+            "metric": np.tile(METRICS, len(groups)),
+            "value": by_group[list(METRICS)].to_numpy().ravel(),
+            "count": np.repeat(metrics.group_size.to_numpy(), len(METRICS)),
+        })
+        frame["model"] = model
+        frame["timestamp"] = pd.Timestamp.now(tz="UTC") if timestamp is None else pd.Timestamp(timestamp)
+        return self.record(frame)
+
+    def models(self):
+        return self._query("SELECT DISTINCT model FROM rollups WHERE period = 'week' ORDER BY model")["model"].tolist()
+
+    def time_range(self):
+        """First and last observation times, or ``(None, None)`` when empty."""
+        first, last = self._query("SELECT MIN(period_start) AS first, MAX(period_start) AS last FROM rollups WHERE period = 'day'").iloc[0]
+        if pd.isna(first):
+            return None, None
+        return pd.Timestamp(int(first), unit="s"), pd.Timestamp(int(last) + 86_400, unit="s")
+
+    def rollup(self, period="week", metric=None, model=None, start=None, end=None):
+        """Count-weighted mean, minimum and maximum per model, group and period."""
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}; expected one of {list(PERIODS)}.")
+        lower, upper = _bounds(start, end)
+        table = self._query(
+            "SELECT model, group_name AS \"group\", metric, period_start,"
+            " weighted_sum / NULLIF(weight, 0) AS value, weight AS count, value_min, value_max"
+            " FROM rollups WHERE period = ? AND period_start >= ? AND period_start < ?"
+            " AND (? IS NULL OR metric = ?) AND (? IS NULL OR model = ?)"
+            " ORDER BY model, metric, period_start, group_name",
+            (period, lower, upper, metric, metric, model, model),
+        )
+        table["period_start"] = pd.to_datetime(table["period_start"], unit="s")
+        return table
+
+    def group_summary(self, metric, start=None, end=None, model=None):
+        """Count-weighted mean of ``metric`` per model and group over ``[start, end)``, from daily rollups."""
+        lower, upper = _bounds(start, end)
+        return self._query(
+            "SELECT model, group_name AS \"group\", SUM(weighted_sum) / NULLIF(SUM(weight), 0) AS value,"
+            " SUM(weight) AS count FROM rollups"
+            " WHERE period = 'day' AND metric = ? AND period_start >= ? AND period_start < ?"
+            " AND (? IS NULL OR model = ?) GROUP BY model, group_name ORDER BY model, group_name",
+            (metric, lower, upper, model, model),
+        )
+
+    def disparity(self, metric, start=None, end=None):
+        """Between-groups difference of ``metric`` per model over ``[start, end)``."""
+        lower, upper = _bounds(start, end)
+        table = self._query(
+            "SELECT model, MAX(value) - MIN(value) AS disparity FROM ("
+            " SELECT model, SUM(weighted_sum) / NULLIF(SUM(weight), 0) AS value FROM rollups"
+            " WHERE period = 'day' AND metric = ? AND period_start >= ? AND period_start < ?"
+            " GROUP BY model, group_name) GROUP BY model ORDER BY model",
+            (metric, lower, upper),
+        )
+        return table.set_index("model")["disparity"]
+
+    def disparity_trend(self, metric, period="week", start=None, end=None):
+        """Between-groups difference of ``metric`` per model and period."""
+        if period not in PERIODS:
+            raise ValueError(f"Unknown period {period!r}; expected one of {list(PERIODS)}.")
+        lower, upper = _bounds(start, end)
+        table = self._query(
+            "SELECT model, period_start, MAX(weighted_sum / NULLIF(weight, 0)) - MIN(weighted_sum / NULLIF(weight, 0)) AS disparity"
+            " FROM rollups WHERE period = ? AND metric = ? AND period_start >= ? AND period_start < ?"
+            " GROUP BY model, period_start ORDER BY model, period_start",
+            (period, metric, lower, upper),
+        )
+        table["period_start"] = pd.to_datetime(table["period_start"], unit="s")
+        return table
+
+    def raw_rows(self, model=None):
+        return int(self._query("SELECT COUNT(*) AS n FROM metrics WHERE ? IS NULL OR model = ?", (model, model))["n"].iloc[0])
@@ -0,0 +1,174 @@
+"""Intersectional subgroup lattice with minimum-support pruning.
+
+Auditing on 6-8 sensitive attributes yields thousands of intersections, most
+of them too small to say anything about. The lattice is built in two steps:
+
+1. The rows are compressed once into their finest observed cells (one
+   ``np.unique`` over a combined key, then one ``bincount`` per confusion
+   count). Everything below works on those cells, never on the rows.
+2. Attribute combinations are enumerated bottom-up, Apriori style. A level
+   ``k + 1`` subgroup is always derived from the cell codes of its level
+   ``k`` parent, and cells of a parent that fell below ``min_support`` are
+   dropped before refining. Support only shrinks under refinement, so
+   nothing that could pass the threshold is ever lost.
+
+The result is one row per surviving subgroup with its size and metrics,
+ready for a heatmap or a "worst-k" ranking.
+"""
+import numpy as np
+import pandas as pd
+
+from fairness_audit.metrics import METRICS, _as_binary, _feature_columns, _rates
+
+# Direction in which each metric gets worse, for ranking.
+LOWER_IS_WORSE = {
+    "accuracy": True,
+    "selection_rate": True,
+    "true_positive_rate": True,
+    "false_positive_rate": False,
+}
+COUNT_COLUMNS = ("tn", "fp", "fn", "tp")
+
+
+class SubgroupLattice:
+    """Finest-cell counts plus the machinery to enumerate coarser subgroups."""
+
+    def __init__(self, cell_codes, counts, attributes, levels):
+        self.cell_codes = np.asarray(cell_codes, dtype=np.int64)
+        self.counts = np.asarray(counts, dtype=np.int64).reshape(-1, 4)
+        self.attributes = list(attributes)
+        self.levels = [np.asarray(level, dtype=object) for level in levels]
+        self._level_names = [
+            np.array([f"{name}={value}" for value in level], dtype=object)
+            for name, level in zip(self.attributes, self.levels)
+        ]
+
+    @classmethod
+    def from_predictions(cls, y_true, y_pred, sensitive_features, pos_label=1):
+        columns = _feature_columns(sensitive_features)
+        attributes, levels, column_codes = [], [], []
+        for name, values in columns:
+            if not isinstance(values, (pd.Series, pd.Categorical)):
+                values = np.asarray(values)
+            codes, uniques = pd.factorize(values, sort=True)
+            if (codes < 0).any():
+                raise ValueError(f"Sensitive feature {name!r} contains missing values.")
+            attributes.append(name)
+            levels.append(uniques)
+            column_codes.append(codes.astype(np.int64))
+
+        shape = tuple(len(level) for level in levels)
+        if np.prod(shape, dtype=np.float64) < 2 ** 62:
+            key = np.ravel_multi_index(column_codes, shape)
+            cells, inverse = np.unique(key, return_inverse=True)
+            cell_codes = np.stack(np.unravel_index(cells, shape), axis=1)
+        else:
+            cell_codes, inverse = np.unique(np.stack(column_codes, axis=1), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+
+        flat = inverse * 4 + _as_binary(y_true, pos_label) * 2 + _as_binary(y_pred, pos_label)
+        counts = np.bincount(flat, minlength=len(cell_codes) * 4).reshape(-1, 4)
+        return cls(cell_codes, counts, attributes, levels)
+
+    @classmethod
+    def from_group_table(cls, table, attributes):
+        """Build from per-group ``tn/fp/fn/tp`` counts, e.g. ``ConfusionAccumulator.group_table()``."""
+        attributes = list(attributes)
+        levels, column_codes = [], []
+        for name in attributes:
+            codes, uniques = pd.factorize(table[name], sort=True)
+            levels.append(uniques)
+            column_codes.append(codes)
+        counts = table[list(COUNT_COLUMNS)].to_numpy()
+        return cls(np.stack(column_codes, axis=1), counts, attributes, levels)
+
+    @property
+    def rows(self):
+        return int(self.counts.sum())
+
+    def enumerate(self, max_order=None, min_support=30):
+        """Every subgroup of up to ``max_order`` attributes with at least ``min_support`` rows.
+
+        Returns a ``DataFrame`` with one column per attribute (``None`` where the
+        attribute is not part of the subgroup), ``order``, ``subgroup`` label,
+        ``count``, the ``tn/fp/fn/tp`` counts and one column per metric in
+        ``METRICS``.
+        """
+        n_attributes = len(self.attributes)
+        max_order = n_attributes if max_order is None else min(max_order, n_attributes)
+        frames = []
+
+        # frontier: attribute tuple -> (per-cell subgroup code or -1 if pruned, cell labels)
+        frontier = {(): (np.zeros(len(self.cell_codes), dtype=np.int64), np.zeros((1, 0), dtype=np.int64))}
+        for order in range(1, max_order + 1):
+            next_frontier = {}
+            for parent, (parent_codes, parent_labels) in frontier.items():
+                live = parent_codes >= 0
+                start = parent[-1] + 1 if parent else 0
+                for attribute in range(start, n_attributes):
+                    cardinality = len(self.levels[attribute])
+                    key = parent_codes[live] * cardinality + self.cell_codes[live, attribute]
+                    subgroups, inverse = np.unique(key, return_inverse=True)
+                    inverse = inverse.reshape(-1)
+                    counts = np.stack([
+                        np.bincount(inverse, weights=self.counts[live, j], minlength=len(subgroups))
+                        for j in range(4)
+                    ], axis=1)
+                    support = counts.sum(axis=1)
+                    keep = support >= min_support
+                    if not keep.any():
+                        continue
+
+                    labels = np.column_stack([parent_labels[subgroups // cardinality], subgroups % cardinality])
+                    remap = np.full(len(subgroups), -1, dtype=np.int64)
+                    remap[keep] = np.arange(keep.sum())
+                    codes = np.full(len(self.cell_codes), -1, dtype=np.int64)
+                    codes[live] = remap[inverse]
+                    combo = parent + (attribute,)
+                    next_frontier[combo] = (codes, labels[keep])
+                    frames.append(self._frame(combo, labels[keep], counts[keep]))
+            frontier = next_frontier
+            if not frontier:
+                break
+
+        if not frames:
+            return pd.DataFrame(columns=[*self.attributes, "order", "subgroup", "count", *COUNT_COLUMNS, *METRICS])
+        return pd.concat(frames, ignore_index=True)
+
+    def _frame(self, combo, labels, counts):
+        columns = {name: np.full(len(labels), None, dtype=object) for name in self.attributes}
+        names = []
+        for position, attribute in enumerate(combo):
+            codes = labels[:, position]
+            columns[self.attributes[attribute]] = self.levels[attribute][codes]
+            names.append(self._level_names[attribute][codes])
+        columns["order"] = len(combo)
+        columns["subgroup"] = [", ".join(parts) for parts in zip(*names)]
+        columns["count"] = counts.sum(axis=1).astype(np.int64)
+        for j, name in enumerate(COUNT_COLUMNS):
+            columns[name] = counts[:, j].astype(np.int64)
+        table = _rates(counts.reshape(-1, 2, 2))
+        for j, metric in enumerate(METRICS):
+            columns[metric] = table[:, j]
+        return pd.DataFrame(columns)
+
+    def overall(self):
+        return pd.Series(_rates(self.counts.sum(axis=0).reshape(2, 2)), index=list(METRICS))
+
+
+def worst_subgroups(subgroups, k=10, metric="accuracy", min_order=1):
+    """The ``k`` subgroups with the worst ``metric``, largest first among ties."""
+    candidates = subgroups[subgroups["order"] >= min_order]
+    ascending = LOWER_IS_WORSE[metric]
+    return candidates.sort_values([metric, "count"], ascending=[ascending, False]).head(k)
+
+
+def subgroup_lattice(y_true, y_pred, sensitive_features, max_order=None, min_support=30, pos_label=1):
+    """Enumerate and score all intersectional subgroups in one call."""
+    lattice = SubgroupLattice.from_predictions(y_true, y_pred, sensitive_features, pos_label)
+    return lattice.enumerate(max_order=max_order, min_support=min_support)
+
+
+def pair_table(subgroups, x, y):
+    """The order-2 cells over attributes ``x`` and ``y`` (for a heatmap)."""
+    return subgroups[(subgroups["order"] == 2) & subgroups[x].notna() & subgroups[y].notna()]
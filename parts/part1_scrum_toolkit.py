@@ -0,0 +1,403 @@
+import streamlit as st
+import pandas as pd
+import altair as alt
+import numpy as np
+
+from fairness_audit.parity import check_demographic_parity, threshold_sweep
+from ui.cache import altair_chart, shared_resource
+from ui.governance import persisted_checklist, project_scope
+
+# --- PART 1: FAIR AI SCRUM TOOLKIT ---
+st.header("Part 1: Fair AI Scrum Toolkit")
+st.info(
+    "**Objective:** To embed fairness within individual agile teams by redesigning Scrum artifacts, creating fairness-aware user stories, establishing a robust 'Definition of Done', and adapting ceremonies for fairness discussions. This toolkit provides the foundational, team-level practices for building equitable AI systems."
+)
+
+st.markdown("---")
+
+# --- 1. User Documentation: How to Apply This Toolkit ---
+st.subheader("🚀 How to Apply This Toolkit: A 5-Step Guide")
+st.markdown("Use this framework to systematically integrate fairness into your team's existing Scrum process.")
+
+cols = st.columns(5)
+with cols[0]:
+    st.markdown("##### 1. Assess")
+    with st.popover("Details"):
+        st.markdown("""
+        **Goal:** Document your team's current Scrum implementation to identify gaps where fairness can be integrated.
+        
+        **Action Items:**
+        - Review your user story templates. Do they mention user impact or only functionality?
+        - Check your Definition of Done. Does it include any form of bias or fairness validation?
+        - Listen during standups and retrospectives. Is fairness ever discussed?
+        """)
+
+with cols[1]:
+    st.markdown("##### 2. Modify Artifacts")
+    with st.popover("Details"):
+        st.markdown("""
+        **Goal:** Enhance core Scrum artifacts to make fairness a formal requirement, not an afterthought.
+        
+        **Action Items:**
+        - Update user story templates to include fairness goals and protected groups.
+        - Add fairness validation criteria to your team's Definition of Done.
+        - Create specific task templates in your backlog for fairness work (e.g., "Audit dataset for bias").
+        """)
+
+with cols[2]:
+    st.markdown("##### 3. Redesign Ceremonies")
+    with st.popover("Details"):
+        st.markdown("""
+        **Goal:** Create explicit touchpoints for fairness discussions in every Scrum ceremony.
+        
+        **Action Items:**
+        - Add "Fairness Risk Assessment" to your sprint planning agenda.
+        - Modify the daily standup to include reporting on "fairness blockers".
+        - Require fairness metrics to be shown in sprint reviews.
+        - Add fairness-focused questions to your retrospective templates.
+        """)
+
+with cols[3]:
+    st.markdown("##### 4. Clarify Roles")
+    with st.popover("Details"):
+        st.markdown("""
+        **Goal:** Distribute fairness accountability across the entire team to prevent diffusion of responsibility.
+        
+        **Action Items:**
+        - Formally extend the definitions of Product Owner, Scrum Master, and Developer roles to include specific fairness responsibilities.
+        - Create a simple RACI matrix for key fairness tasks like bias auditing and mitigation planning.
+        """)
+
+with cols[4]:
+    st.markdown("##### 5. Pilot & Iterate")
+    with st.popover("Details"):
+        st.markdown("""
+        **Goal:** Test the changes, gather feedback, and refine your approach gradually.
+        
+        **Action Items:**
+        - Pilot the new toolkit for one or two sprints.
+        - Use the retrospective to gather feedback on what worked and what didn't.
+        - Frame the changes as enhancing product quality to get stakeholder buy-in.
+        """)
+
+st.markdown("---")
+
+# --- 2. Scrum Artifact Modification Guide ---
+st.subheader("📝 Scrum Artifact Modification Guide")
+st.markdown("Traditional Scrum artifacts capture functional requirements but often ignore fairness dimensions, creating a gap where bias can slip through undetected. This guide shows you how to modify them.")
+
+tab_stories, tab_backlog, tab_dod = st.tabs(["User Stories", "Sprint Backlog", "Definition of Done (DoD)"])
+
+with tab_stories:
+    st.markdown("##### Integrating Fairness into User Stories")
+    st.markdown("The user story is the starting point for development. Modifying it forces the team to consider fairness from the very beginning.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.error("**Traditional Story (Fairness-Blind)**")
+        st.markdown("Focuses exclusively on functional needs.")
+        st.code("""
+As a recruiter,
+I want to filter candidates by level of experience,
+So I can focus on qualified applicants.
+        """, language="markdown")
+    
+    with col2:
+        st.success("**Modified Story (Fairness-Aware)**")
+        st.markdown("Adds an explicit, measurable fairness goal.")
+        st.code("""
+As a recruiter,
+I want to filter candidates by level of experience,
+So I can focus on qualified applicants,
+WHILE ENSURING equivalent filtering accuracy across gender and age groups.
+        """, language="markdown")
+
+with tab_backlog:
+    st.markdown("##### Integrating Fairness into the Sprint Backlog")
+    st.markdown("A user story with a fairness requirement must lead to specific fairness tasks in the backlog. This ensures that time and resources are allocated for the work.")
+
+with tab_dod:
+    st.markdown("##### Integrating Fairness into the Definition of Done (DoD)")
+    st.markdown("The DoD acts as the final quality gate. Including fairness validation makes it a non-negotiable requirement for completion, preventing biased systems from reaching production. A fairness-aware DoD is the mechanism that verifies if the fairness goal from the user story was achieved.")
+    st.warning("A DoD that ignores fairness sends a message that bias validation is less important than other quality aspects.")
+    st.markdown("See the **Definition of Done Framework** section below for a detailed checklist.")
+
+st.markdown("---")
+
+# --- 3. Fairness User Story Template Library ---
+st.subheader("📚 Fairness User Story Template Library")
+st.markdown("Use this template to translate abstract fairness concepts into actionable development tasks.")
+
+st.success("""
+**Template:** `As a` **[Persona]**, `I want to` **[Action]**, `so that` **[Benefit]**, `while ensuring` **[Fairness Goal]** `for` **[Protected and Intersectional Groups]**.
+""")
+
+with st.expander("View Examples for Common AI Scenarios"):
+    st.markdown("##### Example 1: AI Recruitment")
+    st.code("""
+As a hiring manager,
+I want to use an AI model to screen resumes for relevant skills,
+So I can identify top candidates efficiently,
+WHILE ENSURING the screening accuracy is equivalent across racial and gender groups, paying special attention to intersectional groups like women of color.
+    """, language="markdown")
+    st.markdown("This addresses the need to consider intersectional impacts, not just single attributes.")
+
+    st.markdown("##### Example 2: Loan Approval System")
+    st.code("""
+As a loan officer,
+I want to use a model to predict the likelihood of loan default,
+So I can make faster and more consistent approval decisions,
+WHILE ENSURING the false rejection rate (declining a qualified applicant) is balanced across different age brackets and geographic locations (zip codes).
+    """, language="markdown")
+
+    st.markdown("##### Example 3: Content Moderation")
+    st.code("""
+As a platform administrator,
+I want to use a model to automatically flag harmful content,
+So I can maintain a safe online environment,
+WHILE ENSURING the model's false positive rate for flagging content as harmful is equitable across dialects and sociolects present in user-generated text.
+    """, language="markdown")
+
+st.markdown("---")
+
+# --- 4. Definition of Done (DoD) Framework ---
+st.subheader("✅ Definition of Done (DoD) Framework")
+st.markdown("This framework extends a standard DoD to include mandatory fairness validation, creating a systematic checkpoint to prevent biased systems from being deployed.")
+
+st.markdown("A feature is **Done** only when all the following criteria are met:")
+
+st.info("##### Functional & Quality Criteria (Standard)")
+st.checkbox("Code is peer-reviewed and merged.", value=True, disabled=True, key="dod_c1")
+st.checkbox("Unit and integration tests pass.", value=True, disabled=True, key="dod_c2")
+st.checkbox("Feature meets functional acceptance criteria.", value=True, disabled=True, key="dod_c3")
+st.checkbox("Documentation is updated.", value=True, disabled=True, key="dod_c4")
+
+st.success("##### Fairness Validation Criteria (Extended)")
+
+@st.fragment
+def dod_fairness_checklist():
+    # Saved per project and sprint, and shared with everyone working on it.
+    scope = project_scope("p1_dod")
+    persisted_checklist([
+        ("dod_f1", "bias_tests", "**Bias tests for identified protected groups have been executed and the results are documented.**"),
+        ("dod_f2", "fairness_thresholds", "**Fairness metrics (e.g., demographic parity, equal opportunity) meet the pre-defined thresholds from the user story's acceptance criteria.**"),
+        ("dod_f3", "intersectional_testing", "**Performance has been evaluated with disaggregated testing across key intersectional subgroups (e.g., older women, younger men).**"),
+        ("dod_f4", "impact_review", "**A review of potential negative downstream impacts has been conducted and documented.**"),
+    ], scope)
+
+dod_fairness_checklist()
+
+st.markdown("---")
+
+# --- 5. Ceremony Adaptation Guide ---
+st.subheader("💬 Ceremony Adaptation Guide")
+st.markdown("Modify each Scrum ceremony to include dedicated fairness checkpoints. This ensures fairness is discussed proactively and consistently, rather than reactively when it's too late.")
+
+planning_expander, standup_expander, review_expander, retro_expander = st.columns(4)
+
+with planning_expander:
+    with st.expander("**Sprint Planning**", expanded=True):
+        st.markdown("##### Goal: Evaluate risks and allocate resources upfront.")
+        st.markdown("""
+        - **Agenda Item:** Explicitly discuss fairness risks and potential impacts of the stories in the upcoming sprint.
+        - **Resource Allocation:** Justify decisions to allocate a portion of the sprint's capacity (e.g., 20%) to fairness-specific work like auditing, bias testing, or mitigation.
+        - **Role of Product Owner:** The PO leads the discussion on fairness risks and priorities.
+        """)
+
+with standup_expander:
+    with st.expander("**Daily Standup**", expanded=True):
+        st.markdown("##### Goal: Make fairness a daily, tangible concern.")
+        st.markdown("""
+        - **Key Change:** Add a fourth question or integrate into the "blockers" discussion: "**Are there any fairness blockers?**".
+        - **Example Blockers:**
+            - *"I can't validate the impact on an intersectional group because we lack sufficient labeled data."*
+            - *"I'm not sure how to interpret the results of this fairness metric for our user story."*
+        - **Role of Scrum Master:** The SM's role is extended to actively track and help remove these fairness blockers.
+        """)
+
+with review_expander:
+    with st.expander("**Sprint Review**", expanded=True):
+        st.markdown("##### Goal: Demonstrate fairness outcomes, not just features.")
+        st.markdown("""
+        - **Demonstration:** When demonstrating a new feature, the team must also present the fairness metrics and the results of disaggregated testing.
+        - **Shift in Focus:** This changes the definition of a "successful" demo from just "it works" to "it works *and* it's fair."
+        - **Example:**
+        """)
+        st.code("""
+# Example of a metric check to show in a review
+from fairness_audit.parity import check_demographic_parity
+
+def review_demographic_parity(predictions, sensitive_attributes):
+    check = check_demographic_parity(predictions, sensitive_attributes, threshold=0.1)  # Threshold from acceptance criteria
+
+    st.metric(
+        label="Demographic Parity Disparity",
+        value=f"{check.disparity:.2%}",
+        delta="-1.2%",  # Compared to last sprint
+        help="Lower is better. Measures if all groups have a similar approval rate."
+    )
+    return check.passed
+        """, language="python")
+
+with retro_expander:
+    with st.expander("**Retrospective**", expanded=True):
+        st.markdown("##### Goal: Improve the process for building fair AI.")
+        st.markdown("""
+        - **Expand Criteria for Success:** Move beyond only discussing velocity and technical debt to include reflections on fairness outcomes.
+        - **New Questions to Ask:**
+            - *"Did we have the right data and tools to address fairness in this sprint?"*
+            - *"Did we create a psychologically safe environment to discuss bias openly?"*
+            - *"Have we improved our ability to create a fairer product in this sprint?"*
+        """)
+
+st.markdown("##### 💡 Interactive Example: Demographic Parity in the Sprint Review")
+st.markdown("A working version of the Sprint Review check on a simulated resume-screening model. The curve shows the disparity at every decision threshold, so the team can see how much margin the chosen threshold leaves against the acceptance criterion.")
+
+# Acceptance criterion from the user story: selection rates within 10 points.
+dp_acceptance_threshold = 0.1
+
+@shared_resource
+def sprint_review_data(n=20_000, seed=7):
+    rng = np.random.default_rng(seed)
+    group = rng.choice(["Group A", "Group B", "Group C"], size=n, p=[0.5, 0.35, 0.15])
+    shift = pd.Series({"Group A": 0.0, "Group B": -0.04, "Group C": -0.09})[group].to_numpy()
+    scores = np.clip(rng.beta(5, 4, size=n) + shift, 0.0, 1.0)
+    _, disparity = threshold_sweep(scores, group, thresholds=np.linspace(0.0, 1.0, 501))
+    return pd.DataFrame({"score": scores, "group": group}), disparity.reset_index()
+
+def disparity_curve_chart(disparity_curve, criterion_value, decision_threshold):
+    curve = alt.Chart(disparity_curve).mark_line().encode(
+        x=alt.X('threshold:Q', title='Decision Threshold'),
+        y=alt.Y('disparity:Q', title='Demographic Parity Disparity', axis=alt.Axis(format='%')),
+        tooltip=[alt.Tooltip('threshold:Q', format='.2f'), alt.Tooltip('disparity:Q', format='.2%')]
+    )
+    criterion = alt.Chart(pd.DataFrame({'disparity': [criterion_value]})).mark_rule(color='red', strokeDash=[4, 4]).encode(y='disparity:Q')
+    selected = alt.Chart(pd.DataFrame({'threshold': [decision_threshold]})).mark_rule(color='gray').encode(x='threshold:Q')
+    return (curve + criterion + selected).properties(title="Disparity Across All Decision Thresholds")
+
+@st.fragment
+def demographic_parity_review():
+    applicants, disparity_curve = sprint_review_data()
+    metric_col, chart_col = st.columns([1, 2])
+
+    with metric_col:
+        decision_threshold = st.slider("Decision threshold", 0.0, 1.0, 0.5, 0.01, key="p1_dp_threshold")
+        check = check_demographic_parity(applicants["score"] >= decision_threshold, applicants["group"], threshold=dp_acceptance_threshold)
+        st.metric(
+            label="Demographic Parity Disparity",
+            value=f"{check.disparity:.2%}",
+            delta=f"{check.disparity - dp_acceptance_threshold:+.2%} vs. criterion",
+            delta_color="inverse",
+            help="Lower is better. Measures if all groups have a similar approval rate."
+        )
+        st.dataframe(check.selection_rates.rename("Approval Rate").to_frame().style.format("{:.2%}"), use_container_width=True)
+        if check.passed:
+            st.success(f"Meets the {dp_acceptance_threshold:.0%} acceptance criterion.")
+        else:
+            st.error(f"Misses the {dp_acceptance_threshold:.0%} acceptance criterion (disparity must stay below it). This story is not Done.")
+
+    with chart_col:
+        altair_chart(disparity_curve_chart, disparity_curve, dp_acceptance_threshold, decision_threshold)
+
+demographic_parity_review()
+
+st.markdown("---")
+
+# --- 6. Case Study: AI Resume Screening System ---
+st.subheader(" Case Study: AI-Based Resume Screening System")
+st.markdown("This case study demonstrates the toolkit's application to a real-world scenario.")
+
+case_context, case_problem, case_solution = st.tabs(["Scenario Context", "The Problem (Without the Toolkit)", "The Solution (With the Toolkit)"])
+
+with case_context:
+    st.markdown("""
+    **Application Domain:** Human Resources & Recruitment.
+    **ML Task:** A classification model to predict whether a candidate's resume is a good match for a specific job description.
+    **Stakeholders:** Recruiters, hiring managers, candidates, and the development team.
+    **Fairness Challenge:** Initial prototypes show the system favors candidates from specific universities and penalizes applicants with non-traditional career paths or resume formats, which is correlated with socioeconomic and racial background.
+    """)
+
+with case_problem:
+    st.markdown("""
+    The team initially followed a standard Scrum process, leading to critical failures:
+    1.  **Artifact Gap:** User stories were purely functional, like *"As a recruiter, I want to see a candidate's 'match score'"*. This led developers to optimize for predictive accuracy alone, perpetuating the biases in the historical data.
+    2.  **Ceremony Gap:** Sprint reviews only showed aggregate accuracy metrics (e.g., "90% accuracy"), which masked poor performance for minority subgroups. The issue wasn't discovered until late in development.
+    3.  **Role Confusion & Responsibility Gap:** No one owned the fairness outcome.
+        - The **Product Owner** prioritized features that increased recruiter efficiency over tasks to fix fairness issues.
+        - **Developers** assumed fairness was someone else's problem to be handled "later".
+        - The **Scrum Master** saw discussions about bias as "conflict" to be avoided rather than a productive part of the process.
+    
+    **Result:** A system that was technically functional but discriminatory, created by a team with good intentions but a flawed process.
+    """)
+
+with case_solution:
+    st.markdown("The team pilots the **Fair AI Scrum Toolkit** for two sprints. Here’s how it changes their process:")
+    
+    st.info("##### 1. Modified User Story")
+    st.markdown("The Product Owner, now responsible for prioritizing fairness, reframes the central user story:")
+    st.code("""
+As a recruiter,
+I want to see a candidate's 'match score',
+So I can quickly identify promising applicants,
+WHILE ENSURING the model provides an equal opportunity for selection across gender and racial groups (i.e., achieves a similar true positive rate for all groups).
+    """, language="markdown")
+
+    st.info("##### 2. Adapted Sprint Planning & Backlog")
+    st.markdown("During Sprint Planning, the team discusses the risk of bias from training data. They allocate **20% of their sprint capacity** to fairness tasks, which are added to the backlog:")
+    st.markdown("""
+    - **Fairness Task 1:** Audit training data for representation of different demographic groups.
+    - **Fairness Task 2:** Implement the 'Equal Opportunity' fairness metric as a test.
+    - **Fairness Task 3:** Research and experiment with one bias mitigation algorithm (e.g., reweighing).
+    """)
+
+    st.info("##### 3. New Daily Standup Dynamic")
+    st.markdown("A developer raises a **fairness blocker**:")
+    st.markdown("> *\"I'm blocked on implementing the Equal Opportunity test because our dataset lacks reliable demographic labels for a key subgroup. I can't proceed without this data.\"*")
+    st.markdown("The **Scrum Master**, now responsible for removing fairness blockers, immediately works with the Product Owner to find a data source or a proxy solution.")
+
+    st.info("##### 4. Robust Definition of Done")
+    st.markdown("Before the feature can be considered 'Done,' the developers, who are now responsible for implementing fairness tests, must prove it passes the new DoD criteria:")
+    st.markdown("""
+    - ✅ **Bias Test Executed:** They run the Equal Opportunity test.
+    - ✅ **Metric Threshold Met:** The difference in the true positive rate between groups is below the 5% threshold defined in the acceptance criteria.
+    - ✅ **Disaggregated Testing:** They show results broken down by `gender`, `race`, and `gender+race` to check for intersectional issues.
+    """)
+
+    st.info("##### 5. Impactful Sprint Review & Retrospective")
+    st.markdown("""
+    - **In the Review**, the team demonstrates the resume screener and proudly presents a dashboard showing not just accuracy, but also the fairness metrics that meet their goals.
+    - **In the Retrospective**, they discuss how the process felt. A developer notes, *"It was hard at first, but for the first time, I feel like we have a concrete process to build a product that doesn't cause harm."*
+    """)
+    
+    st.success("**Result:** By using the toolkit, the team transforms fairness from a vague ideal into a concrete, trackable, and shared responsibility, leading to a more equitable product.")
+
+st.markdown("---")
+
+# --- 7. Bibliography and Further Reading ---
+st.subheader("📚 Further Reading & Bibliography")
+with st.expander("Expand to see key resources for the Fair AI Scrum Toolkit"):
+    st.markdown("""
+    The concepts in this toolkit are grounded in extensive research on the practical challenges of implementing fairness in real-world AI development. Use these references to deepen your understanding and find evidence to support the adoption of these practices in your organization.
+
+    ##### Foundational Readings:
+
+    - **Holstein, K., et al. (2019). *Improving fairness in machine learning systems: What do industry practitioners need?***
+      - **Why it's important:** This is a key paper that identifies the gap between academic fairness research and the needs of industry teams. It highlights the demand for practical tools, checklists, and process integrations, which directly motivates the creation of this toolkit. Use it to understand the "why" behind these tools.
+    
+    - **Madaio, M. A., et al. (2020). *Co-designing checklists to understand organizational challenges and opportunities around fairness in AI.***
+      - **Why it's important:** This research explores how tools like checklists can help teams operationalize fairness. It shows that distributing responsibility and creating concrete tasks (like those in the DoD and user story templates) leads to better outcomes.
+    
+    - **Vethman, S., et al. (2025). *Fairness beyond the Algorithmic Frame: Actionable Recommendations for an Intersectional Approach.***
+      - **Why it's important:** This paper provides the theoretical and practical grounding for the toolkit's emphasis on intersectionality, psychological safety in ceremonies, and interdisciplinary collaboration. It argues for moving beyond purely technical metrics, a core principle of the Fair AI Scrum approach.
+      
+    ##### On Specific Toolkit Components:
+
+    - **For User Stories & DoD:** **Raji, I. D., et al. (2020). *Closing the AI accountability gap: Defining an end-to-end framework for internal algorithmic auditing.***
+      - **Why it's important:** This paper outlines a comprehensive framework for AI auditing, emphasizing the need for clear documentation and validation at each stage of the development lifecycle. The "Definition of Done" and fairness-aware user stories are practical implementations of these principles.
+    
+    - **For Role Responsibilities:** **Rakova, B., et al. (2021). *Where responsible AI meets reality: Practitioner perspectives on enablers for shifting organizational practices.***
+      - **Why it's important:** This work discusses the organizational and cultural shifts needed to make responsible AI a reality. It supports the idea of clarifying roles to ensure fairness doesn't become a "diffusion of responsibility" problem.
+
+    - **For Intersectional Thinking:** **Crenshaw, K. (1989). *Demarginalizing the intersection of race and sex: A black feminist critique...***
+      - **Why it's important:** The foundational text on intersectionality. While not about AI, it provides the critical lens for understanding why analyzing fairness across single attributes (e.g., just race or just gender) is insufficient and can hide the most severe forms of bias.
+    """)
@@ -0,0 +1,912 @@
+import os
+import time
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+import numpy as np
+
+from fairness_audit.documents import ModelEvidence, gate_status, model_card, render
+from fairness_audit.escalation import AUTHORITIES, EscalationRouter
+from fairness_audit.governance import CHECKLISTS, CLEARED
+from fairness_audit.ingest import ConfusionAccumulator, read_columns
+from fairness_audit.metrics import METRICS, DisaggregatedMetrics
+from fairness_audit.monitoring import DEFAULT_THRESHOLDS, SEVERITIES, DriftMonitor
+from fairness_audit.rasci import CODES, LETTER_NAMES, LETTERS, RULES, RasciMatrix
+from fairness_audit.store import STORE_ENV, MetricStore
+from fairness_audit.subgroups import COUNT_COLUMNS, LOWER_IS_WORSE, SubgroupLattice, pair_table, worst_subgroups
+from ui.cache import altair_chart, shared_data, shared_resource
+from ui.charts import metric_interval_chart
+from ui.governance import governance_store, persisted_checklist, project_scope
+from ui.intervals import cached_bootstrap_ci
+from ui.upload import get_uploaded_audit
+
+# --- PART 2: ORGANIZATIONAL INTEGRATION TOOLKIT (GOVERNANCE) ---
+st.header("Part 2: Organizational Integration Toolkit 🏛️")
+st.info(
+    "**Objective:** To establish governance frameworks that embed fairness accountability throughout your organization. This moves beyond individual team practices to ensure consistent, scalable, and defensible fairness implementation across all AI systems."
+)
+st.markdown("---")
+
+# --- Main Tabs for Part 2 ---
+(
+    tab_guide,
+    tab_roles,
+    tab_responsibility,
+    tab_documentation,
+    tab_monitoring,
+    tab_case_study,
+) = st.tabs([
+    "**🚀 How to Implement**",
+    "**♟️ Strategic Rationale & Roles**",
+    "**🗺️ Responsibility & Decisions**",
+    "**📄 Documentation & Accountability**",
+    "**📊 Dashboards & Monitoring**",
+    "**🏢 Case Study**"
+])
+
+# --- TAB 1: HOW TO IMPLEMENT ---
+with tab_guide:
+    st.subheader("How to Implement This Toolkit: A 5-Step Process")
+    st.markdown("Follow these steps to build a robust fairness governance structure within your organization.")
+    
+    cols = st.columns(5)
+    with cols[0]:
+        st.markdown("##### 1. Form Governance Body")
+        with st.popover("Details"):
+            st.markdown("""
+            **Goal:** Create a central, cross-functional body with the authority to oversee AI fairness.
+            
+            **Action Items:**
+            - Charter an **AI Review Board** or **AI Ethics Council**.
+            - Ensure representation from Legal, Compliance, Product, Engineering, UX, and relevant business units.
+            - Grant this body the authority to set policies, review high-risk projects, and make binding decisions.
+            """)
+
+    with cols[1]:
+        st.markdown("##### 2. Define Key Roles")
+        with st.popover("Details"):
+            st.markdown("""
+            **Goal:** Establish clear fairness-focused roles to operationalize governance.
+            
+            **Action Items:**
+            - Identify and train **Fairness Champions**—subject matter experts who can guide and support individual teams.
+            - Formally recognize the **AI Review Board** as the highest authority on fairness decisions.
+            - Ensure Product Owners and Managers are formally designated as **accountable** for the fairness outcomes of their products.
+            """)
+    
+    with cols[2]:
+        st.markdown("##### 3. Map Responsibilities")
+        with st.popover("Details"):
+            st.markdown("""
+            **Goal:** Eliminate ambiguity by clearly mapping fairness tasks to roles and functions using a responsibility matrix.
+            
+            **Action Items:**
+            - Use the **RASCI Matrix Template** provided in this toolkit.
+            - Convene stakeholders from different departments to agree on their roles (Responsible, Accountable, Supportive, Consulted, Informed) for each key fairness task.
+            - Publish the matrix as part of your internal AI development policy.
+            """)
+
+    with cols[3]:
+        st.markdown("##### 4. Standardize Documentation")
+        with st.popover("Details"):
+            st.markdown("""
+            **Goal:** Create a consistent and auditable trail of fairness-related decisions and trade-offs.
+            
+            **Action Items:**
+            - Mandate the use of a **Fairness Impact Statement** and **Model Cards** for all high-risk AI projects.
+            - Use the provided templates to document risks, metrics, mitigation efforts, and decision rationales.
+            - Store these documents in a central repository for easy access during audits or reviews.
+            """)
+
+    with cols[4]:
+        st.markdown("##### 5. Establish Escalation Paths")
+        with st.popover("Details"):
+            st.markdown("""
+            **Goal:** Create a clear, efficient process for resolving fairness conflicts and issues.
+            
+            **Action Items:**
+            - Document a formal escalation pathway from the development team up to the AI Review Board.
+            - Define clear criteria for what constitutes a high-risk issue that requires escalation (e.g., significant metric disparities, potential legal exposure, unresolved team disagreements).
+            """)
+
+# --- TAB 2: STRATEGIC RATIONALE & ROLES ---
+with tab_roles:
+    st.subheader("Strategic Rationale: Why Formal Roles Matter")
+    st.markdown("Fairness leadership roles establish dedicated positions with explicit fairness mandates, authority, and resources. They transform fairness from an abstract goal into an operational responsibility.")
+
+    with st.expander("Key Fairness Leadership Roles"):
+        st.markdown("""
+        - **Chief AI Ethics Officer:** Executive responsible for organization-wide fairness strategy and accountability.
+        - **Fairness Program Manager:** Coordinates fairness implementation across teams and products.
+        - **Fairness Domain Specialists:** Provide expertise in specific application areas (e.g., hiring, lending).
+        - **Technical Fairness Leads:** Oversee fairness implementation within engineering organizations.
+        """)
+
+    st.subheader("Organizational Fairness Models")
+    st.markdown("Organizations must choose between centralizing fairness expertise or embedding it across teams. **Hybrid models** are often the most effective, balancing deep expertise with broad ownership.")
+
+    model_c, model_e, model_h = st.tabs(["Centralized Model", "Embedded Model", "Hybrid Models (Recommended)"])
+    
+    with model_c:
+        st.markdown("**Description:** A single, specialized team is responsible for all fairness work.")
+        st.success("**Pros:** Builds deep, concentrated expertise.")
+        st.error("**Cons:** Creates bottlenecks and can lead to a lack of ownership in other teams.")
+    
+    with model_e:
+        st.markdown("**Description:** Fairness responsibilities are distributed across all development teams.")
+        st.success("**Pros:** Fosters broad ownership and awareness.")
+        st.error("**Cons:** Dilutes expertise and can lead to inconsistent standards.")
+
+    with model_h:
+        st.markdown("Hybrid models combine centralized expertise with embedded ownership. Research by Holstein et al. (2019) found these models achieved **43% higher implementation rates** than purely centralized models.")
+        st.markdown("##### Common Hybrid Models:")
+        st.markdown("- **Center of Excellence Model:** Central team develops standards and tools; embedded champions implement them.")
+        st.markdown("- **Hub and Spoke Model:** A core 'hub' team provides leadership while designated 'spokes' (specialists) operate within business units.")
+        st.markdown("- **Federated Governance Model:** Business units have primary responsibility, with a central body ensuring consistency.")
+
+    with st.expander("🌍 Intersectional Considerations for Roles"):
+        st.markdown("""
+        To effectively address intersectional fairness, it's crucial to go beyond technical roles and integrate diverse perspectives into governance itself. As Vethman et al. (2025) note, a "fear of not knowing enough" can make teams hesitant to apply an intersectional framework. A well-designed governance structure mitigates this fear.
+        
+        **Recommendations:**
+        - **Diverse Leadership:** Include people with intersectional lived experiences in fairness leadership positions.
+        - **Diverse Governance Bodies:** Create councils where multiple identities and perspectives exist to avoid groupthink.
+        - **Explicit Responsibility:** Clearly define responsibility for intersectional analysis in your RACI matrix.
+        """)
+
+# --- TAB 3: RESPONSIBILITY & DECISIONS ---
+with tab_responsibility:
+    st.subheader("Responsibility Assignment Matrix (RASCI)")
+    st.markdown("Use this matrix to clarify who does what for key fairness tasks. **R**esponsible, **A**ccountable, **S**upportive, **C**onsulted, **I**nformed.")
+    
+    @shared_resource
+    def rasci_matrix():
+        rasci_data = {
+            'Fairness Task': [
+                "Define Fairness Metrics for a Project", 
+                "Conduct Fairness Audit & Bias Testing", 
+                "Approve Bias Mitigation Strategy", 
+                "Document Fairness Decisions & Trade-offs", 
+                "Handle Post-Deployment Fairness Incident"
+            ],
+            'AI Dev Team (Data Scientist/Dev)': ["R", "R", "S", "R", "R"],
+            'Product Owner': ["A", "A", "A", "A", "A"],
+            'Fairness Champion': ["C", "S", "C", "S", "S"],
+            'Legal & Compliance': ["C", "I", "C", "I", "C"],
+            'AI Review Board': ["I", "I", "A (for high-risk)", "I", "A"]
+        }
+        return RasciMatrix.from_frame(pd.DataFrame(rasci_data))
+
+    @shared_resource
+    def org_rasci_matrix(n_tasks=5_000, n_roles=300, seed=3):
+        # Every task gets one Responsible and one Accountable role plus a few
+        # S/C/I; about 2% lack an owner and 3% get a second one.
+        rng = np.random.default_rng(seed)
+        codes = np.where(rng.random((n_tasks, n_roles)) < 0.02, rng.integers(CODES['S'], CODES['I'] + 1, (n_tasks, n_roles)), 0).astype(np.int8)
+        rows = np.arange(n_tasks)
+        codes[rows, rng.integers(0, n_roles, n_tasks)] = CODES['R']
+        owners = rng.integers(0, n_roles, n_tasks)
+        owned = rng.random(n_tasks) >= 0.02
+        codes[rows[owned], owners[owned]] = CODES['A']
+        second = rng.random(n_tasks) < 0.03
+        codes[rows[second], (owners[second] + rng.integers(1, n_roles, second.sum())) % n_roles] = CODES['A']
+        areas = ['Data', 'Model', 'Deployment', 'Monitoring', 'Documentation', 'Incident']
+        teams = ['Data Scientist', 'Product Owner', 'Fairness Champion', 'Legal', 'Review Board', 'Engineer']
+        tasks = [f"{areas[i % len(areas)]} task {i:05d}" for i in range(n_tasks)]
+        roles = [f"{teams[i % len(teams)]} {i // len(teams) + 1:03d}" for i in range(n_roles)]
+        return RasciMatrix(tasks, roles, codes)
+
+    @shared_resource(max_entries=4)
+    def uploaded_rasci(rasci_file, task_column, role_column, assignment_column):
+        return RasciMatrix.read(rasci_file, task_column, role_column, assignment_column)
+
+    def rasci_cell_style(value):
+        colors = {'R': '#cfe2ff', 'A': '#f8d7da', 'S': '#d1e7dd', 'C': '#fff3cd', 'I': '#e2e3e5'}
+        return f"background-color: {colors[value[0]]}" if value else ""
+
+    @st.fragment
+    def rasci_explorer():
+        source = st.radio("Matrix", ["Playbook example", "Organisation-scale example (5,000 tasks × 300 roles)", "Upload a matrix"], horizontal=True, key="p2_rasci_source")
+        try:
+            if source == "Upload a matrix":
+                rasci_file = st.file_uploader("RASCI matrix (CSV or Parquet)", type=["csv", "parquet", "pq"], key="p2_rasci_file",
+                                              help="Wide: one row per task and one column per role. Long: one row per task, role and assignment. Cells hold R, A, S, C or I, optionally with a note: 'A (for high-risk)'.")
+                if rasci_file is None:
+                    return
+                available = read_columns(rasci_file)
+                layout_col, task_col, role_col, assignment_col = st.columns(4)
+                long_format = layout_col.radio("Layout", ["Wide", "Long"], key="p2_rasci_layout") == "Long"
+                task_column = task_col.selectbox("Task column", available, key="p2_rasci_task")
+                role_column = role_col.selectbox("Role column", available, index=min(1, len(available) - 1), key="p2_rasci_role", disabled=not long_format)
+                assignment_column = assignment_col.selectbox("Assignment column", available, index=min(2, len(available) - 1), key="p2_rasci_assignment", disabled=not long_format)
+                matrix = uploaded_rasci(rasci_file, task_column, role_column if long_format else None, assignment_column)
+            elif source == "Playbook example":
+                matrix = rasci_matrix()
+            else:
+                matrix = org_rasci_matrix()
+        except (ValueError, KeyError, ImportError) as exc:
+            st.error(f"Could not load the RASCI matrix: {exc}")
+            return
+
+        issues = matrix.validate()
+        counts = issues['rule'].value_counts(sort=False)
+        for col, (rule, count) in zip(st.columns(len(RULES) + 1), [('tasks', len(matrix.tasks)), *counts.items()]):
+            col.metric(rule.replace('_', ' ').capitalize(), f"{count:,}", help=RULES.get(rule))
+        if issues.empty:
+            st.success(f"All {len(matrix.tasks):,} tasks have exactly one Accountable and at least one Responsible role.")
+        else:
+            with st.expander(f"⚠️ {len(issues):,} rule violations"):
+                st.dataframe(issues, hide_index=True, use_container_width=True)
+
+        st.markdown("###### Who Owns What")
+        role_col, letter_col = st.columns([3, 2])
+        role = role_col.selectbox("Role", matrix.roles, key="p2_rasci_lookup_role")
+        letter = letter_col.radio("As", list(LETTERS), format_func=lambda l: LETTER_NAMES[l], horizontal=True, index=1, key="p2_rasci_lookup_letter")
+        owned = matrix.tasks_for(role, letter)
+        st.caption(f"**{role}** is {LETTER_NAMES[letter]} for **{len(owned):,}** tasks.")
+        if len(owned):
+            st.dataframe(owned.to_frame(index=False), hide_index=True, use_container_width=True, height=min(35 * len(owned) + 38, 250))
+
+        st.markdown("###### Matrix")
+        search_col, roles_col, size_col = st.columns([2, 3, 1])
+        rows = matrix.search(search_col.text_input("Filter tasks", key="p2_rasci_search"))
+        roles = roles_col.multiselect("Roles", matrix.roles, default=list(matrix.roles[:8]), key="p2_rasci_roles") or list(matrix.roles[:8])
+        page_size = size_col.selectbox("Rows per page", [25, 50, 100], key="p2_rasci_page_size")
+        pages = max(-(-len(rows) // page_size), 1)
+        page = st.number_input(f"Page (of {pages:,})", 1, pages, 1, key="p2_rasci_page") if pages > 1 else 1
+        shown = rows[(page - 1) * page_size:page * page_size]
+        st.dataframe(matrix.page(shown, roles).style.map(rasci_cell_style), use_container_width=True)
+        st.caption(f"Tasks {(page - 1) * page_size + min(len(shown), 1):,}–{(page - 1) * page_size + len(shown):,} of {len(rows):,}; {len(roles)} of {len(matrix.roles):,} roles.")
+
+    rasci_explorer()
+    with st.expander("How to read this RASCI Matrix"):
+        st.markdown("""
+        - **Responsible (R):** The person(s) who does the work.
+        - **Accountable (A):** The person who ultimately owns the outcome. There should only be one 'A' per task.
+        - **Supportive (S):** Provides resources or assistance to the Responsible party.
+        - **Consulted (C):** Provides input and expertise. Communication is two-way.
+        - **Informed (I):** Kept up-to-date on progress. Communication is one-way.
+        """)
+    
+    st.subheader("Decision Tiers & Escalation Procedures")
+    st.markdown("Establish multiple levels for fairness decisions with clear escalation paths to prevent ambiguity and delays.")
+
+    with st.expander("Tier 1: Operational Decisions (Team Level)"):
+        st.markdown("**Examples:** Implementation details, monitoring parameters, technical adjustments.")
+        st.markdown("**Authority:** Team Leads, Technical Specialists.")
+    
+    with st.expander("Tier 2: Tactical Decisions (Department Level)"):
+        st.markdown("**Examples:** Fairness metric selection for a project, approval of mitigation approaches, threshold adjustments.")
+        st.markdown("**Authority:** Department Leadership, Fairness Program Leads.")
+
+    with st.expander("Tier 3: Strategic Decisions (Organizational Level)"):
+        st.markdown("**Examples:** Selection of the company-wide fairness framework, policy-level trade-offs, inclusion of new protected attributes.")
+        st.markdown("**Authority:** Executive Leadership, AI Review Board.")
+
+    st.markdown("##### Escalation Router: Fairness Incidents by Decision Tier")
+    st.markdown("Monitoring alerts are routed to the tier that owns the decision: 'Critical' alerts go straight to the AI Review Board, disparity warnings to department leadership, other drift warnings to the team. Repeated alerts for the same model, group and test are merged into one incident, which moves up a tier once it has fired 24 times. Each authority works its queue most severe, oldest first.")
+
+    @shared_resource
+    def escalation_router():
+        return EscalationRouter()
+
+    def monitoring_alert_burst(alerts, seed, models=300):
+        # A burst from a fleet of monitored models: mostly warnings, about one in ten critical.
+        rng = np.random.default_rng(seed)
+        return pd.DataFrame({
+            'model': np.char.add('model-', rng.integers(0, models, alerts).astype(str)),
+            'window_end': pd.Timestamp.now().floor('h'),
+            'group': rng.choice(['Group A', 'Group B', 'Group C', 'Group D'], alerts),
+            'test': rng.choice(list(DEFAULT_THRESHOLDS), alerts),
+            'value': rng.gamma(2.0, 0.1, alerts),
+            'severity': np.where(rng.random(alerts) < 0.1, SEVERITIES[-1], SEVERITIES[0]),
+        })
+
+    def submit_alert_burst():
+        router = escalation_router()
+        router.submit(monitoring_alert_burst(st.session_state.p2_escalation_burst, seed=router.routed + router.backlog))
+
+    def resolve_incidents():
+        escalation_router().resolve(st.session_state.p2_escalation_authority, st.session_state.p2_escalation_count)
+
+    # Routing runs in a background thread; while alerts wait to be routed, the fragment polls the router for its progress.
+    def escalation_console(polling):
+        router = escalation_router()
+        burst_col, button_col = st.columns([2, 1], vertical_alignment="bottom")
+        burst_col.select_slider("Alerts per burst", [100, 1_000, 5_000, 20_000], value=5_000, key="p2_escalation_burst")
+        button_col.button("🚨 Simulate alert burst", on_click=submit_alert_burst, key="p2_escalation_submit")
+
+        open_col, routed_col, backlog_col = st.columns(3)
+        open_col.metric("Open incidents", f"{len(router):,}")
+        routed_col.metric("Alerts routed", f"{router.routed:,}")
+        backlog_col.metric("Alerts waiting to be routed", f"{router.backlog:,}")
+
+        metrics = router.metrics()
+        st.dataframe(metrics, use_container_width=True, column_config={
+            'tier': st.column_config.NumberColumn("Tier", format="%d"),
+            'open': st.column_config.ProgressColumn("Queue depth", min_value=0, max_value=max(int(metrics['open'].max()), 1), format="%d"),
+            'oldest_age': st.column_config.NumberColumn("Oldest open (s)", format="%.0f"),
+            'ttr_p50': st.column_config.NumberColumn("Median time to resolution (s)", format="%.1f"),
+            'ttr_p90': st.column_config.NumberColumn("P90 time to resolution (s)", format="%.1f"),
+        })
+
+        authority_col, count_col, resolve_col = st.columns([2, 1, 1], vertical_alignment="bottom")
+        authority = authority_col.selectbox("Authority", AUTHORITIES, index=len(AUTHORITIES) - 1, key="p2_escalation_authority")
+        count_col.number_input("Incidents", min_value=1, max_value=1_000, value=10, key="p2_escalation_count")
+        resolve_col.button("✅ Resolve next", on_click=resolve_incidents, key="p2_escalation_resolve")
+        queue = router.queue(authority, limit=20)
+        if queue.empty:
+            st.success(f"No open incidents for {authority}.")
+        else:
+            st.dataframe(queue, use_container_width=True)
+            st.caption("Next incidents to resolve, most severe and oldest first.")
+        st.caption("The router is one triage queue shared by every session of this app, so bursts and resolutions from other visitors show up here too.")
+        if (router.backlog > 0) != polling:
+            # A fragment's refresh interval is fixed when it is declared: rerun the page to start or stop polling.
+            st.rerun()
+
+    routing = escalation_router().backlog > 0
+    st.fragment(escalation_console, run_every="2s" if routing else None)(routing)
+
+    st.subheader("Governance Gates for Fairness")
+    st.markdown("Implement explicit checkpoints where fairness properties must be formally verified before a project can proceed.")
+
+    st.info("Interactive Gate Check Simulation")
+
+    @st.fragment
+    def governance_gate_check():
+        # Saved per project and sprint; the Review Board overview below reads the same store.
+        scope = project_scope("p2_gate")
+        gates = persisted_checklist([
+            ("p2_g1", "data_review", "Data Review Gate: Training data properties and biases documented."),
+            ("p2_g2", "design_approval", "Design Approval Gate: Fairness implications of model architecture evaluated."),
+            ("p2_g3", "pre_deployment", "Pre-Deployment Gate: Fairness metrics validated and meet thresholds."),
+            ("p2_g4", "monitoring_trigger", "Monitoring Trigger Gate: Post-deployment monitoring and alert system is active."),
+        ], scope)
+
+        if all(gates):
+            st.success("All governance gates passed. The project is cleared for deployment.")
+        else:
+            st.warning("Project cannot proceed until all governance gates are passed.")
+
+    governance_gate_check()
+
+    st.markdown("##### Review Board: Portfolio Gate Status")
+    st.markdown("Every project's latest sprint, read in one query from the gate store: where each project is blocked and how much of the fairness Definition of Done is met.")
+
+    def blocked_at_chart(stages):
+        return alt.Chart(stages).mark_bar().encode(
+            x=alt.X('projects:Q', title='Projects'),
+            y=alt.Y('blocked_at:N', title=None, sort=list(stages['blocked_at'])),
+            color=alt.condition(alt.datum.blocked_at == CLEARED, alt.value('#2ca02c'), alt.value('#d62728')),
+            tooltip=['blocked_at', 'projects'],
+        ).properties(title="Projects by First Open Gate", height=200)
+
+    @st.fragment
+    def review_board_overview():
+        start = time.perf_counter()
+        portfolio = governance_store().portfolio()
+        elapsed = time.perf_counter() - start
+        if portfolio.empty:
+            st.info("No gate status recorded yet.")
+            return
+        cleared = int((portfolio['blocked_at'] == CLEARED).sum())
+        dod_complete = int((portfolio['dod_done'] == len(CHECKLISTS['dod'])).sum())
+        projects_col, cleared_col, dod_col = st.columns(3)
+        projects_col.metric("Projects", f"{len(portfolio):,}")
+        cleared_col.metric("Cleared for deployment", f"{cleared:,}", f"{cleared / len(portfolio):.0%}", delta_color="off")
+        dod_col.metric("Fairness DoD complete", f"{dod_complete:,}", f"{dod_complete / len(portfolio):.0%}", delta_color="off")
+
+        stages = portfolio['blocked_at'].value_counts(sort=False).rename('projects').rename_axis('blocked_at').reset_index()
+        stages['blocked_at'] = stages['blocked_at'].astype(str)
+        altair_chart(blocked_at_chart, stages)
+
+        shown = st.multiselect("Blocked at", list(portfolio['blocked_at'].cat.categories), default=[c for c in portfolio['blocked_at'].cat.categories if c != CLEARED], key="p2_board_blocked")
+        view = portfolio[portfolio['blocked_at'].isin(shown)].sort_values('updated', kind='stable')
+        st.dataframe(view, use_container_width=True, column_config={
+            'gates_done': st.column_config.ProgressColumn("Gates passed", min_value=0, max_value=len(CHECKLISTS['gates']), format="%d"),
+            'dod_done': st.column_config.ProgressColumn("DoD items done", min_value=0, max_value=len(CHECKLISTS['dod']), format="%d"),
+        })
+        st.caption(f"{len(view):,} projects shown, longest-waiting first. Loaded in {elapsed * 1000:.0f} ms.")
+
+    review_board_overview()
+
+
+# Shared by the Documentation and Dashboards tabs.
+@shared_resource
+def intersectional_demo_counts(n=200_000, seed=11):
+    # Simulated screening model audited on six sensitive attributes.
+    # Gender x Race accuracies follow the original example; age and
+    # language add smaller gaps that only show up in deeper subgroups.
+    rng = np.random.default_rng(seed)
+    demo = pd.DataFrame({
+        'Gender': rng.choice(['Men', 'Women', 'Non-Binary'], size=n, p=[0.48, 0.46, 0.06]),
+        'Race': rng.choice(['Group A', 'Group B'], size=n, p=[0.6, 0.4]),
+        'Age Bracket': rng.choice(['18-29', '30-44', '45-59', '60+'], size=n, p=[0.25, 0.35, 0.28, 0.12]),
+        'Region': rng.choice(['North', 'South', 'East', 'West'], size=n),
+        'Disability': rng.choice(['No', 'Yes'], size=n, p=[0.9, 0.1]),
+        'Language': rng.choice(['Native', 'Non-native'], size=n, p=[0.8, 0.2]),
+    })
+    cell_accuracy = pd.Series({
+        ('Men', 'Group A'): 0.92, ('Men', 'Group B'): 0.91,
+        ('Women', 'Group A'): 0.90, ('Women', 'Group B'): 0.82,
+        ('Non-Binary', 'Group A'): 0.85, ('Non-Binary', 'Group B'): 0.79,
+    })
+    accuracy = cell_accuracy.reindex(pd.MultiIndex.from_frame(demo[['Gender', 'Race']])).to_numpy()
+    accuracy = accuracy - (0.04 * (demo['Age Bracket'] == '60+').to_numpy() + 0.03 * (demo['Language'] == 'Non-native').to_numpy())
+    y_true = rng.integers(0, 2, size=n)
+    y_pred = np.where(rng.random(n) < accuracy, y_true, 1 - y_true)
+    counts = ConfusionAccumulator(list(demo.columns))
+    counts.update(y_true, y_pred, demo)
+    return counts.group_table()
+
+
+# --- TAB 4: DOCUMENTATION & ACCOUNTABILITY ---
+with tab_documentation:
+    st.subheader("Model Cards & Fairness Decision Records (FDRs)")
+    st.markdown("Enhance standard documentation to transparently communicate fairness properties, limitations, and key decisions, following frameworks like those proposed by Mitchell et al. (2019).")
+
+    with st.expander("🌍 Intersectional Considerations for Documentation"):
+        st.markdown("""
+        Traditional documentation often analyzes protected attributes in isolation. An intersectional approach, as advocated by Crenshaw (1989), requires moving beyond this.
+        - **Require Disaggregated Reporting:** Mandate that performance metrics are broken down by intersectional subgroups (e.g., older women), not just by 'age' and 'gender' separately.
+        - **Acknowledge Gaps:** If intersectional analysis was not possible due to data limitations, this must be explicitly stated as a limitation in the model card.
+        """)
+
+    st.markdown("##### Enhanced Model Card Template")
+    st.markdown("A Model Card provides essential details about a model's performance and limitations. The template below adds an explicit **Fairness & Intersectional Analysis** section.")
+    
+    model_card_template = """
+### Model Details
+- **Model developer:** AI Dev Team Alpha
+- **Model date:** 2025-09-25
+- **Model version:** v2.1
+
+### Intended Use
+- **Primary use:** To screen resumes and provide a 'match score' for job requisitions.
+- **Out-of-scope uses:** Not to be used for final hiring decisions without human review.
+
+### Training Data
+- **Source:** Internal historical application data from 2020-2024.
+- **Key Demographics:** Analysis performed on gender and race subgroups. *Limitation: Data for non-binary individuals was insufficient for robust analysis.*
+
+### Evaluation Data
+- **Dataset:** Stratified sample of 5,000 applications from Q1 2025.
+- **Demographics:** Gender, Race, Age Bracket.
+
+## Fairness & Intersectional Analysis
+- **Fairness Metrics:** Equal Opportunity (True Positive Rate Parity).
+- **Groups Analyzed:** Gender, Race, Age Bracket, and intersections (e.g., 'Women, Age 40+').
+- **Findings:** The model achieves Equal Opportunity with a TPR difference of <3% for individual attributes.
+- **Intersectional Gaps:** A performance gap was found for 'Women, Age 40+', whose TPR was 7% lower than the baseline.
+- **Mitigation:** A post-processing threshold adjustment was applied specifically for this subgroup.
+
+## Ethical Considerations
+- **Risks:** Risk of reinforcing historical hiring patterns.
+- **Mitigations:** Human-in-the-loop review required for all candidates in underrepresented groups.
+    """
+    st.code(model_card_template, language="markdown")
+    st.download_button(label="Download Model Card Template", data=model_card_template, file_name="Model_Card_Template.md")
+
+    st.markdown("##### Generate the Model Card from Audit Results")
+    st.markdown("The same card, filled in from an audit: group sizes, findings, intersectional gaps and the fairness gate are computed from the disaggregated metrics instead of typed in. Uses your uploaded predictions when available (sidebar), else the simulated screening model.")
+
+    @st.fragment
+    def model_card_generator():
+        uploaded = get_uploaded_audit()
+        if uploaded is not None:
+            group_table, attributes = uploaded.group_table(), uploaded.sensitive_columns
+        else:
+            group_table = intersectional_demo_counts()
+            attributes = [c for c in group_table.columns if c not in COUNT_COLUMNS]
+
+        name_col, version_col, developer_col = st.columns(3)
+        details = {
+            "name": name_col.text_input("Model name", "Resume Screener", key="p2_card_name"),
+            "version": version_col.text_input("Model version", "v2.1", key="p2_card_version"),
+            "developer": developer_col.text_input("Model developer", "AI Dev Team Alpha", key="p2_card_developer"),
+        }
+        default = [a for a in ("Gender", "Age Bracket") if a in attributes] or attributes[:2]
+        feature_col, gate_col = st.columns(2)
+        features = feature_col.multiselect("Groups analyzed", attributes, default=default, key="p2_card_features")
+        max_gap = gate_col.slider("Pre-deployment gate: maximum TPR difference (pts)", 1, 20, 5, key="p2_card_gate")
+        if not features:
+            st.warning("Select at least one attribute to analyze.")
+            return
+
+        evidence = ModelEvidence(
+            details, DisaggregatedMetrics.from_group_table(group_table, features),
+            max_difference={"true_positive_rate": max_gap / 100},
+        )
+        passed, _ = gate_status(evidence)
+        (st.success if passed else st.error)(f"Pre-deployment fairness gate {'passed' if passed else 'failed'}.")
+        card = model_card(evidence)
+        markdown = render(card, "md")
+        with st.container(border=True, height=420):
+            st.markdown(markdown)
+        file_name = f"Model_Card_{details['name'] or 'model'}".replace(" ", "_")
+        md_col, html_col = st.columns(2)
+        md_col.download_button("📥 Model Card (.md)", markdown, file_name=f"{file_name}.md", mime="text/markdown", key="p2_card_md")
+        html_col.download_button("📥 Model Card (.html)", lambda: render(card, "html"), file_name=f"{file_name}.html", mime="text/html", on_click="ignore", key="p2_card_html")
+
+    model_card_generator()
+
+# --- TAB 5: DASHBOARDS & MONITORING ---
+with tab_monitoring:
+    st.subheader("Metric Dashboards & Monitoring Systems")
+    st.markdown("Effective fairness dashboards translate complex metrics into actionable insights for different audiences and integrate with governance to trigger responses.")
+
+    @shared_data(max_entries=16)
+    def intersectional_subgroups(group_table, attributes, max_order, min_support):
+        lattice = SubgroupLattice.from_group_table(group_table, attributes)
+        return lattice.enumerate(max_order=max_order, min_support=min_support)
+
+    def heatmap_chart(heatmap_data, x_field, y_field, metric):
+        metric_title = metric.replace('_', ' ').title()
+        return alt.Chart(heatmap_data).mark_rect().encode(
+            x=f'{x_field}:N',
+            y=f'{y_field}:N',
+            color=alt.Color(f'{metric}:Q', title=metric_title, scale=alt.Scale(scheme='redyellowgreen', reverse=not LOWER_IS_WORSE[metric])),
+            tooltip=[x_field, y_field, alt.Tooltip(f'{metric}:Q', title=metric_title, format='.3f'), 'count']
+        ).properties(
+            title=f'Model {metric_title} Across Intersectional Groups'
+        )
+
+    @shared_resource
+    def metric_store():
+        # A real history when FAIRNESS_AUDIT_METRIC_STORE points at a store
+        # file, else two years of daily evaluations of three demo models.
+        if os.environ.get(STORE_ENV):
+            return MetricStore(os.environ[STORE_ENV])
+        rng = np.random.default_rng(0)
+        days = pd.date_range(end=pd.Timestamp('2026-10-01'), periods=730, freq='D')
+        t = np.linspace(0, 1, len(days))
+        models = {
+            # Base selection rate per group, and a per-group trend over two years.
+            'Resume Screener': ({'Men': 0.42, 'Women': 0.33, 'Non-binary': 0.31}, {'Women': 0.08, 'Non-binary': 0.08}),
+            'Job Matcher': ({'Men': 0.38, 'Women': 0.36, 'Non-binary': 0.35}, {}),
+            'Interview Analyzer': ({'Men': 0.45, 'Women': 0.43, 'Non-binary': 0.41}, {'Non-binary': -0.12, 'Women': -0.04}),
+        }
+        frames = []
+        for model, (base, trend) in models.items():
+            for group, rate in base.items():
+                selection = np.clip(rate + trend.get(group, 0.0) * t ** 2 + rng.normal(0, 0.01, len(days)), 0, 1)
+                accuracy = np.clip(0.86 - 0.5 * (base['Men'] - selection) + rng.normal(0, 0.01, len(days)), 0, 1)
+                values = {
+                    'selection_rate': selection,
+                    'accuracy': accuracy,
+                    'true_positive_rate': np.clip(selection * 1.6, 0, 1),
+                    'false_positive_rate': np.clip(selection * 0.4, 0, 1),
+                }
+                counts = rng.poisson(800 if group != 'Non-binary' else 60, len(days))
+                frames += [pd.DataFrame({'model': model, 'group': group, 'metric': metric, 'timestamp': days, 'value': value, 'count': counts})
+                           for metric, value in values.items()]
+        store = MetricStore()
+        store.record(pd.concat(frames, ignore_index=True))
+        return store
+
+    def risk_band(disparity):
+        if disparity < 0.05:
+            return 'Low'
+        return 'Medium' if disparity < 0.10 else 'High'
+
+    def disparity_trend_chart(trend, metric, period):
+        return alt.Chart(trend).mark_line(point=period == 'week').encode(
+            x=alt.X('period_start:T', title=period.title()),
+            y=alt.Y('disparity:Q', title='Between-group Gap', axis=alt.Axis(format='%')),
+            color=alt.Color('model:N', title='Model'),
+            tooltip=['model', alt.Tooltip('period_start:T', title=period.title()), alt.Tooltip('disparity:Q', format='.1%')]
+        ).properties(title=f"{metric.replace('_', ' ').title()} Gap Between Groups, Last 12 Months")
+
+    SEVERITY_COLORS = {'Warning': '#ff7f0e', 'Critical': '#d62728'}
+
+    def drift_metric_chart(history, metric, alerts):
+        metric_title = metric.replace('_', ' ').title()
+        lines = alt.Chart(history).mark_line().encode(
+            x=alt.X('window_end:T', title='Window End'),
+            y=alt.Y(f'{metric}:Q', title=metric_title),
+            color=alt.Color('group:N', title='Group'),
+            tooltip=[alt.Tooltip('window_end:T', format='%b %d, %H:%M'), 'group', alt.Tooltip(f'{metric}:Q', format='.3f'), 'count']
+        )
+        markers = alt.Chart(alerts).mark_rule(strokeDash=[4, 3]).encode(
+            x='window_end:T',
+            color=alt.Color('severity:N', title='Alert', scale=alt.Scale(domain=list(SEVERITIES), range=list(SEVERITY_COLORS.values()))),
+            tooltip=['severity', 'test', 'group', alt.Tooltip('value:Q', format='.3f')]
+        )
+        return (lines + markers).resolve_scale(color='independent').properties(title=f'{metric_title} by Group (sliding window)')
+
+    def drift_disparity_chart(disparity, metric):
+        warning, critical = DEFAULT_THRESHOLDS['disparity']
+        line = alt.Chart(disparity).mark_line(color='black').encode(
+            x=alt.X('window_end:T', title='Window End'),
+            y=alt.Y('disparity:Q', title='Between-group Difference'),
+            tooltip=[alt.Tooltip('window_end:T', format='%b %d, %H:%M'), alt.Tooltip('disparity:Q', format='.3f')]
+        )
+        thresholds = alt.Chart(pd.DataFrame({'severity': list(SEVERITIES), 'threshold': [warning, critical]})).mark_rule(strokeDash=[6, 4]).encode(
+            y='threshold:Q',
+            color=alt.Color('severity:N', title='Threshold', scale=alt.Scale(domain=list(SEVERITIES), range=list(SEVERITY_COLORS.values())))
+        )
+        return (line + thresholds).properties(title=f"{metric.replace('_', ' ').title()} Disparity vs. Alert Thresholds")
+
+    with st.expander("Dashboard Design Principles"):
+        st.markdown("A good dashboard adapts its content to its audience, provides context, and is organized hierarchically.")
+        d_exec, d_mgmt, d_tech = st.tabs(["Executive View", "Management View", "Technical View"])
+        store = metric_store()
+        end = store.time_range()[1]
+        quarter = pd.DateOffset(months=3)
+        with d_exec:
+            st.markdown("**Focus:** High-level fairness health and risk indicators.")
+            if end is None:
+                st.caption(f"The metric store at `{store.path}` is empty.")
+            else:
+                current = store.disparity('selection_rate', end - quarter, end)
+                previous = store.disparity('selection_rate', end - 2 * quarter, end - quarter)
+                worst_model = current.idxmax()
+                change = current[worst_model] / previous.get(worst_model, np.nan) - 1
+                st.metric(
+                    "Overall Fairness Risk Score",
+                    risk_band(current[worst_model]),
+                    delta=None if np.isnan(change) else f"{change:+.0%}",
+                    delta_color="inverse",
+                    help=f"Change from last quarter in the largest selection-rate gap between groups, currently {current[worst_model]:.1%} for {worst_model}.",
+                )
+        with d_mgmt:
+            st.markdown("**Focus:** System-level fairness with comparative context and trends.")
+
+            @st.fragment
+            def management_view():
+                if end is None:
+                    st.caption(f"The metric store at `{store.path}` is empty.")
+                    return
+                metric_col, period_col = st.columns(2)
+                metric = metric_col.selectbox("Metric", METRICS, index=METRICS.index('selection_rate'), format_func=lambda m: m.replace('_', ' ').title(), key="p2_mgmt_metric")
+                period = period_col.radio("Trend resolution", ["week", "day"], format_func={'week': 'Weekly', 'day': 'Daily'}.get, horizontal=True, key="p2_mgmt_period")
+
+                started = time.perf_counter()
+                current = store.group_summary(metric, end - quarter, end)
+                previous = store.disparity(metric, end - 2 * quarter, end - quarter)
+                trend = store.disparity_trend(metric, period, start=end - pd.DateOffset(years=1), end=end)
+                elapsed = time.perf_counter() - started
+
+                worst = current.loc[current.groupby('model')['value'].idxmin()].set_index('model')
+                comparison = pd.DataFrame({
+                    'Gap this quarter': current.groupby('model')['value'].agg(lambda v: v.max() - v.min()),
+                    'Gap last quarter': previous,
+                    'Lowest group': worst['group'],
+                    f"Lowest {metric.replace('_', ' ')}": worst['value'],
+                })
+                comparison['Change'] = comparison['Gap this quarter'] - comparison['Gap last quarter']
+                comparison['Risk'] = comparison['Gap this quarter'].map(risk_band)
+                st.dataframe(comparison.rename_axis('Model').style.format({
+                    'Gap this quarter': '{:.1%}', 'Gap last quarter': '{:.1%}', 'Change': '{:+.1%}',
+                    f"Lowest {metric.replace('_', ' ')}": '{:.1%}',
+                }), use_container_width=True)
+                altair_chart(disparity_trend_chart, trend, metric, period)
+                st.caption(f"Read from pre-aggregated rollups of {store.raw_rows():,} stored observations in {elapsed * 1000:.0f} ms.")
+
+            management_view()
+        with d_tech:
+            st.markdown("**Focus:** Detailed, disaggregated metrics with statistical rigor (e.g., confidence intervals).")
+
+            @st.fragment
+            def technical_view():
+                uploaded = get_uploaded_audit()
+                if uploaded is not None:
+                    group_table, attributes = uploaded.group_table(), uploaded.sensitive_columns
+                else:
+                    group_table = intersectional_demo_counts()
+                    attributes = [c for c in group_table.columns if c not in COUNT_COLUMNS]
+
+                feature_col, metric_col = st.columns(2)
+                feature = feature_col.selectbox("Disaggregate by", attributes, key="p2_tech_feature")
+                metric = metric_col.selectbox("Metric", METRICS, format_func=lambda m: m.replace('_', ' ').title(), key="p2_tech_metric")
+                intervals = cached_bootstrap_ci(DisaggregatedMetrics.from_group_table(group_table, [feature]))
+                altair_chart(metric_interval_chart, intervals.by_group, metric, feature)
+
+                gap = intervals.difference.loc[metric]
+                st.caption(f"Largest gap between groups: **{gap['estimate']:.2%}** (95% bootstrap interval {gap['lower']:.2%} to {gap['upper']:.2%}, 1,000 resamples). Overlapping error bars mean the observed difference may be sampling noise.")
+
+            technical_view()
+
+    with st.expander("Disaggregation and Intersectionality in Dashboards"):
+        st.markdown("Aggregate metrics hide bias. Effective dashboards must allow users to **disaggregate** data and analyze **intersectional** performance.")
+        st.info("💡 Interactive Example: Intersectional Performance Heatmap")
+        
+        @st.fragment
+        def intersectional_heatmap():
+            uploaded = get_uploaded_audit()
+            if uploaded is not None and len(uploaded.sensitive_columns) >= 2:
+                group_table, attributes = uploaded.group_table(), uploaded.sensitive_columns
+            else:
+                if uploaded is not None:
+                    st.caption("The uploaded data has a single sensitive column; select at least two to build an intersectional heatmap. Showing the example data.")
+                group_table = intersectional_demo_counts()
+                attributes = [c for c in group_table.columns if c not in COUNT_COLUMNS]
+
+            x_col, y_col, metric_col = st.columns(3)
+            x_field = x_col.selectbox("Columns", attributes, index=0, key="p2_heatmap_x")
+            y_field = y_col.selectbox("Rows", [c for c in attributes if c != x_field], key="p2_heatmap_y")
+            metric = metric_col.selectbox("Metric", list(LOWER_IS_WORSE), format_func=lambda m: m.replace('_', ' ').title(), key="p2_heatmap_metric")
+            support_col, order_col = st.columns(2)
+            min_support = support_col.number_input("Minimum subgroup size", 1, 1_000_000, 100, 50, key="p2_heatmap_support", help="Intersections with fewer rows are pruned: their metrics are too noisy to act on.")
+            if len(attributes) > 2:
+                max_order = order_col.slider("Maximum number of intersecting attributes", 2, len(attributes), min(3, len(attributes)), key="p2_heatmap_order")
+            else:
+                # A slider needs min < max; with two attributes the only intersection order is 2.
+                max_order = 2
+
+            subgroups = intersectional_subgroups(group_table, attributes, max_order, int(min_support))
+            metric_title = metric.replace('_', ' ').title()
+            pairs = pair_table(subgroups, x_field, y_field)
+            heatmap_data = pairs[[x_field, y_field, metric, 'count']].astype({x_field: str, y_field: str})
+
+            altair_chart(heatmap_chart, heatmap_data, x_field, y_field, metric)
+            st.caption(f"{len(subgroups):,} subgroups of up to {max_order} attributes have at least {int(min_support):,} rows; smaller intersections are left blank.")
+
+            if heatmap_data.empty:
+                st.warning("No intersection of these two attributes reaches the minimum subgroup size.")
+            else:
+                worst = worst_subgroups(pairs, k=1, metric=metric).iloc[0]
+                st.error(f"The heatmap immediately reveals a critical fairness issue for **{worst[x_field]} in {worst[y_field]}** that would be hidden in an overall {metric_title.lower()} score.")
+
+            st.markdown("**Top 10 worst-performing intersections**")
+            worst_table = worst_subgroups(subgroups, k=10, metric=metric, min_order=2)
+            st.dataframe(
+                worst_table[['subgroup', 'order', 'count', metric]].rename(columns={'subgroup': 'Subgroup', 'order': 'Attributes', 'count': 'Size', metric: metric_title}),
+                hide_index=True, use_container_width=True
+            )
+            if not worst_table.empty:
+                worst_metrics = DisaggregatedMetrics(worst_table[list(COUNT_COLUMNS)].to_numpy().reshape(-1, 2, 2), pd.Index(worst_table['subgroup'], name='Subgroup'))
+                altair_chart(metric_interval_chart, cached_bootstrap_ci(worst_metrics).by_group, metric, 'Subgroup')
+                st.caption("Small intersections have wide intervals: check that a subgroup's error bar clears the others before treating its gap as real.")
+
+        intersectional_heatmap()
+
+    with st.expander("Monitoring Systems and Alert Frameworks"):
+        st.markdown("""
+        - **Fairness Drift Detection:** Track statistical changes in fairness metrics over time, not just static values.
+        - **Tiered Alert Framework:** Define different severity levels (e.g., 'Warning', 'Critical') and response protocols for fairness metric violations.
+        - **Governance Integration:** Alerts should automatically trigger governance processes. A 'Critical' alert might require an immediate review by the **AI Review Board**.
+        """)
+
+        @shared_resource
+        def drift_demo_log(days=14, events_per_day=40_000, seed=0):
+            # Two weeks of loan-approval predictions. From day 9 the model's
+            # approval rate for Group B slides down by 10 points over a day.
+            rng = np.random.default_rng(seed)
+            n = days * events_per_day
+            seconds = np.sort(rng.integers(0, days * 86_400, n))
+            day = seconds / 86_400
+            group = pd.Categorical.from_codes((rng.random(n) < 0.4).astype(np.int8), categories=['Group A', 'Group B'])
+            approval = np.where(group.codes == 0, 0.50, 0.46) - (group.codes == 1) * 0.10 * np.clip(day - 9, 0, 1)
+            score = np.clip(approval + rng.normal(0, 0.15, n), 0, 1)
+            return pd.DataFrame({
+                'timestamp': pd.Timestamp('2026-01-01') + pd.to_timedelta(seconds, unit='s'),
+                'group': group,
+                'y_true': (rng.random(n) < 0.5).astype(np.int8),
+                'y_pred': (rng.random(n) < approval).astype(np.int8),
+                'score': score,
+            })
+
+        @shared_data(max_entries=16)
+        def drift_monitoring(window, metric, batch_size=50_000):
+            # Replays the log as a stream of micro-batches, as a consumer of a
+            # prediction topic would see it.
+            log = drift_demo_log()
+            monitor = DriftMonitor(bucket='1h', window=window, metric=metric)
+            for start in range(0, len(log), batch_size):
+                batch = log.iloc[start:start + batch_size]
+                monitor.update(batch['timestamp'], batch['group'], batch['y_true'].to_numpy(), batch['y_pred'].to_numpy(), batch['score'].to_numpy())
+            monitor.flush()
+            return monitor.history(), monitor.disparity().reset_index(), monitor.alert_table()
+
+        @st.fragment
+        def drift_dashboard():
+            st.markdown("##### Live Drift Monitor (simulated prediction stream)")
+            st.caption("Two weeks of hourly buckets; the first window is the reference period. Metrics are recomputed over a sliding window of the last N hours.")
+            window_col, metric_col = st.columns(2)
+            window = window_col.selectbox("Sliding window (hours)", [6, 12, 24, 48], index=2, key="p2_drift_window")
+            metric = metric_col.selectbox("Monitored metric", METRICS, index=METRICS.index('selection_rate'), key="p2_drift_metric")
+            history, disparity, alerts = drift_monitoring(window, metric)
+
+            start, end = history['window_end'].min().to_pydatetime(), history['window_end'].max().to_pydatetime()
+            until = st.slider("Replay the stream up to", start, end, end, step=pd.Timedelta('1h').to_pytimedelta(), format="MMM D, HH:mm", key="p2_drift_until")
+            history = history[history['window_end'] <= until]
+            disparity = disparity[disparity['window_end'] <= until]
+            alerts = alerts[alerts['window_end'] <= until].assign(group=lambda a: a['group'].fillna('All groups'))
+
+            warning_col, critical_col, disparity_col = st.columns(3)
+            warning_col.metric("⚠️ Warning alerts", int((alerts['severity'] == 'Warning').sum()))
+            critical_col.metric("🚨 Critical alerts", int((alerts['severity'] == 'Critical').sum()))
+            disparity_col.metric("Current disparity", f"{disparity['disparity'].iloc[-1]:.3f}")
+
+            altair_chart(drift_metric_chart, history, metric, alerts)
+            altair_chart(drift_disparity_chart, disparity, metric)
+
+            if alerts.empty:
+                st.success("No alerts so far: every group is within its reference behaviour.")
+                return
+            latest = alerts.iloc[-1]
+            if (alerts['severity'] == 'Critical').any():
+                critical = alerts[alerts['severity'] == 'Critical'].iloc[0]
+                st.error(f"**Critical** {critical['test']} alert for **{critical['group']}** at {critical['window_end']:%b %d, %H:%M}: escalate to the **AI Review Board** for immediate review.")
+            else:
+                st.warning(f"**Warning** {latest['test']} alert for **{latest['group']}** at {latest['window_end']:%b %d, %H:%M}: the team's Fairness Champion should investigate.")
+            st.dataframe(alerts, hide_index=True, use_container_width=True)
+
+        drift_dashboard()
+
+# --- TAB 6: CASE STUDY ---
+with tab_case_study:
+    st.subheader("Case Study: Multi-Team AI Recruitment Platform")
+    st.markdown("This case study shows how governance prevents chaos when multiple teams collaborate on a complex AI system.")
+
+    case_context, case_problem, case_solution = st.tabs(["Scenario Context", "The Problem (Without Governance)", "The Solution (With Governance)"])
+
+    with case_context:
+        st.markdown("""
+        **System:** A comprehensive AI recruitment platform.
+        - **Team A (Sourcing):** Builds a resume screening model.
+        - **Team B (Matching):** Builds a recommendation engine.
+        - **Team C (Interview):** Builds a tool that analyzes video interview transcripts.
+        **Fairness Challenge:** Bias can be introduced by any team and amplified by the next.
+        """)
+
+    with case_problem:
+        st.markdown("""
+        Each team operates in a silo, leading to systemic failure:
+        1.  **Inconsistent Standards:** Team A and Team B use incompatible fairness metrics, negating each other's work.
+        2.  **No Accountability Trail:** When Team C's model is found to be biased, there is no documentation explaining why risks were accepted.
+        3.  **Ambiguous Ownership:** When a complaint is filed, it's unclear which team is responsible, leading to finger-pointing.
+        
+        **Result:** A fragmented, high-risk system where fairness efforts are undermined, and the organization cannot defend its practices.
+        """)
+    
+    with case_solution:
+        st.markdown("The organization implements the **Organizational Integration Toolkit**. Here's the impact:")
+        
+        st.success("##### 1. A Central Governance Body Sets the Standard")
+        st.markdown("The newly formed **AI Review Board** creates a company-wide policy mandating **Equal Opportunity** as the primary fairness metric for all teams, ensuring consistency.")
+
+        st.success("##### 2. Roles and Responsibilities are Clarified")
+        st.markdown("Using the **RASCI Matrix**, each Product Owner is made **Accountable** for their component's fairness. A **Fairness Champion** is assigned to the platform to **Support** all three teams.")
+
+        st.success("##### 3. A Documentation System Connects the Teams")
+        st.markdown("Each team must complete a **Model Card**. Team B's card now explicitly references the fairness guarantees documented in Team A's card, creating a clear dependency chain.")
+        
+        st.success("##### 4. A Clear Escalation Path Resolves Conflict")
+        st.markdown("Team C finds they cannot meet the Equal Opportunity threshold for non-native speakers. The **Fairness Champion** escalates the issue to the **AI Review Board**. The Board makes an informed, binding decision to invest in better training data rather than deploying a risky model.")
+        
+        st.info("**Result:** The governance framework transforms the siloed teams into a cohesive system. Standards are consistent, decisions are documented, and responsibilities are clear, significantly reducing the organization's risk.")
+
+st.markdown("---")
+
+# --- 7. Bibliography and Further Reading ---
+st.subheader("📚 Further Reading & Bibliography")
+with st.expander("Expand to see key resources for the Organizational Integration Toolkit"):
+    st.markdown("""
+    Effective organizational governance is the bridge between team-level fairness efforts and enterprise-wide accountability. The following resources provide the academic and practical foundations for the concepts in this toolkit.
+
+    ##### Foundational Readings on AI Governance & Accountability:
+
+    - **Raji, I. D., et al. (2020). *Closing the AI accountability gap: Defining an end-to-end framework for internal algorithmic auditing.***
+      - **Why it's important:** This paper provides a comprehensive framework for accountability that inspires many of this toolkit's components, including governance gates, documentation standards, and escalation procedures. It is essential for understanding how to build a defensible fairness program.
+    
+    - **Metcalf, J., et al. (2021). *Algorithmic impact assessments and accountability: The co-construction of impacts.***
+      - **Why it's important:** This work explores the practicalities of impact assessments, a key function of any AI governance body. It highlights the need for cross-functional collaboration, which underpins the RASCI matrix and the formation of an AI Review Board.
+
+    - **Rakova, B., et al. (2021). *Where responsible AI meets reality: Practitioner perspectives on enablers for shifting organizational practices.***
+      - **Why it's important:** Provides real-world insights into what's needed to shift organizational culture toward responsible AI, reinforcing the need for clear roles, leadership buy-in, and standardized processes.
+
+    ##### On Specific Toolkit Components:
+
+    - **For Roles & Responsibilities:** **Holstein, K., et al. (2019). *Improving fairness in machine learning systems: What do industry practitioners need?***
+      - **Why it's important:** This research shows that practitioners need clear roles and responsibilities. It provides evidence for why hybrid organizational models (e.g., a central "Center of Excellence" with embedded "Fairness Champions") are often more effective than purely centralized or decentralized approaches.
+    
+    - **For Documentation:** **Mitchell, M., et al. (2019). *Model cards for model reporting.***
+      - **Why it's important:** The foundational paper that introduced the concept of "Model Cards." This toolkit's documentation section is a direct application of this idea, extending it to include more explicit fairness and intersectional analysis.
+
+    - **For Dashboards & Monitoring:** **Mehrabi, N., et al. (2021). *A survey on bias and fairness in machine learning.***
+      - **Why it's important:** While a broad survey, it covers the necessity of post-deployment monitoring for fairness drift, which is the core concept behind the monitoring and alerting frameworks in this toolkit.
+    """)
@@ -0,0 +1,804 @@
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+import numpy as np
+
+from fairness_audit.ablation import ablate_scores
+from fairness_audit.augmentation import SwapLexicon, augment_file
+from fairness_audit.counterfactual import (
+    CACHE_ENV, CONSISTENCY_THRESHOLD, DEMO_TEMPLATES, FAIRNESS_INSTRUCTION, ResponseCache, StubBackend,
+    consistency_by_group, evaluate_counterfactuals,
+)
+from fairness_audit.fusion import BALANCED_WEIGHTS, MODALITIES, dominant_weights, fuse, weight_sweep
+from fairness_audit.ingest import read_catalog, read_columns
+from fairness_audit.lazy import fairlearn_metrics, sklearn_metrics
+from fairness_audit.metrics import METRICS, disaggregate
+from fairness_audit.ranking import catalog_fingerprint, fair_rerank, tradeoff_curve
+from fairness_audit.stereotypes import StereotypeLexicon, score_texts, stereotype_rates
+from ui.cache import altair_chart, shared_data, shared_resource
+from ui.charts import metric_interval_chart
+from ui.intervals import cached_bootstrap_ci
+from ui.upload import get_uploaded_audit
+
+# --- PART 3: ADVANCED ARCHITECTURE COOKBOOK ---
+st.header("Part 3: Advanced Architecture Cookbook 🍳")
+st.info(
+    "**Objective:** To provide specialized, ready-to-use strategies that translate general fairness principles into concrete technical solutions for specific AI architectures. This cookbook addresses the reality that a 'one-size-fits-all' approach to fairness is insufficient for complex systems."
+)
+st.markdown("---")
+
+# --- 1. How to Use This Cookbook ---
+st.subheader("🚀 How to Use This Cookbook: A 5-Step Guide")
+st.markdown("Follow this process to select and implement the right fairness recipe for your project.")
+
+cols = st.columns(5)
+with cols[0]:
+    st.markdown("##### 1. Identify Architecture")
+    with st.popover("Details"):
+        st.markdown("Select the tab below that matches your AI system's architecture (e.g., LLM, Recommender).")
+
+with cols[1]:
+    st.markdown("##### 2. Understand Risks")
+    with st.popover("Details"):
+        st.markdown("Read the summary of common fairness challenges for that architecture to contextualize your work.")
+
+with cols[2]:
+    st.markdown("##### 3. Select a Recipe")
+    with st.popover("Details"):
+        st.markdown("Choose a specific technical recipe that addresses a risk relevant to your project.")
+
+with cols[3]:
+    st.markdown("##### 4. Integrate into Sprint")
+    with st.popover("Details"):
+        st.markdown("Use the provided guidance and code to create fairness tasks in your sprint backlog, as defined in the **Part 1: Fair AI Scrum Toolkit**.")
+
+with cols[4]:
+    st.markdown("##### 5. Report Metrics")
+    with st.popover("Details"):
+        st.markdown("Ensure the metrics generated by the recipe are documented in your **Fairness Impact Statement** and reported to the governance body, as established in **Part 2**.")
+
+st.markdown("---")
+
+# --- 2. The Cookbook Recipes & Model Selection ---
+st.subheader("📚 The Cookbook: Recipes & Model Selection")
+
+card_tab, llm_tab, rec_tab, vision_tab, multi_tab = st.tabs([
+    "**📜 Selecting Models with Model Cards**",
+    "Large Language Models (LLMs)", 
+    "Recommendation & Ranking Systems", 
+    "Computer Vision Models", 
+    "Multi-Modal Systems"
+])
+
+# --- TAB: MODEL CARDS ---
+with card_tab:
+    st.markdown("#### Selecting the Right Foundation: Using Model Cards")
+    st.markdown("Before you apply any recipe, you must select the right ingredients. For AI, this often means choosing a pre-trained model. **Model Cards** are essential documents that describe a model's performance, intended use, and limitations, helping you make an informed and responsible choice (Mitchell et al., 2019).")
+
+    st.info("💡 **Interactive Scenario: Choosing a Toxicity Classifier**")
+    st.markdown("Your team needs a model to detect toxic comments for a social media platform with a diverse, global user base. Below are three potential models. Review their model cards and choose the most appropriate one.")
+
+    with st.expander("**Model A: Toxicity Master 5000**"):
+        st.markdown("""
+        - **Intended Use:** General-purpose toxicity detection for formal English text.
+        - **Performance:** 95% overall accuracy on benchmark datasets.
+        - **Fairness Analysis:** Analysis performed on gender-related terms shows minimal bias.
+        - **⚠️ Creator's Warnings & Limitations:** *Model was trained primarily on news articles and encyclopedia text. Performance on informal language or dialects like African American Vernacular English (AAVE) is not guaranteed and has been shown to have a higher false positive rate in internal tests.*
+        """)
+
+    with st.expander("**Model B: Dialect-Aware Classifier**"):
+        st.markdown("""
+        - **Intended Use:** Toxicity detection for user-generated content, including multiple English dialects.
+        - **Performance:** 89% overall accuracy on benchmark datasets.
+        - **Fairness Analysis:** Disaggregated performance shows consistent accuracy (<2% difference) across standard English, AAVE, and Indian English. The model was evaluated against the Jigsaw Unintended Bias dataset.
+        - **⚠️ Creator's Warnings & Limitations:** *The model's larger size results in higher inference latency compared to smaller models. May not be suitable for real-time applications with very strict budgets.*
+        """)
+    
+    with st.expander("**Model C: QuickTox v0.1**"):
+        st.markdown("""
+        - **Intended Use:** Fast text classification.
+        - **Performance:** Accuracy is reported to be high.
+        - **Fairness Analysis:** *No fairness analysis provided.*
+        - **⚠️ Creator's Warnings & Limitations:** *Model is experimental. Use at your own risk.*
+        """)
+    
+    st.divider()
+    
+    @st.fragment
+    def model_card_quiz():
+        selection = st.radio(
+            "**Which model is the most appropriate for your use case?**",
+            ("Model A: Toxicity Master 5000", "Model B: Dialect-Aware Classifier", "Model C: QuickTox v0.1"),
+            index=None,
+            key="model_card_choice"
+        )
+
+        if selection == "Model B: Dialect-Aware Classifier":
+            st.success("""
+            **Correct Choice.** Although its overall accuracy is lower, Model B is the most responsible choice. Its model card explicitly states that it was tested for fairness across different dialects, directly addressing a key risk for a social media platform. The known limitation (latency) is a manageable engineering trade-off.
+            """)
+        elif selection == "Model A: Toxicity Master 5000":
+            st.warning("""
+            **Risky Choice.** While its accuracy is high, the model card contains a critical warning: it performs poorly on the exact type of informal language and dialects your platform will have. Deploying this model would likely lead to unfair censorship of minority groups.
+            """)
+        elif selection == "Model C: QuickTox v0.1":
+            st.error("""
+            **Very Risky Choice.** The lack of a proper model card, especially the absence of any fairness analysis or clear limitations, is a major red flag. Using this model would be irresponsible as you have no information about its potential to cause harm.
+            """)
+
+    model_card_quiz()
+
+    st.subheader("Checklist: How to Read a Model Card for Fairness")
+    st.markdown("""
+    - **[ ] Match Use Case:** Does the model's *intended use* align with your specific application? A mismatch is a primary source of risk.
+    - **[ ] Check the Data:** On what datasets was the model trained and, more importantly, *evaluated*? Do these datasets reflect your user population?
+    - **[ ] Scrutinize Fairness Metrics:** What fairness metrics are reported? Are they relevant to the harms you want to prevent (e.g., Equal Opportunity for a screening tool)?
+    - **[ ] Heed the Warnings:** Pay closest attention to the **Limitations and Warnings** section. The creators are telling you where the model is likely to fail.
+    - **[ ] Look for Gaps:** What's *not* on the card? The absence of fairness testing or disaggregated performance analysis is as telling as the presence of a bad result.
+    """)
+
+with llm_tab:
+    st.markdown("#### Fairness in Large Language Models (LLMs)")
+    st.markdown("LLMs present unique bias patterns through their training data and generative processes. A generic approach is ineffective for these models.")
+
+    with st.expander("Key Challenges & Concepts for LLMs"):
+        st.error("##### Pre-training Data Bias and Amplification")
+        st.markdown("LLMs are pre-trained on massive web corpora containing historical biases, stereotypes, and harmful content. These biases don't just transfer—they can be amplified. This connects to Bender et al.'s (2021) work illustrating how models trained on internet corpora inherit and amplify societal biases.")
+        st.info("##### Emergent Behaviors and Safety Guardrails")
+        st.markdown("LLMs exhibit **emergent capabilities** that appear only at scale (e.g., in-context learning, sycophancy), creating fairness challenges that require specialized guardrails, as simple metrics are insufficient.")
+        st.warning("##### Frequent Mistakes")
+        st.markdown("A common mistake is assuming a model fine-tuned on a balanced dataset is free from bias; biases from the original pre-training can persist and re-emerge in unexpected ways.")
+
+    def counterfactual_chart(plot_df):
+        return alt.Chart(plot_df).mark_bar().encode(
+            x=alt.X('Consistency:Q', axis=alt.Axis(format='%'), scale=alt.Scale(domain=[0, 1])),
+            y=alt.Y('Identity:N', sort='x', title=None),
+            color=alt.Color('Prompt:N', title='System prompt'),
+            yOffset='Prompt:N',
+            tooltip=['Identity', 'Prompt', alt.Tooltip('Consistency:Q', format='.0%'), alt.Tooltip('Similarity:Q', format='.2f'), 'Pairs']
+        ).properties(title='Counterfactual Consistency by Identity')
+
+    st.subheader("LLM Fairness Recipes")
+    st.markdown("Select a recipe to see its implementation details.")
+    
+    with st.expander("Recipe 1: Fairness Prompting & Self-Critique"):
+        st.markdown("""
+        - **Objective:** To guide the model toward fairer, less stereotypical outputs at inference time without retraining.
+        - **When to Apply:** Ideal when you have API access to a model but cannot fine-tune it. This is a crucial **Post-processing** technique.
+        - **Key Metric:** Reduction in stereotypical associations; increased consistency in responses across counterfactual prompts.
+        - **Integration:** The prompt design and its effectiveness should be documented in the **Fairness Impact Statement (Part 2)**.
+        """)
+        
+        st.markdown("##### 💡 Interactive Simulation: Self-Critique Prompting")
+        st.markdown("The model generates an initial, potentially biased summary. The self-critique prompt then forces it to revise.")
+
+        initial_summary = "A very nurturing and collaborative female engineer who is a great team player."
+        critique_prompt = "Critique the previous summary for potential gender stereotypes and rewrite it to be neutral and skill-focused."
+        revised_summary = "An engineer with 5 years of experience in Python and cloud architecture, who has successfully led three major projects to completion."
+
+        @shared_resource
+        def stereotype_lexicon():
+            return StereotypeLexicon()
+
+        @st.fragment
+        def self_critique_simulation():
+            lexicon = stereotype_lexicon()
+            initial_hits = lexicon.matches(initial_summary)
+            st.error(f"**Initial Model Output:** *{initial_summary}*")
+            before_col, after_col = st.columns(2)
+            before_col.metric("Stereotype lexicon hits, initial output", len(initial_hits))
+            before_col.caption(", ".join(f"*{term}* ({category})" for term, category in initial_hits) or "No lexicon terms.")
+            if st.checkbox("Apply Self-Critique Prompt"):
+                st.code(f"PROMPT: {critique_prompt}", language="markdown")
+                st.success(f"**Revised Model Output:** *{revised_summary}*")
+                revised_hits = lexicon.matches(revised_summary)
+                after_col.metric("Stereotype lexicon hits, revised output", len(revised_hits), len(revised_hits) - len(initial_hits), delta_color="inverse")
+                after_col.caption(", ".join(f"*{term}* ({category})" for term, category in revised_hits) or "No lexicon terms.")
+                st.caption("The revised output successfully removes subjective, potentially stereotypical language and focuses on verifiable achievements.")
+
+        self_critique_simulation()
+
+        with st.popover("How to Apply: Step-by-Step"):
+            st.markdown("""
+            1.  **Design a Fairness Prompt:** Add explicit instructions to your system prompt. For example: *"You are an AI assistant. Ensure your responses are impartial and do not rely on stereotypes related to gender, race, or age."*
+            2.  **Create a Self-Critique Framework:** For high-stakes generation, use a two-step process. First, generate a response. Second, use another prompt to ask the LLM to check its own work: *"Review the following text for hidden biases. If any are found, rewrite it."*
+            3.  **Implement Counterfactual Testing:** To validate, create prompts that are identical except for a demographic attribute (e.g., "Describe a successful male doctor" vs. "Describe a successful female doctor") and measure the difference in the generated descriptions.
+            """)
+
+        st.markdown("##### 🧪 Counterfactual Prompt Testing")
+        st.markdown("Step 3, run as a harness: each template below is expanded over every combination of gender, age and origin, sent to a local stand-in model with a tunable stereotype bias, and every answer is compared with the answer for the template's reference identity (young, male, native-born), with the identity words themselves masked out.")
+
+        @shared_resource
+        def response_cache():
+            # Responses persist across sessions and restarts, so reruns only
+            # query the model for prompts it has not answered yet.
+            return ResponseCache(os.environ.get(CACHE_ENV) or os.path.join(tempfile.gettempdir(), 'fairness_audit_responses.db'))
+
+        @shared_data(max_entries=16)
+        def counterfactual_runs(bias, batch_size, concurrency):
+            # Scored once per setting: changing the breakdown below reuses
+            # the runs instead of re-reading and re-scoring every answer.
+            # 50 ms per request simulates a hosted model; the response cache
+            # absorbs it across settings and restarts.
+            backend = StubBackend(bias=bias, latency=0.05)
+            return {
+                'Plain': evaluate_counterfactuals(DEMO_TEMPLATES, backend, cache=response_cache(), batch_size=batch_size, concurrency=concurrency),
+                'Fairness instruction': evaluate_counterfactuals(DEMO_TEMPLATES, backend, instruction=FAIRNESS_INSTRUCTION, cache=response_cache(), batch_size=batch_size, concurrency=concurrency),
+            }
+
+        @st.fragment
+        def counterfactual_harness():
+            bias_col, concurrency_col, batch_col = st.columns(3)
+            bias = bias_col.slider("Stand-in model's stereotype bias", 0.0, 1.0, 0.4, 0.1, key="llm_cf_bias")
+            concurrency = concurrency_col.slider("Concurrent requests", 1, 32, 8, key="llm_cf_concurrency")
+            batch_size = batch_col.select_slider("Prompts per request", [1, 4, 8, 16, 32, 64], value=16, key="llm_cf_batch")
+            group_by = st.multiselect("Disaggregate by", ['gender', 'age', 'origin'], default=['gender', 'origin'], key="llm_cf_group")
+            if not group_by:
+                st.info("Select at least one attribute.")
+                return
+
+            runs = counterfactual_runs(bias, batch_size, concurrency)
+            summaries = {label: consistency_by_group(run.scored, group_by) for label, run in runs.items()}
+            plot_df = pd.concat(summaries, names=['Prompt']).reset_index()
+            plot_df['Identity'] = plot_df[group_by[0]].astype(str)
+            for column in group_by[1:]:
+                plot_df['Identity'] = plot_df['Identity'] + ' × ' + plot_df[column].astype(str)
+            plot_df = plot_df.rename(columns={'consistency': 'Consistency', 'similarity': 'Similarity', 'pairs': 'Pairs'})
+            altair_chart(counterfactual_chart, plot_df[['Identity', 'Prompt', 'Consistency', 'Similarity', 'Pairs']])
+
+            plain, instructed = (run.scored.loc[~run.scored['reference'], 'similarity'] for run in runs.values())
+            c1, c2 = st.columns(2)
+            c1.metric("Consistent pairs, plain prompt", f"{(plain >= CONSISTENCY_THRESHOLD).mean():.0%}")
+            c2.metric("Consistent pairs, with fairness instruction", f"{(instructed >= CONSISTENCY_THRESHOLD).mean():.0%}",
+                      f"{((instructed >= CONSISTENCY_THRESHOLD).mean() - (plain >= CONSISTENCY_THRESHOLD).mean()) * 100:+.0f} pts")
+            prompts = sum(run.prompts for run in runs.values())
+            cached = sum(run.cached for run in runs.values())
+            st.caption(f"A pair is consistent when the answer's similarity to the reference answer is at least {CONSISTENCY_THRESHOLD:.0%}. "
+                       f"{prompts:,} prompts in {len(DEMO_TEMPLATES)} templates; {cached:,} answers came from the response cache.")
+            st.markdown("**Stereotype lexicon hit rate by prompted identity**: the share of answers containing a gender, age or origin stereotype term.")
+            rates = pd.concat({label: stereotype_rates(score_texts(run.scored['response'], stereotype_lexicon()), run.scored[group_by])['any']
+                               for label, run in runs.items()}, axis=1)
+            rates.index = [' × '.join(map(str, i)) if isinstance(i, tuple) else i for i in rates.index]
+            st.dataframe(rates.sort_values('Plain', ascending=False).style.format('{:.0%}'), use_container_width=True)
+            with st.expander("Least consistent answers"):
+                worst = runs['Plain'].scored.nsmallest(5, 'similarity')
+                st.dataframe(worst[['prompt', 'response', 'similarity']], use_container_width=True, hide_index=True)
+
+        counterfactual_harness()
+    
+    with st.expander("Recipe 2: Fairness-Aware Fine-Tuning"):
+        st.markdown("""
+        - **Objective:** To specialize a pre-trained LLM for a specific task while actively reducing inherited biases.
+        - **When to Apply:** When you have the resources to fine-tune a model and need to align it with specific domain and fairness requirements. This is an **In-processing** technique.
+        - **Key Metric:** Improvement on fairness benchmark suites (e.g., reduced toxicity, stereotype scores) while maintaining performance on the primary task.
+        - **Integration:** The fine-tuning dataset and methodology must be documented in the **Compliance Addendum (Part 4)** under Data Governance.
+        """)
+        st.markdown("##### How to Apply: Step-by-Step")
+        st.markdown("""
+            1.  **Curate a Balanced Fine-tuning Dataset:** Create or gather a dataset that has diverse, representative examples. For instance, if fine-tuning for a customer service bot, ensure the examples include interactions with people from various linguistic backgrounds.
+            2.  **Use Counterfactual Data Augmentation:** For each training example, create an alternate version where demographic attributes are swapped. For example: "The doctor advised his patient" becomes "The doctor advised her patient." Training on both helps the model de-correlate gender from professions.
+            3.  **Implement Fairness-Specific RLHF:** In Reinforcement Learning from Human Feedback, instruct human labelers to explicitly rank responses not just on helpfulness, but also on fairness. A response that is helpful but contains a microaggression should be ranked lower than one that is slightly less helpful but fair.
+            """)
+
+        st.markdown("##### 🔁 Counterfactual Data Augmentation")
+        st.markdown("Step 2 on your own data: every gendered or age term in the text is swapped in a single pass, keeping its case. For whole corpora, `python -m fairness_audit augment corpus.jsonl augmented.jsonl` streams a JSONL file of any size through the same lexicon in parallel worker processes.")
+
+        @shared_resource
+        def swap_lexicon():
+            return SwapLexicon()
+
+        @st.fragment
+        def augmentation_preview():
+            text = st.text_area("Training example", "The doctor advised his patient before he left. Mr Jones asked his wife whether the young chairman had called.", key="llm_aug_text")
+            counts = {}
+            swapped = swap_lexicon().swap(text, counts)
+            st.success(f"**Counterfactual:** *{swapped}*")
+            if counts:
+                lexicon = swap_lexicon()
+                table = pd.DataFrame({
+                    'Term': list(counts),
+                    'Swapped to': [lexicon.replacement[t] for t in counts],
+                    'Attribute': [lexicon.attribute[t] for t in counts],
+                    'Count': list(counts.values()),
+                })
+                st.dataframe(table, hide_index=True, use_container_width=True)
+
+            uploaded = st.file_uploader("Augment a JSONL file (one record per line, with a `text` field)", type=['jsonl'], key="llm_aug_file")
+            if uploaded is not None:
+                with tempfile.TemporaryDirectory() as directory:
+                    source, destination = os.path.join(directory, 'source.jsonl'), os.path.join(directory, 'augmented.jsonl')
+                    with open(source, 'wb') as handle:
+                        handle.write(uploaded.getvalue())
+                    try:
+                        stats = augment_file(source, destination, lexicon=swap_lexicon(), jobs=1)
+                    except ValueError as exc:
+                        st.error(str(exc))
+                        return
+                    with open(destination, 'rb') as handle:
+                        augmented = handle.read()
+                st.caption(f"{stats.augmented:,} of {stats.documents:,} records got a counterfactual copy.")
+                st.dataframe(stats.by_attribute.rename(columns=str.capitalize), use_container_width=True)
+                st.download_button("Download augmented JSONL", augmented, file_name=f"{os.path.splitext(uploaded.name)[0]}.augmented.jsonl", mime='application/jsonl', key="llm_aug_download")
+
+        augmentation_preview()
+            
+    with st.expander("🌍 Intersectional Considerations for LLMs"):
+        st.markdown("""
+        Traditional LLM fairness often addresses single dimensions of bias (e.g., gender stereotypes). This misses critical intersectional patterns. As Crenshaw (1989) noted, the experience of a Black woman is not simply the sum of racism and sexism.
+        - **Action:** Design prompt templates and fine-tuning datasets that explicitly reference and test intersectional identities (e.g., "Describe a successful older, female, immigrant scientist").
+        - **Evaluation:** Use red-teaming and evaluation frameworks to specifically probe for biases against intersectional groups, as these are often where the most harmful stereotypes emerge.
+        """)
+
+with rec_tab:
+    st.markdown("#### Fairness in Recommendation & Ranking Systems")
+    st.markdown("These systems can create feedback loops that amplify biases and lead to unfair exposure for certain items or creators.")
+
+    with st.expander("Key Challenges & Concepts for Recommendation Systems"):
+        st.error("##### Multi-Stakeholder Fairness Tensions")
+        st.markdown("Systems must balance the needs of **users** (who want relevance), **item providers** (who want fair exposure), and the **platform** (which has business goals). These needs often conflict.")
+        st.info("##### Feedback Loops & Preference Amplification")
+        st.markdown("A key challenge is that the model's own recommendations shape the data it learns from. An initial small bias can become extreme over time as popular items get recommended more, receive more clicks, and thus appear even more popular to the algorithm.")
+        st.warning("##### Diversity-Relevance Trade-offs")
+        st.markdown("A model optimized purely for relevance may create 'filter bubbles,' showing users only what they already like and limiting discovery. Fairness often requires intentionally injecting diversity, which may slightly reduce short-term relevance metrics.")
+
+    st.subheader("Recommendation Fairness Recipes")
+    with st.expander("Recipe 1: Re-ranking for Provider Diversity"):
+        st.markdown("""
+        - **Objective:** To mitigate exposure disparity by adjusting the final ranked list of recommendations to ensure items from different provider groups are fairly represented.
+        - **When to Apply:** As a **Post-processing** step after the initial relevance scores have been generated by the main recommendation model.
+        - **Key Metric:** Exposure parity (the proportion of a group in top-K recommendations should be similar to their proportion in the catalog).
+        - **Integration:** The chosen level of exposure parity is a strategic decision that must be approved by the **AI Review Board (Part 2)**, as it involves a direct trade-off.
+        """)
+        
+        st.markdown("##### 💡 Interactive Simulation: Re-ranking for Exposure")
+        
+        st.code("""
+from fairness_audit.ranking import fair_rerank, tradeoff_curve
+
+# scores: relevance per item, or a (n_users, n_items) matrix for a batch of users
+# provider_groups: provider group of each item (a pd.Categorical for large catalogs)
+result = fair_rerank(scores, provider_groups, protected="Minority Provider",
+                     fairness_boost=0.2, k=50)
+
+result.ranking             # top-50 item indices after the boost (argpartition, no full sort)
+result.exposure            # catalog share vs. position-discounted exposure share per group
+result.exposure_gap        # largest |exposure share - catalog share|
+result.relevance_retained  # DCG of the re-ranked list relative to the relevance-only ranking (scores shifted to >= 0)
+
+# Exposure gap and relevance for a whole grid of boosts, for about the cost of one ranking
+curve = tradeoff_curve(scores, provider_groups, protected="Minority Provider", boosts=101, k=50)
+        """, language="python")
+
+        @shared_resource
+        def recommendation_catalog(n_items=1_000_000, seed=5):
+            # Relevance scores from a model that under-scores minority-provider
+            # items by half a standard deviation. Cached as a shared resource:
+            # the arrays are read-only and too large to copy on every rerun.
+            rng = np.random.default_rng(seed)
+            groups = pd.Categorical(np.where(rng.random(n_items) < 0.7, 'Majority Provider', 'Minority Provider'))
+            scores = rng.normal(0.0, 1.0, n_items) - 0.5 * (groups == 'Minority Provider')
+            return scores, groups, catalog_fingerprint(scores, groups)
+
+        @shared_resource(max_entries=4)
+        def uploaded_catalog(catalog_file, score_column, group_column):
+            scores, groups = read_catalog(catalog_file, score_column, group_column)
+            return scores, groups, catalog_fingerprint(scores, groups)
+
+        @shared_data(max_entries=16)
+        def rerank_tradeoff(fingerprint, _scores, _groups, protected, k):
+            # Keyed on the catalog's content hash: the underscore arguments are
+            # not hashed by Streamlit, so a re-run never re-reads the arrays.
+            return tradeoff_curve(_scores, _groups, protected, boosts=101, k=k)
+
+        @shared_resource(max_entries=4)
+        def sorted_relevance(fingerprint, _scores):
+            # One sort per catalog turns "rank without the boost" into a binary search.
+            return np.sort(_scores)
+
+        @st.fragment
+        def rerank_simulation():
+            catalog_file = st.file_uploader("Re-rank your own catalog (optional): one row per item with a relevance score and a provider group", type=["csv", "parquet", "pq"], key="p3_catalog_file")
+            try:
+                if catalog_file is not None:
+                    columns = read_columns(catalog_file)
+                    score_col, group_col = st.columns(2)
+                    score_column = score_col.selectbox("Relevance score column", columns, key="p3_catalog_score")
+                    group_column = group_col.selectbox("Provider group column", [c for c in columns if c != score_column], key="p3_catalog_group")
+                    scores, groups, fingerprint = uploaded_catalog(catalog_file, score_column, group_column)
+                    catalog_counts = pd.Series(groups).value_counts(ascending=True)
+                    protected = st.selectbox("Provider group to boost", list(catalog_counts.index), key="p3_catalog_protected")
+                else:
+                    scores, groups, fingerprint = recommendation_catalog()
+                    protected = 'Minority Provider'
+            except (ValueError, KeyError, ImportError) as exc:
+                st.error(f"Could not read the catalog: {exc}")
+                return
+
+            boost_col, k_col = st.columns([3, 1])
+            fairness_boost = boost_col.slider("Fairness Boost for Minority Group Items", 0.0, 1.0, 0.2, 0.05, key="p3_slider")
+            top_k = k_col.selectbox("Top-K", [10, 20, 50, 100], index=2, key="p3_rerank_k")
+
+            # The whole boost grid is computed once per catalog and K; moving
+            # the slider only looks up the nearest grid point.
+            curve = rerank_tradeoff(fingerprint, scores, groups, protected, top_k)
+            position = curve.summary.index.get_indexer([fairness_boost], method='nearest')[0]
+            point = curve.summary.iloc[position]
+            exposure_share = curve.exposure_share.iloc[position]
+
+            plot_df = pd.DataFrame({
+                'Group': list(curve.catalog_share.index.astype(str)) * 2,
+                'Source': ['Item Catalog'] * len(exposure_share) + [f'Top-{top_k} Exposure'] * len(exposure_share),
+                'Proportion': list(curve.catalog_share) + list(exposure_share)
+            })
+
+            chart = alt.Chart(plot_df).mark_bar().encode(
+                x=alt.X('Proportion', type='quantitative', axis=alt.Axis(format='%')),
+                y='Source:N',
+                color='Group:N',
+                tooltip=['Group', alt.Tooltip('Proportion:Q', format='.1%')]
+            ).properties(title="Representation in Catalog vs. Recommendations")
+
+            st.altair_chart(chart, use_container_width=True)
+            gap_col, relevance_col = st.columns(2)
+            gap_col.metric("Exposure Parity Gap", f"{point['exposure_gap']:.1%}", help="Largest difference between a group's share of position-discounted exposure and its share of the catalog. 0% is perfect parity.")
+            relevance_col.metric("Relevance Retained (DCG)", f"{point['relevance_retained']:.1%}", help="Relevance of the re-ranked list relative to ranking by relevance alone.")
+            result = fair_rerank(scores, groups, protected, fairness_boost, k=top_k)
+            ranked_scores = scores[result.ranking]
+            boosted = np.asarray(groups[result.ranking] == protected)
+            st.markdown(f"**Top-{top_k} after the boost**")
+            st.dataframe(pd.DataFrame({
+                'Rank': np.arange(1, len(result.ranking) + 1),
+                'Item': result.ranking,
+                'Provider Group': np.asarray(groups[result.ranking]).astype(str),
+                'Relevance': ranked_scores,
+                'Boosted Score': ranked_scores + np.where(boosted, fairness_boost, 0.0),
+                'Rank Without Boost': len(scores) - np.searchsorted(sorted_relevance(fingerprint, scores), ranked_scores, side='right') + 1,
+            }), hide_index=True, use_container_width=True, height=250, column_config={
+                'Relevance': st.column_config.NumberColumn(format='%.3f'),
+                'Boosted Score': st.column_config.NumberColumn(format='%.3f'),
+            })
+            st.caption(f"Measured by re-ranking a catalog of {len(scores):,} items. The 'fairness boost' raises the final score of the boosted group's items, moving them higher in the list; exposure is weighted by position, since the top slots receive most of the attention. Past the parity point, a larger boost over-corrects and costs relevance.")
+
+            frontier_df = curve.summary.reset_index()
+            frontier_df['Frontier'] = np.where(frontier_df['pareto_optimal'], 'Pareto-optimal boost', 'Dominated boost')
+            points = alt.Chart(frontier_df).mark_circle(size=45).encode(
+                x=alt.X('exposure_gap:Q', title='Exposure Parity Gap (lower is fairer)', axis=alt.Axis(format='%')),
+                y=alt.Y('relevance_retained:Q', title='Relevance Retained', axis=alt.Axis(format='%'), scale=alt.Scale(zero=False)),
+                color=alt.Color('Frontier:N', scale=alt.Scale(domain=['Pareto-optimal boost', 'Dominated boost'], range=['#1f77b4', '#c7c7c7'])),
+                tooltip=[alt.Tooltip('boost:Q', format='.2f'), alt.Tooltip('exposure_gap:Q', format='.1%'), alt.Tooltip('relevance_retained:Q', format='.2%')]
+            )
+            frontier = alt.Chart(frontier_df[frontier_df['pareto_optimal']]).mark_line().encode(x='exposure_gap:Q', y='relevance_retained:Q')
+            selected = alt.Chart(frontier_df.iloc[[position]]).mark_point(size=220, color='red', filled=False, strokeWidth=2).encode(x='exposure_gap:Q', y='relevance_retained:Q')
+            st.altair_chart((frontier + points + selected).properties(title="Relevance vs. Exposure Trade-off Across Boost Values"), use_container_width=True)
+            st.caption("Each point is one boost value; the red ring is the current slider setting. Boosts off the frontier are dominated: another boost is both fairer and at least as relevant, so the AI Review Board only needs to choose among frontier points.")
+
+        rerank_simulation()
+
+        with st.popover("How to Apply: Step-by-Step"):
+            st.markdown("""
+            1. **Define Provider Groups:** Tag items in your catalog with relevant provider attributes (e.g., 'new_creator', 'minority_owned_business').
+            2. **Calculate Baseline Exposure:** Run your standard recommendation model and measure the representation of each provider group in the top-K results. Compare this to their representation in the overall catalog.
+            3. **Implement a Re-ranking Function:** Create a post-processing function that takes the initial list of ranked items. The function should iterate through the list and apply a score adjustment (a 'boost') to items from underrepresented groups.
+            4. **Tune the Boost Parameter:** The size of the boost is a hyperparameter that controls the trade-off between relevance and fairness. Tune this parameter on a validation set to find a point that meets your fairness goals without excessively harming relevance.
+            """)
+    
+    with st.expander("🌍 Intersectional Considerations for Recommendation Systems"):
+        st.markdown("""
+        As shown by Noble's (2018) work on search algorithms, systems can perpetuate harmful stereotypes against intersectional groups (e.g., Black women).
+        - **Action:** Define provider groups intersectionally (e.g., 'female creators, non-US'). Your re-ranking and monitoring must track exposure for these specific subgroups.
+        - **Evaluation:** When analyzing user-side fairness, check if recommendation quality is consistent across intersectional user groups. The system may be highly relevant for men and for white users, but fail for white women or men of color.
+        """)
+
+with vision_tab:
+    st.markdown("#### Fairness in Computer Vision Models")
+    st.markdown("Vision models can exhibit significant performance disparities, often failing on demographic intersections (e.g., women with darker skin) that aggregate metrics hide.")
+
+    with st.expander("Key Challenges & Concepts for Computer Vision"):
+        st.error("##### Visual Representation Bias")
+        st.markdown("CNN layers can learn to extract features correlated with race, gender, and age even when it is not the intended task. The model might learn to associate certain backgrounds or lighting conditions with specific demographics.")
+        st.info("##### Data Collection and Capture Conditions")
+        st.markdown("Bias can be introduced before the model is even trained. The **image capture pipeline** itself (camera sensors, lighting) can perform differently for different skin tones. Datasets are often not representative of global populations.")
+        st.warning("##### Frequent Mistakes")
+        st.markdown("Reporting only **overall accuracy** is highly misleading. A model can be 95% accurate overall but have a 30% error rate for a specific intersectional group, a critical failure described by Buolamwini & Gebru (2018).")
+        
+    st.subheader("Computer Vision Fairness Recipes")
+
+    @st.fragment
+    def disaggregated_performance_recipe():
+        # The expander tracks its open state so the metric engine only runs
+        # once somebody opens this recipe; fairlearn/sklearn are imported only
+        # for the optional cross-check below.
+        recipe = st.expander("Recipe 1: Disaggregated Performance Analysis", key="p3_vision_recipe", on_change="rerun")
+        if not recipe.open:
+            return
+        with recipe:
+            st.markdown("""
+            - **Objective:** To move beyond aggregate accuracy and evaluate model performance across distinct demographic subgroups.
+            - **When to Apply:** This should be a **mandatory** validation step for any vision model that analyzes human features.
+            - **Key Metric:** Any standard classification metric (Accuracy, Error Rate) disaggregated by subgroup.
+            - **Integration:** This is a required validation for the **Definition of Done (Part 1)** and must be reported to the **AI Review Board (Part 2)**.
+            """)
+
+            st.markdown("##### 💡 Interactive Example: Detecting Performance Gaps with Disaggregated Metrics")
+            st.markdown("This example slices performance metrics across sensitive features with the playbook's vectorized metric engine (`fairness_audit.metrics`). It reproduces `Fairlearn`'s `MetricFrame.by_group` in a single pass, so the same recipe scales to evaluation sets with millions of predictions.")
+
+            uploaded = get_uploaded_audit()
+            if uploaded is not None:
+                feature_options = uploaded.sensitive_columns + (["All (intersectional)"] if len(uploaded.sensitive_columns) > 1 else [])
+                feature = st.selectbox("Sensitive feature to disaggregate by", feature_options, key="p3_vision_feature")
+                grouped_on_skin_tone = uploaded.to_metrics(None if feature == "All (intersectional)" else [feature])
+                group_label = feature
+                st.caption(f"Computed from {uploaded.rows:,} uploaded predictions.")
+            else:
+                data = {
+                    'true_label': [1, 0, 1, 1, 0, 0, 1, 0, 1, 1, 1, 0],
+                    'prediction': [1, 1, 1, 0, 0, 0, 1, 1, 0, 1, 1, 1],
+                    'skin_tone': ['Light', 'Light', 'Light', 'Light', 'Dark', 'Dark', 'Dark', 'Dark', 'Dark', 'Dark', 'Light', 'Dark'],
+                }
+                df_vision = pd.DataFrame(data)
+
+                grouped_on_skin_tone = disaggregate(y_true=df_vision['true_label'],
+                                                    y_pred=df_vision['prediction'],
+                                                    sensitive_features=df_vision['skin_tone'])
+                group_label = "Perceived Skin Tone"
+
+            st.metric(label="Overall Accuracy", value=f"{grouped_on_skin_tone.overall['accuracy']:.2%}")
+            st.markdown(f"##### Metrics by {group_label}")
+            st.dataframe(grouped_on_skin_tone.by_group, use_container_width=True)
+            st.markdown("##### Disparity Across Groups")
+            intervals = cached_bootstrap_ci(grouped_on_skin_tone)
+            st.dataframe(pd.DataFrame({
+                'difference()': grouped_on_skin_tone.difference(),
+                'ratio()': grouped_on_skin_tone.ratio(),
+                'difference() 95% CI': [f"{row.lower:.2%} to {row.upper:.2%}" for row in intervals.difference.itertuples()],
+            }), use_container_width=True)
+
+            ci_metric = st.selectbox("Metric to plot with confidence intervals", METRICS, format_func=lambda m: m.replace('_', ' ').title(), key="p3_vision_ci_metric")
+            altair_chart(metric_interval_chart, intervals.by_group, ci_metric, group_label)
+            st.caption("Error bars are 95% intervals from 1,000 bootstrap resamples. A gap is only evidence of bias once the intervals stop overlapping; on a dozen examples, like the sample data, they rarely do.")
+
+            accuracy_by_group = grouped_on_skin_tone.by_group['accuracy']
+            accuracy_gap = grouped_on_skin_tone.difference()['accuracy']
+            worst_group = accuracy_by_group.idxmin()
+            if isinstance(worst_group, tuple):
+                worst_group = ", ".join(map(str, worst_group))
+
+            st.error(f"The results clearly show a performance gap: the model's accuracy is **{accuracy_gap:.2%}** lower for the '{worst_group}' group than for the best-served group. This is a critical fairness issue.")
+
+            if uploaded is None and st.checkbox("Cross-check against Fairlearn's `MetricFrame`", key="p3_vision_crosscheck"):
+                reference = fairlearn_metrics.MetricFrame(metrics={'accuracy': sklearn_metrics.accuracy_score},
+                                                          y_true=df_vision['true_label'],
+                                                          y_pred=df_vision['prediction'],
+                                                          sensitive_features=df_vision['skin_tone'])
+                deviation = (reference.by_group['accuracy'] - accuracy_by_group).abs().max()
+                st.caption(f"Largest absolute deviation from `MetricFrame.by_group`: {deviation:.2e}")
+
+            with st.popover("How to Apply: Step-by-Step"):
+                st.markdown("""
+                1. **Acquire Labeled Data:** Obtain a validation dataset with reliable labels for the demographic attributes you need to test (e.g., skin tone, gender).
+                2. **Choose Your Metrics:** Decide which performance metrics are most important for your use case (e.g., accuracy, false negative rate).
+                3. **Use `MetricFrame`:** The `fairlearn` library is the industry standard for this. Create a `MetricFrame` object, passing in your metrics, true labels, predictions, and the sensitive features you want to group by.
+                4. **Analyze Results:** Examine both the `.overall` metric and the `.by_group` metrics. Calculate the `.difference()` or `.ratio()` to quantify the disparity. Any large gap indicates a fairness problem that must be addressed.
+                """)
+
+    disaggregated_performance_recipe()
+
+    with st.expander("🌍 Intersectional Considerations for Computer Vision"):
+        st.markdown("""
+        As the 'Gender Shades' project famously demonstrated, intersectional failures are the most common and severe in computer vision. A model might work well for men and for light-skinned individuals, but fail catastrophically for dark-skinned women.
+        - **Action:** Your disaggregated analysis **must** be intersectional. Create a combined feature (e.g., `gender_skin_tone`) and use that as the sensitive attribute in your `MetricFrame` analysis.
+        - **Data Collection:** When augmenting or collecting new data, prioritize filling gaps for the worst-performing intersectional subgroups.
+        """)
+
+with multi_tab:
+    st.markdown("#### Fairness in Multi-Modal Systems")
+    st.markdown("Multi-modal systems combine challenges from different architectures. Bias can emerge from a single modality or from flawed interactions between them.")
+    
+    with st.expander("Key Challenges & Concepts for Multi-Modal Systems"):
+        st.error("##### Cross-Modal Bias Amplification")
+        st.markdown("Bias from one modality (e.g., a speech-to-text model that performs poorly on accented speech) can 'poison' the entire system, leading to an incorrect final decision even if other modalities (like video) are neutral.")
+        st.info("##### Modality Dominance")
+        st.markdown("The model may learn to over-rely on one modality for certain groups. For example, it might rely on visual cues for one demographic group but on audio cues for another, leading to inconsistent and unfair evaluations.")
+        st.warning("##### Fusion Layer Bias")
+        st.markdown("The **shared latent space** where modalities are fused can propagate or amplify hidden biases in ways that are very hard to detect. The fusion process itself can create new biases not present in any single modality.")
+
+    def ablation_chart(plot_df):
+        return alt.Chart(plot_df).mark_bar().encode(
+            x=alt.X('Group:N', title=None, axis=alt.Axis(labelAngle=0)),
+            xOffset='Variant:N',
+            y=alt.Y('Prediction change rate:Q', axis=alt.Axis(format='%')),
+            color=alt.Color('Variant:N', title='Ablation'),
+            tooltip=['Group', 'Variant', alt.Tooltip('Prediction change rate:Q', format='.1%')]
+        ).properties(title='How Often Dropping a Modality Changes the Decision')
+
+    def simplex_chart(sweep, max_gap, resolution, presets):
+        # Barycentric (Text, Vision, Audio) -> plane: Text at the bottom left,
+        # Vision at the bottom right, Audio at the top.
+        def project(frame):
+            return frame.assign(x=frame['Vision'] + frame['Audio'] / 2, y=frame['Audio'] * np.sqrt(3) / 2)
+
+        x = alt.X('x:Q', axis=None, scale=alt.Scale(domain=[-0.08, 1.08]))
+        y = alt.Y('y:Q', axis=None, scale=alt.Scale(domain=[-0.08, 0.95]))
+        weight_tooltip = [alt.Tooltip(f'{m}:Q', format='.2f') for m in MODALITIES]
+        cells = alt.Chart(project(sweep)).mark_square(size=max(8, 24_000 / resolution ** 2)).encode(
+            x=x, y=y,
+            color=alt.condition(f'datum.gap > {max_gap}', alt.Color('gap:Q', title='Group gap', scale=alt.Scale(scheme='orangered', domain=[0, 0.5])), alt.value('#d9d9d9')),
+            tooltip=weight_tooltip + [alt.Tooltip('gap:Q', format='.1%'), 'lowest']
+        )
+        markers = alt.Chart(project(presets)).mark_point(shape='diamond', size=120, filled=True, color='black').encode(
+            x=x, y=y, tooltip=['preset'] + weight_tooltip + [alt.Tooltip('gap:Q', format='.1%')]
+        )
+        marker_labels = alt.Chart(project(presets)).mark_text(dx=8, align='left', fontSize=11).encode(x=x, y=y, text='preset')
+        vertices = pd.DataFrame({'x': [0, 1, 0.5], 'y': [0, 0, np.sqrt(3) / 2], 'label': [f"{m} only" for m in MODALITIES], 'dy': [14, 14, -12]})
+        corner_labels = alt.Chart(vertices).mark_text(fontWeight='bold', dy=14).encode(x=x, y=y, text='label')
+        return (cells + markers + marker_labels + corner_labels).properties(
+            title=f'Between-group Shortlisting Gap Across the Weight Simplex (grey: gap ≤ {max_gap:.0%})', height=420
+        )
+
+    st.subheader("Multi-Modal Fairness Recipes")
+    with st.expander("Recipe 1: Cross-Modal Consistency Check"):
+        st.markdown("""
+        - **Objective:** To check if the model's prediction remains stable when one modality is removed or altered. Inconsistency can reveal over-reliance on a biased modality.
+        - **When to Apply:** During model evaluation and debugging, especially when you suspect modality dominance.
+        - **Key Metric:** Prediction Agreement Rate (how often the prediction is the same with and without a modality).
+        - **Integration:** This is an advanced testing strategy that can be added as an acceptance criterion to a **User Story (Part 1)** for high-risk systems.
+        """)
+        
+        st.markdown("##### 💡 Interactive Simulation: Modality Dominance")
+        st.markdown("Imagine an AI system analyzing a video interview for a 'confidence' score. See how the final score can be swayed by just one modality.")
+
+        @st.fragment
+        def modality_dominance_simulation():
+            text_score = st.slider("Score from Transcript (Text)", 0.0, 1.0, 0.8, key="mm_text")
+            video_score = st.slider("Score from Body Language (Vision)", 0.0, 1.0, 0.7, key="mm_video")
+            audio_score = st.slider("Score from Vocal Tone (Audio)", 0.0, 1.0, 0.3, key="mm_audio")
+
+            dominant_modality = st.radio("Simulate a biased model that over-weights one modality:", list(MODALITIES), horizontal=True, key="mm_dom")
+            modality_weights = dominant_weights(dominant_modality)
+
+            final_score = fuse({"Text": text_score, "Vision": video_score, "Audio": audio_score}, modality_weights)
+
+            st.metric(label="Final Confidence Score", value=f"{final_score:.2%}")
+
+            if final_score < 0.5:
+                st.warning(f"Notice how the low **{dominant_modality}** score is disproportionately pulling down the final assessment. This is **Modality Dominance**, a key fairness risk if that modality is less accurate for certain demographic groups.")
+            else:
+                st.success("The scores are more balanced. A fair fusion mechanism should prevent one modality from unfairly dominating the outcome.")
+
+        modality_dominance_simulation()
+
+        with st.popover("How to Apply: Step-by-Step"):
+            st.markdown("""
+            1.  **Get a Baseline Prediction:** Run your multi-modal model on a validation sample and store the prediction.
+            2.  **Perform Modality Ablation:** Run the model again on the same sample, but this time "zero out" or remove one of the modalities (e.g., replace the image with a blank tensor, or the audio with silence).
+            3.  **Compare Predictions:** Check if the prediction changed. Do this for each modality.
+            4.  **Disaggregate Results:** Perform this analysis separately for different demographic groups. If you find that removing the audio modality changes the prediction for Group A 80% of the time, but only 20% of the time for Group B, it indicates the model is relying on audio unfairly for Group A.
+            """)
+
+        st.markdown("##### 🔬 Running the Ablation on a Validation Set")
+        st.markdown("The steps above, executed on 50,000 simulated interviews. The audio model under-scores candidates with non-native accents; the ablation shows how much each weighting lets that modality decide outcomes, and for whom.")
+
+        @shared_resource
+        def interview_validation_set(n=50_000, seed=0):
+            rng = np.random.default_rng(seed)
+            accent = np.where(rng.random(n) < 0.3, 'Non-native accent', 'Native accent')
+            gender = np.where(rng.random(n) < 0.5, 'Women', 'Men')
+            quality = rng.beta(5, 4, n)
+            scores = {
+                'Text': np.clip(quality + rng.normal(0, 0.10, n), 0, 1),
+                'Vision': np.clip(quality + rng.normal(0, 0.15, n) - 0.05 * (gender == 'Women'), 0, 1),
+                'Audio': np.clip(quality + rng.normal(0, 0.12, n) - 0.30 * (accent == 'Non-native accent'), 0, 1),
+            }
+            return pd.DataFrame({'Accent': accent, 'Gender': gender, **scores})
+
+        @shared_data(max_entries=32)
+        def modality_ablation(weighting, group_by, max_dropped):
+            validation = interview_validation_set()
+            weights = BALANCED_WEIGHTS if weighting == 'Balanced' else dominant_weights(weighting.split()[0])
+            return ablate_scores(validation, weights, validation[list(group_by)], max_dropped=max_dropped)
+
+        @st.fragment
+        def ablation_runner():
+            weighting_col, group_col = st.columns(2)
+            weighting = weighting_col.radio("Fusion weights", ['Balanced'] + [f"{m} dominant" for m in MODALITIES], horizontal=True, key="mm_ablation_weights")
+            group_by = group_col.selectbox("Disaggregate by", [('Accent',), ('Gender',), ('Accent', 'Gender')], format_func=' × '.join, key="mm_ablation_group")
+            pairs = st.checkbox("Also drop pairs of modalities", key="mm_ablation_pairs")
+            result = modality_ablation(weighting, group_by, 2 if pairs else 1)
+
+            change = 1 - result.agreement
+            change.index = [' × '.join(g) if isinstance(g, tuple) else g for g in change.index]
+            plot_df = change.rename_axis('Group').reset_index().melt(id_vars='Group', var_name='Variant', value_name='Prediction change rate')
+            altair_chart(ablation_chart, plot_df)
+
+            variant = result.gap.idxmax()
+            most, least = change[variant].idxmax(), change[variant].idxmin()
+            message = f"Dropping **{variant.removeprefix('without ')}** changes the prediction for **{most}** {change.loc[most, variant]:.0%} of the time, but only {change.loc[least, variant]:.0%} of the time for **{least}**."
+            if result.gap[variant] >= 0.1:
+                st.warning(message + " The model relies on it unevenly across groups.")
+            else:
+                st.success(message + " Reliance on each modality is similar across groups.")
+            table = result.agreement.T.assign(**{'Overall': result.overall, 'Gap': result.gap})
+            table.columns = [' × '.join(c) if isinstance(c, tuple) else c for c in table.columns]
+            st.dataframe(table.style.format('{:.1%}'), use_container_width=True)
+            st.caption("Cells are Prediction Agreement Rates: the share of interviews whose shortlisting decision (fused score ≥ 0.5) is unchanged when the modality is blanked out.")
+
+        ablation_runner()
+
+        st.markdown("##### 🗺️ Auditing Every Fusion Weighting")
+        st.markdown("Learned fusion weights can land anywhere on the weight simplex, not just on the presets above. Each cell of the triangle is one (Text, Vision, Audio) weighting; its colour is the gap in shortlisting rates between groups on the validation set.")
+
+        @shared_data(max_entries=16)
+        def simplex_audit(group_by, resolution):
+            validation = interview_validation_set()
+            groups = validation[group_by[0]]
+            for column in group_by[1:]:
+                groups = groups + ' × ' + validation[column]
+            return weight_sweep(validation, groups, resolution=resolution)
+
+        @st.fragment
+        def weight_simplex_audit():
+            group_col, gap_col, resolution_col = st.columns(3)
+            group_by = group_col.selectbox("Compare groups by", [('Accent',), ('Gender',), ('Accent', 'Gender')], format_func=' × '.join, key="mm_simplex_group")
+            max_gap = gap_col.slider("Largest acceptable gap", 0.0, 0.5, 0.1, 0.01, format="%.2f", key="mm_simplex_gap")
+            resolution = resolution_col.selectbox("Weight step", [20, 40, 60], index=2, format_func=lambda r: f"1/{r} ({(r + 1) * (r + 2) // 2:,} weightings)", key="mm_simplex_resolution")
+            sweep = simplex_audit(group_by, resolution)
+
+            presets = {'Balanced': BALANCED_WEIGHTS, **{f"{m} dominant": dominant_weights(m) for m in MODALITIES}}
+            weights = sweep[list(MODALITIES)].to_numpy()
+            preset_rows = {name: int(np.abs(weights - [w[m] for m in MODALITIES]).sum(axis=1).argmin()) for name, w in presets.items()}
+            preset_df = sweep.iloc[list(preset_rows.values())].assign(preset=list(preset_rows))
+            altair_chart(simplex_chart, sweep, max_gap, resolution, preset_df)
+
+            exceeding = sweep['gap'] > max_gap
+            fairest = sweep.loc[sweep['gap'].idxmin()]
+            share_col, fairest_col = st.columns(2)
+            share_col.metric("Weightings over the gap limit", f"{exceeding.mean():.0%}", help=f"{exceeding.sum():,} of {len(sweep):,} weightings.")
+            fairest_col.metric("Smallest achievable gap", f"{fairest['gap']:.1%}", help="At Text {:.2f} / Vision {:.2f} / Audio {:.2f}.".format(*fairest[list(MODALITIES)]))
+            if exceeding.any():
+                worst = sweep.loc[sweep['gap'].idxmax()]
+                st.warning(f"Weightings in the coloured region disadvantage **{worst['lowest']}** most, up to a {worst['gap']:.0%} gap at Text {worst['Text']:.2f} / Vision {worst['Vision']:.2f} / Audio {worst['Audio']:.2f}. A learned fusion layer should be checked against this map before deployment.")
+            else:
+                st.success("No weighting exceeds the gap limit on this validation set.")
+
+        weight_simplex_audit()
+
+    with st.expander("🌍 Intersectional Considerations for Multi-Modal Systems"):
+        st.markdown("""
+        Intersectional bias in multi-modal systems can be particularly insidious. For example, a speech recognition system (audio modality) might perform poorly for women with non-native accents, and a gesture recognition system (vision modality) might misinterpret cultural gestures. For a woman with a non-native accent using culturally specific gestures, the system could fail on both modalities, leading to a compounded, severe bias.
+        - **Action:** Your cross-modal consistency checks must be performed on intersectional subgroups.
+        - **Evaluation:** When evaluating, specifically look for cases where the model fails on *multiple* modalities for the same intersectional group.
+        """)
+
+st.markdown("---")
+
+# --- 7. Bibliography and Further Reading ---
+st.subheader("📚 Further Reading & Bibliography")
+with st.expander("Expand to see key resources for the Advanced Architecture Cookbook"):
+    st.markdown("""
+    The strategies in this cookbook are derived from leading research into the fairness challenges unique to complex AI architectures. These references provide deeper technical and conceptual background for the recipes provided.
+
+    ##### Foundational Readings on Architectural Fairness:
+
+    - **Bommasani, R., et al. (2021). *On the opportunities and risks of foundation models.***
+      - **Why it's important:** This comprehensive paper outlines the unique societal risks, including fairness, posed by large-scale, pre-trained "foundation models" like LLMs. It provides the context for why these models need specialized fairness approaches.
+    
+    - **Bender, E. M., et al. (2021). *On the dangers of stochastic parrots: Can language models be too big?***
+      - **Why it's important:** A critical examination of the harms embedded in the massive web-scale datasets used to train LLMs. It explains the source of many of the biases that the LLM recipes in this cookbook are designed to mitigate.
+    
+    - **Buolamwini, J., & Gebru, T. (2018). *Gender shades: Intersectional accuracy disparities in commercial gender classification.***
+      - **Why it's important:** The landmark study that revealed severe intersectional bias in commercial computer vision systems. It is the foundational text for understanding why disaggregated and intersectional evaluation is non-negotiable for vision models.
+
+    ##### On Specific Architectures:
+
+    - **For LLMs:** **Liang, P. P., et al. (2022). *Holistic evaluation of language models.***
+      - **Why it's important:** Proposes a multi-faceted approach to evaluating LLMs that goes beyond simple accuracy to include fairness, robustness, and other dimensions. This informs the evaluation strategies for the LLM recipes.
+    
+    - **For Recommendation Systems:** **Burke, R. (2017). *Multisided fairness for recommendation.***
+      - **Why it's important:** This paper is essential for understanding the core challenge in recommender fairness: balancing the needs of multiple stakeholders (users, item providers, the platform). It frames the problem that many of the cookbook's re-ranking and diversity recipes aim to solve.
+    
+    - **For Vision & Multi-Modal Systems:** **Wang, Z., et al. (2022). *Towards fairness in visual recognition: Effective strategies for bias mitigation.***
+      - **Why it's important:** Provides a practical overview of different bias mitigation strategies for computer vision, aligning with the cookbook's recipe-based format. It covers data-centric, in-processing, and post-processing approaches.
+    """)
@@ -0,0 +1,570 @@
+import json
+import os
+import tempfile
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+import numpy as np
+
+from fairness_audit.documents import ModelEvidence, bundle_file, compliance_addendum, render
+from fairness_audit.evidence import EVIDENCE_ENV, REQUIREMENTS, Artifact, EvidenceStore
+from fairness_audit.ingest import iter_chunks, read_columns
+from fairness_audit.metrics import DisaggregatedMetrics
+from fairness_audit.risk import (
+    AUTONOMY, DECISION_IMPACT, DOMAIN_IMPACT, FACTORS, MAX_SCORE, SCALE, TIERS,
+    assess_risk, classify_portfolio, risk_table, tier_distribution, what_if_grid,
+)
+from ui.cache import altair_chart, shared_resource
+
+# --- PART 4: REGULATORY COMPLIANCE & RISK ALIGNMENT ---
+st.header("Part 4: Regulatory Compliance & Risk Alignment ⚖️")
+st.info(
+    "**Objective:** To translate abstract legal obligations from regulations like the EU AI Act and GDPR into concrete development tasks, governance controls, and documentation. This guide ensures that your fairness implementation is not just ethical and technical, but also legally defensible."
+)
+st.markdown("---")
+
+# --- Main Tabs for Part 4 ---
+(
+    tab_guide,
+    tab_risk,
+    tab_translation,
+    tab_eu,
+    tab_evidence,
+    tab_case_study,
+) = st.tabs([
+    "**🚀 How to Use This Guide**",
+    "**🌍 Global Landscape & Risk Classification**",
+    "**⚖️ Translating Law to Code**",
+    "**🇪🇺 EU AI Act & GDPR Deep Dive**",
+    "**📄 Evidence Collection & Audit Trails**",
+    "**🎓 Case Study: University Admissions**"
+])
+
+# --- TAB 1: HOW TO USE THIS GUIDE ---
+with tab_guide:
+    st.subheader("How to Use This Guide: A 5-Step Process")
+    st.markdown("Follow this process to align your AI development lifecycle with regulatory requirements.")
+    
+    cols = st.columns(5)
+    with cols[0]:
+        st.markdown("##### 1. Classify System Risk")
+        with st.popover("Details"):
+            st.markdown("Use the **Risk Classification Calculator** in the next tab to determine the risk level of your AI system (e.g., Low, High). This is the most critical first step.")
+    
+    with cols[1]:
+        st.markdown("##### 2. Identify Controls")
+        with st.popover("Details"):
+            st.markdown("The risk level will automatically trigger a set of required compliance controls, such as mandatory documentation, human oversight, or data governance checks.")
+    
+    with cols[2]:
+        st.markdown("##### 3. Map to Sprint Tasks")
+        with st.popover("Details"):
+            st.markdown("Use the **Regulatory Mapping Framework** to translate the required controls into specific user stories, backlog tasks, and Definition of Done criteria for your team.")
+    
+    with cols[3]:
+        st.markdown("##### 4. Implement Governance Gates")
+        with st.popover("Details"):
+            st.markdown("Ensure that your project cannot proceed to deployment without satisfying the controls for its risk level. This is enforced by the **AI Review Board (Part 2)**.")
+    
+    with cols[4]:
+        st.markdown("##### 5. Maintain Audit Trail")
+        with st.popover("Details"):
+            st.markdown("Use the **Evidence Collection** templates and frameworks to continuously capture the evidence needed to demonstrate compliance to auditors or regulators.")
+
+# --- TAB 2: GLOBAL LANDSCAPE & RISK CLASSIFICATION ---
+with tab_risk:
+    st.subheader("Global Regulatory Landscape")
+    with st.expander("Common Principles Across Global Frameworks"):
+        st.markdown("""
+        Despite regional differences, most AI regulations are converging on a set of core principles. Understanding these helps create a unified compliance strategy.
+        - **Risk-Based Regulation:** Stricter rules for higher-risk systems.
+        - **Fairness Impact Assessment:** A mandatory evaluation of fairness implications before deployment.
+        - **Human Oversight:** Mechanisms for human review of significant automated decisions.
+        - **Documentation & Record-Keeping:** Maintaining detailed records for accountability.
+        - **Transparency Obligations:** Providing clear information about how AI systems function.
+        """)
+
+    st.subheader("Multi-Factor Risk Classification Calculator")
+    st.markdown("Effective risk assessment is multi-dimensional. Rate your system on the following factors to determine its **inherent risk level** (the risk before mitigation controls are applied).")
+    
+    FACTOR_LABELS = {
+        "domain_impact": "Domain Impact",
+        "autonomy": "Autonomy Level",
+        "decision_impact": "Decision Impact",
+        "scale": "Scale",
+    }
+    TIER_COLORS = ["#2ca02c", "#ff7f0e", "#d62728"]
+
+    def what_if_heatmap(grid, x_factor, y_factor, x_level, y_level):
+        x = alt.X(f'{x_factor}:N', title=FACTOR_LABELS[x_factor], sort=list(FACTORS[x_factor]))
+        y = alt.Y(f'{y_factor}:N', title=FACTOR_LABELS[y_factor], sort=list(FACTORS[y_factor]))
+        cells = alt.Chart(grid).mark_rect().encode(
+            x=x, y=y,
+            color=alt.Color('tier:N', title='Tier', scale=alt.Scale(domain=list(TIERS), range=TIER_COLORS)),
+            tooltip=[x_factor, y_factor, alt.Tooltip('score:Q', format='.4~g'), 'tier']
+        )
+        labels = alt.Chart(grid).mark_text(fontSize=16, color='white').encode(x=x, y=y, text=alt.Text('score:Q', format='.4~g'))
+        current = alt.Chart(grid[(grid[x_factor] == x_level) & (grid[y_factor] == y_level)]).mark_rect(fill=None, stroke='black', strokeWidth=3).encode(x=x, y=y)
+        return (cells + labels + current).properties(title=f"Risk Score by {FACTOR_LABELS[x_factor]} and {FACTOR_LABELS[y_factor]}", height=240)
+
+    # Interactive Multi-Factor Calculator
+    @st.fragment
+    def risk_calculator():
+        q1 = st.select_slider("**1. Domain Impact:** What is the typical impact of decisions in this domain?", options=DOMAIN_IMPACT.keys(), value="Medium", key="p4_q1")
+        q2 = st.select_slider("**2. Autonomy Level:** How much human oversight is involved in a typical decision?", options=AUTONOMY.keys(), value="Human over the loop", key="p4_q2")
+        q3 = st.select_slider("**3. Decision Impact:** How significant is the system's impact on an individual's rights or opportunities?", options=DECISION_IMPACT.keys(), value="Affects Opportunities", key="p4_q3")
+        q4 = st.select_slider("**4. Scale:** How many people will be affected by the system in a year?", options=SCALE.keys(), value="1k - 100k people", key="p4_q4")
+
+        answers = dict(zip(FACTORS, (q1, q2, q3, q4)))
+
+        with st.expander("⚖️ Governance Board Factor Weights"):
+            st.caption("Relative importance of each factor. Weights are rescaled to average 1, so scores stay on the 4-20 scale and the tier thresholds still apply.")
+            weights = {
+                factor: col.number_input(FACTOR_LABELS[factor], min_value=0.0, max_value=5.0, value=1.0, step=0.25, key=f"p4_weight_{factor}")
+                for col, factor in zip(st.columns(len(FACTORS)), FACTORS)
+            }
+        try:
+            table = risk_table(weights)
+        except ValueError as exc:
+            st.error(str(exc))
+            return
+
+        # Every combination, and its nearest tier flips, is precomputed per
+        # weight set; an interaction is a single lookup.
+        row = table.loc[tuple(answers.values())]
+        total_score, risk_level = row['score'], row['tier']
+
+        st.divider()
+        st.metric(label="Calculated Risk Score", value=f"{total_score:.4g} / {MAX_SCORE}")
+        st.markdown(f"#### Recommended Inherent Risk Classification: **{risk_level}**")
+        st.caption("This classification determines which regulatory controls and governance procedures apply to your project.")
+
+        down_col, up_col = st.columns(2)
+        for col, direction, heading in ((down_col, "down", "⬇️ Nearest step down"), (up_col, "up", "⬆️ Nearest step up")):
+            factor = row[f"{direction}_factor"]
+            if pd.isna(factor):
+                col.info(f"**{heading}:** no single-factor change moves this system to a {'lower' if direction == 'down' else 'higher'} tier.")
+            else:
+                message = f"**{heading}:** setting **{FACTOR_LABELS[factor]}** to *{row[f'{direction}_level']}* gives a score of {row[f'{direction}_score']:.4g}, i.e. **{row[f'{direction}_tier']}**."
+                (col.success if direction == "down" else col.warning)(message)
+
+        st.markdown("##### What-if: Score Across Two Factors")
+        x_col, y_col = st.columns(2)
+        x_factor = x_col.selectbox("Horizontal factor", list(FACTORS), index=1, format_func=FACTOR_LABELS.get, key="p4_whatif_x")
+        y_factor = y_col.selectbox("Vertical factor", [f for f in FACTORS if f != x_factor], format_func=FACTOR_LABELS.get, key="p4_whatif_y")
+        grid = what_if_grid(table, x_factor, y_factor, answers)
+        grid["tier"] = grid["tier"].astype(str)
+        altair_chart(what_if_heatmap, grid, x_factor, y_factor, answers[x_factor], answers[y_factor])
+        st.caption("The other two factors stay at the answers above; the outlined cell is the current system.")
+
+    risk_calculator()
+    st.divider()
+
+    st.subheader("Portfolio Mode: Classify Your Whole AI Inventory")
+    st.markdown("Governance teams rarely assess one system at a time. Upload an inventory with one row per AI system and a column for each of the four factors above; every system is scored and tiered in a single pass.")
+
+    @shared_resource
+    def demo_inventory(n_systems=2_000, seed=0):
+        rng = np.random.default_rng(seed)
+        inventory = pd.DataFrame({"system": [f"System {i:04d}" for i in range(1, n_systems + 1)]})
+        for factor, levels in FACTORS.items():
+            inventory[factor] = pd.Categorical.from_codes(rng.choice(len(levels), n_systems, p=[0.4, 0.4, 0.2]), categories=list(levels))
+        return classify_portfolio(inventory)
+
+    @shared_resource(max_entries=4)
+    def uploaded_portfolio(inventory_file, columns):
+        inventory = pd.concat(iter_chunks(inventory_file), ignore_index=True)
+        return classify_portfolio(inventory, columns)
+
+    def score_distribution_chart(score_counts):
+        return alt.Chart(score_counts).mark_bar().encode(
+            x=alt.X('score:O', title='Risk Score', sort='ascending'),
+            y=alt.Y('systems:Q', title='Systems'),
+            color=alt.Color('tier:N', title='Tier', scale=alt.Scale(domain=list(TIERS), range=TIER_COLORS)),
+            tooltip=['score', 'tier', 'systems']
+        ).properties(title="Risk Score Distribution Across the Portfolio")
+
+    @st.fragment
+    def portfolio_classifier():
+        template = demo_inventory()[["system", *FACTORS]].head(3)
+        upload_col, template_col = st.columns([3, 1])
+        inventory_file = upload_col.file_uploader("Inventory (CSV or Parquet)", type=["csv", "parquet", "pq"], key="p4_portfolio_file")
+        template_col.download_button("📥 Inventory template", template.to_csv(index=False), file_name="ai_inventory_template.csv", mime="text/csv", help="Factor columns accept the calculator's level names or their points (1, 3, 5).")
+        try:
+            if inventory_file is not None:
+                available = read_columns(inventory_file)
+                columns = {}
+                for col, (factor, label) in zip(st.columns(len(FACTORS)), FACTOR_LABELS.items()):
+                    columns[factor] = col.selectbox(f"{label} column", available, index=available.index(factor) if factor in available else 0, key=f"p4_portfolio_{factor}")
+                classified = uploaded_portfolio(inventory_file, columns)
+            else:
+                st.caption("No inventory uploaded: showing a synthetic portfolio of 2,000 systems.")
+                classified = demo_inventory()
+        except (ValueError, KeyError, ImportError) as exc:
+            st.error(f"Could not classify the inventory: {exc}")
+            return
+
+        distribution = tier_distribution(classified)
+        for col, (tier, row) in zip(st.columns(len(TIERS)), distribution.iterrows()):
+            col.metric(tier, f"{row['systems']:,}", f"{row['share']:.0%} of portfolio", delta_color="off")
+
+        score_counts = classified.groupby(["score", "tier"], observed=True).size().rename("systems").reset_index()
+        score_counts["tier"] = score_counts["tier"].astype(str)
+        altair_chart(score_distribution_chart, score_counts)
+
+        shown_tiers = st.multiselect("Show tiers", TIERS, default=list(TIERS), key="p4_portfolio_tiers")
+        view = classified[classified["tier"].isin(shown_tiers)].sort_values("score", ascending=False, kind="stable")
+        st.dataframe(
+            view,
+            column_config={"score": st.column_config.ProgressColumn("score", min_value=0, max_value=MAX_SCORE, format="%.4g")},
+            hide_index=True,
+            use_container_width=True,
+        )
+        st.caption("Click a column header to sort.")
+        st.download_button("📥 Download classified inventory (CSV)", classified.to_csv(index=False), file_name="ai_inventory_classified.csv", mime="text/csv", key="p4_portfolio_download")
+
+    portfolio_classifier()
+    st.divider()
+
+    with st.expander("🌍 Intersectional Considerations for Risk Classification"):
+        st.markdown("""
+        Traditional risk assessment often misses how risks can be amplified for intersectional groups. A system might be medium-risk for the general population but high-risk for a specific subgroup (e.g., non-native speakers in a voice analysis system).
+        - **Action:** During assessment, explicitly ask: *"Could the impact of this system be disproportionately severe for any intersectional group?"* If the answer is yes, consider increasing the 'Decision Impact' score.
+        """)
+
+# --- TAB 3: TRANSLATING LAW TO CODE ---
+with tab_translation:
+    st.subheader("Regulatory Mapping Framework: From Law to Code")
+    st.markdown("This framework translates high-level legal requirements into actionable tasks for agile teams, connecting compliance directly to the development lifecycle.")
+
+    with st.expander("**Requirement: Data Quality & Governance** (EU AI Act, Article 10)"):
+        st.markdown("""
+        - **📜 What it means:** The data used to train your model must be relevant, representative, and free of errors and biases.
+        - **💻 Corresponding Sprint Task:**
+          - Create a task to generate a "Datasheet for Datasets" to document data provenance, collection, and limitations.
+          - Add a task for a bias audit on the training data.
+        - **✅ Impact on Definition of Done (DoD):**
+          - Add a criterion: *"Data bias audit has been completed and documented."*
+        """)
+        
+    with st.expander("**Requirement: Human Oversight** (EU AI Act, Article 14)"):
+        st.markdown("""
+        - **📜 What it means:** High-risk systems must be designed so that a human can intervene or oversee their decisions.
+        - **💻 Corresponding Sprint Task:**
+          - Create a user story for a human-in-the-loop feature (e.g., "As an admin, I want to review and override the AI's high-impact decisions").
+          - Design and test the UI/UX for this oversight mechanism.
+        - **✅ Impact on Acceptance Criteria:**
+          - The human override feature must be fully functional and tested.
+        """)
+        
+    with st.expander("**Requirement: Transparency & Explainability** (GDPR, Article 22)"):
+        st.markdown("""
+        - **📜 What it means:** You must be able to provide meaningful information about the logic involved in automated decisions.
+        - **💻 Corresponding Sprint Task:**
+          - Implement a library like SHAP or LIME to generate local explanations for individual predictions.
+          - Create an API endpoint to serve these explanations upon request.
+        - **✅ Impact on Documentation (Audit Trail):**
+          - The chosen explainability method and its limitations must be documented in the **Compliance Addendum**.
+        """)
+
+# --- TAB 4: EU AI ACT & GDPR DEEP DIVE ---
+with tab_eu:
+    st.subheader("Deep Dive into EU Regulations")
+    eu_act_tab, gdpr_tab = st.tabs(["EU AI Act", "GDPR Article 22"])
+
+    with eu_act_tab:
+        st.markdown("#### The EU AI Act's Risk-Based Approach")
+        with st.expander("The Four Risk Tiers"):
+            st.markdown("""
+            - **Unacceptable Risk:** Prohibited practices like social scoring or manipulation.
+            - **High-Risk:** Systems in sensitive domains (e.g., hiring, credit) requiring robust compliance.
+            - **Limited Risk:** Systems requiring transparency (e.g., chatbots must disclose they are AI).
+            - **Minimal Risk:** Most AI systems, with no new legal obligations.
+            """)
+        with st.expander("Core Requirements for High-Risk Systems"):
+            st.markdown("""
+            1.  **Risk Management System:** A continuous process to identify and mitigate risks.
+            2.  **Data Governance:** High standards for data quality, relevance, and bias examination.
+            3.  **Technical Documentation:** Detailed records of design, development, and performance.
+            4.  **Record-Keeping (Logging):** Automatic logging for traceability.
+            5.  **Transparency & User Information:** Clear instructions and information for users.
+            6.  **Human Oversight:** Mechanisms for meaningful human review and intervention.
+            7.  **Accuracy, Robustness, and Cybersecurity:** High technical standards.
+            """)
+
+    with gdpr_tab:
+        st.markdown("#### GDPR Article 22: Rights in Automated Decision-Making")
+        st.markdown("This article grants individuals specific rights when they are subject to a purely automated decision with legal or similarly significant effects.")
+        with st.expander("Key Rights and Principles"):
+            st.markdown("""
+            - **Right to Object:** Individuals can generally opt out of purely automated decisions.
+            - **Right to an Explanation:** They must receive meaningful information about the logic involved.
+            - **Right to Contest:** They can challenge the decision and request a human review.
+            - **Safeguard Requirements:** Organizations must implement measures to prevent discriminatory outcomes.
+            """)
+
+    with st.expander("💡 FAQ: How do we comply with both the AI Act and GDPR?"):
+        st.markdown("""
+        Implement a **unified compliance approach**. Both frameworks have overlapping requirements for impact assessments, documentation, human oversight, and transparency.
+        1.  Create a single, comprehensive technical documentation package that satisfies both.
+        2.  Design a human oversight mechanism that fulfills the requirements of both regulations.
+        3.  Then, address the unique elements of each (like GDPR's lawful basis) as extensions to your unified foundation.
+        This layered approach, as suggested by researchers, can reduce compliance overhead significantly.
+        """)
+
+# --- TAB 5: EVIDENCE COLLECTION & AUDIT TRAILS ---
+with tab_evidence:
+    st.subheader("Evidence Collection & Creating a Defensible Audit Trail")
+    st.markdown("Without systematic evidence, you can't demonstrate compliance. This section provides frameworks for creating audit trails that document fairness decisions and link evidence to specific requirements.")
+
+    with st.expander("Key Concepts for Evidence Collection"):
+        st.markdown("""
+        - **Evidence Lifecycle Management:** Systematically plan, generate, validate, and store evidence throughout the AI lifecycle, rather than creating it last-minute.
+        - **Requirement-Driven Documentation:** Map every documentation artifact directly to a specific regulatory requirement to ensure complete coverage without unnecessary work.
+        - **Automated Evidence Generation:** Integrate evidence collection into your CI/CD pipeline. For example, automatically save fairness test reports from each build as a compliance artifact.
+        """)
+
+    st.subheader("Evidence Store")
+    st.markdown("A content-addressed, append-only store for compliance artifacts. Each artifact is stored once, compressed, under the SHA-256 of its bytes, so identical reports from repeated CI builds only add a log entry. Every entry is linked to the requirements of **Translating Law to Code** it evidences, and chained to the previous entry's hash, so rewritten history is detectable. In CI: `python -m fairness_audit disaggregate ... --evidence evidence.db --requirement \"EU AI Act Art. 10\" --build $BUILD_ID`.")
+
+    @shared_resource
+    def evidence_store():
+        # Persists across sessions and restarts. Without FAIRNESS_AUDIT_EVIDENCE_STORE,
+        # an empty store is seeded with a year of nightly CI reports of three models.
+        if os.environ.get(EVIDENCE_ENV):
+            return EvidenceStore(os.environ[EVIDENCE_ENV])
+        store = EvidenceStore(os.path.join(tempfile.gettempdir(), 'fairness_audit_evidence.db'))
+        if len(store) == 0:
+            rng = np.random.default_rng(0)
+            days = pd.date_range(end=pd.Timestamp('2026-10-01'), periods=365, freq='D')
+            artifacts = []
+            for model, requirement, drift in (("Resume Screener", "EU AI Act Art. 10", 0.02),
+                                              ("Loan Approval", "GDPR Art. 22", 0.01),
+                                              ("Interview Analyzer", "EU AI Act Art. 14", 0.03)):
+                # The report only changes when the model is retrained, about monthly.
+                gaps = np.repeat(np.round(rng.uniform(0.01, 0.05, 13) + drift, 3), 30)[:len(days)]
+                for build, (day, gap) in enumerate(zip(days, gaps), 1):
+                    report = json.dumps({"audit": "disaggregate", "model": model, "true_positive_rate_difference": gap, "passed": bool(gap <= 0.05)})
+                    artifacts.append(Artifact(report, f"{model} fairness report", (requirement,), "disaggregate", model, f"nightly-{build}", day))
+            store.put_many(artifacts)
+        return store
+
+    @st.fragment
+    def evidence_trail():
+        store = evidence_store()
+        stats = store.stats()
+        saved = 1 - stats['stored_bytes'] / max(stats['recorded_bytes'], 1)
+        entries_col, artifacts_col, recorded_col, stored_col = st.columns(4)
+        entries_col.metric("Log entries", f"{stats['entries']:,}")
+        artifacts_col.metric("Distinct artifacts", f"{stats['artifacts']:,}")
+        recorded_col.metric("Bytes recorded", f"{stats['recorded_bytes'] / 1e3:,.1f} kB")
+        stored_col.metric("Bytes stored", f"{stats['stored_bytes'] / 1e3:,.1f} kB", f"-{saved:.0%} (dedup + compression)", delta_color="off")
+
+        coverage = store.coverage()
+        coverage.insert(0, "obligation", [REQUIREMENTS.get(r, "") for r in coverage.index])
+        st.markdown("###### Requirement Coverage")
+        st.dataframe(coverage, use_container_width=True)
+        for requirement in coverage.index[coverage["entries"] == 0]:
+            st.warning(f"No evidence recorded for **{requirement}** yet.")
+
+        with st.expander("➕ Record evidence"):
+            files = st.file_uploader("Artifacts (reports, model cards, datasheets)", accept_multiple_files=True, key="p4_evidence_files")
+            requirement_col, model_col, build_col = st.columns(3)
+            requirements = requirement_col.multiselect("Evidences", list(REQUIREMENTS), key="p4_evidence_requirements")
+            model = model_col.text_input("Model", key="p4_evidence_model")
+            build = build_col.text_input("Build / review", key="p4_evidence_build")
+            if st.button("Record", disabled=not files, key="p4_evidence_record"):
+                entries = store.put_many(Artifact(f.getvalue(), f.name, tuple(requirements), "upload", model or None, build or None) for f in files)
+                new = sum(entry.new for entry in entries)
+                st.success(f"Recorded {len(entries)} entries: {new} new artifacts, {len(entries) - new} already stored.")
+
+        st.markdown("###### Audit Trail")
+        filter_col, model_col, limit_col = st.columns(3)
+        requirement = filter_col.selectbox("Requirement", ["All", *REQUIREMENTS], key="p4_evidence_filter")
+        model = model_col.text_input("Model", key="p4_evidence_filter_model")
+        limit = limit_col.number_input("Entries", 10, 10_000, 200, 10, key="p4_evidence_limit")
+        trail = store.find(requirement=None if requirement == "All" else requirement, model=model or None, limit=int(limit))
+        st.dataframe(trail, hide_index=True, use_container_width=True,
+                     column_config={"size": st.column_config.NumberColumn("bytes", format="%d")})
+
+        digest_col, verify_col = st.columns([3, 1])
+        digest = digest_col.selectbox("Artifact", trail["digest"].unique(), format_func=lambda d: d[:16], key="p4_evidence_digest") if len(trail) else None
+        if digest is not None:
+            name = trail.loc[trail["digest"] == digest, "name"].iloc[0]
+            digest_col.download_button("📥 Download artifact", lambda: store.get(digest), file_name=name, on_click="ignore", key="p4_evidence_download")
+        if verify_col.button("Verify hash chain", key="p4_evidence_verify"):
+            broken = store.verify()
+            if broken is None:
+                verify_col.success("Audit trail intact.")
+            else:
+                verify_col.error(f"Entry {broken} was altered.")
+
+    evidence_trail()
+    
+    st.subheader("Compliance Documentation Template (Addendum)")
+    st.markdown("This template extends the **Fairness Impact Statement (Part 2)** to include fields specifically required for regulatory compliance.")
+
+    compliance_addendum_template = """
+# Compliance Addendum for [Name of AI System]
+**Date:** 2025-09-22
+**Version:** 1.1
+
+### 1. Applicable Regulations & Legal Basis
+*List the regulations this system is subject to (e.g., EU AI Act, GDPR Art. 22) and the legal basis for its data processing.*
+
+### 2. Risk Classification
+*State the result from the Risk Classification Calculator (e.g., High Risk) and a brief justification.*
+
+### 3. Data Governance Log
+*Link to "Datasheet for Datasets". Summarize steps taken to ensure data quality and mitigate bias, including dates and personnel involved.*
+
+### 4. Human Oversight Mechanism
+*Describe the implemented human oversight system. Detail the conditions under which a human is alerted, the information they are provided, and the scope of their authority to intervene.*
+
+### 5. Log of Audits and Reviews
+*Maintain a running log of all fairness and compliance reviews. Include dates, findings, and resolutions.*
+    """
+    st.code(compliance_addendum_template, language="markdown")
+    st.download_button(
+        label="Download Compliance Addendum Template (.md)",
+        data=compliance_addendum_template,
+        file_name="Compliance_Addendum_Template.md",
+        mime="text/markdown"
+    )
+
+    st.markdown("##### Generate Addenda from Audit Results")
+    st.markdown("Sections 1, 2, 4 and 5 follow from the **Risk Classification Calculator** answers and the fairness gate, and the Data Governance Log from the audit's group sizes. Below, a simulated audit of the calculator's system; for a whole portfolio, every system's addendum and model card are rendered in parallel and streamed into one ZIP archive.")
+
+    @shared_resource
+    def simulated_audits(n_systems=2_000, n=5_000, seed=1):
+        # Gender x age confusion counts per system, drawn in one pass: each
+        # system gets its own TPR penalty for older women.
+        rng = np.random.default_rng(seed)
+        groups = pd.MultiIndex.from_product([["Men", "Women", "Non-binary"], ["Under 40", "40+"]], names=["gender", "age"])
+        sizes = rng.multinomial(n, [0.24, 0.24, 0.24, 0.24, 0.02, 0.02], size=n_systems)
+        positives = rng.binomial(sizes, 0.4)
+        tpr = np.full((n_systems, len(groups)), 0.85) - rng.normal(0, 0.01, (n_systems, len(groups)))
+        tpr[:, 3] -= rng.uniform(0, 0.12, n_systems)
+        tp = rng.binomial(positives, np.clip(tpr, 0, 1))
+        fp = rng.binomial(sizes - positives, 0.1)
+        counts = np.stack([sizes - positives - fp, fp, positives - tp, tp], axis=-1).reshape(n_systems, len(groups), 2, 2)
+        return [DisaggregatedMetrics(system, groups) for system in counts]
+
+    def system_evidence(system, answers, metrics, max_gap):
+        return ModelEvidence(
+            {"name": system, "version": "1.0"}, metrics, assess_risk(*answers.values()), answers,
+            {"true_positive_rate": max_gap / 100},
+        )
+
+    @st.fragment
+    def addendum_generator():
+        # The calculator above has already run on this page, so its answers are in the session state.
+        answers = {factor: st.session_state[f"p4_q{i}"] for i, factor in enumerate(FACTORS, 1)}
+        name_col, gate_col = st.columns(2)
+        name = name_col.text_input("AI system", "Resume Screener", key="p4_addendum_name")
+        max_gap = gate_col.slider("Fairness gate: maximum TPR difference (pts)", 1, 20, 5, key="p4_addendum_gate")
+        evidence = system_evidence(name, answers, simulated_audits()[0], max_gap)
+        addendum = compliance_addendum(evidence)
+        markdown = render(addendum, "md")
+        with st.container(border=True, height=420):
+            st.markdown(markdown)
+        file_name = f"Compliance_Addendum_{name or 'system'}".replace(" ", "_")
+        md_col, html_col = st.columns(2)
+        md_col.download_button("📥 Addendum (.md)", markdown, file_name=f"{file_name}.md", mime="text/markdown", key="p4_addendum_md")
+        html_col.download_button("📥 Addendum (.html)", lambda: render(addendum, "html"), file_name=f"{file_name}.html", mime="text/html", on_click="ignore", key="p4_addendum_html")
+
+        st.markdown("###### Portfolio Bundle")
+        classified = demo_inventory()
+        tier_col, count_col = st.columns(2)
+        tiers = tier_col.multiselect("Tiers", TIERS, default=[TIERS[2]], key="p4_bundle_tiers")
+        selected = classified[classified["tier"].isin(tiers)]
+        limit = count_col.number_input("Systems", 1, max(len(selected), 1), min(len(selected), 200) or 1, key="p4_bundle_limit")
+        selected = selected.head(int(limit))
+        audits = simulated_audits()
+        bundle = [
+            system_evidence(row.system, {factor: getattr(row, factor) for factor in FACTORS}, audits[i % len(audits)], max_gap)
+            for i, row in enumerate(selected.itertuples(index=False))
+        ]
+        st.caption(f"{len(bundle):,} systems × Model Card and Compliance Addendum in Markdown and HTML. The archive is rendered only when you click download; Streamlit then holds the finished archive in memory to serve it, so the Systems limit bounds its size.")
+        st.download_button(
+            "📦 Download documentation bundle (.zip)", lambda: bundle_file(bundle), file_name="fairness_documentation.zip",
+            mime="application/zip", on_click="ignore", disabled=not bundle, key="p4_bundle_download",
+        )
+
+    addendum_generator()
+    
+    with st.expander("🌍 Intersectional Considerations for Evidence Collection"):
+        st.markdown("""
+        Regulatory frameworks often address protected attributes independently. Your evidence collection must go further.
+        - **Action:** Your documentation must show explicit consideration of intersectional impacts. For example, the "Data Governance Log" should describe how you audited for representation gaps in intersectional subgroups, not just individual groups.
+        - **Testing Evidence:** Your stored test results must include performance data disaggregated by intersectional groups.
+        """)
+
+# --- TAB 6: CASE STUDY: UNIVERSITY ADMISSIONS ---
+with tab_case_study:
+    st.subheader("Case Study: AI-Powered University Admissions System")
+    st.markdown("A university implements an AI tool to help review student applications. Here's how they use the compliance guide.")
+    
+    cs_context, cs_problem, cs_solution = st.tabs(["Context", "The Problem (Without This Guide)", "The Solution (With This Guide)"])
+    
+    with cs_context:
+        st.markdown("""
+        - **System:** An AI model that provides a "readiness score" for university applicants based on grades, essays, and extracurriculars.
+        - **Goal:** To help admissions officers handle a large volume of applications more efficiently.
+        - **Jurisdiction:** Operates within the European Union.
+        """)
+    
+    with cs_problem:
+        st.markdown("""
+        The development team, under pressure to deliver, makes several compliance errors:
+        1.  **Misclassification:** They classify the system as "Limited Risk" because it only provides a score, not a final decision. They fail to recognize its significant impact on educational opportunities.
+        2.  **Disconnected Compliance:** The legal team provides a summary of GDPR, but the developers don't know how to translate it into specific tasks. They ignore it.
+        3.  **No Audit Trail:** When an external audit asks how they ensure fairness, the team has no documentation of their data quality checks or bias testing, even though they performed some.
+        
+        **Result:** The university deploys a high-risk system without the required safeguards, exposing them to significant legal fines and reputational damage.
+        """)
+    
+    with cs_solution:
+        st.markdown("The team adopts the **Regulatory Compliance & Risk Alignment** guide.")
+        st.success("##### 1. Correct Risk Classification")
+        st.markdown("Using the **Multi-Factor Risk Calculator**, they correctly identify the system as **High-Risk** due to its high impact on educational access. This immediately triggers a formal set of controls.")
+
+        st.success("##### 2. Law is Translated to Code")
+        st.markdown("Using the **Regulatory Mapping Framework**, the Product Owner translates the 'Human Oversight' requirement into a specific user story: *\"As an admissions officer, I want to view the top 5 factors for each AI score so I can make an informed final decision.\"*")
+
+        st.success("##### 3. An Audit Trail is Created")
+        st.markdown("The team uses the **Compliance Addendum Template**. As they complete their data bias audit, the results are automatically linked in the Data Governance Log section. This creates a real-time, defensible record of their due diligence.")
+
+        st.info("**Result:** The guide provides a clear, structured process. The final system is not only compliant by design but also has a comprehensive audit trail to prove it, satisfying regulators and building trust with applicants.")
+
+st.markdown("---")
+
+# --- 7. Bibliography and Further Reading ---
+st.subheader("📚 Further Reading & Bibliography")
+with st.expander("Expand to see key resources for the Regulatory Compliance & Risk Alignment Toolkit"):
+    st.markdown("""
+    Navigating the complex, fast-evolving landscape of AI regulation requires grounding in both legal and technical scholarship. These resources provide the foundation for the risk-based, integrated compliance approach of this toolkit.
+
+    ##### Foundational Readings on AI Regulation & Governance:
+
+    - **Veale, M., & Zuiderveen Borgesius, F. (2021). *Demystifying the Draft EU Artificial Intelligence Act.***
+      - **Why it's important:** A clear, accessible overview of the structure and core principles of the EU AI Act. This is the best starting point for understanding the risk-based tiers and high-risk requirements that drive this toolkit's compliance framework.
+    
+    - **Wachter, S., et al. (2017). *Why a right to explanation of automated decision-making does not exist in the General Data Protection Regulation.***
+      - **Why it's important:** Despite its title, this paper provides one of the most insightful analyses of what GDPR Article 22 *does* require, focusing on "meaningful information about the logic involved" rather than a full technical explanation. It informs the design of transparency and explainability controls.
+    
+    - **Bradford, A. (2020). *The Brussels Effect: How the European Union rules the world.***
+      - **Why it's important:** Explains the global significance of EU regulations like the AI Act and GDPR. This work provides the strategic context for why organizations outside the EU must still pay close attention to these rules, justifying the investment in compliance.
+
+    ##### On Specific Toolkit Components:
+
+    - **For Risk Classification:** **Selbst, A. D. (2020). *The Danger of Bounding rectangles: A Critical Look at Algorithmic Risk Assessments.***
+      - **Why it's important:** This work (and related papers by Selbst) critiques simplistic risk assessments and argues for a more sociotechnical approach. It motivates the multi-factor, context-aware risk calculator in this toolkit.
+    
+    - **For Evidence & Audit Trails:** **Raji, I. D., et al. (2020). *Closing the AI accountability gap...***
+      - **Why it's important:** Essential reading for understanding the need for systematic, end-to-end audit trails. This paper's framework for internal auditing provides the conceptual backbone for the "Evidence Collection" and "Compliance Addendum" templates.
+    
+    - **For Translating Law to Code:** **Kaminski, M. E., & Malgieri, G. (2021). *Algorithmic impact assessments under the GDPR...***
+      - **Why it's important:** Provides a detailed analysis of how to translate the legal requirements of GDPR's impact assessments into concrete, multi-layered explanations and technical documentation, directly informing the "Translating Law to Code" section.
+    """)
@@ -0,0 +1,124 @@
+import streamlit as st
+
+# --- PART 5: FULL PLAYBOOK & SYNTHESIS ---
+st.header("Part 5: Full Playbook & Synthesis 🧩")
+st.info(
+    "**Objective:** To integrate the four previous components into a single, cohesive deployment methodology. This section provides a clear, end-to-end workflow, an implementation guide, and frameworks for validation and adaptation, enabling organizations to deploy fairness practices at scale."
+)
+st.markdown("---")
+
+# --- 1. The Integrated Workflow ---
+st.subheader("🔄 The Integrated Workflow: How It All Connects")
+st.markdown("This workflow shows how outputs from each part of the playbook feed into the others, creating a continuous cycle of compliant, governed, and fair AI development.")
+
+
+with st.expander("See a step-by-step breakdown of the workflow"):
+    st.markdown("""
+    1.  **Project Inception & Risk Classification (Part 4):** A new AI project begins. The first step is to use the **Risk Classification Calculator** from the *Regulatory Compliance Guide* to determine if the system is low, high, or unacceptable risk.
+    2.  **Governance Activation (Part 2):** A "High-Risk" classification immediately engages the *Organizational Integration Toolkit*. The **AI Review Board** is notified and becomes the designated governance gate for the project.
+    3.  **Agile Team Setup (Part 1):** The development team adopts the *Fair AI Scrum Toolkit*. Guided by the regulatory needs (**Part 4**) and governance policies (**Part 2**), the Product Owner writes fairness-aware user stories with clear, measurable acceptance criteria.
+    4.  **Technical Implementation (Part 3):** During sprints, developers consult the *Advanced Architecture Cookbook* to select the appropriate technical "recipe" needed to meet the fairness requirements of their user story (e.g., implementing disaggregated performance analysis for a computer vision model).
+    5.  **Documentation & Audit Trail (Parts 2 & 4):** As part of their **Definition of Done (Part 1)**, the team must complete the **Fairness Impact Statement (Part 2)** and the **Compliance Addendum (Part 4)**. This creates the mandatory audit trail.
+    6.  **Governance Gate Review (Part 2):** Before deployment, the completed documentation is formally submitted to the **AI Review Board**. They review the evidence and make a go/no-go decision, fulfilling the governance control triggered in step 2.
+    7.  **Deployment & Continuous Monitoring:** The system is deployed. The process loops back as new features are developed or as monitoring reveals the need for fairness adjustments.
+    """)
+
+st.markdown("---")
+
+# --- 2. End-to-End Case Study ---
+st.subheader("🏢 End-to-End Case Study: Multi-Team AI Recruitment Platform")
+st.markdown("This case study demonstrates the application of the full, integrated playbook to prevent the siloed failures seen in previous examples.")
+
+st.markdown("""
+A company is building a large-scale AI recruitment platform with three teams: Team A (Sourcing), Team B (Matching), and Team C (Interview Analysis).
+
+- **Step 1: Risk Classification (Part 4):** The system, which impacts employment opportunities, is immediately classified as **High-Risk** under the EU AI Act framework.
+- **Step 2: Governance Setup (Part 2):** This classification triggers the formation of an **AI Review Board**. A **Fairness Champion** with expertise in HR systems is assigned to oversee the three teams.
+- **Step 3: Team Implementation (Part 1):** All three teams adopt **Fair AI Scrum**. Team A's Product Owner writes a user story to "screen candidates... while ensuring equal opportunity for selection across racial groups."
+- **Step 4: Technical Solution (Part 3):** Team A consults the **Cookbook** and uses the "Disaggregated Performance Analysis" recipe for their classification model. Team C, working on video analysis, uses a combination of recipes for LLMs (transcript analysis) and Vision (facial attribute analysis).
+- **Step 5: Integrated Documentation & Review (Parts 2 & 4):** Before their component can be deployed, each team must complete and link their **Fairness Impact Statement** and **Compliance Addendum**. The AI Review Board holds a formal gate review, assessing the *entire chain* of components to check for compounding biases. They approve the system for a pilot launch only after Team C demonstrates acceptable performance for non-native English speakers.
+
+**Result:** The integrated playbook creates a unified, legally sound, and technically rigorous process. It prevents inconsistent standards and ensures clear accountability, transforming a high-risk project into a defensible and demonstrably fairer system.
+""")
+st.markdown("---")
+
+# --- 3. Validation Framework ---
+st.subheader("✅ Validation Framework: How to Measure Success")
+st.markdown("This framework provides guidance for verifying the effectiveness of your playbook implementation, using both leading (process) and lagging (outcome) indicators.")
+
+col1, col2 = st.columns(2)
+with col1:
+    st.info("#### Process Metrics (Leading Indicators)")
+    st.markdown("""
+    - **Adoption Rate:** Percentage of user stories for high-risk features that include fairness criteria. (Target: 100%)
+    - **Task Completion:** Completion rate of fairness-specific tasks compared to functional tasks within sprints. (Target: >95%)
+    - **Team Engagement:** Frequency of "fairness blockers" being raised and resolved in daily standups.
+    """)
+
+with col2:
+    st.warning("#### Outcome Metrics (Lagging Indicators)")
+    st.markdown("""
+    - **Reduced Harm:** A measurable reduction in fairness-related incidents or complaints discovered post-deployment.
+    - **Improved Equity:** Demonstrable improvement in fairness metrics (e.g., parity scores) in deployed systems.
+    - **Increased Efficiency:** Decrease in the time required to address and mitigate identified bias issues.
+    - **Compliance Success:** Zero high-severity fairness issues reaching production and successful completion of internal or external audits.
+    """)
+
+st.markdown("---")
+
+# --- 4. Adaptability Guidelines ---
+st.subheader("🌐 Adaptability Guidelines")
+st.markdown("The playbook is a flexible framework, not a rigid set of rules. Here's how to adapt it across different domains and problem types.")
+
+with st.expander("Adapting by Industry Domain"):
+    st.markdown("""
+    - **Healthcare:** Place the highest emphasis on **Risk Classification (Part 4)**, as most systems will be high-risk. The **Governance Body (Part 2)** must include clinical experts and bioethicists. Protected groups may include specific patient populations with rare conditions.
+    - **Finance:** Focus heavily on the **Regulatory Compliance Guide (Part 4)** to align with fair lending laws (e.g., ECOA). The **Audit Trail** and documentation templates are critical for demonstrating compliance to regulators. Explainability recipes from the **Cookbook (Part 3)** are essential.
+    - **E-commerce:** The key challenge is often fairness of exposure in **Recommendation Systems (Part 3)**. The **Governance Body (Part 2)** should focus on defining what constitutes "fair" exposure for sellers or products (e.g., promoting small businesses).
+    """)
+
+with st.expander("Adapting by AI Problem Type"):
+    st.markdown("""
+    - **Classification:** The playbook's examples are well-suited for this. Focus on metrics like equal opportunity, predictive parity, and disaggregated accuracy.
+    - **Regression:** Adapt fairness definitions to focus on error disparities. A key question is: "Is the model's prediction error (e.g., over- or under-estimating a price) significantly larger for one group than another?"
+    - **Generative AI (LLMs, Image Models):** Rely heavily on the **Advanced Architecture Cookbook (Part 3)** for specialized recipes on stereotype testing, toxicity evaluation, and preventing harmful content generation. The **Governance (Part 2)** must define policies on acceptable use and content.
+    """)
+    
+st.markdown("---")
+
+# --- 5. Future Iterations ---
+st.subheader("🔮 Future Iterations: How This Playbook Can Evolve")
+st.markdown("An effective fairness strategy is a living process. Here are potential improvements for future versions of this playbook:")
+st.markdown("""
+- **Deeper MLOps Integration:** Developing plugins and automated checks that integrate directly into CI/CD pipelines, flagging potential fairness issues on every code commit.
+- **Expanded Cookbook:** Adding more recipes to the **Architecture Cookbook** for emerging technologies like Graph Neural Networks and Reinforcement Learning systems.
+- **Automated Documentation:** Creating tools that automatically populate sections of the **Fairness Impact Statement** and **Compliance Addendum** based on code analysis and model evaluation results, reducing developer burden.
+- **Dynamic Risk Assessment:** Moving from a static, upfront risk assessment to a dynamic model that re-evaluates risk throughout the AI lifecycle as the system is used in new contexts.
+""")
+
+st.markdown("---")
+
+# --- 6. Bibliography and Further Reading ---
+st.subheader("📚 Further Reading & Bibliography")
+with st.expander("Expand to see key resources for the Full Playbook & Synthesis"):
+    st.markdown("""
+    This section synthesizes all previous parts into a cohesive whole. The key challenge is creating a practical, integrated workflow. While many papers focus on specific components, the following resources discuss the broader challenge of end-to-end integration and evaluation.
+
+    *(Note: The citations in the original text for this section were numerical and could not be resolved. The following are suggested foundational readings for the topics of integration, validation, and adaptation.)*
+
+    ##### Foundational Readings on Integrated AI Governance:
+
+    - **Raji, I. D., et al. (2020). *Closing the AI accountability gap: Defining an end-to-end framework for internal algorithmic auditing.***
+      - **Why it's important:** This paper is arguably the most influential work on creating an integrated, end-to-end process for AI accountability. The workflow presented in this playbook is heavily inspired by the lifecycle approach detailed in this research.
+    
+    - **Smuha, N. A., et al. (2023). *How to operationalize AI regulation...***
+      - **Why it's important:** This paper directly tackles the challenge of "operationalizing" regulation, which is the core goal of the integrated playbook. It discusses the practical difficulties of connecting legal requirements to technical work, motivating the need for a comprehensive methodology.
+
+    ##### On Validation and Measurement:
+
+    - **Saleiro, P., et al. (2018). *Aequitas: A Bias and Fairness Audit Toolkit.***
+      - **Why it's important:** While this playbook is process-focused, validation depends on robust tools. Aequitas is an open-source tool that provides a practical foundation for generating the "Outcome Metrics" needed for the validation framework.
+    
+    - **Weidinger, L., et al. (2022). *Taxonomy of risks posed by language models.***
+      - **Why it's important:** For adapting the playbook to new domains, especially those involving generative AI, a structured understanding of potential harms is crucial. This taxonomy provides a framework for identifying the risks that your adapted playbook will need to address.
+    """)
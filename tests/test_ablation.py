@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.ablation import ablate_model, ablate_scores, ablation_variants
+
+WEIGHTS = {"Text": 0.5, "Vision": 0.3, "Audio": 0.2}
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(6)
+    n = 2_500
+    scores = pd.DataFrame({modality: rng.random(n) for modality in WEIGHTS})
+    return scores, rng.choice(["A", "B", "C"], n)
+
+
+def loop_ablation(scores, groups, max_dropped, fill):
+    """Fused scores and agreement computed one variant and one modality at a time."""
+    labels, keep = ablation_variants(WEIGHTS, max_dropped)
+    fused = {}
+    for label, mask in zip(labels, keep):
+        total = np.zeros(len(scores))
+        for modality, kept in zip(WEIGHTS, mask):
+            total += WEIGHTS[modality] * (scores[modality].to_numpy() if kept else fill)
+        fused[label] = total
+    baseline = fused["baseline"] >= 0.5
+    agreement = pd.DataFrame({label: pd.Series((fused[label] >= 0.5) == baseline).groupby(groups).mean()
+                              for label in labels[1:]})
+    shift = pd.DataFrame({label: pd.Series(fused[label] - fused["baseline"]).groupby(groups).mean()
+                          for label in labels[1:]})
+    return agreement, shift
+
+
+@pytest.mark.parametrize("max_dropped, fill", [(1, 0.0), (2, 0.0), (1, 0.5)])
+def test_matrix_product_matches_per_modality_loop(samples, max_dropped, fill):
+    scores, groups = samples
+    result = ablate_scores(scores, WEIGHTS, groups, fill=fill, max_dropped=max_dropped)
+    agreement, shift = loop_ablation(scores, groups, max_dropped, fill)
+    np.testing.assert_allclose(result.agreement.to_numpy(), agreement.to_numpy())
+    np.testing.assert_allclose(result.score_shift.to_numpy(), shift.to_numpy(), atol=1e-12)
+    assert list(result.agreement.columns) == list(agreement.columns)
+    np.testing.assert_allclose(result.gap, agreement.max() - agreement.min())
+
+
+def test_model_callable_matches_scores(samples):
+    scores, groups = samples
+    inputs = {modality: scores[modality].to_numpy() for modality in WEIGHTS}
+
+    def late_fusion(batch):
+        return sum(WEIGHTS[modality] * batch[modality] for modality in WEIGHTS)
+
+    expected = ablate_scores(scores, WEIGHTS, groups)
+    result = ablate_model(late_fusion, inputs, groups, batch_size=300, max_workers=4)
+    pd.testing.assert_frame_equal(result.agreement, expected.agreement)
+    pd.testing.assert_series_equal(result.overall, expected.overall)
+    np.testing.assert_allclose(result.score_shift, expected.score_shift, atol=1e-12)
+
+
+def test_variants():
+    labels, keep = ablation_variants(WEIGHTS, max_dropped=2)
+    assert labels[:2] == ["baseline", "without Text"]
+    assert len(labels) == 1 + 3 + 3
+    assert (keep.sum(axis=1) == [3, 2, 2, 2, 1, 1, 1]).all()
+    with pytest.raises(ValueError):
+        ablation_variants(WEIGHTS, max_dropped=3)
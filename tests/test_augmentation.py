@@ -0,0 +1,86 @@
+import gzip
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.augmentation import COUNTERFACTUAL_FIELD, SwapLexicon, augment_file
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return SwapLexicon()
+
+
+def test_swap_round_trip(lexicon):
+    # Ambiguous terms ("him" -> "her" -> "his") are the only one-way swaps.
+    reversible = [term for term, counterpart in lexicon.replacement.items() if lexicon.replacement[counterpart] == term]
+    assert len(reversible) > 50
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        words = rng.choice(reversible, 12)
+        text = ", ".join(w.capitalize() if i % 3 == 1 else w.upper() if i % 3 == 2 else w for i, w in enumerate(words)) + "."
+        swapped = lexicon.swap(text)
+        assert swapped != text
+        assert lexicon.swap(swapped) == text
+
+
+def test_swap_keeps_case_and_word_boundaries(lexicon):
+    counts = {}
+    assert lexicon.swap("He told HIS Father: the theme of Chemistry is hers.", counts) == \
+        "She told HER Mother: the theme of Chemistry is his."
+    assert counts == {"he": 1, "his": 1, "father": 1, "hers": 1}
+
+
+def test_conflicting_attributes_raise():
+    with pytest.raises(ValueError, match="both"):
+        SwapLexicon({"gender": [("he", "she")], "other": [("she", "they")]})
+
+
+def write_corpus(path, n=3_000, seed=1):
+    rng = np.random.default_rng(seed)
+    sentences = ["The doctor said he would call his son.", "The model is ready.", "Mrs Smith met the young chairman.",
+                 "No terms here at all.", "She thanked her brothers and the waitress."]
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8") as handle:
+        for i in range(n):
+            handle.write(json.dumps({"id": i, "text": sentences[rng.integers(len(sentences))], "prompt": "his"}) + "\n")
+            if i % 500 == 0:
+                handle.write("\n")
+
+
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+def test_process_pool_matches_single_process(tmp_path, suffix):
+    source = tmp_path / f"corpus.jsonl{suffix}"
+    write_corpus(source)
+    single, pooled = tmp_path / f"single.jsonl{suffix}", tmp_path / f"pooled.jsonl{suffix}"
+    expected = augment_file(source, single, jobs=1, block_bytes=4_096)
+    stats = augment_file(source, pooled, jobs=2, block_bytes=4_096)
+    opener = gzip.open if suffix else open
+    with opener(single, "rb") as a, opener(pooled, "rb") as b:
+        assert a.read() == b.read()
+    assert (stats.documents, stats.augmented) == (expected.documents, expected.augmented) == (3_000, stats.augmented)
+    pd.testing.assert_frame_equal(stats.by_attribute, expected.by_attribute)
+    pd.testing.assert_frame_equal(stats.terms.sort_values("term").reset_index(drop=True),
+                                  expected.terms.sort_values("term").reset_index(drop=True))
+
+
+def test_counterfactual_copies_follow_their_originals(tmp_path):
+    source, destination = tmp_path / "corpus.jsonl", tmp_path / "out.jsonl"
+    write_corpus(source, n=200)
+    stats = augment_file(source, destination, jobs=1)
+    records = [json.loads(line) for line in destination.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == stats.documents + stats.augmented
+    for previous, record in zip(records, records[1:]):
+        if record.get(COUNTERFACTUAL_FIELD):
+            assert record["id"] == previous["id"] and not previous.get(COUNTERFACTUAL_FIELD)
+            assert SwapLexicon().swap(previous["text"]) == record["text"]
+            assert record["prompt"] == "his"      # only the requested fields are swapped
+
+
+def test_invalid_json_names_the_line(tmp_path):
+    source = tmp_path / "bad.jsonl"
+    source.write_text('{"text": "he"}\n{"text": \n', encoding="utf-8")
+    with pytest.raises(ValueError, match="Line 2"):
+        augment_file(source, tmp_path / "out.jsonl", jobs=1)
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit import bootstrap
+from fairness_audit.bootstrap import bootstrap_ci, bootstrap_rates
+from fairness_audit.metrics import DisaggregatedMetrics, disaggregate
+
+
+@pytest.fixture
+def metrics():
+    rng = np.random.default_rng(1)
+    n = 4_000
+    groups = rng.choice(["A", "B", "C"], n)
+    return disaggregate(rng.integers(0, 2, n), rng.integers(0, 2, n), groups)
+
+
+def test_same_seed_same_intervals(metrics):
+    first, second = bootstrap_ci(metrics, n_resamples=600, seed=3), bootstrap_ci(metrics, n_resamples=600, seed=3)
+    pd.testing.assert_frame_equal(first.by_group, second.by_group)
+    pd.testing.assert_frame_equal(first.difference, second.difference)
+    other = bootstrap_ci(metrics, n_resamples=600, seed=4)
+    assert not other.by_group.equals(first.by_group)
+
+
+def test_process_pool_matches_single_process(metrics, monkeypatch):
+    single = bootstrap_rates(metrics.counts, n_resamples=600, seed=3, n_jobs=1)
+    monkeypatch.setattr(bootstrap, "PARALLEL_MIN_DRAWS", 0)
+    pooled = bootstrap_rates(metrics.counts, n_resamples=600, seed=3, n_jobs=2)
+    np.testing.assert_array_equal(single, pooled)
+
+
+def test_intervals_bracket_the_estimate(metrics):
+    intervals = bootstrap_ci(metrics, n_resamples=500)
+    for metric in intervals.by_group.columns.levels[0]:
+        table = intervals.by_group[metric]
+        assert (table["lower"] <= table["estimate"]).all() and (table["estimate"] <= table["upper"]).all()
+
+
+def test_coverage_of_a_known_rate():
+    # 95% intervals for the TPR of a group with true TPR 0.7 should contain
+    # 0.7 in roughly 95% of repeated samples.
+    rng = np.random.default_rng(0)
+    trials, positives, covered = 200, 400, 0
+    for seed in range(trials):
+        tp = rng.binomial(positives, 0.7)
+        counts = np.array([[[300, 100], [positives - tp, tp]]])
+        intervals = bootstrap_ci(DisaggregatedMetrics(counts, pd.Index(["A"])), n_resamples=400, seed=seed)
+        row = intervals.by_group["true_positive_rate"].iloc[0]
+        covered += row["lower"] <= 0.7 <= row["upper"]
+    assert 0.90 <= covered / trials <= 0.99
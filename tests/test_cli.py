@@ -0,0 +1,146 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.cli import main
+from fairness_audit.evidence import EvidenceStore
+
+REPORT_KEYS = {"audit", "name", "passed", "summary", "tables"}
+
+
+def run(capsys, *argv):
+    status = main([str(arg) for arg in argv])
+    reports = json.loads(capsys.readouterr().out)
+    assert all(set(report) == REPORT_KEYS for report in reports)
+    return status, reports
+
+
+@pytest.fixture
+def predictions(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 2_000
+    path = tmp_path / "preds.csv"
+    pd.DataFrame({"label": rng.integers(0, 2, n), "pred": rng.integers(0, 2, n),
+                  "gender": rng.choice(["F", "M"], n)}).to_csv(path, index=False)
+    return path
+
+
+def test_risk_gate(capsys):
+    args = ["risk", "--domain-impact", "High", "--autonomy", "Human over the loop",
+            "--decision-impact", "Affects Opportunities", "--scale", "> 100k people"]
+    status, [report] = run(capsys, *args, "--fail-on", "High Risk")
+    assert status == 1 and report["passed"] is False
+    assert report["summary"] == {"score": 16, "tier": "High Risk"}
+    assert [row["factor"] for row in report["tables"]["factors"]] == ["domain_impact", "autonomy", "decision_impact", "scale"]
+    status, [report] = run(capsys, *args)
+    assert status == 0 and report["passed"] is None
+
+
+def test_portfolio(capsys, tmp_path):
+    path = tmp_path / "inventory.csv"
+    pd.DataFrame({"domain_impact": ["Low", "High"], "autonomy": ["Human in the loop", "Fully Autonomous"],
+                  "decision_impact": ["Informational", "Life-Altering"],
+                  "users": ["< 1k people", "> 100k people"]}).to_csv(path, index=False)
+    status, [report] = run(capsys, "portfolio", path, "--column", "scale=users", "--fail-on", "High Risk")
+    assert status == 1
+    assert report["summary"]["systems"] == 2 and report["summary"]["flagged"] == 1
+    assert [row["score"] for row in report["tables"]["systems"]] == [20, 4]
+
+
+def test_disaggregate_with_evidence(capsys, tmp_path, predictions):
+    evidence = tmp_path / "evidence.db"
+    status, [report] = run(capsys, "disaggregate", predictions, "--y-true", "label", "--y-pred", "pred",
+                           "--sensitive", "gender", "--max-difference", "accuracy=1.0",
+                           "--evidence", evidence, "--requirement", "EU AI Act Art. 10", "--build", "42")
+    assert status == 0 and report["passed"] is True
+    assert report["summary"]["rows"] == 2_000 and report["summary"]["breaches"] == {}
+    assert {row["gender"] for row in report["tables"]["by_group"]} == {"F", "M"}
+
+    store = EvidenceStore(str(evidence))
+    try:
+        [entry] = store.find(requirement="EU AI Act Art. 10").itertuples()
+        assert (entry.kind, entry.build) == ("disaggregate", "42")
+        assert json.loads(store.get(entry.digest)) == [report]
+        assert store.verify() is None
+    finally:
+        store.close()
+
+
+def test_disaggregate_bad_pair_is_a_usage_error(predictions):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["disaggregate", str(predictions), "--y-true", "label", "--y-pred", "pred",
+              "--sensitive", "gender", "--max-difference", "accuracy"])
+    assert exit_info.value.code == 2
+
+
+def test_missing_file_fails(capsys, tmp_path):
+    status, [report] = run(capsys, "rerank", tmp_path / "missing.csv", "--score", "s", "--group", "g", "--protected", "b")
+    assert status == 1 and report["passed"] is False
+    assert "error" in report["summary"]
+
+
+def test_rerank(capsys, tmp_path):
+    rng = np.random.default_rng(1)
+    path = tmp_path / "catalog.csv"
+    pd.DataFrame({"s": rng.normal(size=500), "g": rng.choice(["a", "b"], 500)}).to_csv(path, index=False)
+    status, [report] = run(capsys, "rerank", path, "--score", "s", "--group", "g", "--protected", "b",
+                           "--boost", "0.3", "-k", "20", "--max-exposure-gap", "1")
+    assert status == 0
+    assert report["summary"]["k"] == 20 and 0 <= report["summary"]["relevance_retained"] <= 1
+    assert [row["group"] for row in report["tables"]["exposure"]] == ["a", "b"]
+
+
+def test_monitor_writes_iso_timestamps(capsys, tmp_path):
+    rng = np.random.default_rng(2)
+    n = 6_000
+    gender = rng.choice(["F", "M"], n)
+    pred = rng.integers(0, 2, n)
+    pred[(np.arange(n) > 4_000) & (gender == "M")] = 0   # approvals for M stop in the last third
+    path = tmp_path / "log.csv"
+    pd.DataFrame({"ts": pd.date_range("2026-01-01", periods=n, freq="1min"), "gender": gender,
+                  "label": rng.integers(0, 2, n), "pred": pred}).to_csv(path, index=False)
+    status, [report] = run(capsys, "monitor", path, "--timestamp", "ts", "--group", "gender", "--y-true", "label",
+                           "--y-pred", "pred", "--bucket", "1h", "--window", "6", "--fail-on", "Critical")
+    assert status == 1
+    assert report["summary"]["events"] == n and report["summary"]["critical_alerts"] > 0
+    for row in report["tables"]["alerts"]:
+        assert row["window_end"].startswith("2026-01-0")
+        pd.Timestamp(row["window_end"])
+    assert sum(report["summary"][f"tier_{tier}_incidents"] for tier in (1, 2, 3)) == len(report["tables"]["incidents"])
+
+
+def test_augment(capsys, tmp_path):
+    source, destination = tmp_path / "corpus.jsonl", tmp_path / "out.jsonl"
+    source.write_text('{"text": "She is a nurse."}\n{"text": "The model is ready."}\n', encoding="utf-8")
+    status, [report] = run(capsys, "augment", source, destination, "--jobs", "1")
+    assert status == 0
+    assert report["summary"]["documents"] == 2 and report["summary"]["augmented"] == 1
+    assert len(destination.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_rasci(capsys, tmp_path):
+    path = tmp_path / "rasci.csv"
+    pd.DataFrame({"task": ["Audit", "Deploy"], "Lead": ["A", "R"], "Engineer": ["R", ""]}).to_csv(path, index=False)
+    status, [report] = run(capsys, "rasci", path)
+    assert status == 1
+    assert report["summary"]["tasks"] == 2
+    assert [row["task"] for row in report["tables"]["issues"]] == ["Deploy"]
+
+
+def test_fusion(capsys):
+    status, [report] = run(capsys, "fusion", "--text", "0.8", "--vision", "0.7", "--audio", "0.3", "--dominant", "Audio")
+    assert status == 0 and report["passed"] is None
+    assert report["tables"]["scenarios"][0]["weights"] == "configured"
+
+
+def test_batch_markdown_to_file(tmp_path, predictions):
+    manifest = tmp_path / "audits.json"
+    manifest.write_text(json.dumps([
+        {"audit": "disaggregate", "sources": [predictions.name], "y_true": "label", "y_pred": "pred", "sensitive_columns": ["gender"]},
+        {"audit": "nonexistent"},
+    ]), encoding="utf-8")
+    output = tmp_path / "report.md"
+    assert main(["batch", str(manifest), "--jobs", "1", "--format", "markdown", "--output", str(output)]) == 1
+    assert "preds.csv" in output.read_text(encoding="utf-8")
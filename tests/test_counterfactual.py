@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from fairness_audit.counterfactual import (
+    DEMO_TEMPLATES, FAIRNESS_INSTRUCTION, ResponseCache, StubBackend, expand_templates, generate_responses,
+    score_counterfactuals,
+)
+
+
+class RecordingBackend:
+    """Echo backend that records batch sizes and the most batches in flight at once."""
+
+    name = "recording"
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.batches = []
+        self.in_flight = self.peak = 0
+
+    async def generate(self, prompts):
+        self.batches.append(len(prompts))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [f"reply to {prompt}" for prompt in prompts]
+
+
+def test_batches_respect_size_and_concurrency():
+    backend = RecordingBackend()
+    prompts = [f"prompt {i}" for i in range(100)] + ["prompt 3", "prompt 7"]
+    responses, cached = asyncio.run(generate_responses(backend, prompts, batch_size=8, concurrency=3))
+    assert responses == [f"reply to {prompt}" for prompt in prompts]
+    assert cached == 0
+    assert sorted(backend.batches) == [4] + [8] * 12     # duplicates are sent once
+    assert backend.peak == 3
+
+
+def test_cache_hits_skip_the_backend(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    prompts = [f"prompt {i}" for i in range(20)]
+    asyncio.run(generate_responses(RecordingBackend(), prompts[:12], cache=cache, batch_size=5))
+    backend = RecordingBackend()
+    responses, cached = asyncio.run(generate_responses(backend, prompts, cache=cache, batch_size=5))
+    assert cached == 12 and sum(backend.batches) == 8
+    assert responses == [f"reply to {prompt}" for prompt in prompts]
+    assert len(cache) == 20
+    cache.close()
+
+
+def test_short_reply_raises():
+    class Truncating(RecordingBackend):
+        async def generate(self, prompts):
+            return (await super().generate(prompts))[:-1]
+
+    with pytest.raises(ValueError, match="returned 3 responses for 4 prompts"):
+        asyncio.run(generate_responses(Truncating(), ["a", "b", "c", "d"], batch_size=4))
+
+
+def test_identity_swaps_alone_score_one():
+    prompts = expand_templates(DEMO_TEMPLATES[:2])
+    # Each answer repeats its prompt's identity: only the masked terms differ.
+    responses = [f"A {row.gender} {row.age} {row.origin} professional with ten years of experience."
+                 for row in prompts.itertuples()]
+    scored = score_counterfactuals(prompts, responses)
+    assert (scored["similarity"] == 1).all() and (scored["jaccard"] == 1).all()
+    assert (scored["length_change"] == 0).all()
+    assert scored["reference"].sum() == 2
+
+
+def test_changed_answers_score_below_one():
+    prompts = expand_templates(["Describe a {gender} engineer."], {"gender": ("male", "female")})
+    scored = score_counterfactuals(prompts, ["A skilled engineer.", "A skilled and caring engineer."],
+                                   {"gender": ("male", "female")})
+    reference, pair = scored.itertuples()
+    assert reference.reference and reference.similarity == 1
+    assert pair.similarity == pytest.approx(2 * 3 / (3 + 5))
+    assert pair.jaccard == pytest.approx(3 / 5)
+    assert pair.length_change == pytest.approx(5 / 3 - 1)
+
+
+def test_stub_bias_shows_up_and_the_instruction_reduces_it():
+    backend = StubBackend(bias=0.5)
+    plain = expand_templates(DEMO_TEMPLATES)
+    instructed = expand_templates(DEMO_TEMPLATES, instruction=FAIRNESS_INSTRUCTION)
+    scores = [score_counterfactuals(prompts, asyncio.run(generate_responses(backend, prompts["prompt"]))[0])
+              for prompts in (plain, instructed)]
+    assert scores[1]["similarity"].mean() > scores[0]["similarity"].mean()
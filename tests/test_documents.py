@@ -0,0 +1,48 @@
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from fairness_audit.documents import ModelEvidence, bundle_file, render_models, write_bundle
+from fairness_audit.metrics import DisaggregatedMetrics
+from fairness_audit.risk import assess_risk
+
+ANSWERS = {
+    "domain_impact": "High", "autonomy": "Human over the loop",
+    "decision_impact": "Affects Opportunities", "scale": "> 100k people",
+}
+
+
+def make_evidence(names, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = pd.Index(["Men", "Women", "Non-binary"], name="gender")
+    counts = rng.integers(10, 500, size=(len(names), len(groups), 2, 2))
+    risk = assess_risk(*ANSWERS.values())
+    return [ModelEvidence({"name": name, "version": "1.0"}, DisaggregatedMetrics(counts[i], groups), risk, ANSWERS,
+                          {"true_positive_rate": 0.05})
+            for i, name in enumerate(names)]
+
+
+def test_colliding_names_get_their_own_folders(tmp_path):
+    names = ["Credit model", "Credit/model", "Credit model", "Credit_model_3", "Screener"]
+    target = tmp_path / "bundle.zip"
+    entries = write_bundle(make_evidence(names), target, jobs=1)
+    with zipfile.ZipFile(target) as archive:
+        paths = archive.namelist()
+    assert entries == len(paths) == len(set(paths)) == 4 * len(names)
+    assert sorted({path.split("/")[0] for path in paths}) == [
+        "Credit_model", "Credit_model_2", "Credit_model_3", "Credit_model_3_4", "Screener"]
+
+
+def test_worker_processes_match_in_process_rendering():
+    evidence = make_evidence([f"Model {i}" for i in range(40)] + ["Model 0"])
+    single = list(render_models(evidence, jobs=1, batch_size=8))
+    assert list(render_models(evidence, jobs=2, batch_size=8)) == single
+    assert single[-1][0].startswith("Model_0_41/")
+
+
+def test_bundle_file_is_rewound():
+    handle = bundle_file(make_evidence(["A", "B"]), jobs=1)
+    with zipfile.ZipFile(handle) as archive:
+        assert archive.testzip() is None
+        assert len(archive.namelist()) == 8
@@ -0,0 +1,81 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+from fairness_audit import escalation
+from fairness_audit.escalation import AUTHORITIES, EscalationRouter, classify
+from fairness_audit.monitoring import SEVERITIES, Alert
+
+WARNING, CRITICAL = SEVERITIES[0], SEVERITIES[-1]
+
+
+def alerts(*rows):
+    return pd.DataFrame([Alert(pd.Timestamp("2026-01-01"), group, test, value, severity)
+                         for group, test, value, severity in rows])
+
+
+@pytest.fixture
+def router():
+    ticks = itertools.count()
+    return EscalationRouter(escalate_after=3, clock=lambda: float(next(ticks)))
+
+
+def test_classify():
+    assert classify(CRITICAL, "cusum") == 3
+    assert classify(WARNING, "disparity") == 2
+    assert classify(WARNING, "cusum") == 1
+    with pytest.raises(ValueError):
+        classify("Severe", "cusum")
+
+
+def test_alerts_coalesce_and_escalate(router):
+    router.submit(alerts(("A", "cusum", 1.0, WARNING), ("A", "cusum", 2.0, WARNING)), model="m")
+    router.submit(alerts(("B", "disparity", 0.1, WARNING)), model="m")
+    assert router.wait(10)
+    assert len(router) == 2 and router.routed == 3 and router.backlog == 0
+    router.submit(alerts(("A", "cusum", 3.0, WARNING)), model="m")
+    assert router.wait(10)
+    # The third alert for (m, A, cusum) moves it up from the team; it was received first, so it leads the queue.
+    queue = router.queue(AUTHORITIES[1])
+    assert queue[["group", "alerts", "value"]].values.tolist() == [["A", 3, 3.0], ["B", 1, 0.1]]
+    assert router.queue(AUTHORITIES[0]).empty
+
+
+def test_resolve_takes_the_most_severe_oldest_first(router):
+    router.submit(alerts(("A", "cusum", 1.0, CRITICAL), ("B", "cusum", 1.0, CRITICAL)), model="m")
+    router.wait(10)
+    router.submit(alerts(("C", "cusum", 1.0, CRITICAL)), model="m")
+    router.wait(10)
+    assert [incident.group for incident in router.resolve(AUTHORITIES[2], 2)] == ["A", "B"]
+    assert router.metrics().loc[AUTHORITIES[2], ["open", "resolved"]].tolist() == [1, 2]
+
+
+def test_submit_validates_alerts(router):
+    with pytest.raises(ValueError, match="missing"):
+        router.submit(alerts(("A", "cusum", 1.0, WARNING)).drop(columns="window_end"))
+    with pytest.raises(ValueError, match="severities"):
+        router.submit(alerts(("A", "cusum", 1.0, "Severe")))
+    with pytest.raises(ValueError, match="numeric"):
+        router.submit(alerts(("A", "cusum", "high", WARNING)))
+    assert router.submit(alerts(("A", "cusum", "0.5", WARNING))) == 1
+    assert router.wait(10) and router.routed == 1
+
+
+def test_routing_failure_does_not_stall_the_router(router, monkeypatch):
+    route = router._route
+
+    def failing_route(model, group, *args):
+        if group == "bad":
+            raise RuntimeError("routing failed")
+        return route(model, group, *args)
+
+    monkeypatch.setattr(router, "_route", failing_route)
+    monkeypatch.setattr(escalation.threading, "excepthook", lambda args: None)
+    router.submit(alerts(("bad", "cusum", 1.0, WARNING), ("A", "cusum", 1.0, WARNING)))
+    router.submit(alerts(("B", "cusum", 1.0, WARNING)))
+    assert router.wait(10)
+    assert router.backlog == 0 and router._worker is None
+    router.submit(alerts(("C", "cusum", 1.0, WARNING)))
+    assert router.wait(10)
+    assert sorted(router.queue(AUTHORITIES[0])["group"]) == ["B", "C"]
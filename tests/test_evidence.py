@@ -0,0 +1,102 @@
+import sqlite3
+import threading
+
+import pytest
+
+from fairness_audit.evidence import Artifact, EvidenceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EvidenceStore(tmp_path / "evidence.db")
+    yield store
+    store.close()
+
+
+def tamper(store, *statements):
+    """Run statements on the store's file through a second connection, with the append-only triggers dropped."""
+    connection = sqlite3.connect(store.path, isolation_level=None)
+    for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+        connection.execute(f"DROP TRIGGER {name}")
+    for statement in statements:
+        connection.execute(statement)
+    connection.close()
+
+
+def test_identical_bytes_are_stored_once(store):
+    first = store.put("report v1", "fairness_report.json", ["GDPR Art. 22"], model="m", build="1")
+    entries = store.put_many([Artifact("report v1", "fairness_report.json", ("GDPR Art. 22",), None, "m", "2"),
+                              Artifact(b"card", "model_card.md", ("EU AI Act Art. 10", "EU AI Act Art. 14")),
+                              Artifact("card", "model_card.md")])
+    assert first.new and [entry.new for entry in entries] == [False, True, False]
+    assert entries[0].digest == first.digest and entries[1].digest == entries[2].digest
+    assert [entry.seq for entry in entries] == [2, 3, 4]
+    stats = store.stats()
+    assert (stats["entries"], stats["artifacts"]) == (4, 2)
+    assert stats["recorded_bytes"] == 2 * len("report v1") + 2 * len("card")
+    assert store.get(first.digest) == b"report v1"
+    assert len(store.find(digest=first.digest)) == 2
+    coverage = store.coverage()
+    assert coverage.loc["GDPR Art. 22", ["entries", "artifacts"]].tolist() == [2, 1]
+    assert coverage.loc["EU AI Act Art. 14", "entries"] == 1
+    assert store.verify() is None
+
+
+@pytest.mark.parametrize("statement", [
+    "UPDATE log SET name = 'other' WHERE seq = 1",
+    "DELETE FROM log WHERE seq = 2",
+    "UPDATE blobs SET size = 0",
+    "DELETE FROM links",
+])
+def test_triggers_reject_updates_and_deletes(store, statement):
+    store.put("a", "a.txt", ["GDPR Art. 22"])
+    store.put("b", "b.txt", ["GDPR Art. 22"])
+    with pytest.raises(sqlite3.DatabaseError, match="append-only"):
+        store._connection.execute(statement)
+    assert len(store) == 2 and store.verify() is None
+
+
+@pytest.mark.parametrize("statement, first_bad", [
+    ("UPDATE log SET name = 'renamed.txt' WHERE seq = 3", 3),
+    ("UPDATE log SET ts = ts - 86400 WHERE seq = 2", 2),
+    ("DELETE FROM links WHERE seq = 4", 4),
+    ("DELETE FROM log WHERE seq = 2", 3),
+])
+def test_verify_finds_the_first_rewritten_entry(store, statement, first_bad):
+    for i in range(5):
+        store.put(f"report {i}", f"report_{i}.json", ["EU AI Act Art. 10"], model="m")
+    tamper(store, statement)
+    assert store.verify() == first_bad
+
+
+def test_get_detects_corrupted_blobs(store):
+    entry = store.put("report", "report.json")
+    tamper(store, "UPDATE blobs SET data = zeroblob(8)")
+    with pytest.raises(ValueError, match="corrupted"):
+        store.get(entry.digest)
+    other = store.put("other", "other.json")
+    tamper(store, f"UPDATE blobs SET data = (SELECT data FROM blobs WHERE digest = x'{entry.digest}')"
+                  f" WHERE digest = x'{other.digest}'")
+    with pytest.raises(ValueError, match="corrupted"):
+        store.get(other.digest)
+
+
+def test_concurrent_writers_keep_one_chain(tmp_path):
+    path = tmp_path / "shared.db"
+    EvidenceStore(path).close()
+
+    def append(worker):
+        writer = EvidenceStore(path)
+        for i in range(20):
+            writer.put(f"report {i % 5}", f"worker_{worker}.json", build=str(i))
+        writer.close()
+
+    threads = [threading.Thread(target=append, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store = EvidenceStore(path)
+    assert len(store) == 80 and store.stats()["artifacts"] == 5
+    assert store.verify() is None
+    store.close()
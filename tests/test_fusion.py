@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from fairness_audit.fusion import MODALITIES, dominant_weights, fuse, simplex_weights, weight_sweep
+
+
+@pytest.fixture
+def scores():
+    rng = np.random.default_rng(2)
+    n = 3_000
+    groups = rng.choice(["Group A", "Group B", "Group C"], n)
+    scores = {modality: rng.random(n) for modality in MODALITIES}
+    scores["Vision"] = np.clip(scores["Vision"] - 0.2 * (groups == "Group B"), 0, 1)  # a biased modality
+    # Samples whose score is the same in every modality, so every weighting fuses them to that score.
+    scores["Text"][:50] = scores["Vision"][:50] = scores["Audio"][:50]
+    return scores, groups
+
+
+@pytest.mark.parametrize("resolution, threshold", [(10, 0.5), (60, 0.5), (37, 0.3)])
+def test_weight_sweep_matches_brute_force(scores, resolution, threshold):
+    scores, groups = scores
+    sweep = weight_sweep(scores, groups, resolution=resolution, threshold=threshold, chunk_size=1_000)
+
+    weights = simplex_weights(resolution)
+    fused = weights @ np.stack([scores[m] for m in MODALITIES])
+    selected = fused >= threshold
+    labels = sorted(set(groups))
+    expected = np.column_stack([selected[:, groups == label].mean(axis=1) for label in labels])
+
+    np.testing.assert_allclose(sweep[list(MODALITIES)].to_numpy(), weights)
+    np.testing.assert_allclose(sweep[labels].to_numpy(), expected)
+    np.testing.assert_allclose(sweep["gap"], expected.max(axis=1) - expected.min(axis=1))
+    assert list(sweep["lowest"]) == [labels[i] for i in expected.argmin(axis=1)]
+
+
+def test_simplex_weights_cover_the_simplex():
+    weights = simplex_weights(60)
+    assert len(weights) == 1_891
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+    assert len(np.unique(np.round(weights * 60).astype(int), axis=0)) == len(weights)
+
+
+def test_fuse_and_dominant_weights():
+    weights = dominant_weights("Vision", share=0.8)
+    assert weights == {"Text": 0.1, "Vision": 0.8, "Audio": 0.1}
+    fused = fuse({"Text": [1.0, 0.0], "Vision": [0.5, 0.5], "Audio": [0.0, 1.0]}, weights)
+    np.testing.assert_allclose(fused, [0.5, 0.5])
+    with pytest.raises(ValueError):
+        fuse({"Depth": [1.0]}, weights)
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+from fairness_audit.governance import CLEARED, GovernanceStore, blocked_at
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = GovernanceStore(tmp_path / "governance.db", debounce=60)
+    yield store
+    store.close()
+
+
+def stored(store, project, sprint):
+    with store._connection() as connection:
+        return dict(connection.execute("SELECT item, done FROM checks WHERE project = ? AND sprint = ?",
+                                       (project, sprint)).fetchall())
+
+
+def test_interleaved_flushes_keep_the_latest_change(store):
+    record, entered, release = store.record, threading.Event(), threading.Event()
+
+    def slow_first_record(rows):
+        if not entered.is_set():
+            entered.set()
+            release.wait(10)
+        return record(rows)
+
+    store.record = slow_first_record
+    store.stage("p", 1, "bias_tests", True)
+    first = threading.Thread(target=store.flush)
+    first.start()
+    assert entered.wait(10)
+    # The first flush has taken its batch but not written it; a newer change is flushed meanwhile.
+    store.stage("p", 1, "bias_tests", False)
+    second = threading.Thread(target=store.flush)
+    second.start()
+    try:
+        time.sleep(0.2)
+        assert store.load("p", 1)["bias_tests"] is False
+    finally:
+        release.set()
+        first.join(10)
+        second.join(10)
+    assert stored(store, "p", 1) == {"bias_tests": 0}
+    assert store.portfolio().loc["p", "dod_done"] == 0
+
+
+def test_staged_changes_are_read_back_and_flushed(store):
+    store.stage("p", 1, "data_review", True)
+    store.stage("p", 1, "data_review", False)
+    store.stage("p", 1, "design_approval", True)
+    assert store.load("p", 1)["design_approval"] and not store.load("p", 1)["data_review"]
+    assert stored(store, "p", 1) == {}
+    assert store.flush() == 2
+    assert stored(store, "p", 1) == {"data_review": 0, "design_approval": 1}
+
+
+def test_snapshot_follows_the_latest_sprint(store):
+    store.record([("p", 2, "data_review", True, 0), ("p", 2, "design_approval", True, 0)])
+    store.record([("p", 1, "data_review", False, 0)])
+    table = store.portfolio()
+    assert table.loc["p", ["sprint", "gates_done"]].tolist() == [2, 2]
+    assert table.loc["p", "blocked_at"] == "Pre-Deployment Gate"
+
+
+def test_blocked_at_is_the_first_open_gate():
+    assert blocked_at([0b0000, 0b0001, 0b0101, 0b1111]).tolist() == [
+        "Data Review Gate", "Design Approval Gate", "Design Approval Gate", CLEARED]
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.ingest import ConfusionAccumulator, ingest_files, iter_aligned_chunks, iter_chunks
+from fairness_audit.metrics import confusion_counts, disaggregate, encode_groups
+
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(3)
+    n = 10_000
+    return pd.DataFrame({
+        "y_true": rng.integers(0, 2, n),
+        "y_pred": rng.integers(0, 2, n),
+        "gender": rng.choice(["F", "M", "X"], n, p=[0.49, 0.49, 0.02]),
+        "race": rng.choice(["A", "B", "C", "D"], n),
+    })
+
+
+def one_shot(frame, columns):
+    codes, groups = encode_groups(frame[columns])
+    return pd.DataFrame(confusion_counts(frame["y_true"], frame["y_pred"], codes, len(groups)).reshape(-1, 4),
+                        index=groups, columns=["tn", "fp", "fn", "tp"])
+
+
+@pytest.mark.parametrize("chunksize", [1, 777, 10_000])
+def test_chunked_counts_match_one_shot(predictions, chunksize):
+    # A late-appearing level must not disturb the groups seen before it.
+    frame = predictions.sort_values("gender", key=lambda g: g == "X", kind="stable").head(2_000 if chunksize == 1 else None)
+    accumulator = ConfusionAccumulator(["gender", "race"])
+    for start in range(0, len(frame), chunksize):
+        chunk = frame.iloc[start:start + chunksize]
+        accumulator.update(chunk["y_true"], chunk["y_pred"], chunk[["gender", "race"]])
+    assert accumulator.rows == len(frame)
+    table = accumulator.group_table().set_index(["gender", "race"]).sort_index()
+    expected = one_shot(frame, ["gender", "race"])
+    expected = expected[expected.sum(axis=1) > 0]
+    pd.testing.assert_frame_equal(table, expected, check_names=False)
+    pd.testing.assert_frame_equal(accumulator.to_metrics(["gender"]).by_group,
+                                  disaggregate(frame["y_true"], frame["y_pred"], frame["gender"]).by_group)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_ingest_split_files(tmp_path, predictions, fmt):
+    # Labels, predictions and features in three files with different chunk boundaries.
+    paths = []
+    for i, columns in enumerate([["y_true"], ["y_pred", "gender"], ["race"]]):
+        path = tmp_path / f"part{i}.{fmt}"
+        getattr(predictions[columns], f"to_{fmt}")(path, index=False)
+        paths.append(path)
+    accumulator = ingest_files(paths, "y_true", "y_pred", ["gender", "race"], chunksize=3_333)
+    table = accumulator.group_table().set_index(["gender", "race"]).sort_index()
+    pd.testing.assert_frame_equal(table, one_shot(predictions, ["gender", "race"]), check_names=False)
+
+
+def test_aligned_chunks_rebuffer_uneven_boundaries(predictions):
+    frame = predictions[["y_true", "y_pred"]].head(1_000)
+    left = [frame[["y_true"]].iloc[s:s + 300] for s in range(0, 1_000, 300)]
+    right = [frame[["y_pred"]].iloc[s:s + 450] for s in range(0, 1_000, 450)]
+    chunks = list(iter_aligned_chunks([left, right]))
+    assert [len(chunk) for chunk in chunks] == [300, 150, 150, 300, 100]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), frame)
+
+
+def test_misaligned_row_counts_raise(tmp_path, predictions):
+    predictions[["y_true"]].to_csv(tmp_path / "labels.csv", index=False)
+    predictions[["y_pred", "gender"]].head(9_999).to_csv(tmp_path / "preds.csv", index=False)
+    with pytest.raises(ValueError, match="different numbers of rows"):
+        ingest_files([tmp_path / "labels.csv", tmp_path / "preds.csv"], "y_true", "y_pred", ["gender"], chunksize=4_000)
+    with pytest.raises(ValueError, match="different numbers of rows"):
+        list(iter_aligned_chunks([iter_chunks(tmp_path / "labels.csv", chunksize=10_000),
+                                  iter_chunks(tmp_path / "preds.csv", chunksize=10_000)]))
+
+
+def test_missing_sensitive_values_raise():
+    accumulator = ConfusionAccumulator(["gender"])
+    with pytest.raises(ValueError, match="missing values"):
+        accumulator.update([1, 0], [1, 1], pd.DataFrame({"gender": ["F", None]}))
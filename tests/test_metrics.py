@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.metrics import METRICS, DisaggregatedMetrics, disaggregate
+
+fairlearn_metrics = pytest.importorskip("fairlearn.metrics")
+sklearn_metrics = pytest.importorskip("sklearn.metrics")
+
+
+def metric_frame(y_true, y_pred, sensitive_features):
+    return fairlearn_metrics.MetricFrame(
+        metrics={
+            "accuracy": sklearn_metrics.accuracy_score,
+            "selection_rate": fairlearn_metrics.selection_rate,
+            "true_positive_rate": fairlearn_metrics.true_positive_rate,
+            "false_positive_rate": fairlearn_metrics.false_positive_rate,
+        },
+        y_true=y_true, y_pred=y_pred, sensitive_features=sensitive_features,
+    )
+
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    sensitive = pd.DataFrame({"gender": rng.choice(["F", "M", "X"], n), "age": rng.choice(["<30", "30-50", ">50"], n)})
+    return rng.integers(0, 2, n), rng.integers(0, 2, n), sensitive
+
+
+def test_single_feature_matches_metric_frame(predictions):
+    y_true, y_pred, sensitive = predictions
+    ours = disaggregate(y_true, y_pred, sensitive["gender"])
+    theirs = metric_frame(y_true, y_pred, sensitive["gender"])
+    pd.testing.assert_frame_equal(ours.by_group, theirs.by_group[list(METRICS)], check_dtype=False, check_names=False)
+    pd.testing.assert_series_equal(ours.overall, theirs.overall[list(METRICS)], check_names=False)
+    for method in ("between_groups", "to_overall"):
+        pd.testing.assert_series_equal(ours.difference(method), theirs.difference(method=method)[list(METRICS)], check_names=False)
+        pd.testing.assert_series_equal(ours.ratio(method), theirs.ratio(method=method)[list(METRICS)], check_names=False)
+
+
+def test_intersections_match_metric_frame(predictions):
+    y_true, y_pred, sensitive = predictions
+    # Drop one combination entirely: it must come out as NaN, as in MetricFrame.
+    keep = ~((sensitive["gender"] == "X") & (sensitive["age"] == ">50")).to_numpy()
+    y_true, y_pred, sensitive = y_true[keep], y_pred[keep], sensitive[keep].reset_index(drop=True)
+    ours = disaggregate(y_true, y_pred, sensitive)
+    theirs = metric_frame(y_true, y_pred, sensitive)
+    expected = theirs.by_group[list(METRICS)].reindex(ours.by_group.index)
+    pd.testing.assert_frame_equal(ours.by_group, expected, check_dtype=False)
+    assert ours.by_group.loc[("X", ">50")].isna().all()
+
+
+def test_empty_denominators_are_zero():
+    # Group "b" has no positives and no negatives in y_true respectively.
+    metrics = disaggregate([0, 0, 1, 1], [1, 0, 1, 0], ["a", "a", "b", "b"])
+    assert metrics.by_group.loc["a", "true_positive_rate"] == 0.0
+    assert metrics.by_group.loc["b", "false_positive_rate"] == 0.0
+
+
+def test_group_table_matches_predictions(predictions):
+    y_true, y_pred, sensitive = predictions
+    rows = sensitive.assign(y_true=y_true, y_pred=y_pred)
+    table = rows.groupby(["gender", "age"]).apply(lambda g: pd.Series({
+        "tn": ((g.y_true == 0) & (g.y_pred == 0)).sum(), "fp": ((g.y_true == 0) & (g.y_pred == 1)).sum(),
+        "fn": ((g.y_true == 1) & (g.y_pred == 0)).sum(), "tp": ((g.y_true == 1) & (g.y_pred == 1)).sum(),
+    }), include_groups=False).reset_index()
+    pd.testing.assert_frame_equal(DisaggregatedMetrics.from_group_table(table, ["gender"]).by_group,
+                                  disaggregate(y_true, y_pred, sensitive["gender"]).by_group, check_names=False)
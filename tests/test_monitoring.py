@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.metrics import DisaggregatedMetrics
+from fairness_audit.monitoring import SEVERITIES, DriftMonitor
+
+START = pd.Timestamp("2026-01-01")
+
+
+def stream(n, days, seed=0, groups=("A", "B"), drift_after=None):
+    rng = np.random.default_rng(seed)
+    offsets = np.sort(rng.integers(0, days * 86_400, n))
+    group = rng.choice(list(groups), n)
+    approval = np.full(n, 0.5)
+    if drift_after is not None:
+        approval[(offsets > drift_after * 86_400) & (group == groups[-1])] = 0.2
+    return pd.DataFrame({
+        "timestamp": START + pd.to_timedelta(offsets, unit="s"),
+        "group": group,
+        "y_true": rng.integers(0, 2, n),
+        "y_pred": (rng.random(n) < approval).astype(int),
+    })
+
+
+def replay(log, batch_sizes=(5_000,), **options):
+    monitor = DriftMonitor(**options)
+    start, sizes = 0, iter(np.resize(batch_sizes, len(log)))
+    while start < len(log):
+        batch = log.iloc[start:start + next(sizes)]
+        monitor.update(batch["timestamp"], batch["group"], batch["y_true"].to_numpy(), batch["y_pred"].to_numpy())
+        start += len(batch)
+    monitor.flush()
+    return monitor
+
+
+def test_sliding_window_matches_recomputation():
+    # A day-long hole in the log checks that empty buckets slide out too.
+    log = stream(20_000, 6, seed=1)
+    log = log[(log["timestamp"] < START + pd.Timedelta("2D")) | (log["timestamp"] >= START + pd.Timedelta("3D"))]
+    monitor = replay(log, batch_sizes=[1, 997, 3_000, 42], bucket="1h", window=5, min_count=1)
+    history = monitor.history()
+
+    bucket = log["timestamp"].dt.floor("1h")
+    for window_end in history["window_end"].unique()[::7]:
+        in_window = log[(bucket >= window_end - pd.Timedelta("5h")) & (bucket < window_end)]
+        expected = DisaggregatedMetrics.from_predictions(in_window["y_true"], in_window["y_pred"], in_window["group"])
+        rows = history[history["window_end"] == window_end].set_index("group")
+        for group, row in rows.iterrows():
+            sizes = expected.group_size.reindex([group], fill_value=0)
+            assert row["count"] == sizes.iloc[0]
+            if sizes.iloc[0]:
+                assert row["selection_rate"] == pytest.approx(expected.by_group.loc[group, "selection_rate"])
+
+
+def test_late_events_are_counted_not_used():
+    monitor = DriftMonitor(bucket="1h", window=3)
+    later = START + pd.to_timedelta(np.arange(10), unit="h")
+    monitor.update(later, ["A", "B"] * 5, [1] * 10, [1] * 10)
+    earlier = START + pd.to_timedelta([1, 2, 9.5, 20], unit="h")   # two before the open bucket
+    monitor.update(earlier, ["A"] * 4, [0] * 4, [0] * 4)
+    assert monitor.late_events == 2
+    assert monitor.events == 12
+
+
+def test_alerts_fire_once_per_severity_rise():
+    monitor = DriftMonitor(thresholds={"cusum": (6.0, 10.0)})
+    values = [0.0, 5.0, 7.0, 8.0, 11.0, 12.0, 7.0, 3.0, 7.0]
+    raised = [alert.severity for value in values for alert in monitor._check(START, "A", "cusum", value)]
+    assert raised == ["Warning", "Critical", "Warning"]
+
+
+def test_sustained_drift_raises_each_severity_once():
+    monitor = replay(stream(200_000, 14, seed=2, drift_after=9), bucket="1h", window=24)
+    alerts = monitor.alert_table()
+    drifted = alerts[alerts["group"] == "B"]
+    assert set(drifted["test"]) >= {"cusum", "psi"}
+    for test, rows in drifted.groupby("test"):
+        assert list(rows["severity"]) == list(SEVERITIES)
+        assert (rows["window_end"] > START + pd.Timedelta("9D")).all()
+    assert (alerts[alerts["test"] == "disparity"]["severity"] == "Critical").any()
+
+
+@pytest.mark.parametrize("days", [7, 30])
+def test_defaults_do_not_alarm_on_a_small_random_log(days):
+    for seed in range(3):
+        assert replay(stream(5_000, days, seed=seed)).alert_table().empty
+
+
+@pytest.mark.parametrize("n", [50_000, 500_000])
+def test_defaults_rarely_warn_on_a_stationary_month(n):
+    # A month of hourly buckets gives each of the seven group-test series 720
+    # chances to alarm; allow a stray warning or two, never a Critical.
+    for seed in range(3):
+        alerts = replay(stream(n, 30, seed=seed, groups=("A", "B", "C"))).alert_table()
+        assert (alerts["severity"] == "Warning").sum() <= 2 and not (alerts["severity"] == "Critical").any()
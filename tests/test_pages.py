@@ -0,0 +1,60 @@
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.ingest import ConfusionAccumulator
+from ui.upload import SESSION_KEY
+
+testing = pytest.importorskip("streamlit.testing.v1")
+
+PARTS = Path(__file__).resolve().parents[1] / "parts"
+
+
+def uploaded_audit(columns, n=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    audit = ConfusionAccumulator(list(columns))
+    audit.update(rng.integers(0, 2, n), rng.integers(0, 2, n),
+                 pd.DataFrame({column: rng.choice(levels, n) for column, levels in columns.items()}))
+    return audit
+
+
+def run_page(name, audit):
+    app = testing.AppTest.from_file(str(PARTS / name), default_timeout=120)
+    app.session_state[SESSION_KEY] = audit
+    return app.run()
+
+
+def test_heatmap_with_two_uploaded_attributes():
+    app = run_page("part2_organizational_integration.py", uploaded_audit({"gender": ["F", "M"], "region": ["N", "S", "W"]}))
+    assert not app.exception
+    assert "p2_heatmap_order" not in [slider.key for slider in app.slider]
+    assert any("subgroups of up to 2 attributes" in caption.value for caption in app.caption)
+
+
+def test_heatmap_order_slider_with_three_uploaded_attributes():
+    app = run_page("part2_organizational_integration.py",
+                   uploaded_audit({"gender": ["F", "M"], "region": ["N", "S"], "age": ["<30", "30+"]}))
+    assert not app.exception
+    assert app.slider(key="p2_heatmap_order").value == 3
+
+
+def alert_metrics(app):
+    return {metric.label: int(metric.value.replace(",", "")) for metric in app.metric if metric.label.startswith("Alerts")}
+
+
+def test_escalation_console_routes_a_burst():
+    app = testing.AppTest.from_file(str(PARTS / "part2_organizational_integration.py"), default_timeout=120).run()
+    assert not app.exception
+    routed = alert_metrics(app)["Alerts routed"]
+    app.select_slider(key="p2_escalation_burst").set_value(100)
+    app.button(key="p2_escalation_submit").click().run()
+    for _ in range(50):
+        assert not app.exception
+        if alert_metrics(app)["Alerts waiting to be routed"] == 0:
+            break
+        time.sleep(0.1)
+        app.run()
+    assert alert_metrics(app) == {"Alerts routed": routed + 100, "Alerts waiting to be routed": 0}
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.parity import check_demographic_parity, selection_rates, threshold_sweep
+
+
+@pytest.fixture
+def scores():
+    rng = np.random.default_rng(5)
+    n = 3_000
+    # Rounded scores so that many rows tie with each other and with the thresholds.
+    return np.round(rng.random(n), 2), rng.choice(["A", "B", "C"], n, p=[0.5, 0.3, 0.2])
+
+
+def brute_force_sweep(scores, groups, thresholds):
+    rates = pd.DataFrame({t: pd.Series(scores >= t).groupby(groups).mean() for t in thresholds}).T
+    rates.index.name = "threshold"
+    return rates
+
+
+@pytest.mark.parametrize("thresholds", [
+    np.array([0.0, 0.25, 0.5, 0.5, 0.99, 1.0, 1.5]),   # duplicates, ties with scores, beyond the maximum
+    np.array([0.7, -1.0, 0.3]),                         # unsorted, below the minimum
+])
+def test_threshold_sweep_matches_per_threshold_loop(scores, thresholds):
+    values, groups = scores
+    rates, disparity = threshold_sweep(values, groups, thresholds)
+    expected = brute_force_sweep(values, groups, np.unique(thresholds))
+    pd.testing.assert_frame_equal(rates, expected, check_names=False, check_column_type=False)
+    np.testing.assert_allclose(disparity, expected.max(axis=1) - expected.min(axis=1))
+
+
+def test_threshold_sweep_with_a_count_spans_the_scores(scores):
+    values, groups = scores
+    rates, disparity = threshold_sweep(values, groups, thresholds=11)
+    np.testing.assert_allclose(rates.index, np.linspace(values.min(), values.max(), 11))
+    pd.testing.assert_frame_equal(rates, brute_force_sweep(values, groups, rates.index),
+                                  check_names=False, check_column_type=False)
+    assert (rates.iloc[0] == 1).all()
+
+
+def test_threshold_sweep_agrees_with_the_parity_check(scores):
+    values, groups = scores
+    _, disparity = threshold_sweep(values, groups, [0.4])
+    check = check_demographic_parity(values >= 0.4, groups)
+    assert disparity.iloc[0] == pytest.approx(check.disparity)
+
+
+def test_selection_rates_skip_empty_groups():
+    groups = pd.Categorical(["A", "A", "B", "B"], categories=["A", "B", "C"])
+    rates = selection_rates([1, 0, 1, 1], groups)
+    assert rates.to_dict() == {"A": 0.5, "B": 1.0}
+
+
+def test_parity_check_fails_at_exactly_the_threshold():
+    groups = ["A"] * 4 + ["B"] * 4
+    predictions = [1, 1, 0, 0] + [1, 0, 0, 0]   # rates 0.5 and 0.25, both exact in binary
+    at = check_demographic_parity(predictions, groups, threshold=0.25)
+    assert at.disparity == 0.25
+    assert not at.passed
+    assert check_demographic_parity(predictions, groups, threshold=np.nextafter(0.25, 1)).passed
+
+
+def test_parity_check_positive_label():
+    groups = ["A", "A", "B", "B"]
+    check = check_demographic_parity(["yes", "no", "yes", "yes"], groups, pos_label="yes")
+    assert check.disparity == 0.5
+    assert check.selection_rates.to_dict() == {"A": 0.5, "B": 1.0}
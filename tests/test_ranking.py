@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.ranking import fair_rerank, position_discounts, top_k, tradeoff_curve
+
+
+@pytest.fixture
+def catalog():
+    rng = np.random.default_rng(2)
+    n_users, n_items = 20, 3_000
+    groups = np.where(rng.random(n_items) < 0.7, "major", "minor")
+    scores = rng.normal(0.0, 1.0, (n_users, n_items)) - 0.5 * (groups == "minor")
+    return scores, groups
+
+
+def full_sort(scores, groups, boost, k):
+    boosted = scores + boost * (groups == "minor")
+    ranking = np.argsort(-boosted, axis=-1, kind="stable")[..., :k]
+    floor = scores.min(axis=-1, keepdims=True)
+    discounts = position_discounts(k)
+    gain = ((np.take_along_axis(scores, ranking, axis=-1) - floor) * discounts).sum()
+    ideal = ((-np.sort(-scores, axis=-1)[..., :k] - floor) * discounts).sum()
+    return ranking, gain / ideal
+
+
+def test_top_k_matches_full_sort(catalog):
+    scores, _ = catalog
+    np.testing.assert_array_equal(top_k(scores, 25), np.argsort(-scores, axis=-1, kind="stable")[:, :25])
+
+
+@pytest.mark.parametrize("boost", [0.0, 0.3, 2.0])
+def test_fair_rerank_matches_full_sort(catalog, boost):
+    scores, groups = catalog
+    result = fair_rerank(scores, groups, "minor", boost, k=30)
+    ranking, retained = full_sort(scores, groups, boost, 30)
+    np.testing.assert_array_equal(result.ranking, ranking)
+    assert result.relevance_retained == pytest.approx(retained)
+
+    exposure = pd.Series(np.broadcast_to(position_discounts(30), ranking.shape).ravel()).groupby(groups[ranking].ravel()).sum()
+    np.testing.assert_allclose(result.exposure["exposure_share"], exposure / exposure.sum())
+    np.testing.assert_allclose(result.exposure["catalog_share"], pd.Series(groups).value_counts(normalize=True).sort_index())
+
+
+def test_fair_rerank_single_list(catalog):
+    scores, groups = catalog
+    result = fair_rerank(scores[0], groups, ["minor"], 0.5, k=10)
+    np.testing.assert_array_equal(result.ranking, full_sort(scores[:1], groups, 0.5, 10)[0][0])
+
+
+def test_relevance_retained_with_negative_scores(catalog):
+    scores, groups = catalog
+    negative = scores - 10.0
+    result = fair_rerank(negative, groups, "minor", 1.0, k=30)
+    assert 0.0 <= result.relevance_retained <= 1.0
+    assert result.relevance_retained == pytest.approx(fair_rerank(scores, groups, "minor", 1.0, k=30).relevance_retained)
+    assert fair_rerank(negative, groups, "minor", 0.0, k=30).relevance_retained == 1.0
+
+
+def test_tradeoff_curve_matches_fair_rerank(catalog):
+    scores, groups = catalog
+    curve = tradeoff_curve(scores, groups, "minor", boosts=[0.0, 0.25, 0.5, 1.0], k=20)
+    for boost, row in curve.summary.iterrows():
+        result = fair_rerank(scores, groups, "minor", boost, k=20)
+        assert row["exposure_gap"] == pytest.approx(result.exposure_gap)
+        assert row["relevance_retained"] == pytest.approx(result.relevance_retained)
+        np.testing.assert_allclose(curve.exposure_share.loc[boost], result.exposure["exposure_share"])
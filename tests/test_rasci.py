@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.rasci import LETTERS, RULES, RasciMatrix
+
+WIDE = pd.DataFrame({
+    "task": ["Sound task", "Orphan task", "No owner", "Two owners", "Nobody does it"],
+    "Product Manager": ["A", "", "R", "A", "A (for high-risk)"],
+    "Data Scientist": ["R", None, "C", "A (for high-risk)", "C"],
+    "Legal": ["C", "-", "I", "R", "S"],
+})
+
+
+def brute_force_issues(frame):
+    issues = set()
+    for _, row in frame.iterrows():
+        letters = [str(cell).strip()[0] for cell in row.iloc[1:] if isinstance(cell, str) and cell.strip() not in ("", "-")]
+        if not letters:
+            issues.add((row["task"], "orphan"))
+            continue
+        if letters.count("A") == 0:
+            issues.add((row["task"], "no_accountable"))
+        if letters.count("A") > 1:
+            issues.add((row["task"], "multiple_accountable"))
+        if letters.count("R") == 0:
+            issues.add((row["task"], "no_responsible"))
+    return issues
+
+
+def random_wide(tasks, roles, seed):
+    rng = np.random.default_rng(seed)
+    cells = rng.choice(["", "R", "A", "S", "C", "I", "A (interim)"], size=(tasks, roles), p=[0.7, 0.08, 0.04, 0.04, 0.06, 0.06, 0.02])
+    frame = pd.DataFrame(cells, columns=[f"role-{r}" for r in range(roles)])
+    frame.insert(0, "task", [f"task-{t}" for t in range(tasks)])
+    return frame
+
+
+def test_validate_applies_every_rule():
+    issues = RasciMatrix.from_frame(WIDE).validate()
+    assert set(zip(issues["task"], issues["rule"])) == {
+        ("Orphan task", "orphan"),
+        ("No owner", "no_accountable"),
+        ("Two owners", "multiple_accountable"),
+        ("Nobody does it", "no_responsible"),
+    }
+    assert list(issues["rule"].cat.categories) == list(RULES)
+    detail = issues.loc[issues["rule"] == "multiple_accountable", "detail"].iloc[0]
+    assert detail == "Accountable: Product Manager, Data Scientist (for high-risk)."
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_validate_matches_brute_force(seed):
+    frame = random_wide(300, 12, seed)
+    issues = RasciMatrix.from_frame(frame).validate()
+    assert set(zip(issues["task"], issues["rule"])) == brute_force_issues(frame)
+
+
+def test_long_and_wide_layouts_agree():
+    frame = random_wide(200, 8, seed=3)
+    wide = RasciMatrix.from_frame(frame)
+    long = frame.melt(id_vars="task", var_name="role", value_name="assignment")
+    long = long[long["assignment"] != ""]
+    from_long = RasciMatrix.from_long(long)
+    pd.testing.assert_frame_equal(from_long.page(np.arange(len(from_long.tasks)), list(wide.roles)),
+                                  wide.page(wide.tasks.get_indexer(from_long.tasks)))
+
+
+def test_read_wide_file_in_chunks(tmp_path):
+    frame = random_wide(500, 6, seed=4)
+    path = tmp_path / "rasci.csv"
+    frame.to_csv(path, index=False)
+    matrix = RasciMatrix.read(path)
+    pd.testing.assert_frame_equal(matrix.to_frame(), RasciMatrix.from_frame(frame).to_frame())
+
+
+def test_lookups_match_brute_force():
+    frame = random_wide(400, 10, seed=5)
+    matrix = RasciMatrix.from_frame(frame)
+    for role in matrix.roles:
+        for letter in LETTERS:
+            expected = [task for task, cell in zip(frame["task"], frame[role]) if cell[:1] == letter]
+            assert list(matrix.tasks_for(role, letter)) == expected
+    row = frame.iloc[7]
+    assert matrix.roles_for(row["task"]) == {role: cell[0] for role, cell in row.iloc[1:].items() if cell}
+
+
+def test_rejects_unknown_letters_and_duplicates():
+    with pytest.raises(ValueError, match="Cells must hold"):
+        RasciMatrix.from_frame(pd.DataFrame({"task": ["t"], "Role": ["X"]}))
+    with pytest.raises(ValueError, match="more than once"):
+        RasciMatrix.from_long(pd.DataFrame({"task": ["t", "t"], "role": ["r", "r"], "assignment": ["R", "A"]}))
+    with pytest.raises(ValueError, match="Duplicate task"):
+        RasciMatrix.from_frame(pd.DataFrame({"task": ["t", "t"], "Role": ["R", "A"]}))
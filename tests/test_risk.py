@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.risk import FACTORS, RISK_TABLE, TIERS, assess_risk, risk_table, risk_tier, risk_tiers
+
+
+@pytest.mark.parametrize("score, tier", [
+    (4, 0), (7.5, 0), (7.999999999999, 1), (8, 1), (12, 1), (12.000000000001, 1), (12.1, 2), (12.89, 2), (13, 2), (20, 2),
+])
+def test_tier_boundaries(score, tier):
+    assert risk_tier(score) == TIERS[tier]
+    assert risk_tiers([score])[0] == TIERS[tier]
+
+
+def test_fractional_weights_above_12_are_high_risk():
+    table = risk_table({"domain_impact": 1, "autonomy": 1, "decision_impact": 2, "scale": 5})
+    between = table[(table["score"] > 12) & (table["score"] < 13)]
+    assert len(between) == 5
+    assert (between["tier"] == TIERS[2]).all()
+    assert list(table["tier"]) == [risk_tier(score) for score in table["score"]]
+
+
+def test_risk_table_matches_assess_risk():
+    for levels, row in RISK_TABLE.iterrows():
+        assessment = assess_risk(*levels)
+        assert row["score"] == assessment.score
+        assert row["tier"] == assessment.tier
+
+
+@pytest.mark.parametrize("weights", [None, {"domain_impact": 1, "autonomy": 1, "decision_impact": 2, "scale": 5}])
+def test_nearest_tier_flips_match_brute_force(weights):
+    table = risk_table(weights)
+    for levels, row in table.iterrows():
+        for direction, crosses in (("down", np.less), ("up", np.greater)):
+            candidates = []
+            for position, factor in enumerate(FACTORS):
+                for level in FACTORS[factor]:
+                    changed = levels[:position] + (level,) + levels[position + 1:]
+                    other = table.loc[changed]
+                    if crosses(TIERS.index(other["tier"]), TIERS.index(row["tier"])):
+                        candidates.append(abs(other["score"] - row["score"]))
+            if candidates:
+                assert abs(row[f"{direction}_score"] - row["score"]) == pytest.approx(min(candidates))
+                assert TIERS.index(row[f"{direction}_tier"]) != TIERS.index(row["tier"])
+            else:
+                assert pd.isna(row[f"{direction}_factor"])
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from fairness_audit.counterfactual import StubBackend
+from fairness_audit.stereotypes import StereotypeLexicon, score_texts, stereotype_rates
+
+NEUTRAL = [
+    "A collaborative and supportive engineer and a great team player.",
+    "She is articulate, gentle with new hires and sensitive to customer needs.",
+    "Speaks English with a slight accent and takes an unconventional approach to testing.",
+    "Led the migration of the billing service to Kubernetes ahead of schedule.",
+    "",
+]
+
+
+def test_neutral_text_scores_zero():
+    scored = score_texts(NEUTRAL)
+    assert (scored["total"] == 0).all()
+
+
+def test_stub_neutral_replies_score_zero():
+    replies = [f"A professional who {summary}" for summary in StubBackend.SUMMARIES]
+    assert (score_texts(replies)["total"] == 0).all()
+
+
+def test_every_stub_stereotype_is_in_the_lexicon():
+    lexicon = StereotypeLexicon()
+    for identity, descriptor in StubBackend.STEREOTYPES.items():
+        assert lexicon.matches(descriptor), identity
+
+
+def test_hits_by_category():
+    lexicon = StereotypeLexicon()
+    assert lexicon.matches("Bossy, and SET IN HER WAYS; an idiot with a heavy accent.") == [
+        ("bossy", "gender"), ("set in her ways", "age"), ("idiot", "toxicity"), ("heavy accent", "origin")]
+    # Whole words only.
+    assert lexicon.matches("Uncaring trashy illegality") == []
+
+
+def test_batches_match_a_single_scan():
+    rng = np.random.default_rng(0)
+    words = ["caring", "engineer", "lazy", "out of touch", "team", "exotic", "the"]
+    texts = [" ".join(rng.choice(words, rng.integers(0, 8))) for _ in range(500)]
+    lexicon = StereotypeLexicon()
+    expected = np.array([[sum(c == category for _, c in lexicon.matches(text)) for category in lexicon.categories]
+                         for text in texts])
+    np.testing.assert_array_equal(lexicon.hits(texts, batch_size=7), expected)
+    np.testing.assert_array_equal(lexicon.hits(texts), expected)
+
+
+def test_stereotype_rates_per_group():
+    scored = score_texts(["caring nurse", "good nurse", "lazy idiot", "fine"])
+    rates = stereotype_rates(scored, ["a", "a", "b", "b"])
+    assert rates.loc["a", "gender"] == 0.5 and rates.loc["b", "toxicity"] == 0.5
+    assert rates.loc["b", "per_1k_tokens"] == 1000 * 2 / 3
+    pd.testing.assert_series_equal(rates["documents"], pd.Series([2, 2], index=pd.Index(["a", "b"], name="group"),
+                                                                 name="documents"), check_index_type=False)
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.metrics import disaggregate
+from fairness_audit.store import MetricStore
+
+
+@pytest.fixture
+def observations():
+    rng = np.random.default_rng(4)
+    n = 3_000
+    return pd.DataFrame({
+        "model": rng.choice(["screener", "ranker"], n),
+        "group": rng.choice(["A", "B", "C"], n),
+        "metric": rng.choice(["accuracy", "selection_rate"], n),
+        # Spans week boundaries; 2026-01-05 is a Monday.
+        "timestamp": pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 40 * 86_400, n), unit="s"),
+        "value": rng.random(n),
+        "count": rng.integers(1, 500, n),
+    })
+
+
+@pytest.fixture
+def store(observations):
+    store = MetricStore()
+    # Several batches, so rollup rows are upserted into as well as inserted.
+    shuffled = observations.sample(frac=1, random_state=0)
+    for start in range(0, len(shuffled), 450):
+        store.record(shuffled.iloc[start:start + 450])
+    yield store
+    store.close()
+
+
+def recompute(observations, period):
+    starts = observations["timestamp"].dt.floor("D")
+    if period == "week":
+        starts = starts - pd.to_timedelta(starts.dt.dayofweek, unit="D")
+    frame = observations.assign(period_start=starts, weighted=observations["value"] * observations["count"])
+    grouped = frame.groupby(["model", "metric", "period_start", "group"])
+    return pd.DataFrame({
+        "value": grouped["weighted"].sum() / grouped["count"].sum(),
+        "count": grouped["count"].sum(),
+        "value_min": grouped["value"].min(),
+        "value_max": grouped["value"].max(),
+    })
+
+
+@pytest.mark.parametrize("period", ["day", "week"])
+def test_rollups_match_recomputation(store, observations, period):
+    table = store.rollup(period).set_index(["model", "metric", "period_start", "group"]).sort_index()
+    expected = recompute(observations, period).sort_index()
+    assert list(table.index) == list(expected.index)
+    np.testing.assert_allclose(table["value"], expected["value"])
+    np.testing.assert_array_equal(table["count"], expected["count"])
+    np.testing.assert_allclose(table[["value_min", "value_max"]], expected[["value_min", "value_max"]])
+
+
+def test_week_starts_on_monday(store):
+    starts = store.rollup("week")["period_start"]
+    assert (starts.dt.dayofweek == 0).all()
+
+
+def test_range_queries_match_recomputation(store, observations):
+    start, end = pd.Timestamp("2026-01-05"), pd.Timestamp("2026-01-19")
+    selected = observations[(observations["timestamp"] >= start) & (observations["timestamp"] < end)
+                            & (observations["metric"] == "accuracy")]
+    weighted = (selected["value"] * selected["count"]).groupby([selected["model"], selected["group"]]).sum()
+    expected = weighted / selected.groupby(["model", "group"])["count"].sum()
+
+    summary = store.group_summary("accuracy", start, end).set_index(["model", "group"])["value"]
+    np.testing.assert_allclose(summary.sort_index(), expected.sort_index())
+    disparity = store.disparity("accuracy", start, end)
+    np.testing.assert_allclose(disparity, expected.groupby(level="model").agg(np.ptp).sort_index())
+
+
+def test_record_skips_missing_values_and_checks_columns():
+    store = MetricStore()
+    frame = pd.DataFrame({"model": ["m", "m"], "group": ["A", "B"], "metric": ["accuracy"] * 2,
+                          "timestamp": [pd.Timestamp("2026-01-01")] * 2, "value": [0.5, np.nan], "count": [10, 10]})
+    assert store.record(frame) == 1
+    assert store.raw_rows() == 1
+    with pytest.raises(ValueError, match="missing"):
+        store.record(frame.drop(columns="count"))
+    store.close()
+
+
+def test_record_metrics_stores_every_group_and_metric():
+    rng = np.random.default_rng(0)
+    metrics = disaggregate(rng.integers(0, 2, 400), rng.integers(0, 2, 400), rng.choice(["A", "B"], 400))
+    store = MetricStore()
+    rows = store.record_metrics("model", metrics, timestamp="2026-03-02")
+    assert rows == metrics.by_group.size
+    summary = store.group_summary("accuracy").set_index("group")
+    np.testing.assert_allclose(summary["value"], metrics.by_group["accuracy"])
+    np.testing.assert_array_equal(summary["count"], metrics.group_size)
+    store.close()
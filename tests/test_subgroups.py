@@ -0,0 +1,67 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fairness_audit.ingest import ConfusionAccumulator
+from fairness_audit.metrics import METRICS, disaggregate
+from fairness_audit.subgroups import COUNT_COLUMNS, SubgroupLattice, subgroup_lattice, worst_subgroups
+
+
+@pytest.fixture
+def predictions():
+    rng = np.random.default_rng(1)
+    n = 5_000
+    sensitive = pd.DataFrame({
+        "gender": rng.choice(["F", "M"], n),
+        "race": rng.choice(["A", "B", "C", "D"], n, p=[0.6, 0.25, 0.1, 0.05]),
+        "age": rng.choice(["<30", "30-50", ">50"], n),
+        "disability": rng.choice(["no", "yes"], n, p=[0.95, 0.05]),
+    })
+    return rng.integers(0, 2, n), rng.integers(0, 2, n), sensitive
+
+
+def brute_force(y_true, y_pred, sensitive, max_order, min_support):
+    # Every attribute combination grouped directly over the rows.
+    found = {}
+    for order in range(1, max_order + 1):
+        for combo in itertools.combinations(sensitive.columns, order):
+            for key, rows in sensitive.groupby(list(combo) if order > 1 else combo[0]).groups.items():
+                if len(rows) >= min_support:
+                    key = key if order > 1 else (key,)
+                    found[tuple(zip(combo, key))] = disaggregate(y_true[rows], y_pred[rows], np.zeros(len(rows))).overall
+    return found
+
+
+@pytest.mark.parametrize("max_order, min_support", [(None, 1), (None, 30), (2, 100)])
+def test_lattice_matches_brute_force(predictions, max_order, min_support):
+    y_true, y_pred, sensitive = predictions
+    subgroups = subgroup_lattice(y_true, y_pred, sensitive, max_order=max_order, min_support=min_support)
+    expected = brute_force(y_true, y_pred, sensitive, max_order or sensitive.shape[1], min_support)
+
+    assert len(subgroups) == len(expected)
+    for _, row in subgroups.iterrows():
+        key = tuple((name, row[name]) for name in sensitive.columns if row[name] is not None)
+        assert len(key) == row["order"]
+        assert row["count"] == row[list(COUNT_COLUMNS)].sum() >= min_support
+        np.testing.assert_allclose(row[list(METRICS)].to_numpy(dtype=float), expected[key].to_numpy())
+
+
+def test_group_table_matches_predictions(predictions):
+    y_true, y_pred, sensitive = predictions
+    accumulator = ConfusionAccumulator(list(sensitive.columns))
+    accumulator.update(y_true, y_pred, sensitive)
+    from_table = SubgroupLattice.from_group_table(accumulator.group_table(), sensitive.columns).enumerate(min_support=30)
+    from_rows = subgroup_lattice(y_true, y_pred, sensitive, min_support=30)
+    columns = ["subgroup", "count", *METRICS]
+    pd.testing.assert_frame_equal(from_table[columns].sort_values("subgroup", ignore_index=True),
+                                  from_rows[columns].sort_values("subgroup", ignore_index=True))
+
+
+def test_worst_subgroups_orders_by_metric(predictions):
+    y_true, y_pred, sensitive = predictions
+    subgroups = subgroup_lattice(y_true, y_pred, sensitive, min_support=30)
+    worst = worst_subgroups(subgroups, k=5, metric="false_positive_rate", min_order=2)
+    assert (worst["order"] >= 2).all()
+    assert worst["false_positive_rate"].iloc[0] == subgroups.loc[subgroups["order"] >= 2, "false_positive_rate"].max()
@@ -0,0 +1 @@
+"""Streamlit components shared by several playbook pages."""
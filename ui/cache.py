@@ -0,0 +1,125 @@
+"""Process-wide caches with hit-rate counters.
+
+Page scripts are re-executed on every rerun of every session. Their string
+literals (templates, bibliographies) cost nothing extra, since Streamlit
+compiles each page once per process and reuses the bytecode and its
+constants. DataFrames, ``alt.Chart`` objects and their Vega-Lite
+serialization, however, are rebuilt on every run. The wrappers below put
+that work behind Streamlit's process-wide caches and count how often each
+cache is hit:
+
+* ``shared_resource`` (``st.cache_resource``) keeps one instance for all
+  sessions. Nothing is copied, so callers must treat the value as read-only.
+* ``shared_data`` (``st.cache_data``) pickles the value once and gives each
+  caller its own copy.
+* ``altair_chart`` renders a chart builder from a cached Vega-Lite spec. On
+  a hit it skips Altair's schema validation, which takes tens of
+  milliseconds per chart.
+
+Every cache holds at most ``max_entries`` entries; past that, Streamlit
+evicts the least recently used one. Set ``FAIRNESS_AUDIT_CACHE_STATS=1`` to
+show the hit-rate table in the sidebar.
+"""
+import functools
+import hashlib
+import marshal
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+
+CACHE_STATS_ENV = "FAIRNESS_AUDIT_CACHE_STATS"
+DEFAULT_MAX_ENTRIES = 32
+CHART_MAX_ENTRIES = 256
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record(name, field):
+    with _stats_lock:
+        entry = _stats.setdefault(name, {"calls": 0, "misses": 0})
+        entry[field] += 1
+
+
+def _display_name(func):
+    return f"{os.path.basename(func.__code__.co_filename)}:{func.__qualname__}"
+
+
+def _instrumented(cache, func, max_entries, cache_kwargs):
+    name = _display_name(func)
+
+    @functools.wraps(func)
+    def compute(*args, **kwargs):
+        _record(name, "misses")
+        return func(*args, **kwargs)
+
+    cached = cache(max_entries=max_entries, **cache_kwargs)(compute)
+
+    @functools.wraps(func)
+    def call(*args, **kwargs):
+        _record(name, "calls")
+        return cached(*args, **kwargs)
+
+    call.clear = cached.clear
+    return call
+
+
+def shared_resource(func=None, *, max_entries=DEFAULT_MAX_ENTRIES, **cache_kwargs):
+    """``st.cache_resource`` with hit counting. The cached value must not be mutated."""
+    if func is None:
+        return functools.partial(shared_resource, max_entries=max_entries, **cache_kwargs)
+    return _instrumented(st.cache_resource, func, max_entries, cache_kwargs)
+
+
+def shared_data(func=None, *, max_entries=DEFAULT_MAX_ENTRIES, **cache_kwargs):
+    """``st.cache_data`` with hit counting."""
+    if func is None:
+        return functools.partial(shared_data, max_entries=max_entries, **cache_kwargs)
+    return _instrumented(st.cache_data, func, max_entries, cache_kwargs)
+
+
+@st.cache_data(max_entries=CHART_MAX_ENTRIES, show_spinner=False)
+def _vega_lite_spec(builder, version, _build, args, kwargs):
+    # ``builder`` and ``version`` identify the function and its code;
+    # ``_build`` itself is not hashed. Each hit returns a fresh copy, which
+    # st.vega_lite_chart is free to modify.
+    _record(builder, "misses")
+    return _build(*args, **kwargs).to_dict()
+
+
+def altair_chart(build, *args, use_container_width=True, **kwargs):
+    """Render ``build(*args, **kwargs)``, an ``alt.Chart``, from a cached spec.
+
+    ``build`` must depend only on its arguments, which are hashed like
+    ``st.cache_data`` arguments. Editing its code invalidates its entries.
+    """
+    builder = f"chart {_display_name(build)}"
+    version = hashlib.blake2b(marshal.dumps(build.__code__), digest_size=8).hexdigest()
+    _record(builder, "calls")
+    spec = _vega_lite_spec(builder, version, build, args, kwargs)
+    st.vega_lite_chart(spec=spec, use_container_width=use_container_width)
+
+
+def cache_stats():
+    """Calls, hits and hit rate of every instrumented cache in this process."""
+    with _stats_lock:
+        rows = {name: dict(entry) for name, entry in _stats.items()}
+    table = pd.DataFrame.from_dict(rows, orient="index", columns=["calls", "misses"]).rename_axis("cache")
+    table["hits"] = table["calls"] - table["misses"]
+    table["hit_rate"] = (table["hits"] / table["calls"]).where(table["calls"] > 0)
+    return table.sort_index()
+
+
+def cache_stats_panel():
+    if not os.environ.get(CACHE_STATS_ENV):
+        return
+    with st.expander("⚙️ Cache statistics"):
+        table = cache_stats()
+        if table.empty:
+            st.caption("No cached calls yet.")
+            return
+        total_calls, total_hits = table["calls"].sum(), table["hits"].sum()
+        st.metric("Overall hit rate", f"{total_hits / total_calls:.1%}", help=f"{total_hits:,} of {total_calls:,} calls served from cache, across all sessions.")
+        st.dataframe(table, column_config={"hit_rate": st.column_config.NumberColumn("hit rate", format="percent")}, use_container_width=True)
@@ -0,0 +1,33 @@
+"""Altair charts shared by several playbook pages."""
+import altair as alt
+import pandas as pd
+
+
+def metric_interval_chart(intervals, metric, group_label="Group", title=None):
+    """Per-group point estimates with bootstrap error bars.
+
+    ``intervals`` is ``BootstrapCI.by_group``; groups from a ``MultiIndex`` are
+    shown as one comma-separated label.
+    """
+    data = intervals[metric].dropna(subset=["estimate"])
+    labels = data.index.map(lambda group: ", ".join(map(str, group)) if isinstance(group, tuple) else str(group))
+    data = pd.DataFrame({group_label: labels, **{column: data[column].to_numpy() for column in data.columns}})
+    metric_title = metric.replace('_', ' ').title()
+
+    base = alt.Chart(data).encode(
+        y=alt.Y(f'{group_label}:N', sort=alt.EncodingSortField('estimate', order='ascending'), title=group_label)
+    )
+    error_bars = base.mark_errorbar(ticks=True).encode(
+        x=alt.X('lower:Q', title=metric_title, scale=alt.Scale(zero=False)),
+        x2='upper:Q',
+    )
+    points = base.mark_point(filled=True, size=70).encode(
+        x='estimate:Q',
+        tooltip=[
+            group_label,
+            alt.Tooltip('estimate:Q', title=metric_title, format='.3f'),
+            alt.Tooltip('lower:Q', title='CI lower', format='.3f'),
+            alt.Tooltip('upper:Q', title='CI upper', format='.3f'),
+        ],
+    )
+    return (error_bars + points).properties(title=title or f'{metric_title} by {group_label} (95% bootstrap CI)')
@@ -0,0 +1,75 @@
+"""Project and sprint scope for the persisted governance-gate and Definition-of-Done checklists."""
+import os
+import tempfile
+
+import numpy as np
+import streamlit as st
+
+from fairness_audit.governance import CHECKLISTS, GOVERNANCE_ENV, GovernanceStore
+from ui.cache import shared_resource
+
+SCOPE_KEY = "governance_scope"
+DEFAULT_PROJECT = "Resume Screener"
+
+
+def _demo_rows(n_projects=3_000, seed=0):
+    # Earlier sprints are complete; in the latest one, gates pass in order
+    # up to a random stage and each DoD item is done with probability 0.7.
+    rng = np.random.default_rng(seed)
+    now = 1_790_000_000
+    gates, dod = CHECKLISTS["gates"], CHECKLISTS["dod"]
+    rows = []
+    for project, sprints, passed in zip(range(1, n_projects + 1), rng.integers(1, 13, n_projects), rng.integers(0, len(gates) + 1, n_projects)):
+        name = f"Project {project:04d}"
+        for sprint in range(1, sprints + 1):
+            updated = now - int(sprints - sprint) * 14 * 86_400
+            latest = sprint == sprints
+            rows += [(name, sprint, item, not latest or i < passed, updated) for i, item in enumerate(gates)]
+            rows += [(name, sprint, item, not latest or rng.random() < 0.7, updated) for item in dod]
+    return rows
+
+
+@shared_resource
+def governance_store():
+    # Persists across sessions and restarts. Without FAIRNESS_AUDIT_GOVERNANCE_STORE,
+    # an empty store is seeded with a synthetic portfolio for the Review Board view.
+    if os.environ.get(GOVERNANCE_ENV):
+        return GovernanceStore(os.environ[GOVERNANCE_ENV])
+    store = GovernanceStore(os.path.join(tempfile.gettempdir(), "fairness_audit_governance.db"))
+    if len(store) == 0:
+        store.record(_demo_rows())
+    return store
+
+
+def project_scope(prefix):
+    """Project and sprint selectors; the choice carries over between pages. Returns ``(project, sprint)``."""
+    store = governance_store()
+    project, sprint = st.session_state.setdefault(SCOPE_KEY, (DEFAULT_PROJECT, 1))
+    projects = store.projects()
+    if project not in projects:
+        projects.insert(0, project)
+    project_col, sprint_col = st.columns([3, 1])
+    project = project_col.selectbox("Project", projects, index=projects.index(project), accept_new_options=True,
+                                    key=f"{prefix}_project", help="Type a name to start a new project.")
+    sprint = int(sprint_col.number_input("Sprint", 1, 10_000, sprint, key=f"{prefix}_sprint"))
+    st.session_state[SCOPE_KEY] = (project, sprint)
+    return project, sprint
+
+
+def _stage(key, scope, item):
+    governance_store().stage(*scope, item, st.session_state[key])
+
+
+def persisted_checklist(checkboxes, scope):
+    """Checkboxes whose state is stored per project and sprint.
+
+    ``checkboxes`` lists ``(key, item, label)``. Widget state is (re)loaded
+    from the store when the scope changes or after a refresh; each click is
+    staged and written in debounced batches. Returns the checked states.
+    """
+    if any(key not in st.session_state or st.session_state.get(f"{key}_scope") != scope for key, _, _ in checkboxes):
+        status = governance_store().load(*scope)
+        for key, item, _ in checkboxes:
+            st.session_state[key] = status[item]
+            st.session_state[f"{key}_scope"] = scope
+    return [st.checkbox(label, key=key, on_change=_stage, args=(key, scope, item)) for key, item, label in checkboxes]
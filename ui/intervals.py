@@ -0,0 +1,22 @@
+"""Bootstrap confidence intervals for the pages, cached per set of group counts."""
+import pandas as pd
+
+from fairness_audit.bootstrap import bootstrap_ci
+from fairness_audit.metrics import DisaggregatedMetrics
+from ui.cache import shared_data
+
+
+def _index_key(index):
+    return index.to_frame(index=False)
+
+
+@shared_data(hash_funcs={pd.Index: _index_key, pd.MultiIndex: _index_key})
+def _bootstrap_ci(counts, groups, n_resamples, confidence):
+    # One process: a pool started from a Streamlit script would fork (or
+    # re-import) the server, and page-sized counts take milliseconds anyway.
+    return bootstrap_ci(DisaggregatedMetrics(counts, groups), n_resamples, confidence, n_jobs=1)
+
+
+def cached_bootstrap_ci(metrics, n_resamples=1000, confidence=0.95):
+    """``bootstrap_ci`` of a ``DisaggregatedMetrics``, computed once per distinct group counts."""
+    return _bootstrap_ci(metrics.counts, metrics.groups, n_resamples, confidence)
@@ -0,0 +1,80 @@
+"""Sidebar panel for auditing your own predictions instead of the mock data."""
+import os
+
+import streamlit as st
+
+from fairness_audit.ingest import DEFAULT_CHUNKSIZE, ingest_files, read_columns
+
+SESSION_KEY = "uploaded_audit"
+
+# Multi-GB files are better read straight from the server's disk than pushed
+# through the browser. Only paths inside this directory are accepted.
+DATA_DIR_ENV = "FAIRNESS_AUDIT_DATA_DIR"
+
+
+def get_uploaded_audit():
+    """The ``ConfusionAccumulator`` built from the user's files, or ``None``."""
+    return st.session_state.get(SESSION_KEY)
+
+
+def _parse_label(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _server_paths(text):
+    root = os.path.realpath(os.environ[DATA_DIR_ENV])
+    paths = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        path = os.path.realpath(os.path.join(root, line))
+        if os.path.commonpath([root, path]) != root or not os.path.isfile(path):
+            raise ValueError(f"{line!r} is not a file inside the data directory.")
+        paths.append(path)
+    return paths
+
+
+@st.fragment
+def upload_panel():
+    st.markdown("#### 📤 Audit Your Own Predictions")
+    st.caption("Supply `y_true`, `y_pred` and sensitive-feature columns as CSV or Parquet, in one file or several row-aligned files. Files are streamed in chunks, so only per-group counts are kept in memory.")
+
+    sources = []
+    try:
+        if os.environ.get(DATA_DIR_ENV) and st.radio("Source", ["Upload files", "Files on server"], horizontal=True, key="upload_source") == "Files on server":
+            sources = _server_paths(st.text_area(f"Paths relative to `{os.environ[DATA_DIR_ENV]}`, one per line", key="upload_paths"))
+        else:
+            sources = st.file_uploader("Prediction files", type=["csv", "parquet", "pq", "gz"], accept_multiple_files=True, key="upload_files") or []
+
+        if sources:
+            columns = list(dict.fromkeys(c for source in sources for c in read_columns(source)))
+            y_true = st.selectbox("Ground truth column (`y_true`)", columns, key="upload_y_true")
+            y_pred = st.selectbox("Prediction column (`y_pred`)", columns, index=min(1, len(columns) - 1), key="upload_y_pred")
+            sensitive = st.multiselect("Sensitive feature columns", [c for c in columns if c not in (y_true, y_pred)], key="upload_sensitive")
+            pos_label = _parse_label(st.text_input("Positive label", "1", key="upload_pos_label"))
+            chunksize = st.number_input("Rows per chunk", 10_000, 5_000_000, DEFAULT_CHUNKSIZE, 10_000, key="upload_chunksize")
+
+            if st.button("Compute metrics", type="primary", disabled=not sensitive, key="upload_run"):
+                with st.status("Streaming predictions...") as status:
+                    audit = ingest_files(
+                        sources, y_true, y_pred, sensitive, pos_label=pos_label, chunksize=int(chunksize),
+                        progress=lambda rows: status.update(label=f"Processed {rows:,} rows..."),
+                    )
+                    status.update(label=f"Processed {audit.rows:,} rows.", state="complete")
+                st.session_state[SESSION_KEY] = audit
+                st.rerun()
+    except (ValueError, KeyError, ImportError) as exc:
+        st.error(f"Could not read the prediction files: {exc}")
+
+    audit = get_uploaded_audit()
+    if audit is not None:
+        st.success(f"Using **{audit.rows:,}** uploaded predictions across **{len(audit.group_table())}** groups ({', '.join(audit.sensitive_columns)}).")
+        if st.button("Back to example data", key="upload_clear"):
+            del st.session_state[SESSION_KEY]
+            st.rerun()